@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""
+Microbenchmark: presseportal article parser backends (bs4 vs lexbor).
+
+Times parse_article_page and parse_article_page_lexbor over the fixture corpus
+plus a synthetic full-size page (presseportal articles carry ~100KB of
+navigation around a short story), and reports ms/page and speedup.
+
+Usage:
+    python3 scripts/benchmarks/bench_article_parsers.py
+    python3 scripts/benchmarks/bench_article_parsers.py --repeat 200 --fixtures-dir /tmp/pages
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent))
+from scripts.benchmarks.bench_parse_pool import synthetic_article_html
+from scripts.benchmarks.parser_parity import FIXTURES_DIR, fixture_url
+from scripts.scrape_blaulicht_async import ARTICLE_PARSERS, BASE_URL
+
+
+def time_parser(parse_fn, pages: list[tuple[str, str]], repeat: int) -> float:
+    """Return mean seconds per page."""
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for html, url in pages:
+            parse_fn(html, url)
+    return (time.perf_counter() - start) / (repeat * len(pages))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark article parser backends")
+    parser.add_argument("--fixtures-dir", type=str, default=str(FIXTURES_DIR),
+                        help=f"Directory of saved article pages (default: {FIXTURES_DIR})")
+    parser.add_argument("--repeat", type=int, default=50,
+                        help="Passes over each page set (default: 50)")
+    args = parser.parse_args()
+
+    fixtures = [
+        (p.read_text(encoding="utf-8"), fixture_url(p))
+        for p in sorted(Path(args.fixtures_dir).glob("*.html"))
+    ]
+    synthetic = [(synthetic_article_html(1, BASE_URL), f"{BASE_URL}/blaulicht/pm/4969/1")]
+
+    page_sets = [("fixtures", fixtures), ("synthetic full page", synthetic)]
+
+    print(f"{'page set':<22}  {'pages':>5}  " + "  ".join(f"{name + ' ms/page':>16}" for name in ARTICLE_PARSERS) + "  speedup")
+    for label, pages in page_sets:
+        if not pages:
+            continue
+        timings = {name: time_parser(fn, pages, args.repeat) for name, fn in ARTICLE_PARSERS.items()}
+        speedup = timings["bs4"] / timings["lexbor"]
+        cols = "  ".join(f"{timings[name] * 1000:>16.3f}" for name in ARTICLE_PARSERS)
+        print(f"{label:<22}  {len(pages):>5}  {cols}  {speedup:>6.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+"""
+Benchmark: fixed-size LLM batches vs token-budget packing (pack_batches).
+
+Plans the enrichment calls for a set of articles both ways and reports,
+from the token estimates: calls, tokens per call, calls whose output would
+overflow max_output_tokens (truncated JSON), and the simulated wall time of
+running them through the async enricher's semaphore, where a call's latency
+grows with its output tokens.
+
+Articles come from --input, or a synthetic mix of Sachsen one-line teasers,
+ordinary reports, city-header digests and Bayern-style mega-digests.
+
+--usage reads a token_usage.jsonl instead and reports the real tokens per
+call and truncation rate (finish_reason == "length") per packing mode.
+
+Usage:
+    python3 scripts/benchmarks/bench_batch_packing.py
+    python3 scripts/benchmarks/bench_batch_packing.py --input data/pipeline/chunks/raw/bayern/2025-01.json
+    python3 scripts/benchmarks/bench_batch_packing.py --usage .cache/token_usage.jsonl
+"""
+
+import argparse
+import heapq
+import json
+import random
+import sys
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent))
+from scripts.pipeline.article_io import load_articles
+from scripts.pipeline.config import ASYNC_BATCH_SIZE, ASYNC_CONCURRENCY
+from scripts.pipeline.fast_enricher import UNIFIED_MAX_TOKENS, estimate_article_tokens, plan_batches
+
+_SENTENCE = ("Am Dienstagabend brachen bislang unbekannte Täter in eine Wohnung in der Hauptstraße ein "
+             "und entwendeten Schmuck sowie Bargeld im Wert von mehreren tausend Euro. ")
+_CITIES = ["Dresden", "Leipzig", "Chemnitz", "Bautzen", "Görlitz", "Pirna", "Meißen", "Zwickau", "Plauen"]
+
+
+def _incident(rng: random.Random) -> str:
+    return _SENTENCE * rng.randint(2, 5)
+
+
+def synthetic_articles(count: int, seed: int = 1) -> list[dict]:
+    """Article mix with the body lengths and digest shapes the enricher sees."""
+    rng = random.Random(seed)
+    articles = []
+    for n in range(count):
+        roll = rng.random()
+        if roll < 0.30:
+            body = _SENTENCE[: rng.randint(80, 180)]
+        elif roll < 0.85:
+            body = _incident(rng) * rng.randint(1, 2)
+        else:
+            incidents = rng.randint(3, 8) if roll < 0.95 else rng.randint(15, 30)
+            body = "Polizeidirektion (ots)\n" + "".join(
+                f"\n\n{rng.choice(_CITIES)}: Einbruch in Wohnung\n\n{_incident(rng)}" for _ in range(incidents)
+            )
+        articles.append({
+            "title": f"Meldung {n}",
+            "body": body,
+            "date": "2026-01-12T10:00:00",
+            "city": rng.choice(_CITIES),
+            "source": "Polizei",
+            "url": f"https://example.org/{n}",
+        })
+    return articles
+
+
+def simulate_wall_time(calls: list[tuple[int, int]], concurrency: int, base_s: float, tokens_per_s: float) -> float:
+    """Makespan of calls started in order on `concurrency` slots; latency = base + output/tps."""
+    slots = [0.0] * min(concurrency, max(1, len(calls)))
+    for _, tokens_out in calls:
+        start = heapq.heappop(slots)
+        heapq.heappush(slots, start + base_s + tokens_out / tokens_per_s)
+    return max(slots) if calls else 0.0
+
+
+def simulate(args) -> None:
+    articles = load_articles(args.input) if args.input else synthetic_articles(args.articles)
+    sizes = [estimate_article_tokens(art) for art in articles]
+    solo = sum(1 for _, tokens_out in sizes if tokens_out > args.max_output_tokens)
+    print(f"{len(articles)} articles, max_output_tokens {args.max_output_tokens}, "
+          f"concurrency {args.concurrency}")
+    print(f"{solo} articles overflow max_output_tokens on their own (not counted below)\n")
+    print(f"{'':<14} {'calls':>6} {'art/call':>9} {'in/call':>8} {'out/call':>9} "
+          f"{'overflow':>11} {'wall':>8}")
+
+    for label, packing in ((f"fixed {args.batch_size}", "fixed"), ("tokens", "tokens")):
+        batches = plan_batches(articles, packing, args.batch_size, args.max_output_tokens)
+        calls = [
+            (sum(sizes[i][0] for i in batch), sum(sizes[i][1] for i in batch))
+            for batch in batches
+        ]
+        overflow = sum(
+            1 for batch, (_, tokens_out) in zip(batches, calls)
+            if tokens_out > args.max_output_tokens and len(batch) > 1
+        )
+        wall = simulate_wall_time(calls, args.concurrency, args.base_latency, args.tokens_per_s)
+        print(f"{label:<14} {len(calls):>6} {len(articles) / len(calls):>9.1f} "
+              f"{sum(c[0] for c in calls) / len(calls):>8.0f} {sum(c[1] for c in calls) / len(calls):>9.0f} "
+              f"{overflow:>5} ({overflow / len(calls):>4.0%}) {wall:>7.0f}s")
+
+
+def usage_report(path: Path) -> None:
+    """Real tokens per call and truncation rate per packing mode from token_usage.jsonl."""
+    groups: dict[str, list[dict]] = {}
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            try:
+                entry = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+            # Entries from before packing were fixed-size batches
+            groups.setdefault(entry.get("packing", "fixed"), []).append(entry)
+
+    print(f"{'packing':<8} {'calls':>7} {'art/call':>9} {'prompt/call':>12} {'compl/call':>11} {'truncated':>14}")
+    for packing, entries in sorted(groups.items()):
+        calls = len(entries)
+        with_reason = [e for e in entries if "finish_reason" in e]
+        truncated = sum(1 for e in with_reason if e["finish_reason"] == "length")
+        rate = f"{truncated}/{len(with_reason)} ({truncated / len(with_reason):.1%})" if with_reason else "n/a"
+        print(f"{packing:<8} {calls:>7} "
+              f"{sum(e.get('batch_size', 0) for e in entries) / calls:>9.1f} "
+              f"{sum(e.get('prompt_tokens', 0) for e in entries) / calls:>12.0f} "
+              f"{sum(e.get('completion_tokens', 0) for e in entries) / calls:>11.0f} "
+              f"{rate:>14}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark fixed vs token-budget LLM batches")
+    parser.add_argument("--input", type=str, default=None, help="Articles JSON/NDJSON (default: synthetic)")
+    parser.add_argument("--articles", type=int, default=5000, help="Synthetic article count (default: 5000)")
+    parser.add_argument("--batch-size", type=int, default=ASYNC_BATCH_SIZE,
+                        help=f"Fixed batch size to compare against (default: {ASYNC_BATCH_SIZE})")
+    parser.add_argument("--max-output-tokens", type=int, default=UNIFIED_MAX_TOKENS,
+                        help=f"Output token limit per call (default: {UNIFIED_MAX_TOKENS})")
+    parser.add_argument("--concurrency", type=int, default=ASYNC_CONCURRENCY,
+                        help=f"Concurrent calls in the wall-time simulation (default: {ASYNC_CONCURRENCY})")
+    parser.add_argument("--base-latency", type=float, default=2.0,
+                        help="Per-call latency before output tokens, seconds (default: 2.0)")
+    parser.add_argument("--tokens-per-s", type=float, default=150.0,
+                        help="Output tokens per second per call (default: 150)")
+    parser.add_argument("--usage", type=str, default=None,
+                        help="Report real calls from a token_usage.jsonl instead of simulating")
+    args = parser.parse_args()
+
+    if args.usage:
+        usage_report(Path(args.usage))
+    else:
+        simulate(args)
+
+
+if __name__ == "__main__":
+    main()
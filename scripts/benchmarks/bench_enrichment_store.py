@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""
+Benchmark: enrichment_cache.json vs the SQLite EnrichmentStore.
+
+Builds a synthetic enrichment cache (entries shaped like FastEnricher's: a
+list with one enrichment dict, some junk sentinels), then times for both:
+opening the cache, a batch lookup, saving after one batch of new entries,
+and several processes writing at once (the JSON loses every writer's
+entries but the last one's; the store keeps them all).
+
+Usage:
+    python3 scripts/benchmarks/bench_enrichment_store.py
+    python3 scripts/benchmarks/bench_enrichment_store.py --entries 1000000 --writers 4
+"""
+
+import argparse
+import hashlib
+import json
+import multiprocessing
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent))
+from scripts.pipeline.enrichment_store import EnrichmentStore
+
+
+def _key(n: int) -> str:
+    return hashlib.sha256(f"https://example.org/{n}:body".encode()).hexdigest()[:16]
+
+
+def _entry(n: int) -> list[dict]:
+    if n % 10 == 0:
+        return [{"_classification": "junk", "reason": "Verkehrshinweis"}]
+    return [{
+        "clean_title": f"Einbruch in Wohnung {n}",
+        "classification": "crime",
+        "location": {"street": "Hauptstraße", "city": "Darmstadt", "lat": 49.87, "lon": 8.65},
+        "incident_time": {"date": "2026-01-12", "time": "22:30"},
+        "crime": {"pks_code": "4350", "sub_type": "wohnungseinbruch"},
+        "details": {"damage_amount_eur": 1000 + n},
+        "is_update": False,
+    }]
+
+
+def _timed(fn):
+    start = time.perf_counter()
+    result = fn()
+    return result, time.perf_counter() - start
+
+
+def _json_writer(path: str, first: int, count: int) -> None:
+    with open(path, "r", encoding="utf-8") as f:
+        cache = json.load(f)
+    for n in range(first, first + count):
+        cache[_key(n)] = _entry(n)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(cache, f, ensure_ascii=False)
+
+
+def _store_writer(cache_dir: str, first: int, count: int) -> None:
+    store = EnrichmentStore(cache_dir)
+    for n in range(first, first + count):
+        store[_key(n)] = _entry(n)
+    store.close()
+
+
+def _run_writers(target, arg: str, entries: int, writers: int, per_writer: int) -> float:
+    procs = [
+        multiprocessing.Process(target=target, args=(arg, entries + w * per_writer, per_writer))
+        for w in range(writers)
+    ]
+    start = time.perf_counter()
+    for p in procs:
+        p.start()
+    for p in procs:
+        p.join()
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark JSON vs SQLite enrichment cache")
+    parser.add_argument("--entries", type=int, default=200_000, help="Cache size (default: 200000)")
+    parser.add_argument("--batch", type=int, default=500, help="Lookup/insert batch size (default: 500)")
+    parser.add_argument("--writers", type=int, default=4, help="Concurrent writer processes (default: 4)")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        json_dir, store_dir = Path(tmp) / "json", Path(tmp) / "store"
+        json_dir.mkdir()
+        store_dir.mkdir()
+        json_file = json_dir / "enrichment_cache.json"
+        with open(json_file, "w", encoding="utf-8") as f:
+            json.dump({_key(n): _entry(n) for n in range(args.entries)}, f, ensure_ascii=False)
+        (store_dir / json_file.name).write_bytes(json_file.read_bytes())
+        print(f"{args.entries} entries, {json_file.stat().st_size / 1e6:.0f} MB as JSON")
+
+        _, import_s = _timed(lambda: EnrichmentStore(str(store_dir)).close())
+        print(f"One-time JSON import: {import_s:.2f}s\n")
+
+        lookup = [_key(n) for n in range(0, args.entries, max(1, args.entries // args.batch))]
+        new = [(_key(n), _entry(n)) for n in range(args.entries, args.entries + args.batch)]
+
+        def json_save(cache: dict) -> None:
+            cache.update(new)
+            with open(json_file, "w", encoding="utf-8") as f:
+                json.dump(cache, f, ensure_ascii=False)
+
+        cache, json_open = _timed(lambda: json.load(open(json_file, encoding="utf-8")))
+        _, json_get = _timed(lambda: {k: cache[k] for k in lookup if k in cache})
+        _, json_put = _timed(lambda: json_save(cache))
+        del cache
+
+        store, store_open = _timed(lambda: EnrichmentStore(str(store_dir)))
+        _, store_get = _timed(lambda: store.get_many(lookup))
+        _, store_put = _timed(lambda: store.put_many(new))
+        store.close()
+
+        print(f"{'':<10}  {'open':>9}  {'get ' + str(len(lookup)):>9}  {'save +' + str(args.batch):>9}")
+        print(f"{'json':<10}  {json_open:>8.3f}s  {json_get:>8.4f}s  {json_put:>8.3f}s")
+        print(f"{'sqlite':<10}  {store_open:>8.3f}s  {store_get:>8.4f}s  {store_put:>8.3f}s")
+
+        per_writer = args.batch
+        first = args.entries + args.batch
+        json_s = _run_writers(_json_writer, str(json_file), first, args.writers, per_writer)
+        with open(json_file, "r", encoding="utf-8") as f:
+            json_kept = len(json.load(f)) - args.entries - args.batch
+        store_s = _run_writers(_store_writer, str(store_dir), first, args.writers, per_writer)
+        store = EnrichmentStore(str(store_dir))
+        store_kept = len(store) - args.entries - args.batch
+        store.close()
+        expected = args.writers * per_writer
+        print(f"\n{args.writers} writer processes x {per_writer} new entries each:")
+        print(f"  json    {json_s:>6.2f}s, {json_kept}/{expected} entries kept")
+        print(f"  sqlite  {store_s:>6.2f}s, {store_kept}/{expected} entries kept")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+Benchmark: fixed semaphore + per-request backoff vs the shared AdaptiveLimiter.
+
+Runs the same number of simulated LLM calls against a simulated provider.
+Latency rises once more than --capacity calls are in flight. Beyond
+--rate-limit in-flight calls, the provider answers 429.
+
+"fixed" is the old AsyncFastEnricher behaviour: Semaphore(--concurrency),
+and each 429 backs off on its own with exponential delay and jitter.
+"adaptive" is AdaptiveLimiter starting at --concurrency. Its cooldowns
+are scaled like the real ones: 5s-60s against LLM calls of ~20s, i.e.
+0.25-3x the call latency. Reports wall time, 429s, calls/s and the
+concurrency the limiter settled on.
+
+Usage:
+    python3 scripts/benchmarks/bench_llm_limiter.py
+    python3 scripts/benchmarks/bench_llm_limiter.py --calls 5000 --capacity 80 --rate-limit 60
+"""
+
+import argparse
+import asyncio
+import random
+import sys
+import time
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent))
+from scripts.pipeline.llm_limiter import AdaptiveLimiter
+
+
+class SimulatedProvider:
+    """Latency grows past `capacity` in-flight calls; 429 past `rate_limit`."""
+
+    def __init__(self, capacity: int, rate_limit: int, base_latency: float):
+        self.capacity = capacity
+        self.rate_limit = rate_limit
+        self.base_latency = base_latency
+        self.in_flight = 0
+        self.throttled = 0
+
+    async def call(self) -> bool:
+        """True on success, False on 429."""
+        if self.in_flight >= self.rate_limit:
+            self.throttled += 1
+            await asyncio.sleep(self.base_latency * 0.05)
+            return False
+        self.in_flight += 1
+        try:
+            load = max(1.0, self.in_flight / self.capacity)
+            await asyncio.sleep(self.base_latency * load * random.uniform(0.8, 1.2))
+            return True
+        finally:
+            self.in_flight -= 1
+
+
+async def run_fixed(provider: SimulatedProvider, calls: int, concurrency: int, retry_base: float) -> None:
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def one():
+        attempt = 0
+        while True:
+            async with semaphore:
+                if await provider.call():
+                    return
+            await asyncio.sleep(min(retry_base * (2 ** attempt) + random.uniform(0, retry_base), 60 * retry_base))
+            attempt += 1
+
+    await asyncio.gather(*(one() for _ in range(calls)))
+
+
+async def run_adaptive(provider: SimulatedProvider, calls: int, limiter: AdaptiveLimiter) -> None:
+    async def one():
+        while True:
+            await limiter.acquire()
+            start = time.perf_counter()
+            ok = await provider.call()
+            limiter.release("ok" if ok else "throttled", latency_s=time.perf_counter() - start)
+            if ok:
+                return
+
+    await asyncio.gather(*(one() for _ in range(calls)))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark fixed vs adaptive LLM concurrency")
+    parser.add_argument("--calls", type=int, default=3000, help="Simulated LLM calls (default: 3000)")
+    parser.add_argument("--concurrency", type=int, default=30, help="Fixed/starting concurrency (default: 30)")
+    parser.add_argument("--max-concurrency", type=int, default=100, help="Adaptive ceiling (default: 100)")
+    parser.add_argument("--capacity", type=int, default=60,
+                        help="In-flight calls before provider latency rises (default: 60)")
+    parser.add_argument("--rate-limit", type=int, default=80,
+                        help="In-flight calls before the provider returns 429 (default: 80)")
+    parser.add_argument("--latency", type=float, default=0.05,
+                        help="Unloaded call latency in seconds; 1 simulated second (default: 0.05)")
+    args = parser.parse_args()
+
+    print(f"{args.calls} calls, provider capacity {args.capacity}, 429 above {args.rate_limit} in flight\n")
+    print(f"{'':<22} {'wall':>7} {'calls/s':>8} {'429s':>6}  limiter")
+
+    configs = [
+        (f"fixed {args.concurrency}", None),
+        (f"adaptive {args.concurrency}->{args.max_concurrency}", args.max_concurrency),
+        (f"fixed {args.rate_limit + 20}", None),
+    ]
+    for label, max_limit in configs:
+        random.seed(1)
+        provider = SimulatedProvider(args.capacity, args.rate_limit, args.latency)
+        start = time.perf_counter()
+        status = ""
+        if max_limit:
+            limiter = AdaptiveLimiter(args.concurrency, max_limit=max_limit, min_limit=2,
+                                      cooldown=args.latency * 0.25, max_cooldown=args.latency * 3)
+            asyncio.run(run_adaptive(provider, args.calls, limiter))
+            status = limiter.status()
+        else:
+            concurrency = int(label.split()[1])
+            asyncio.run(run_fixed(provider, args.calls, concurrency, args.latency))
+        wall = time.perf_counter() - start
+        print(f"{label:<22} {wall:>6.2f}s {args.calls / wall:>8.0f} {provider.throttled:>6}  {status}")
+
+
+if __name__ == "__main__":
+    main()
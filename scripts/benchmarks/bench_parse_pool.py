@@ -0,0 +1,202 @@
+#!/usr/bin/env python3
+"""
+Benchmark: inline vs process-pool HTML parsing in AsyncPresseportalScraper.
+
+Starts a local aiohttp server (separate process) that mimics presseportal's
+listing and article pages with a fixed response latency, then runs the real
+scraper against it at several concurrency levels — once parsing on the event
+loop, once with --parse-workers — and reports articles/sec for each.
+
+By default pages are synthetic (same markup structure as presseportal, padded
+to a realistic size). Pass --html-dir with saved article pages to serve those
+instead.
+
+Usage:
+    python3 scripts/benchmarks/bench_parse_pool.py
+    python3 scripts/benchmarks/bench_parse_pool.py --concurrency 5 10 30 --pages 20 --latency-ms 120
+    python3 scripts/benchmarks/bench_parse_pool.py --html-dir path/to/saved_pages
+"""
+
+import argparse
+import asyncio
+import contextlib
+import io
+import multiprocessing
+import os
+import random
+import sys
+import tempfile
+import time
+import zlib
+from pathlib import Path
+
+from aiohttp import web
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent))
+from scripts import scrape_blaulicht_async as presseportal
+from scripts.scrapers.parse_pool import resolve_workers
+
+ARTICLES_PER_PAGE = 30
+
+
+# ---------------------------------------------------------------------------
+# Synthetic pages
+# ---------------------------------------------------------------------------
+
+def _nav_padding(n_links: int) -> str:
+    """Header/footer boilerplate — real pages carry ~100KB of navigation."""
+    items = "".join(
+        f'<li class="nav-item"><a href="/blaulicht/r/Ort{i}" title="Ort {i}">Ort {i}</a></li>'
+        for i in range(n_links)
+    )
+    return f'<nav class="main-nav"><ul class="nav-list">{items}</ul></nav>'
+
+
+def synthetic_article_html(n: int, origin: str) -> str:
+    paragraphs = "".join(
+        f"<p>Absatz {i}: Am Montagabend kam es in der Hauptstraße zu einem Vorfall. "
+        f"Die Polizei bittet Zeugen, sich unter der Rufnummer 06151 969-0 zu melden. "
+        f"Der Sachschaden wird auf etwa {1000 + n} Euro geschätzt.</p>"
+        for i in range(8)
+    )
+    return f"""<!DOCTYPE html>
+<html lang="de"><head>
+<meta charset="utf-8"><title>POL-DA: Meldung {n} | Presseportal</title>
+<meta property="og:title" content="POL-DA: Meldung {n} - Darmstadt">
+<script type="application/ld+json">{{"@type": "NewsArticle", "datePublished": "2026-02-04T05:55:00+01:00"}}</script>
+</head><body>
+{_nav_padding(400)}
+<article class="story"><div class="card">
+<p class="date">04.02.2026 – 05:55</p>
+<p class="customer">Polizeipräsidium Südhessen</p>
+<h1>POL-DA: Meldung {n} - Darmstadt</h1>
+<p>Darmstadt (ots) - Einleitung der Meldung {n}.</p>
+{paragraphs}
+<p class="contact-headline">Rückfragen bitte an:</p>
+<p class="contact-text">Polizeipräsidium Südhessen, Pressestelle</p>
+<p class="originator">Original-Content von: Polizeipräsidium Südhessen</p>
+</div></article>
+<div class="thisisnoh">Orte in dieser Meldung</div>
+<ul><li><a href="{origin}/blaulicht/r/Darmstadt">Darmstadt</a></li><li><a href="{origin}/blaulicht/l/hessen">Hessen</a></li></ul>
+<div class="thisisnoh">Themen in dieser Meldung</div>
+<ul><li><a href="{origin}/blaulicht/t/polizei">Polizei</a></li></ul>
+{_nav_padding(200)}
+</body></html>"""
+
+
+def synthetic_listing_html(offset: int, origin: str, agency: int = 4969) -> str:
+    items = "".join(
+        f'<article class="news"><h3><a href="{origin}/blaulicht/pm/{agency}/{offset + i}">'
+        f'POL-DA: Meldung {offset + i} - Darmstadt</a></h3>'
+        f'<div class="date">04.02.2026 – 05:55</div>'
+        f'<a href="{origin}/blaulicht/nr/{agency}">Polizeipräsidium Südhessen</a></article>'
+        for i in range(ARTICLES_PER_PAGE)
+    )
+    return f"<html><body>{_nav_padding(300)}<main>{items}</main></body></html>"
+
+
+# ---------------------------------------------------------------------------
+# Local server (runs in its own process so scraper CPU does not skew it)
+# ---------------------------------------------------------------------------
+
+def _serve(port_queue, pages: int, latency_s: float, html_dir: str | None) -> None:
+    recorded = []
+    if html_dir:
+        recorded = [p.read_text(encoding="utf-8") for p in sorted(Path(html_dir).glob("*.html"))]
+
+    async def listing(request: web.Request) -> web.Response:
+        origin = f"http://{request.host}"
+        offset = int(request.match_info.get("offset", 0))
+        # Distinct article URLs per state, so a shared URL cache does not dedupe them
+        agency = 1000 + zlib.crc32(request.match_info["state"].encode()) % 9000
+        await asyncio.sleep(latency_s)
+        if offset >= pages * ARTICLES_PER_PAGE:
+            return web.Response(text="<html><body><main></main></body></html>", content_type="text/html")
+        return web.Response(text=synthetic_listing_html(offset, origin, agency), content_type="text/html")
+
+    async def article(request: web.Request) -> web.Response:
+        n = int(request.match_info["n"])
+        await asyncio.sleep(latency_s * random.uniform(0.8, 1.2))
+        if recorded:
+            text = recorded[n % len(recorded)]
+        else:
+            text = synthetic_article_html(n, f"http://{request.host}")
+        return web.Response(text=text, content_type="text/html")
+
+    async def start() -> None:
+        app = web.Application()
+        app.router.add_get("/blaulicht/l/{state}", listing)
+        app.router.add_get("/blaulicht/l/{state}/{offset}", listing)
+        app.router.add_get("/blaulicht/pm/{agency}/{n}", article)
+        runner = web.AppRunner(app, access_log=None)
+        await runner.setup()
+        site = web.TCPSite(runner, "127.0.0.1", 0)
+        await site.start()
+        port_queue.put(site._server.sockets[0].getsockname()[1])
+        await asyncio.Event().wait()
+
+    asyncio.run(start())
+
+
+# ---------------------------------------------------------------------------
+# Benchmark
+# ---------------------------------------------------------------------------
+
+async def run_once(pages: int, concurrency: int, parse_workers: int, streaming: bool = False) -> tuple[int, float]:
+    with tempfile.TemporaryDirectory() as tmp:
+        scraper = presseportal.AsyncPresseportalScraper(
+            bundesland="hessen",
+            max_pages=pages,
+            output=os.path.join(tmp, "out.json"),
+            concurrent_requests=concurrency,
+            cache_dir=tmp,
+            parse_workers=parse_workers,
+            streaming=streaming,
+        )
+        start = time.perf_counter()
+        with contextlib.redirect_stdout(io.StringIO()):
+            await scraper.run_async()
+        return len(scraper.articles), time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark inline vs process-pool parsing")
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[5, 10, 30],
+                        help="Concurrent request levels to test (default: 5 10 30)")
+    parser.add_argument("--pages", type=int, default=10,
+                        help=f"Listing pages per run, {ARTICLES_PER_PAGE} articles each (default: 10)")
+    parser.add_argument("--latency-ms", type=float, default=80,
+                        help="Simulated server latency per request (default: 80)")
+    parser.add_argument("--workers", type=int, default=-1,
+                        help="Parse workers for the pool runs (-1 = one per CPU core)")
+    parser.add_argument("--html-dir", type=str, default=None,
+                        help="Serve saved article pages (*.html) instead of synthetic ones")
+    parser.add_argument("--stream", action="store_true",
+                        help="Run the scraper in streaming (pipelined) mode")
+    args = parser.parse_args()
+
+    port_queue = multiprocessing.Queue()
+    server = multiprocessing.Process(
+        target=_serve, args=(port_queue, args.pages, args.latency_ms / 1000, args.html_dir), daemon=True,
+    )
+    server.start()
+    port = port_queue.get(timeout=10)
+    presseportal.BASE_URL = f"http://127.0.0.1:{port}"
+
+    print(f"Server: 127.0.0.1:{port}, {args.pages} pages x {ARTICLES_PER_PAGE} articles, "
+          f"{args.latency_ms:.0f}ms latency, {os.cpu_count()} CPU(s)")
+    print(f"{'concurrent':>10}  {'mode':<24}  {'articles':>8}  {'seconds':>8}  {'art/sec':>8}")
+
+    try:
+        for concurrency in args.concurrency:
+            for workers in dict.fromkeys((0, args.workers)):
+                count, elapsed = asyncio.run(run_once(args.pages, concurrency, workers, args.stream))
+                mode = "inline" if workers == 0 else f"process pool ({resolve_workers(workers)} workers)"
+                print(f"{concurrency:>10}  {mode:<24}  {count:>8}  {elapsed:>8.2f}  {count / elapsed:>8.1f}")
+    finally:
+        server.terminate()
+
+
+if __name__ == "__main__":
+    main()
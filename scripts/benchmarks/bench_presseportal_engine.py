@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+Benchmark: subprocess-per-state fan-out vs the in-process presseportal engine.
+
+Scrapes one month for every presseportal state from a local aiohttp server
+(separate process, synthetic listing/article pages, fixed latency) two ways:
+
+  subprocess  what parallel_orchestrator.run_scraper_sync did: one Python
+              process per state, run in turn, then re-read the output JSON
+              to count articles
+  engine      scripts/pipeline/presseportal_engine.scrape_jobs: all states as
+              tasks over one session, request budget and URL cache
+
+Usage:
+    python3 scripts/benchmarks/bench_presseportal_engine.py
+    python3 scripts/benchmarks/bench_presseportal_engine.py --pages 10 --latency-ms 120
+
+The server ends each state's listing after --pages pages, which is what
+stops both modes (no --max-pages needed).
+"""
+
+import argparse
+import json
+import multiprocessing
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Add project root to path
+PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+from scripts import scrape_blaulicht_async as presseportal
+from scripts.benchmarks.bench_parse_pool import ARTICLES_PER_PAGE, _serve
+from scripts.pipeline.config import PRESSEPORTAL_STATES
+from scripts.pipeline.presseportal_engine import scrape_jobs
+
+# Synthetic articles are dated 04.02.2026
+MONTH_START = "2026-02-01"
+MONTH_END = "2026-02-28"
+
+# Runs the real CLI in a fresh interpreter with BASE_URL pointed at the local server
+_SUBPROCESS_SNIPPET = (
+    "import sys; sys.path.insert(0, sys.argv[1]); "
+    "from scripts import scrape_blaulicht_async as m; "
+    "m.BASE_URL = sys.argv[2]; sys.argv = ['scrape_blaulicht_async.py'] + sys.argv[3:]; m.main()"
+)
+
+
+def run_subprocesses(states: list[str], base_url: str, work_dir: Path) -> int:
+    total = 0
+    for state in states:
+        output = work_dir / f"{state}.json"
+        subprocess.run(
+            [sys.executable, "-c", _SUBPROCESS_SNIPPET, str(PROJECT_ROOT), base_url,
+             "--bundesland", state, "--start-date", MONTH_START, "--end-date", MONTH_END,
+             "--output", str(output), "--cache-dir", str(work_dir)],
+            capture_output=True, text=True, check=True,
+        )
+        with open(output, "r", encoding="utf-8") as f:
+            total += len(json.load(f))
+    return total
+
+
+def run_engine(states: list[str], work_dir: Path) -> int:
+    jobs = [(state, MONTH_START, MONTH_END, str(work_dir / f"{state}.json")) for state in states]
+    results = scrape_jobs(jobs, cache_dir=str(work_dir))
+    return sum(count for _, count, _ in results)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark subprocess fan-out vs in-process engine")
+    parser.add_argument("--pages", type=int, default=4,
+                        help=f"Listing pages per state, {ARTICLES_PER_PAGE} articles each (default: 4)")
+    parser.add_argument("--latency-ms", type=float, default=80,
+                        help="Simulated server latency per request (default: 80)")
+    parser.add_argument("--states", nargs="+", default=PRESSEPORTAL_STATES,
+                        help="States to scrape (default: all presseportal states)")
+    args = parser.parse_args()
+
+    port_queue = multiprocessing.Queue()
+    server = multiprocessing.Process(
+        target=_serve, args=(port_queue, args.pages, args.latency_ms / 1000, None), daemon=True,
+    )
+    server.start()
+    base_url = f"http://127.0.0.1:{port_queue.get(timeout=10)}"
+    presseportal.BASE_URL = base_url
+
+    print(f"Server: {base_url}, {len(args.states)} states x {args.pages} pages x {ARTICLES_PER_PAGE} articles, "
+          f"{args.latency_ms:.0f}ms latency, {os.cpu_count()} CPU(s)")
+    print(f"{'mode':<12}  {'articles':>8}  {'seconds':>8}  {'art/sec':>8}")
+
+    try:
+        for mode in ("subprocess", "engine"):
+            with tempfile.TemporaryDirectory() as tmp:
+                start = time.perf_counter()
+                if mode == "subprocess":
+                    count = run_subprocesses(args.states, base_url, Path(tmp))
+                else:
+                    count = run_engine(args.states, Path(tmp))
+                elapsed = time.perf_counter() - start
+            print(f"{mode:<12}  {count:>8}  {elapsed:>8.2f}  {count / elapsed:>8.1f}")
+    finally:
+        server.terminate()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+"""
+Benchmark: inline vs system prompt layout (build_messages) for provider prefix caching.
+
+Providers cache a prompt prefix that repeats across calls (OpenAI, xAI,
+DeepSeek and Gemini do it automatically above ~1024 tokens). The inline
+layout formats the article count into the first line of the template, so
+consecutive calls share almost no prefix. The system layout sends the
+instructions as an identical system message and only the batch varies.
+
+By default this plans the enrichment calls for a set of articles and
+reports, per layout, the prompt tokens per call, how many of them
+repeat from the previous call (cacheable), and the estimated input cost
+per 1000 calls with and without those served from the cache.
+
+--usage reads a token_usage.jsonl instead and reports the real prompt
+tokens, provider-reported cached tokens, cost and latency per layout.
+Entries from before the layout existed count as inline.
+
+Usage:
+    python3 scripts/benchmarks/bench_prompt_cache.py
+    python3 scripts/benchmarks/bench_prompt_cache.py --input data/pipeline/chunks/raw/bayern/2025-01.json
+    python3 scripts/benchmarks/bench_prompt_cache.py --usage .cache/token_usage.jsonl
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent))
+from scripts.benchmarks.bench_batch_packing import synthetic_articles
+from scripts.pipeline.article_io import load_articles
+from scripts.pipeline.config import ASYNC_BATCH_SIZE
+from scripts.pipeline.fast_enricher import (
+    BATCH_PACKING,
+    CACHED_INPUT_PRICE,
+    CHARS_PER_TOKEN,
+    UNIFIED_MAX_TOKENS,
+    build_messages,
+    load_prompt,
+    plan_batches,
+)
+
+# Providers only cache prefixes from this length on
+MIN_CACHED_PREFIX_TOKENS = 1024
+
+
+def _batch_json(batch: list[dict]) -> str:
+    """The article payload as the enrichers format it."""
+    return json.dumps([
+        {
+            "index": i,
+            "title": art.get("title", "")[:200],
+            "body": art.get("body", ""),
+            "date": art.get("date", ""),
+            "city": art.get("city", ""),
+            "source": art.get("source", ""),
+        }
+        for i, art in enumerate(batch)
+    ], ensure_ascii=False, indent=2)
+
+
+def _serialized(messages: list[dict]) -> str:
+    return "".join(f"<{m['role']}>{m['content']}" for m in messages)
+
+
+def _common_prefix(a: str, b: str) -> int:
+    n = min(len(a), len(b))
+    i = 0
+    while i < n and a[i] == b[i]:
+        i += 1
+    return i
+
+
+def simulate(args) -> None:
+    template = load_prompt(version=args.prompt_version)["template"]
+    articles = load_articles(args.input) if args.input else synthetic_articles(args.articles)
+    batches = [
+        [articles[i] for i in indices]
+        for indices in plan_batches(articles, args.packing, ASYNC_BATCH_SIZE, UNIFIED_MAX_TOKENS)
+    ]
+    print(f"{len(articles)} articles in {len(batches)} calls ({args.packing} packing), "
+          f"input ${args.input_price}/M, cached {CACHED_INPUT_PRICE:.0%} of that\n")
+    print(f"{'layout':<8} {'prompt/call':>12} {'shared prefix':>14} {'cacheable':>10} "
+          f"{'$/1000 calls':>13} {'cached':>9}")
+
+    for layout in ("inline", "system"):
+        prompt_tokens = cacheable = 0.0
+        previous = None
+        prefixes = []
+        for batch in batches:
+            text = _serialized(build_messages(template, _batch_json(batch), len(batch), layout))
+            tokens = len(text) / CHARS_PER_TOKEN
+            prefix = _common_prefix(previous, text) / CHARS_PER_TOKEN if previous else 0.0
+            previous = text
+            prompt_tokens += tokens
+            prefixes.append(prefix)
+            if prefix >= MIN_CACHED_PREFIX_TOKENS:
+                cacheable += prefix
+        calls = len(batches)
+        cost = prompt_tokens / calls * args.input_price / 1000
+        cached_cost = (prompt_tokens - cacheable + cacheable * CACHED_INPUT_PRICE) / calls * args.input_price / 1000
+        print(f"{layout:<8} {prompt_tokens / calls:>12.0f} {sum(prefixes) / calls:>14.0f} "
+              f"{cacheable / prompt_tokens:>10.0%} {cost:>12.2f}$ {cached_cost:>8.2f}$")
+
+
+def _percentile(values: list[float], q: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * q))] if ordered else 0.0
+
+
+def usage_report(path: Path, args) -> None:
+    """Real prompt/cached tokens, cost and latency per prompt layout from token_usage.jsonl."""
+    groups: dict[str, list[dict]] = {}
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            try:
+                entry = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+            if args.model and entry.get("model") != args.model:
+                continue
+            # Entries from before the layout was recorded sent the inline prompt
+            groups.setdefault(entry.get("prompt_layout", "inline"), []).append(entry)
+
+    print(f"{'layout':<8} {'calls':>7} {'prompt/call':>12} {'cached':>7} {'compl/call':>11} "
+          f"{'$/call':>8} {'latency p50':>12} {'p95':>7}")
+    for layout, entries in sorted(groups.items()):
+        calls = len(entries)
+        prompt = sum(e.get("prompt_tokens", 0) for e in entries)
+        cached = sum(e.get("cached_tokens") or 0 for e in entries)
+        completion = sum(e.get("completion_tokens", 0) for e in entries)
+        cost = ((prompt - cached + cached * CACHED_INPUT_PRICE) * args.input_price
+                + completion * args.output_price) / 1_000_000
+        latencies = [e["latency_ms"] / 1000 for e in entries if "latency_ms" in e]
+        print(f"{layout:<8} {calls:>7} {prompt / calls:>12.0f} {cached / prompt if prompt else 0:>7.0%} "
+              f"{completion / calls:>11.0f} {cost / calls:>8.5f} {_percentile(latencies, 0.5):>11.1f}s "
+              f"{_percentile(latencies, 0.95):>6.1f}s")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark prompt layouts for provider prefix caching")
+    parser.add_argument("--input", type=str, default=None, help="Articles JSON/NDJSON (default: synthetic)")
+    parser.add_argument("--articles", type=int, default=2000, help="Synthetic article count (default: 2000)")
+    parser.add_argument("--packing", default=BATCH_PACKING, choices=["tokens", "fixed"],
+                        help=f"Batching of the planned calls (default: {BATCH_PACKING})")
+    parser.add_argument("--prompt-version", default=None, help="Prompt version (default: active)")
+    parser.add_argument("--input-price", type=float, default=0.27, help="USD per 1M prompt tokens (default: 0.27)")
+    parser.add_argument("--output-price", type=float, default=1.10,
+                        help="USD per 1M completion tokens (default: 1.10)")
+    parser.add_argument("--usage", type=str, default=None,
+                        help="Report real calls from a token_usage.jsonl instead of simulating")
+    parser.add_argument("--model", default=None, help="Only entries for this model (with --usage)")
+    args = parser.parse_args()
+
+    if args.usage:
+        usage_report(Path(args.usage), args)
+    else:
+        simulate(args)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,232 @@
+#!/usr/bin/env python3
+"""
+Benchmark: every scraper against a local replay server, no network needed.
+
+Starts scripts/benchmarks/replay_server.py in its own process (one port per
+source, synthetic or recorded pages, configurable latency/jitter/429s),
+then runs each scraper in a fresh interpreter with its module URL constants
+pointed at the server, over the synthetic date window. Reports per source:
+
+  pages     listing/search + article responses served (server-side count)
+  429s      throttled responses injected
+  pages/s   pages / wall time
+  art/s     articles scraped / wall time
+  cpu s     scraper process CPU time (user + sys) during the run
+  rss MB    scraper process peak RSS
+
+The server's RNG is seeded (--seed), so jitter and 429 placement repeat
+between runs; write --json to diff runs before/after a change.
+
+Usage:
+    python3 scripts/benchmarks/bench_scrapers.py
+    python3 scripts/benchmarks/bench_scrapers.py --sources presseportal sachsen --pages 10 --latency-ms 120 --jitter-ms 40
+    python3 scripts/benchmarks/bench_scrapers.py --rate-429 0.05 --concurrency 20 --json /tmp/after.json
+    python3 scripts/benchmarks/bench_scrapers.py --archive-dir .cache/html_archive --start-date 2026-01-01 --end-date 2026-01-31
+"""
+
+import argparse
+import asyncio
+import contextlib
+import importlib
+import inspect
+import json
+import multiprocessing
+import os
+import resource
+import sys
+import tempfile
+import time
+import urllib.request
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent))
+from scripts.benchmarks.replay_server import SOURCES, SYNTHETIC_END, SYNTHETIC_START, ServerConfig, serve
+
+# source -> (module, scraper class, extra constructor kwargs)
+SCRAPERS = {
+    "presseportal": ("scripts.scrape_blaulicht_async", "AsyncPresseportalScraper", {"bundesland": "hessen"}),
+    "bayern": ("scripts.scrapers.scrape_bayern_polizei", "AsyncBayernPolizeiScraper", {}),
+    "berlin": ("scripts.scrapers.scrape_berlin_polizei", "AsyncBerlinPolizeiScraper", {}),
+    "brandenburg": ("scripts.scrapers.scrape_brandenburg_polizei", "AsyncBrandenburgPolizeiScraper", {}),
+    "hamburg": ("scripts.scrapers.scrape_hamburg_polizei", "AsyncHamburgPolizeiScraper", {}),
+    "sachsen-anhalt": ("scripts.scrapers.scrape_sachsen_anhalt", "AsyncSachsenAnhaltScraper", {}),
+    "sachsen": ("scripts.scrapers.scrape_sachsen_polizei", "AsyncSachsenPolizeiScraper", {}),
+}
+
+
+def patch_module(module, origin: str, no_delays: bool = False) -> None:
+    """Point a scraper module at the local server.
+
+    Rewrites every module-level string starting with the module's BASE_URL
+    (LISTING_URL, SEARCH_API, URL templates, ...) and function defaults
+    bound to it at import time.
+    """
+    real = module.BASE_URL
+    for name, value in list(vars(module).items()):
+        if isinstance(value, str) and value.startswith(real):
+            setattr(module, name, origin + value[len(real):])
+        elif inspect.isfunction(value) and value.__defaults__ and real in value.__defaults__:
+            value.__defaults__ = tuple(origin if d == real else d for d in value.__defaults__)
+        elif no_delays and "DELAY" in name and isinstance(value, (int, float)):
+            setattr(module, name, 0)
+
+
+def _peak_rss_mb() -> float:
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports KiB, macOS bytes
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def run_scraper(source: str, origin: str, options: dict, result_queue) -> None:
+    """Worker process entry point: run one scraper, report its metrics."""
+    module_name, class_name, extra = SCRAPERS[source]
+    module = importlib.import_module(module_name)
+    patch_module(module, origin, no_delays=options["no_delays"])
+    scraper_cls = getattr(module, class_name)
+
+    kwargs = dict(extra)
+    params = inspect.signature(scraper_cls).parameters
+    if options["concurrency"]:
+        kwargs["concurrent_requests" if "concurrent_requests" in params else "concurrent"] = options["concurrency"]
+    if options["parse_workers"] and "parse_workers" in params:
+        kwargs["parse_workers"] = options["parse_workers"]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        scraper = scraper_cls(
+            start_date=options["start_date"],
+            end_date=options["end_date"],
+            output=str(Path(tmp) / f"{source}.json"),
+            cache_dir=tmp,
+            **kwargs,
+        )
+        out = contextlib.nullcontext() if options["verbose"] else contextlib.redirect_stdout(open(os.devnull, "w"))
+        usage_before = resource.getrusage(resource.RUSAGE_SELF)
+        start = time.perf_counter()
+        error = None
+        with out:
+            try:
+                asyncio.run(scraper.run_async())
+            except Exception as e:
+                error = f"{type(e).__name__}: {e}"
+        elapsed = time.perf_counter() - start
+        usage_after = resource.getrusage(resource.RUSAGE_SELF)
+
+    result_queue.put({
+        "source": source,
+        "seconds": elapsed,
+        "articles": len(scraper.articles),
+        "fetch_errors": getattr(scraper, "fetch_errors", None),
+        "cpu_seconds": (usage_after.ru_utime - usage_before.ru_utime) + (usage_after.ru_stime - usage_before.ru_stime),
+        "peak_rss_mb": _peak_rss_mb(),
+        "error": error,
+    })
+
+
+def server_stats(port: int) -> dict:
+    with urllib.request.urlopen(f"http://127.0.0.1:{port}/__stats", timeout=10) as resp:
+        return json.load(resp)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark all scrapers against a local replay server")
+    parser.add_argument("--sources", nargs="+", choices=SOURCES, default=SOURCES,
+                        help="Scrapers to run (default: all)")
+    parser.add_argument("--pages", type=int, default=4,
+                        help="Synthetic listing pages per source (default: 4)")
+    parser.add_argument("--latency-ms", type=float, default=80, help="Server latency per request (default: 80)")
+    parser.add_argument("--jitter-ms", type=float, default=0, help="Uniform ± jitter on latency (default: 0)")
+    parser.add_argument("--rate-429", type=float, default=0.0,
+                        help="Fraction of requests answered 429 with Retry-After (default: 0)")
+    parser.add_argument("--retry-after", type=int, default=1, help="Retry-After seconds on injected 429s (default: 1)")
+    parser.add_argument("--seed", type=int, default=0, help="Server RNG seed (default: 0)")
+    parser.add_argument("--archive-dir", type=str, default=None,
+                        help="Replay pages recorded in this HTML archive (see scrapers/html_archive.py)")
+    parser.add_argument("--start-date", type=str, default=SYNTHETIC_START.isoformat(),
+                        help=f"Scraper start date (default: {SYNTHETIC_START}, the synthetic window)")
+    parser.add_argument("--end-date", type=str, default=SYNTHETIC_END.isoformat(),
+                        help=f"Scraper end date (default: {SYNTHETIC_END})")
+    parser.add_argument("--concurrency", type=int, default=0,
+                        help="Override each scraper's concurrency (default: 0 = scraper default)")
+    parser.add_argument("--parse-workers", type=int, default=0,
+                        help="Parse process pool size, where the scraper supports it (default: 0)")
+    parser.add_argument("--no-delays", action="store_true",
+                        help="Zero the scrapers' fixed politeness sleeps (*DELAY* constants)")
+    parser.add_argument("--json", type=str, default=None, help="Also write results to this JSON file")
+    parser.add_argument("--verbose", "-v", action="store_true", help="Show scraper output")
+    args = parser.parse_args()
+
+    config = ServerConfig(
+        pages=args.pages,
+        latency_s=args.latency_ms / 1000,
+        jitter_s=args.jitter_ms / 1000,
+        rate_429=args.rate_429,
+        retry_after=args.retry_after,
+        archive_dir=args.archive_dir,
+        seed=args.seed,
+    )
+    options = {
+        "start_date": args.start_date,
+        "end_date": args.end_date,
+        "concurrency": args.concurrency,
+        "parse_workers": args.parse_workers,
+        "no_delays": args.no_delays,
+        "verbose": args.verbose,
+    }
+
+    # Fresh interpreters: peak RSS and CPU belong to one scraper, not the harness
+    ctx = multiprocessing.get_context("spawn")
+    port_queue = ctx.Queue()
+    server = ctx.Process(target=serve, args=(port_queue, config, args.sources), daemon=True)
+    server.start()
+    ports = port_queue.get(timeout=30)
+
+    print(f"Replay server: {args.pages} pages/source, {args.latency_ms:.0f}±{args.jitter_ms:.0f}ms latency, "
+          f"{args.rate_429:.0%} 429s, seed {args.seed}"
+          + (f", replaying {args.archive_dir}" if args.archive_dir else ", synthetic pages")
+          + f", {os.cpu_count()} CPU(s)")
+    print(f"{'source':<16}{'articles':>9}{'pages':>7}{'429s':>6}{'seconds':>9}"
+          f"{'pages/s':>9}{'art/s':>8}{'cpu s':>7}{'rss MB':>8}")
+
+    results = []
+    try:
+        for source in args.sources:
+            before = server_stats(ports[source])
+            result_queue = ctx.Queue()
+            worker = ctx.Process(
+                target=run_scraper, args=(source, f"http://127.0.0.1:{ports[source]}", options, result_queue),
+            )
+            worker.start()
+            result = result_queue.get()
+            worker.join()
+            after = server_stats(ports[source])
+
+            served = {key: after[key] - before[key] for key in after}
+            pages = served["listing"] + served["article"] + served["replayed"]
+            result.update({
+                "pages": pages,
+                "listing_pages": served["listing"],
+                "article_pages": served["article"],
+                "replayed_pages": served["replayed"],
+                "not_found": served["missing"],
+                "throttled": served["throttled"],
+                "pages_per_s": pages / result["seconds"] if result["seconds"] else 0.0,
+                "articles_per_s": result["articles"] / result["seconds"] if result["seconds"] else 0.0,
+            })
+            results.append(result)
+
+            print(f"{source:<16}{result['articles']:>9}{pages:>7}{served['throttled']:>6}"
+                  f"{result['seconds']:>9.2f}{result['pages_per_s']:>9.1f}{result['articles_per_s']:>8.1f}"
+                  f"{result['cpu_seconds']:>7.2f}{result['peak_rss_mb']:>8.0f}"
+                  + (f"  ERROR {result['error']}" if result["error"] else ""))
+    finally:
+        server.terminate()
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump({"config": vars(args), "results": results}, f, indent=2)
+        print(f"Wrote {args.json}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,220 @@
+#!/usr/bin/env python3
+"""
+Benchmark: buffered vs streamed LLM responses (JsonArrayStream).
+
+The buffered path waits for the whole completion, then parses it and runs
+the downstream work per record (geocoding in FastEnricher --with-geocode,
+cache write + output in AsyncFastEnricher). The streamed path parses each
+object as it closes and starts its downstream work right away, while the
+model is still writing the next one.
+
+For responses of increasing size this reports time to the first finished
+record and the end-to-end batch latency. The model writes --tokens-per-s
+output tokens after --ttft seconds. Records are handled one at a time,
+each taking --downstream-ms. Object positions and parse times come from
+running the real parsers over the response text.
+
+--usage reads a token_usage.jsonl instead and compares first_record_ms
+with latency_ms for the calls made with --stream-responses.
+
+--check-failed-stream runs AsyncFastEnricher against a fake provider whose
+first streamed response fails after handing on some articles, and checks
+that every article still comes out exactly once.
+
+Usage:
+    python3 scripts/benchmarks/bench_streamed_responses.py
+    python3 scripts/benchmarks/bench_streamed_responses.py --downstream-ms 2
+    python3 scripts/benchmarks/bench_streamed_responses.py --usage .cache/token_usage.jsonl
+    python3 scripts/benchmarks/bench_streamed_responses.py --check-failed-stream
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent))
+from scripts.pipeline.fast_enricher import CHARS_PER_TOKEN, INCIDENT_OUTPUT_TOKENS, JsonArrayStream, parse_llm_array
+
+_BODY = "Am Dienstagabend brachen bislang unbekannte Täter in eine Wohnung in der Hauptstraße ein. "
+
+
+def synthetic_response(incidents: int, per_article: int = 3) -> str:
+    """A JSON array of `incidents` crime records, ~INCIDENT_OUTPUT_TOKENS each, as the model writes it."""
+    record_chars = int(INCIDENT_OUTPUT_TOKENS * CHARS_PER_TOKEN)
+    records = []
+    for n in range(incidents):
+        record = {
+            "article_index": n // per_article,
+            "classification": "crime",
+            "clean_title": f"Einbruch in Wohnung {n}",
+            "is_update": False,
+            "location": {"street": "Hauptstraße", "house_number": str(n), "city": "Dresden", "confidence": 0.9},
+            "incident_time": {"date": "2026-01-12", "time": "21:15", "precision": "exact"},
+            "crime": {"pks_code": "4350", "pks_category": "Wohnungseinbruchdiebstahl", "confidence": 0.9},
+            "details": {"victim_count": 1, "suspect_count": 2, "severity": "property_only"},
+        }
+        filler = record_chars - len(json.dumps(record, ensure_ascii=False))
+        record["incident_body"] = (_BODY * (filler // len(_BODY) + 1))[:max(0, filler)]
+        records.append(record)
+    return "```json\n" + json.dumps(records, ensure_ascii=False, indent=2) + "\n```"
+
+
+def measure(text: str, args) -> dict:
+    """Simulated latencies (seconds) of one response on both paths."""
+    gen_s = len(text) / CHARS_PER_TOKEN / args.tokens_per_s
+    down_s = args.downstream_ms / 1000
+
+    start = time.perf_counter()
+    objects, _ = parse_llm_array(text)
+    buffered_parse = time.perf_counter() - start
+    done = args.ttft + gen_s + buffered_parse
+    buffered = {"first": done + down_s, "batch": done + len(objects) * down_s}
+
+    # Feed the text in stream-sized deltas; note where each object closes
+    parser = JsonArrayStream()
+    closes = []
+    parse_s = 0.0
+    for pos in range(0, len(text), args.delta_chars):
+        start = time.perf_counter()
+        closed = parser.feed(text[pos:pos + args.delta_chars])
+        parse_s += time.perf_counter() - start
+        arrived = args.ttft + min(len(text), pos + args.delta_chars) / len(text) * gen_s
+        closes.extend(arrived + parse_s for _ in closed)
+    finished = 0.0
+    first = None
+    for closed_at in closes:
+        finished = max(finished, closed_at) + down_s
+        first = first if first is not None else finished
+    streamed = {"first": first, "batch": max(finished, args.ttft + gen_s + parse_s)}
+    return {"records": len(objects), "tokens": len(text) / CHARS_PER_TOKEN, "buffered": buffered,
+            "streamed": streamed, "parse_ms": (buffered_parse * 1000, parse_s * 1000)}
+
+
+def simulate(args) -> None:
+    print(f"ttft {args.ttft}s, {args.tokens_per_s:.0f} output tokens/s, "
+          f"{args.downstream_ms}ms downstream per record\n")
+    print(f"{'records':>7} {'tokens':>7}  {'first record':>22}  {'batch':>22}  {'parse ms':>13}")
+    print(f"{'':>7} {'':>7}  {'buffered':>10} {'streamed':>11}  {'buffered':>10} {'streamed':>11}  "
+          f"{'buf':>6} {'str':>6}")
+    for incidents in args.records:
+        r = measure(synthetic_response(incidents), args)
+        b, s = r["buffered"], r["streamed"]
+        print(f"{r['records']:>7} {r['tokens']:>7.0f}  {b['first']:>9.2f}s {s['first']:>10.2f}s  "
+              f"{b['batch']:>9.2f}s {s['batch']:>10.2f}s  {r['parse_ms'][0]:>6.1f} {r['parse_ms'][1]:>6.1f}")
+
+
+def usage_report(path: Path) -> None:
+    """First record vs full latency of streamed calls in token_usage.jsonl."""
+    streamed = []
+    buffered = []
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            try:
+                entry = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+            if entry.get("first_record_ms") is not None:
+                streamed.append(entry)
+            elif not entry.get("streamed"):
+                buffered.append(entry)
+
+    def mean(entries, key):
+        return sum(e.get(key, 0) for e in entries) / len(entries) if entries else 0.0
+
+    print(f"{'':<9} {'calls':>7} {'compl/call':>11} {'latency':>9} {'first record':>13}")
+    for label, entries in (("buffered", buffered), ("streamed", streamed)):
+        first = f"{mean(entries, 'first_record_ms') / 1000:>12.1f}s" if label == "streamed" else f"{'-':>13}"
+        print(f"{label:<9} {len(entries):>7} {mean(entries, 'completion_tokens'):>11.0f} "
+              f"{mean(entries, 'latency_ms') / 1000:>8.1f}s {first}")
+
+
+async def _run_failed_stream(articles: int, streamed_before_failure: int) -> list[str]:
+    from scripts.pipeline.async_enricher import AsyncFastEnricher
+    from scripts.pipeline.fast_enricher import PROVIDERS
+
+    # Never contacted: _call_llm is replaced below
+    for prov in PROVIDERS.values():
+        os.environ.setdefault(prov["api_key_env"], "offline-check")
+
+    calls = 0
+
+    async def fake_call_llm(prompt, max_tokens, batch_size, est_tokens=0, sink=None):
+        nonlocal calls
+        calls += 1
+        records = [{"article_index": i, "classification": "crime", "clean_title": f"Artikel {i}"}
+                   for i in range(batch_size)]
+        if calls == 1:
+            # Stream a few articles, then fail the way a dropped connection does
+            for record in records[:streamed_before_failure + 1]:
+                sink.add(record)
+            return []
+        for record in records:
+            sink.add(record)
+        return records
+
+    with tempfile.TemporaryDirectory() as cache_dir:
+        enricher = AsyncFastEnricher(cache_dir=cache_dir, stream_responses=True)
+        enricher._call_llm = fake_call_llm
+        batch = [{"url": f"https://example.org/{i}", "title": f"Artikel {i}", "body": f"Text {i}"}
+                 for i in range(articles)]
+        emitted = []
+        returned = await enricher._process_single_batch(batch, 1, 1, emitted.append)
+        enricher.cache.close()
+
+    urls = [art["url"] for art, _, _ in emitted + returned]
+    problems = [f"{url} came out {urls.count(url)} times" for url in dict.fromkeys(urls) if urls.count(url) > 1]
+    problems += [f"{art['url']} never came out" for art in batch if art["url"] not in urls]
+    if len(emitted) < streamed_before_failure:
+        problems.append(f"only {len(emitted)} articles were emitted while streaming")
+    if enricher.stats.processed != articles:
+        problems.append(f"stats.processed is {enricher.stats.processed}, expected {articles}")
+    return problems
+
+
+def check_failed_stream(args) -> None:
+    """A streamed batch that fails after a partial emit must not re-emit those articles."""
+    problems = asyncio.run(_run_failed_stream(args.check_articles, args.check_streamed))
+    for problem in problems:
+        print(f"  FAIL {problem}")
+    print(f"{'OK' if not problems else 'FAIL'}: {args.check_articles} articles, stream failed after "
+          f"{args.check_streamed}")
+    sys.exit(1 if problems else 0)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark buffered vs streamed LLM responses")
+    parser.add_argument("--records", type=int, nargs="+", default=[1, 4, 12, 24, 40],
+                        help="Incident records per response (default: 1 4 12 24 40)")
+    parser.add_argument("--ttft", type=float, default=1.5, help="Seconds to the first token (default: 1.5)")
+    parser.add_argument("--tokens-per-s", type=float, default=150.0,
+                        help="Output tokens per second (default: 150)")
+    parser.add_argument("--downstream-ms", type=float, default=150.0,
+                        help="Work per record after parsing, e.g. a HERE geocode (default: 150)")
+    parser.add_argument("--delta-chars", type=int, default=16,
+                        help="Characters per streamed delta (default: 16)")
+    parser.add_argument("--usage", type=str, default=None,
+                        help="Report real calls from a token_usage.jsonl instead of simulating")
+    parser.add_argument("--check-failed-stream", action="store_true",
+                        help="Check that a stream failing after a partial emit yields each article once")
+    parser.add_argument("--check-articles", type=int, default=6,
+                        help="--check-failed-stream: articles in the batch (default: 6)")
+    parser.add_argument("--check-streamed", type=int, default=2,
+                        help="--check-failed-stream: articles emitted before the failure (default: 2)")
+    args = parser.parse_args()
+
+    if args.check_failed_stream:
+        check_failed_stream(args)
+    elif args.usage:
+        usage_report(Path(args.usage))
+    else:
+        simulate(args)
+
+
+if __name__ == "__main__":
+    main()
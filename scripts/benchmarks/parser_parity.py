@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""
+Parity check: lexbor (selectolax) vs BeautifulSoup presseportal article parser.
+
+Runs parse_article_page and parse_article_page_lexbor over every saved HTML
+page in the fixture corpus and compares the returned dicts field for field.
+Exits non-zero on any mismatch, so it can gate a switch of the default backend.
+
+The bundled fixtures are hand-built pages that reproduce presseportal's article
+markup and its edge cases (JSON-LD lists, card-less pages, tags without a
+sibling <ul>, Feuerwehr sources, ...). Add real pages with --record.
+
+Usage:
+    python3 scripts/benchmarks/parser_parity.py
+    python3 scripts/benchmarks/parser_parity.py --record https://www.presseportal.de/blaulicht/pm/4969/6123456
+    python3 scripts/benchmarks/parser_parity.py --fixtures-dir /tmp/pages --verbose
+"""
+
+import argparse
+import re
+import sys
+from pathlib import Path
+
+import requests
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent))
+from scripts.scrape_blaulicht_async import (
+    BASE_URL,
+    USER_AGENT,
+    parse_article_page,
+    parse_article_page_lexbor,
+)
+
+FIXTURES_DIR = Path(__file__).resolve().parent / "fixtures" / "presseportal"
+FIELDS = ["title", "date", "city", "source", "agency_code", "url", "body", "places", "themes"]
+
+
+def fixture_url(path: Path) -> str:
+    """Stable URL handed to both parsers (only echoed back into the dict)."""
+    return f"{BASE_URL}/blaulicht/pm/fixture/{path.stem}"
+
+
+def record(urls: list[str], fixtures_dir: Path) -> None:
+    """Download live article pages into the fixture corpus."""
+    fixtures_dir.mkdir(parents=True, exist_ok=True)
+    for url in urls:
+        resp = requests.get(url, headers={"User-Agent": USER_AGENT}, timeout=30)
+        resp.raise_for_status()
+        name = re.sub(r"[^A-Za-z0-9]+", "_", url.split("/blaulicht/", 1)[-1]).strip("_")
+        out = fixtures_dir / f"live_{name}.html"
+        out.write_text(resp.text, encoding="utf-8")
+        print(f"  Saved {url} -> {out.name} ({len(resp.text):,} chars)")
+
+
+def compare(path: Path) -> list[str]:
+    """Return a list of human-readable field mismatches for one fixture."""
+    html = path.read_text(encoding="utf-8")
+    url = fixture_url(path)
+    expected = parse_article_page(html, url)
+    actual = parse_article_page_lexbor(html, url)
+
+    if expected is None or actual is None:
+        if expected is actual:
+            return []
+        return [f"bs4 returned {expected!r}, lexbor returned {actual!r}"]
+
+    diffs = []
+    for field in FIELDS:
+        if expected.get(field) != actual.get(field):
+            diffs.append(f"{field}: bs4={expected.get(field)!r} lexbor={actual.get(field)!r}")
+    extra = set(expected) ^ set(actual)
+    if extra:
+        diffs.append(f"key mismatch: {sorted(extra)}")
+    return diffs
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Check lexbor vs bs4 article parser parity")
+    parser.add_argument("--fixtures-dir", type=str, default=str(FIXTURES_DIR),
+                        help=f"Directory of saved article pages (default: {FIXTURES_DIR})")
+    parser.add_argument("--record", nargs="+", metavar="URL",
+                        help="Fetch these article URLs into the fixtures dir before checking")
+    parser.add_argument("--verbose", "-v", action="store_true",
+                        help="Print the parsed dict for every fixture")
+    args = parser.parse_args()
+
+    fixtures_dir = Path(args.fixtures_dir)
+    if args.record:
+        print(f"Recording {len(args.record)} page(s)...")
+        record(args.record, fixtures_dir)
+
+    paths = sorted(fixtures_dir.glob("*.html"))
+    if not paths:
+        print(f"No fixtures in {fixtures_dir}")
+        sys.exit(1)
+
+    failures = 0
+    for path in paths:
+        diffs = compare(path)
+        status = "OK  " if not diffs else "FAIL"
+        print(f"  {status} {path.name}")
+        for diff in diffs:
+            print(f"         {diff}")
+        if args.verbose and not diffs:
+            parsed = parse_article_page(path.read_text(encoding="utf-8"), fixture_url(path))
+            for field in FIELDS:
+                print(f"         {field}: {parsed[field]!r}"[:160])
+        failures += bool(diffs)
+
+    print(f"\n{len(paths) - failures}/{len(paths)} fixtures match")
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,457 @@
+#!/usr/bin/env python3
+"""
+Local stand-in for every site the scrapers hit, for offline benchmarks.
+
+Each source gets its own port (so the scrapers' absolute paths work
+unchanged once their BASE_URL points at it) and answers the requests its
+scraper makes:
+
+  presseportal    /blaulicht/l/{state}/{offset} listings, /blaulicht/pm/ articles
+  bayern          POST /es/search (Elasticsearch JSON), article pages
+  berlin          yearly archive listings (?page_at_1_0=N), article pages
+  brandenburg     /suche/... search result pages (10 per page), article pages
+  hamburg         /pressemeldungen/ with .pagination links, article pages
+  sachsen-anhalt  TYPO3 listing (?tx_tsarssinclude_pi1[page]=N), article pages
+  sachsen         /medien/news/search.json (teaser HTML in JSON), article pages
+
+Content is synthetic by default: --pages listing pages per source in each
+site's markup, dated within SYNTHETIC_START..SYNTHETIC_END, newest first.
+With an archive_dir (see scrapers/html_archive.py) every GET whose original
+URL was recorded is replayed verbatim instead; anything not recorded (and
+the Bayern/Sachsen JSON search APIs, which are not archived) stays synthetic.
+
+Every response waits latency ± jitter; a fraction (rate_429) is answered
+with 429 + Retry-After instead. Counters per source (synthetic listing and
+article pages, replayed pages, 404s, 429s) are served at /__stats.
+
+Usage:
+    python3 scripts/benchmarks/replay_server.py --pages 4 --latency-ms 80 --jitter-ms 30 --rate-429 0.02
+    (started in-process by bench_scrapers.py; run standalone to poke at it with curl)
+"""
+
+import argparse
+import asyncio
+import base64
+import json
+import random
+import sys
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta, timezone
+from pathlib import Path
+from typing import Optional
+from urllib.parse import parse_qs
+
+from aiohttp import web
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent))
+from scripts.benchmarks.bench_parse_pool import _nav_padding, synthetic_article_html, synthetic_listing_html
+
+# Synthetic articles fall in this window (scrapers are run with it as their date range)
+SYNTHETIC_START = date(2026, 2, 1)
+SYNTHETIC_END = date(2026, 2, 28)
+
+# Articles per listing/search page, as on the real sites
+PAGE_SIZES = {
+    "presseportal": 30,
+    "bayern": 30,  # ES returns everything at once; pages * 30 articles
+    "berlin": 30,
+    "brandenburg": 10,
+    "hamburg": 20,
+    "sachsen-anhalt": 10,
+    "sachsen": 6,
+}
+
+# Real origin per source, for looking up recorded pages by their original URL
+REAL_ORIGINS = {
+    "presseportal": "https://www.presseportal.de",
+    "bayern": "https://www.polizei.bayern.de",
+    "berlin": "https://www.berlin.de",
+    "brandenburg": "https://polizei.brandenburg.de",
+    "hamburg": "https://www.polizei.hamburg",
+    "sachsen-anhalt": "https://www.sachsen-anhalt.de",
+    "sachsen": "https://medienservice.sachsen.de",
+}
+
+SOURCES = list(PAGE_SIZES)
+
+# Sachsen Polizeidirektion institution IDs; synthetic article n belongs to n % 5
+SACHSEN_INSTITUTIONS = [10996, 10997, 10998, 10976, 10999]
+
+# Hits returned per Bayern ES query; larger windows report the full total
+ES_RESULT_CAP = 1000
+
+
+@dataclass
+class ServerConfig:
+    pages: int = 4
+    latency_s: float = 0.08
+    jitter_s: float = 0.0
+    rate_429: float = 0.0
+    retry_after: Optional[int] = 1  # seconds; None sends 429 without Retry-After
+    archive_dir: Optional[str] = None
+    seed: int = 0
+
+
+def article_datetime(n: int, total: int) -> datetime:
+    """Publication time of synthetic article n (0 = newest) spread over the window."""
+    days = (SYNTHETIC_END - SYNTHETIC_START).days + 1
+    day = SYNTHETIC_END - timedelta(days=n * days // max(total, 1))
+    return datetime(day.year, day.month, day.day, 8 + n % 12, (n * 7) % 60)
+
+
+def _paragraphs(n: int, count: int = 6) -> str:
+    return "".join(
+        f"<p>Absatz {i}: Am Montagabend kam es in der Hauptstraße zu einem Vorfall. "
+        f"Die Polizei bittet Zeugen, sich unter der angegebenen Rufnummer zu melden. "
+        f"Der Sachschaden wird auf etwa {1000 + n} Euro geschätzt.</p>"
+        for i in range(count)
+    )
+
+
+def _page(body: str) -> str:
+    return f"<!DOCTYPE html><html lang=\"de\"><head><meta charset=\"utf-8\"></head><body>{_nav_padding(300)}{body}{_nav_padding(100)}</body></html>"
+
+
+# ---------------------------------------------------------------------------
+# Synthetic sites: respond(request, origin, total) -> (kind, status, body, content_type)
+# kind is "listing", "article" or "missing" (counted in /__stats)
+# ---------------------------------------------------------------------------
+
+Response = tuple[str, int, str, str]
+HTML = "text/html"
+JSON = "application/json"
+
+
+def _missing() -> Response:
+    return "missing", 404, "<html><body>Not found</body></html>", HTML
+
+
+def _article_number(text: str) -> Optional[int]:
+    digits = "".join(ch for ch in text if ch.isdigit())
+    return int(digits) if digits else None
+
+
+async def presseportal_site(request: web.Request, origin: str, total: int) -> Response:
+    parts = request.path.strip("/").split("/")
+    if parts[:2] == ["blaulicht", "l"]:
+        offset = int(parts[3]) if len(parts) > 3 else 0
+        if offset >= total:
+            return "listing", 200, "<html><body><main></main></body></html>", HTML
+        return "listing", 200, synthetic_listing_html(offset, origin), HTML
+    if parts[:2] == ["blaulicht", "pm"] and len(parts) == 4:
+        return "article", 200, synthetic_article_html(int(parts[3]), origin), HTML
+    return _missing()
+
+
+async def bayern_site(request: web.Request, origin: str, total: int) -> Response:
+    if request.path == "/es/search" and request.method == "POST":
+        payload = await request.json()
+        query = json.loads(payload.get("q") or "{}")
+        start = datetime.strptime(query["datefr"], "%d.%m.%Y").date()
+        end = datetime.strptime(query["dateto"], "%d.%m.%Y").date()
+        hits = []
+        for n in range(total):
+            published = article_datetime(n, total)
+            if start <= published.date() <= end:
+                hits.append({"_source": {
+                    "title": f"{n:04d} - Meldung {n} aus Schwaben",
+                    "teaser_text": f"Kurzfassung der Meldung {n}",
+                    "created_date": published.strftime("%d.%m.%Y"),
+                    "sort_date_js": int(published.replace(tzinfo=timezone.utc).timestamp() * 1000),
+                    "creating_organization": "Polizeipräsidium Schwaben Süd/West",
+                    "directory": f"/aktuelles/pressemitteilungen/{n}/",
+                }})
+        # Like the real API: at most ES_RESULT_CAP hits, total counts them all
+        body = {"hits": {"total": {"value": len(hits)}, "hits": hits[:ES_RESULT_CAP]}}
+        return "listing", 200, json.dumps(body), JSON
+    if request.path.startswith("/aktuelles/pressemitteilungen/"):
+        n = _article_number(request.path)
+        if n is None:
+            return _missing()
+        section = base64.b64encode(f"<p>Kempten (ots) - Meldung {n}.</p>{_paragraphs(n, 3)}".encode()).decode()
+        bp_item = json.dumps({"title": "Landkreis Oberallgäu & Kempten", "data": {"iwe2": section}})
+        body = (
+            f"<main><bp-headline title=\"{n:04d} - Meldung {n} aus Schwaben\"></bp-headline>"
+            f"<bp-item json='{bp_item}'></bp-item>{_paragraphs(n, 2)}</main>"
+        )
+        return "article", 200, _page(body), HTML
+    return _missing()
+
+
+async def berlin_site(request: web.Request, origin: str, total: int) -> Response:
+    path = request.path
+    if path.startswith("/polizei/polizeimeldungen/archiv/"):
+        year = _article_number(path)
+        page = int(request.query.get("page_at_1_0", 1))
+        start = (page - 1) * PAGE_SIZES["berlin"]
+        items = ""
+        if year == SYNTHETIC_END.year:
+            for n in range(start, min(start + PAGE_SIZES["berlin"], total)):
+                published = article_datetime(n, total)
+                items += (
+                    f"<li><strong>{published:%d.%m.%Y %H:%M} Uhr</strong> "
+                    f"<a href=\"/polizei/polizeimeldungen/{year}/pressemitteilung.{n}.php\">Meldung {n} in Mitte</a> "
+                    f"<strong>Ereignisort:</strong> Mitte</li>"
+                )
+        pager = ""
+        if year == SYNTHETIC_END.year and page == 1:
+            pages = -(-total // PAGE_SIZES["berlin"])
+            links = "".join(f"<li><a href=\"?page_at_1_0={p}\">{p}</a></li>" for p in range(2, pages + 1))
+            pager = f"<ul class=\"pager\">{links}</ul>"
+        return "listing", 200, _page(f"<ul class=\"list--tablelist\">{items}</ul>{pager}"), HTML
+    if "/pressemitteilung." in path:
+        n = _article_number(path.rsplit("/", 1)[-1])
+        published = article_datetime(n, total)
+        body = (
+            f"<h1>Meldung {n} in Mitte</h1>"
+            f"<p class=\"polizeimeldung\">Polizeimeldung vom {published:%d.%m.%Y}</p>"
+            f"<p class=\"polizeimeldung\">Mitte</p>"
+            f"<section class=\"modul-text_bild\"><div class=\"text\"><div class=\"textile\">"
+            f"<p><strong>Nr. {n:04d}</strong><br/>Einleitung der Meldung {n}.</p>{_paragraphs(n)}"
+            f"</div></div></section>"
+        )
+        return "article", 200, _page(body), HTML
+    return _missing()
+
+
+async def brandenburg_site(request: web.Request, origin: str, total: int) -> Response:
+    path = request.path
+    if path.startswith("/suche/"):
+        page = int(path.rstrip("/").split("/")[-2])
+        start = (page - 1) * PAGE_SIZES["brandenburg"]
+        items = ""
+        for n in range(start, min(start + PAGE_SIZES["brandenburg"], total)):
+            published = article_datetime(n, total)
+            items += (
+                f"<li><a href=\"/pressemeldung/{n}\"><img src=\"/img/{n}.jpg\" alt=\"\"></a>"
+                f"<h4><a href=\"/pressemeldung/{n}\"><strong>Meldung {n} aus Potsdam</strong></a></h4>"
+                f"<span>Artikel vom {published:%d.%m.%Y}</span>"
+                f"<a href=\"/suche/typ/Meldungen/landkreis/Potsdam\">Potsdam</a></li>"
+            )
+        count = f"<p class=\"pbb-searchcount\">{total} Treffer</p>" if page == 1 else ""
+        return "listing", 200, _page(f"{count}<ul class=\"pbb-searchlist\">{items}</ul>"), HTML
+    if path.startswith("/pressemeldung/"):
+        n = _article_number(path)
+        published = article_datetime(n, total)
+        body = (
+            f"<h1 class=\"pbb-mainheadline\" data-iw-field=\"title\">Meldung {n} aus Potsdam</h1>"
+            f"<dl id=\"pbb-metadata\"><dt data-iw-field=\"kategorie\">Kategorie</dt><dd>Kriminalität</dd>"
+            f"<dt>Datum</dt><dd data-iw-field=\"datum\">{published:%d.%m.%Y}</dd></dl>"
+            f"<p class=\"pbb-ort\" data-iw-field=\"ort\">Potsdam</p>"
+            f"<p class=\"pbb-landkreis\" data-iw-field=\"landkreis\">Potsdam</p>"
+            f"<div class=\"pbb-article-text\" data-iw-field=\"text\">{_paragraphs(n)}</div>"
+            f"<p data-iw-field=\"adresse\">Polizeidirektion West<br/>Potsdam</p>"
+        )
+        return "article", 200, _page(body), HTML
+    return _missing()
+
+
+async def hamburg_site(request: web.Request, origin: str, total: int) -> Response:
+    path = request.path
+    if path == "/pressemeldungen/":
+        page = int(request.query.get("page", 1))
+        start = (page - 1) * PAGE_SIZES["hamburg"]
+        items = ""
+        for n in range(start, min(start + PAGE_SIZES["hamburg"], total)):
+            published = article_datetime(n, total)
+            items += (
+                f"<article class=\"teaser\"><h3><a href=\"{origin}/pressemeldungen/{n}\">"
+                f"Meldung {n} aus Altona</a></h3><time datetime=\"{published:%Y-%m-%dT%H:%M:%S}\">"
+                f"{published:%d.%m.%Y}</time></article>"
+            )
+        pagination = ""
+        if page == 1:
+            pages = -(-total // PAGE_SIZES["hamburg"])
+            links = "".join(f"<a href=\"{origin}/pressemeldungen/?page={p}\">{p}</a>" for p in range(2, pages + 1))
+            pagination = f"<nav class=\"pagination\">{links}</nav>"
+        return "listing", 200, _page(f"<main>{items}{pagination}</main>"), HTML
+    if path.startswith("/pressemeldungen/"):
+        n = _article_number(path)
+        published = article_datetime(n, total)
+        body = (
+            f"<meta property=\"article:published_time\" content=\"{published:%Y-%m-%dT%H:%M:%S}\">"
+            f"<article><h1 class=\"headline\">Meldung {n} aus Altona</h1>"
+            f"<div class=\"article-body\">{_paragraphs(n)}</div></article>"
+        )
+        return "article", 200, _page(body), HTML
+    return _missing()
+
+
+async def sachsen_anhalt_site(request: web.Request, origin: str, total: int) -> Response:
+    if request.path != "/bs/pressemitteilungen/polizei":
+        return _missing()
+    query = parse_qs(request.query_string)
+    if query.get("tx_tsarssinclude_pi1[action]") == ["single"]:
+        n = int(query["tx_tsarssinclude_pi1[uid]"][0])
+        published = article_datetime(n, total)
+        body = (
+            f"<meta name=\"date\" content=\"{published:%d.%m.%Y}\">"
+            f"<h1>Magdeburg: Meldung {n}</h1><div class=\"ce-bodytext\">{_paragraphs(n)}</div>"
+        )
+        return "article", 200, _page(body), HTML
+    page = int(query.get("tx_tsarssinclude_pi1[page]", ["1"])[0])
+    start = (page - 1) * PAGE_SIZES["sachsen-anhalt"]
+    items = ""
+    for n in range(start, min(start + PAGE_SIZES["sachsen-anhalt"], total)):
+        published = article_datetime(n, total)
+        href = (f"/bs/pressemitteilungen/polizei?tx_tsarssinclude_pi1%5Baction%5D=single"
+                f"&amp;tx_tsarssinclude_pi1%5Buid%5D={n}")
+        items += (
+            f"<div>{published:%d.%m.%Y} Nr. {n} <a href=\"{href}\">Magdeburg: Meldung {n}</a>"
+            f"<p>Vorschau der Meldung {n}</p><a href=\"{href}\">[weiterlesen]</a></div>"
+        )
+    return "listing", 200, _page(items), HTML
+
+
+async def sachsen_site(request: web.Request, origin: str, total: int) -> Response:
+    path = request.path
+    if path == "/medien/news/search.json":
+        # Honors the institution and date filters, so partitioned discovery sees real subsets
+        institutions = {int(i) for i in request.query.getall("search[institution_ids][]", [])}
+        date_from = request.query.get("search[from]")
+        date_to = request.query.get("search[to]")
+        date_from = datetime.strptime(date_from, "%d.%m.%Y").date() if date_from else date.min
+        date_to = datetime.strptime(date_to, "%d.%m.%Y").date() if date_to else date.max
+        matching = [
+            n for n in range(total)
+            if (not institutions or SACHSEN_INSTITUTIONS[n % len(SACHSEN_INSTITUTIONS)] in institutions)
+            and date_from <= article_datetime(n, total).date() <= date_to
+        ]
+        page = int(request.query.get("page", 1))
+        start = (page - 1) * PAGE_SIZES["sachsen"]
+        end = min(start + PAGE_SIZES["sachsen"], len(matching))
+        teasers = []
+        for n in matching[start:end]:
+            published = article_datetime(n, total)
+            teasers.append(
+                f"<div class=\"box teaser\" id=\"box-{100000 + n}\">"
+                f"<div class=\"box-media-overlay\"><p>Polizeidirektion Dresden</p></div>"
+                f"<div class=\"teaser-text\"><p class=\"time\">{published:%d.%m.%Y, %H:%M} Uhr</p>"
+                f"Meldung {n} aus Dresden</div>"
+                f"<div class=\"box-footer\"><a href=\"/medien/news/{100000 + n}\">Lesen</a></div></div>"
+            )
+        return "listing", 200, json.dumps({"teaser": teasers, "disable": end >= len(matching)}), JSON
+    if path.startswith("/medien/news/"):
+        n = _article_number(path) - 100000
+        published = article_datetime(n, total)
+        body = (
+            f"<meta name=\"date\" content=\"{published:%d.%m.%Y %H:%M}\">"
+            f"<meta name=\"author\" content=\"Polizeidirektion Dresden\">"
+            f"<h1 id=\"page-title\">Meldung {n} aus Dresden</h1>"
+            f"<div class=\"content-col-wide\"><h2>Medieninformation Polizeidirektion Dresden Nr. {n}|26</h2>"
+            f"<h2>Landeshauptstadt Dresden</h2><h3>Vorfall {n}</h3>{_paragraphs(n)}</div>"
+        )
+        return "article", 200, _page(body), HTML
+    return _missing()
+
+
+SITES = {
+    "presseportal": presseportal_site,
+    "bayern": bayern_site,
+    "berlin": berlin_site,
+    "brandenburg": brandenburg_site,
+    "hamburg": hamburg_site,
+    "sachsen-anhalt": sachsen_anhalt_site,
+    "sachsen": sachsen_site,
+}
+
+
+# ---------------------------------------------------------------------------
+# Server
+# ---------------------------------------------------------------------------
+
+def _new_stats() -> dict:
+    return {"listing": 0, "article": 0, "replayed": 0, "missing": 0, "throttled": 0}
+
+
+def build_app(source: str, config: ServerConfig, rng: random.Random, archive=None) -> web.Application:
+    total = config.pages * PAGE_SIZES[source]
+    site = SITES[source]
+    stats = _new_stats()
+
+    async def handle(request: web.Request) -> web.Response:
+        if request.path == "/__stats":
+            return web.json_response(stats)
+
+        delay = config.latency_s + rng.uniform(-config.jitter_s, config.jitter_s)
+        await asyncio.sleep(max(0.0, delay))
+
+        if config.rate_429 and rng.random() < config.rate_429:
+            stats["throttled"] += 1
+            headers = {"Retry-After": str(config.retry_after)} if config.retry_after is not None else {}
+            return web.Response(status=429, text="Too Many Requests", headers=headers)
+
+        if archive is not None and request.method == "GET":
+            recorded = archive.get(REAL_ORIGINS[source] + request.raw_path)
+            if recorded is not None:
+                stats["replayed"] += 1
+                return web.Response(text=recorded, content_type=HTML)
+
+        kind, status, body, content_type = await site(request, f"http://{request.host}", total)
+        stats[kind] += 1
+        return web.Response(status=status, text=body, content_type=content_type)
+
+    app = web.Application()
+    app.router.add_route("*", "/{tail:.*}", handle)
+    return app
+
+
+async def start_servers(config: ServerConfig, sources: list[str]) -> tuple[dict[str, int], list[web.AppRunner]]:
+    """Start one site per source on 127.0.0.1; returns ({source: port}, runners)."""
+    archive = None
+    if config.archive_dir:
+        from scripts.scrapers.html_archive import HtmlArchive
+        archive = HtmlArchive(config.archive_dir, source="replay")
+
+    rng = random.Random(config.seed)
+    ports, runners = {}, []
+    for source in sources:
+        runner = web.AppRunner(build_app(source, config, rng, archive), access_log=None)
+        await runner.setup()
+        site = web.TCPSite(runner, "127.0.0.1", 0)
+        await site.start()
+        ports[source] = site._server.sockets[0].getsockname()[1]
+        runners.append(runner)
+    return ports, runners
+
+
+def serve(port_queue, config: ServerConfig, sources: list[str]) -> None:
+    """Process entry point: start the sites, report their ports, run forever."""
+    async def run() -> None:
+        ports, _ = await start_servers(config, sources)
+        port_queue.put(ports)
+        await asyncio.Event().wait()
+
+    asyncio.run(run())
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Local stand-in for all scraped sites")
+    parser.add_argument("--pages", type=int, default=4, help="Listing pages per source (default: 4)")
+    parser.add_argument("--latency-ms", type=float, default=80, help="Response latency (default: 80)")
+    parser.add_argument("--jitter-ms", type=float, default=0, help="Uniform ± jitter on latency (default: 0)")
+    parser.add_argument("--rate-429", type=float, default=0.0, help="Fraction of requests answered 429 (default: 0)")
+    parser.add_argument("--archive-dir", type=str, default=None, help="Replay pages recorded in this HTML archive")
+    parser.add_argument("--seed", type=int, default=0, help="RNG seed for jitter/429 injection (default: 0)")
+    args = parser.parse_args()
+
+    config = ServerConfig(
+        pages=args.pages, latency_s=args.latency_ms / 1000, jitter_s=args.jitter_ms / 1000,
+        rate_429=args.rate_429, archive_dir=args.archive_dir, seed=args.seed,
+    )
+
+    async def run() -> None:
+        ports, _ = await start_servers(config, SOURCES)
+        for source, port in ports.items():
+            print(f"{source:<16} http://127.0.0.1:{port}")
+        await asyncio.Event().wait()
+
+    try:
+        asyncio.run(run())
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
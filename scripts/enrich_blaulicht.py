@@ -39,6 +39,10 @@ os.environ['SSL_CERT_FILE'] = certifi.where()
 from geopy.geocoders import Nominatim
 from geopy.exc import GeocoderTimedOut, GeocoderServiceError
 
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from scripts.pipeline.enrichment_store import EnrichmentStore, enrichment_fingerprint
+
 # Constants
 DEFAULT_MODEL = "google/gemini-3-flash-preview"
 OPENROUTER_BASE_URL = "https://openrouter.ai/api/v1"
@@ -245,29 +249,22 @@ class EnrichedCrime:
 
 
 class EnrichmentCache:
-    """JSON-based caching for enrichment results."""
-
-    def __init__(self, cache_dir: str = ".cache"):
-        self.cache_dir = Path(cache_dir)
-        self.cache_file = self.cache_dir / "enrichment_cache.json"
-        self.cache: dict = {}
-        self._load()
+    """Enrichment results in the shared SQLite store (pipeline/enrichment_store.py)."""
 
-    def _load(self) -> None:
-        """Load cache from disk if exists."""
-        if self.cache_file.exists():
-            try:
-                with open(self.cache_file, "r", encoding="utf-8") as f:
-                    self.cache = json.load(f)
-            except (json.JSONDecodeError, IOError) as e:
-                print(f"Warning: Could not load enrichment cache: {e}")
-                self.cache = {}
+    def __init__(self, cache_dir: str = ".cache", model: str = DEFAULT_MODEL):
+        self.cache = EnrichmentStore(
+            cache_dir,
+            enrichment_fingerprint(EXTRACTION_PROMPT, model, "openrouter"),
+            prompt_version="enrich_blaulicht", model=model, provider="openrouter",
+        )
+        self.cache_file = self.cache.cache_file
 
     def save(self) -> None:
-        """Persist cache to disk."""
-        self.cache_dir.mkdir(parents=True, exist_ok=True)
-        with open(self.cache_file, "w", encoding="utf-8") as f:
-            json.dump(self.cache, f, ensure_ascii=False, indent=2)
+        """Export the namespace to enrichment_cache.json (read by the admin API routes).
+
+        Every set() is already committed to the store.
+        """
+        self.cache.export_json()
 
     def _make_key(self, url: str, body: str) -> str:
         """Create cache key from article URL and body hash."""
@@ -348,7 +345,7 @@ class ArticleEnricher:
         )
 
         # Initialize caches
-        self.enrichment_cache = EnrichmentCache(cache_dir)
+        self.enrichment_cache = EnrichmentCache(cache_dir, model)
         self.geocode_cache = GeocodeCache(cache_dir) if not no_geocode else None
 
         # Initialize geocoder
@@ -0,0 +1,7 @@
+-- Add per-source listing watermarks to pipeline_poll_state
+-- watermark_url: newest article URL scraped by the last successful live cycle
+-- watermark_published_at: its publication time; listing discovery stops at
+--   a page with nothing newer than this
+
+ALTER TABLE pipeline_poll_state ADD COLUMN IF NOT EXISTS watermark_url TEXT;
+ALTER TABLE pipeline_poll_state ADD COLUMN IF NOT EXISTS watermark_published_at TIMESTAMPTZ;
@@ -0,0 +1,175 @@
+"""
+Article file I/O: JSON arrays and append-only NDJSON.
+
+Scrapers used to load the whole output JSON, merge new articles by URL and
+rewrite it with indent=2 on every run, so live mode and monthly chunks paid
+O(total) per run. With an .ndjson output each article is appended (one JSON
+object per line) as soon as it is parsed; a sidecar <file>.urls (one URL per
+line) makes the URL dedup check cheap without parsing the articles.
+
+Readers accept both formats, chosen by extension:
+    for article in iter_articles("data/x.ndjson"):   # lazy, line by line
+        ...
+    articles = load_articles("data/x.json")           # list, either format
+
+    source = ArticleFile("data/x.json")               # lazy, remembers the shape
+    kept = [a for a in source if keep(a)]
+    json.dump(source.wrap(kept), f)                   # list or {"articles": ...} like the input
+"""
+
+import json
+import re
+from pathlib import Path
+from typing import Iterator, Optional
+
+NDJSON_SUFFIXES = (".ndjson", ".jsonl")
+
+
+def is_ndjson(path) -> bool:
+    return Path(path).suffix in NDJSON_SUFFIXES
+
+
+def meta_path_for(output: str) -> str:
+    """x.json / x.ndjson -> x.meta.json"""
+    return re.sub(r"\.(nd)?json(l)?$", "", str(output)) + ".meta.json"
+
+
+class ArticleFile:
+    """Articles of a JSON array/{"articles": [...]} file or an NDJSON file.
+
+    Iterating reads lazily (NDJSON line by line; a truncated last line from
+    a crash mid-append is skipped). Once read, `wrapper` holds the other
+    keys of a {"articles": [...]} file (None for a list or NDJSON), and
+    wrap() gives output the same shape as the input.
+    """
+
+    def __init__(self, path):
+        self.path = Path(path)
+        self.wrapper: Optional[dict] = None
+
+    def __iter__(self) -> Iterator[dict]:
+        if not is_ndjson(self.path):
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            if isinstance(data, list):
+                yield from data
+            else:
+                self.wrapper = {k: v for k, v in data.items() if k != "articles"}
+                yield from data.get("articles", [])
+            return
+
+        with open(self.path, "r", encoding="utf-8") as f:
+            for lineno, line in enumerate(f, 1):
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    yield json.loads(line)
+                except json.JSONDecodeError:
+                    print(f"  WARN: skipping unparsable line {lineno} in {self.path}")
+
+    def wrap(self, articles: list[dict]):
+        """`articles` as a list, or as {**wrapper, "articles": ...} if the input was wrapped."""
+        return articles if self.wrapper is None else {**self.wrapper, "articles": articles}
+
+
+def iter_articles(path) -> Iterator[dict]:
+    """Yield articles from a JSON array/{"articles": [...]} file or an NDJSON file."""
+    return iter(ArticleFile(path))
+
+
+def load_articles(path) -> list[dict]:
+    return list(iter_articles(path))
+
+
+class NdjsonArticleWriter:
+    """Append articles to an NDJSON file, skipping URLs already in it."""
+
+    def __init__(self, path: str):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.index_path = self.path.with_name(self.path.name + ".urls")
+        self.urls = self._load_index()
+        self.existing_count = len(self.urls)
+        self.new_count = 0
+        self._drop_torn_line()
+        self._file = open(self.path, "a", encoding="utf-8")
+        self._index = open(self.index_path, "a", encoding="utf-8")
+
+    def _load_index(self) -> set[str]:
+        if self.index_path.exists():
+            with open(self.index_path, "r", encoding="utf-8") as f:
+                return {line.rstrip("\n") for line in f if line.strip()}
+        if not self.path.exists():
+            return set()
+        # Sidecar missing (first run after an upgrade, or deleted): rebuild it
+        urls = {a.get("url") for a in iter_articles(self.path) if a.get("url")}
+        with open(self.index_path, "w", encoding="utf-8") as f:
+            f.writelines(f"{url}\n" for url in urls)
+        return urls
+
+    def _drop_torn_line(self) -> None:
+        """Cut off a partial last line left by a crash mid-append.
+
+        Appending after it would glue the next article onto the fragment,
+        and readers would skip both. The fragment's article may already be
+        in the .urls sidecar, so it is dropped from there too.
+        """
+        if not self.path.exists() or not self.path.stat().st_size:
+            return
+        with open(self.path, "rb+") as f:
+            f.seek(-1, 2)
+            if f.read(1) == b"\n":
+                return
+            # Scan back in blocks for the last complete line
+            end = f.tell()
+            pos = end
+            cut = 0
+            while pos > 0:
+                step = min(65536, pos)
+                pos -= step
+                f.seek(pos)
+                block = f.read(step)
+                newline = block.rfind(b"\n")
+                if newline >= 0:
+                    cut = pos + newline + 1
+                    break
+            f.seek(cut)
+            fragment = f.read(end - cut)
+            f.truncate(cut)
+        print(f"  WARN: dropped a {len(fragment)}-byte partial line at the end of {self.path}")
+
+        # A URL indexed for the torn article would make the next run skip it
+        match = re.search(rb'"url":\s*"((?:[^"\\]|\\.)*)"', fragment)
+        url = json.loads(b'"' + match.group(1) + b'"') if match else None
+        if url in self.urls:
+            self.urls.discard(url)
+            with open(self.index_path, "w", encoding="utf-8") as f:
+                f.writelines(f"{u}\n" for u in self.urls)
+
+    def __contains__(self, url: str) -> bool:
+        return url in self.urls
+
+    def append(self, article: dict) -> bool:
+        """Write one article; returns False if its URL is already in the file."""
+        url: Optional[str] = article.get("url")
+        if url and url in self.urls:
+            return False
+        self._file.write(json.dumps(article, ensure_ascii=False) + "\n")
+        self._file.flush()
+        if url:
+            self.urls.add(url)
+            self._index.write(url + "\n")
+            self._index.flush()
+        self.new_count += 1
+        return True
+
+    def close(self) -> None:
+        self._file.close()
+        self._index.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
@@ -2,7 +2,8 @@
 """
 Async parallel enrichment for Blaulicht articles.
 
-Uses AsyncOpenAI + asyncio.Semaphore for high-concurrency LLM calls.
+Uses AsyncOpenAI with a shared adaptive concurrency limit (llm_limiter.py)
+for high-concurrency LLM calls.
 Replaces the synchronous fast_enricher.py for bulk backfill scenarios.
 
 No geocoding — always deferred to post_geocode.py.
@@ -19,19 +20,29 @@ Usage:
         --input-dir data/pipeline/chunks/raw/ \
         --output-dir data/pipeline/chunks/enriched/ \
         --concurrency 30
+
+Concurrency starts at --concurrency and adapts (llm_limiter.py): it grows
+towards --max-concurrency while latency and errors stay flat and halves
+on provider 429s.
+
+--stream-responses streams each completion and hands an article on (cache
+write, output file) as soon as its incidents have arrived, instead of
+after the whole batch response.
 """
 
 import asyncio
 import hashlib
 import json
 import os
-import re
+import random
 import signal
 import sys
 import time
 import uuid
+from collections import deque
 from dataclasses import dataclass, field
 from pathlib import Path
+from typing import AsyncIterable, AsyncIterator, Callable, Optional
 
 import certifi
 from dotenv import load_dotenv
@@ -51,19 +62,54 @@ from .fast_enricher import (
     DEFAULT_PROVIDER,
     UNIFIED_BATCH_SIZE,
     UNIFIED_MAX_TOKENS,
+    BATCH_PACKING,
+    CHARS_PER_TOKEN,
+    SALVAGE_MAX_ROUNDS,
+    STREAM_RESPONSES,
+    PROMPT_LAYOUT,
+    CACHED_INPUT_PRICE,
+    JsonArrayStream,
+    build_messages,
+    cached_prompt_tokens,
+    chat_messages,
+    drop_last_article,
+    estimate_article_tokens,
     load_prompt,
+    missing_article_indices,
+    parse_llm_array,
+    plan_batches,
+    salvage_batches,
 )
+from .article_io import ArticleFile, load_articles
+from .enrichment_store import EnrichmentStore, enrichment_fingerprint
+from .llm_limiter import AdaptiveLimiter
 from .config import (
     ASYNC_CONCURRENCY,
+    ASYNC_MAX_CONCURRENCY,
+    ASYNC_MIN_CONCURRENCY,
+    ASYNC_THROTTLE_COOLDOWN,
     ASYNC_BATCH_SIZE,
-    ASYNC_CACHE_SAVE_INTERVAL,
     ASYNC_MAX_RETRIES,
     ASYNC_RETRY_BASE_DELAY,
     ASYNC_RETRY_MAX_DELAY,
+    ASYNC_STREAM_WINDOW_FACTOR,
+    ASYNC_STREAM_READ_AHEAD,
     CACHE_DIR,
 )
 
 
+def _retry_after_seconds(error: RateLimitError) -> float | None:
+    """Retry-After of a 429, if the provider sent one in seconds."""
+    try:
+        return float(error.response.headers.get("retry-after"))
+    except (AttributeError, TypeError, ValueError):
+        return None
+
+
+# (article, enriched_records, removed_record) — both empty when the LLM skipped the article
+ArticleResult = tuple[dict, list[dict], Optional[dict]]
+
+
 @dataclass
 class Stats:
     """Tracks enrichment progress and performance."""
@@ -77,9 +123,19 @@ class Stats:
     errors: int = 0
     retries: int = 0
     llm_calls: int = 0
+    truncated: int = 0
+    partial_responses: int = 0  # responses parsed from an incomplete JSON array
+    requeued: int = 0           # articles a batch left out, re-queued in smaller batches
+    salvaged: int = 0           # of those, returned by a follow-up batch
+    lost: int = 0               # still missing after SALVAGE_MAX_ROUNDS
+    streamed_calls: int = 0
+    first_record_s: float = 0.0  # summed time to the first parsed object of streamed calls
+    stream_late: int = 0         # objects for an article already handed on (dropped)
     prompt_tokens: int = 0
+    cached_tokens: int = 0       # prompt tokens served from the provider's prefix cache
     completion_tokens: int = 0
     start_time: float = field(default_factory=time.time)
+    limiter: Optional[AdaptiveLimiter] = None
 
     @property
     def elapsed(self) -> float:
@@ -98,14 +154,36 @@ class Stats:
             return float("inf")
         return remaining / self.articles_per_min
 
+    @property
+    def tokens_per_call(self) -> tuple[float, float]:
+        """Mean (prompt, completion) tokens per LLM call."""
+        if not self.llm_calls:
+            return 0.0, 0.0
+        return self.prompt_tokens / self.llm_calls, self.completion_tokens / self.llm_calls
+
+    @property
+    def mean_first_record_s(self) -> float:
+        return self.first_record_s / self.streamed_calls if self.streamed_calls else 0.0
+
+    @property
+    def salvage_rate(self) -> float:
+        """Share of re-queued articles a follow-up batch recovered."""
+        return self.salvaged / self.requeued if self.requeued else 0.0
+
     @property
     def estimated_cost(self) -> float:
         """Estimated cost in USD (grok-4-fast pricing, approximate)."""
         # Rough average — actual price depends on provider/model
-        return (self.prompt_tokens * 0.27 + self.completion_tokens * 1.10) / 1_000_000
+        uncached = self.prompt_tokens - self.cached_tokens
+        input_cost = (uncached + self.cached_tokens * CACHED_INPUT_PRICE) * 0.27
+        return (input_cost + self.completion_tokens * 1.10) / 1_000_000
+
+    @property
+    def cached_share(self) -> float:
+        """Share of prompt tokens served from the provider's cache."""
+        return self.cached_tokens / self.prompt_tokens if self.prompt_tokens else 0.0
 
     def progress_line(self) -> str:
-        remaining = self.total - self.cached - self.cached_removed - self.processed
         eta = f"{self.eta_minutes:.1f}min" if self.eta_minutes < 1000 else "?"
         return (
             f"  [{self.processed}/{self.total - self.cached - self.cached_removed} uncached] "
@@ -113,9 +191,46 @@ class Stats:
             f"ETA {eta} | "
             f"${self.estimated_cost:.3f} | "
             f"{self.retries} retries, {self.errors} errors"
+            + (f" | salvaged {self.salvaged}/{self.requeued}" if self.requeued else "")
+            + (f" | {self.limiter.status()}" if self.limiter else "")
         )
 
 
+class _ArticleSink:
+    """Hands on each article of a streamed response once its incidents are complete.
+
+    The model writes an article's incidents together, so an article is
+    complete when the next article_index starts. The last one waits for
+    the end of the response, which may have been cut off mid-article.
+    """
+
+    def __init__(self, on_complete: Callable[[int, list[dict]], None], stats: Stats):
+        self._on_complete = on_complete
+        self._stats = stats
+        self._done: set = set()
+        self._replayed: set = set()
+        self._idx = None
+        self._incidents: list[dict] = []
+
+    def restart(self) -> None:
+        """A retried call streams the response again from the start."""
+        self._replayed = set(self._done)
+        self._idx, self._incidents = None, []
+
+    def add(self, obj: dict) -> None:
+        idx = obj.get("article_index")
+        if idx in self._done:
+            if idx not in self._replayed:
+                self._stats.stream_late += 1
+            return
+        if idx != self._idx:
+            if self._idx is not None:
+                self._done.add(self._idx)
+                self._on_complete(self._idx, self._incidents)
+            self._idx, self._incidents = idx, []
+        self._incidents.append(obj)
+
+
 class AsyncFastEnricher:
     """Async parallel article enricher using AsyncOpenAI."""
 
@@ -127,6 +242,10 @@ class AsyncFastEnricher:
         model: str = None,
         prompt_version: str = None,
         provider: str = None,
+        packing: str = BATCH_PACKING,
+        max_concurrency: int = ASYNC_MAX_CONCURRENCY,
+        stream_responses: bool = STREAM_RESPONSES,
+        prompt_layout: str = PROMPT_LAYOUT,
     ):
         # Load prompt config first — it may supply model/provider defaults
         self.prompt_config = load_prompt(version=prompt_version)
@@ -145,142 +264,195 @@ class AsyncFastEnricher:
         self.model = model or self.prompt_config.get("model") or prov["default_model"]
         self.max_output_tokens = self.prompt_config.get("max_tokens") or prov.get("max_output_tokens", UNIFIED_MAX_TOKENS)
         self.batch_size = batch_size or prov.get("batch_size", ASYNC_BATCH_SIZE)
+        self.packing = packing
+        self.stream_responses = stream_responses
+        self.prompt_layout = prompt_layout
         self.prompt_version = prompt_version
 
         self.cache_dir = Path(cache_dir)
-        self.cache_file = self.cache_dir / "enrichment_cache.json"
-        self.cache = self._load_cache(self.cache_file)
+        # SQLite store: each batch's entries are committed as it completes,
+        # so parallel enricher processes can share the cache dir. Namespaced by
+        # prompt/model/provider: runs with the same fingerprint reuse each other's work.
+        self.cache = EnrichmentStore(
+            cache_dir,
+            enrichment_fingerprint(self.prompt_config["template"], self.model, effective_provider, prompt_layout),
+            prompt_version=self.prompt_config["version"], model=self.model, provider=effective_provider,
+        )
 
-        self._semaphore = asyncio.Semaphore(concurrency)
+        # Starts at `concurrency`, grows towards max_concurrency while latency
+        # and errors stay flat, halves on 429s (max_concurrency == concurrency pins it)
+        self._limiter = AdaptiveLimiter(
+            concurrency,
+            max_limit=max_concurrency,
+            min_limit=min(ASYNC_MIN_CONCURRENCY, concurrency),
+            tokens_per_minute=prov.get("tokens_per_minute"),
+            cooldown=ASYNC_THROTTLE_COOLDOWN,
+            max_cooldown=ASYNC_RETRY_MAX_DELAY,
+        )
         self._cache_lock = asyncio.Lock()
-        self._save_counter = 0
         self._shutdown = False
 
-        self.stats = Stats()
-
-    def _load_cache(self, path: Path) -> dict:
-        if path.exists():
-            try:
-                with open(path, "r", encoding="utf-8") as f:
-                    return json.load(f)
-            except Exception:
-                return {}
-        return {}
-
-    def _save_cache_sync(self) -> None:
-        self.cache_dir.mkdir(parents=True, exist_ok=True)
-        with open(self.cache_file, "w", encoding="utf-8") as f:
-            json.dump(self.cache, f, ensure_ascii=False)
-
-    async def _save_cache_async(self) -> None:
-        """Non-blocking cache save via thread pool."""
-        # Snapshot the cache dict under lock, then write in thread
-        async with self._cache_lock:
-            snapshot = dict(self.cache)
-        await asyncio.to_thread(self._write_cache_snapshot, snapshot)
-
-    def _write_cache_snapshot(self, snapshot: dict) -> None:
-        self.cache_dir.mkdir(parents=True, exist_ok=True)
-        tmp = self.cache_file.with_suffix(".tmp")
-        with open(tmp, "w", encoding="utf-8") as f:
-            json.dump(snapshot, f, ensure_ascii=False)
-        tmp.rename(self.cache_file)
+        self.stats = Stats(limiter=self._limiter)
 
     @staticmethod
     def _cache_key(url: str, body: str) -> str:
         return hashlib.sha256(f"{url}:{body}".encode()).hexdigest()[:16]
 
-    async def _call_llm(self, prompt: str, max_tokens: int, batch_size: int) -> list[dict]:
-        """Call LLM with semaphore-controlled concurrency and retry logic."""
+    async def _call_llm(
+        self, prompt: str | list[dict], max_tokens: int, batch_size: int, est_tokens: int = 0,
+        sink: Optional["_ArticleSink"] = None,
+    ) -> list[dict]:
+        """Call LLM under the shared adaptive limiter, with retry logic.
+
+        A 429 puts every caller into the limiter's global cooldown rather
+        than backing off per request; timeouts back off per request, outside
+        the slot. With stream_responses, objects go to `sink` as they close.
+        `prompt` is a prompt string or the messages from build_messages().
+        """
         last_error = None
 
         for attempt in range(ASYNC_MAX_RETRIES):
             if self._shutdown:
                 return []
 
-            async with self._semaphore:
-                try:
-                    start_time = time.time()
+            await self._limiter.acquire(est_tokens)
+            outcome, latency_s, used_tokens, retry_after, backoff = "error", None, None, None, 0.0
+            try:
+                start_time = time.time()
+                first_record_s = None
+                if self.stream_responses:
+                    results, complete, finish_reason, usage, first_record_s = await self._stream_completion(
+                        prompt, max_tokens, sink,
+                    )
+                else:
                     response = await self.client.chat.completions.create(
                         model=self.model,
-                        messages=[{"role": "user", "content": prompt}],
+                        messages=chat_messages(prompt),
                         temperature=0.1,
                         max_tokens=max_tokens,
                     )
-                    latency_ms = int((time.time() - start_time) * 1000)
-                    text = response.choices[0].message.content
-
-                    # Track token usage
-                    if response.usage:
-                        self.stats.prompt_tokens += response.usage.prompt_tokens
-                        self.stats.completion_tokens += response.usage.completion_tokens
-
-                    self.stats.llm_calls += 1
-
-                    # Log token usage to file (non-blocking)
-                    if response.usage:
-                        entry = {
-                            "timestamp": time.time(),
-                            "model": self.model,
-                            "prompt_tokens": response.usage.prompt_tokens,
-                            "completion_tokens": response.usage.completion_tokens,
-                            "total_tokens": response.usage.total_tokens,
-                            "batch_size": batch_size,
-                            "latency_ms": latency_ms,
-                        }
-                        asyncio.create_task(self._log_usage(entry))
-
-                    # Parse JSON response
-                    text = text.strip()
-                    if "```json" in text:
-                        text = text.split("```json", 1)[1]
-                    if "```" in text:
-                        text = text.split("```")[0]
-
-                    match = re.search(r"\[[\s\S]*\]", text)
-                    if match:
-                        return json.loads(match.group())
-                    return []
-
-                except RateLimitError as e:
-                    last_error = e
-                    self.stats.retries += 1
-                    # Exponential backoff with jitter
-                    import random
-                    delay = min(
-                        ASYNC_RETRY_BASE_DELAY * (2 ** attempt) + random.uniform(0, 1),
-                        ASYNC_RETRY_MAX_DELAY,
-                    )
-                    if attempt == 0:
-                        print(f"    Rate limited, backing off {delay:.1f}s...")
-                    await asyncio.sleep(delay)
-
-                except (APITimeoutError, APIConnectionError) as e:
-                    last_error = e
-                    self.stats.retries += 1
-                    import random
-                    delay = min(
-                        ASYNC_RETRY_BASE_DELAY * (2 ** attempt) + random.uniform(0, 1),
-                        ASYNC_RETRY_MAX_DELAY,
-                    )
-                    await asyncio.sleep(delay)
+                    finish_reason = response.choices[0].finish_reason
+                    usage = response.usage
+                latency_s = time.time() - start_time
+                latency_ms = int(latency_s * 1000)
+                outcome = "ok"
+                if finish_reason == "length":
+                    self.stats.truncated += 1
+
+                # Track token usage
+                cached_tokens = cached_prompt_tokens(usage) if usage else None
+                if usage:
+                    used_tokens = usage.total_tokens
+                    self.stats.prompt_tokens += usage.prompt_tokens
+                    self.stats.cached_tokens += cached_tokens or 0
+                    self.stats.completion_tokens += usage.completion_tokens
+
+                self.stats.llm_calls += 1
+                if first_record_s is not None:
+                    self.stats.streamed_calls += 1
+                    self.stats.first_record_s += first_record_s
+
+                # Log token usage to file (non-blocking)
+                if usage:
+                    entry = {
+                        "timestamp": time.time(),
+                        "model": self.model,
+                        "prompt_tokens": usage.prompt_tokens,
+                        "completion_tokens": usage.completion_tokens,
+                        "total_tokens": usage.total_tokens,
+                        "batch_size": batch_size,
+                        "latency_ms": latency_ms,
+                        "finish_reason": finish_reason,
+                        "packing": self.packing,
+                        "concurrency": int(self._limiter.limit),
+                        "streamed": self.stream_responses,
+                        "cached_tokens": cached_tokens,
+                        "prompt_layout": self.prompt_layout if isinstance(prompt, list) else "inline",
+                    }
+                    if first_record_s is not None:
+                        entry["first_record_ms"] = int(first_record_s * 1000)
+                    asyncio.create_task(self._log_usage(entry))
+
+                if not self.stream_responses:
+                    results, complete = parse_llm_array(response.choices[0].message.content)
+                if not complete and results:
+                    self.stats.partial_responses += 1
+                return results
+
+            except RateLimitError as e:
+                last_error = e
+                outcome = "throttled"
+                retry_after = _retry_after_seconds(e)
+                self.stats.retries += 1
+
+            except (APITimeoutError, APIConnectionError) as e:
+                last_error = e
+                self.stats.retries += 1
+                # Exponential backoff with jitter
+                backoff = min(
+                    ASYNC_RETRY_BASE_DELAY * (2 ** attempt) + random.uniform(0, 1),
+                    ASYNC_RETRY_MAX_DELAY,
+                )
+
+            except APIError as e:
+                # Non-retryable API errors
+                self.stats.errors += 1
+                print(f"    LLM API error: {e}")
+                return []
 
-                except APIError as e:
-                    # Non-retryable API errors
-                    self.stats.errors += 1
-                    print(f"    LLM API error: {e}")
-                    return []
+            except Exception as e:
+                self.stats.errors += 1
+                print(f"    LLM error: {e}")
+                return []
 
-                except Exception as e:
-                    self.stats.errors += 1
-                    print(f"    LLM error: {e}")
-                    return []
+            finally:
+                self._limiter.release(
+                    outcome, latency_s=latency_s, est_tokens=est_tokens,
+                    used_tokens=used_tokens, retry_after=retry_after,
+                )
+
+            if backoff:
+                await asyncio.sleep(backoff)
 
         # All retries exhausted
         self.stats.errors += 1
         print(f"    LLM failed after {ASYNC_MAX_RETRIES} retries: {last_error}")
         return []
 
+    async def _stream_completion(self, prompt: str | list[dict], max_tokens: int, sink: Optional["_ArticleSink"] = None):
+        """Streamed completion parsed as it arrives.
+
+        Returns (objects, complete, finish_reason, usage, first_record_s).
+        """
+        start_time = time.time()
+        stream = await self.client.chat.completions.create(
+            model=self.model,
+            messages=chat_messages(prompt),
+            temperature=0.1,
+            max_tokens=max_tokens,
+            stream=True,
+            stream_options={"include_usage": True},
+        )
+        if sink:
+            sink.restart()
+        parser = JsonArrayStream()
+        objects, finish_reason, usage, first_record_s = [], None, None, None
+        async for chunk in stream:
+            usage = getattr(chunk, "usage", None) or usage
+            if not chunk.choices:
+                continue
+            choice = chunk.choices[0]
+            finish_reason = choice.finish_reason or finish_reason
+            for obj in parser.feed(choice.delta.content or ""):
+                if first_record_s is None:
+                    first_record_s = time.time() - start_time
+                objects.append(obj)
+                if sink:
+                    sink.add(obj)
+        if not parser.closed:
+            objects = drop_last_article(objects)
+        return objects, parser.closed, finish_reason, usage, first_record_s
+
     async def _log_usage(self, entry: dict) -> None:
         """Log token usage to JSONL file (fire-and-forget)."""
         try:
@@ -296,7 +468,7 @@ class AsyncFastEnricher:
         with open(path, "a") as f:
             f.write(line)
 
-    async def _enrich_batch(self, batch: list[dict]) -> list[dict]:
+    async def _enrich_batch(self, batch: list[dict], sink: Optional["_ArticleSink"] = None) -> list[dict]:
         """Enrich a single batch of articles via LLM."""
         articles_data = []
         for i, art in enumerate(batch):
@@ -309,12 +481,19 @@ class AsyncFastEnricher:
                 "source": art.get("source", ""),
             })
 
-        prompt = self.prompt_config["template"].format(
-            count=len(batch),
-            articles_json=json.dumps(articles_data, ensure_ascii=False, indent=2),
+        messages = build_messages(
+            self.prompt_config["template"],
+            json.dumps(articles_data, ensure_ascii=False, indent=2),
+            len(batch),
+            self.prompt_layout,
         )
+        # For the limiter's TPM budget: prompt plus expected output
+        prompt_chars = sum(len(m["content"]) for m in messages)
+        est_tokens = int(prompt_chars / CHARS_PER_TOKEN) + sum(estimate_article_tokens(art)[1] for art in batch)
 
-        return await self._call_llm(prompt, max_tokens=self.max_output_tokens, batch_size=len(batch))
+        return await self._call_llm(
+            messages, max_tokens=self.max_output_tokens, batch_size=len(batch), est_tokens=est_tokens, sink=sink,
+        )
 
     def _process_llm_results(
         self, batch: list[dict], llm_results: list[dict]
@@ -376,68 +555,178 @@ class AsyncFastEnricher:
 
         return results, removed
 
+    async def _enrich_with_salvage(
+        self, batch: list[dict], on_article: Optional[Callable[[int, dict, dict], None]] = None,
+        delivered: Optional[set[int]] = None,
+    ) -> tuple[dict[int, list[dict]], dict[int, dict]]:
+        """Enrich a batch; re-queue articles the response left out in smaller batches.
+
+        Truncation, a miscounted article_index or a failed call leave
+        articles without results. Those go out again split in two, up to
+        SALVAGE_MAX_ROUNDS times; whatever is still missing stays uncached
+        for the next run. With stream_responses, on_article(idx, results,
+        removed) is called for each article as soon as its incidents are
+        complete. Indices in `delivered` (filled by on_article's caller) are
+        never re-queued, even if the stream failed after handing them on.
+        Returns (results_by_batch_idx, removed_by_batch_idx).
+        """
+        delivered = delivered if delivered is not None else set()
+        results: dict[int, list[dict]] = {}
+        removed: dict[int, dict] = {}
+        groups = [list(range(len(batch)))]
+
+        def handle(group: list[int], llm_results: list[dict]) -> None:
+            group_results, group_removed = self._process_llm_results([batch[i] for i in group], llm_results)
+            for local, idx in enumerate(group):
+                if local in group_results:
+                    results[idx] = group_results[local]
+                elif local in group_removed:
+                    removed[idx] = group_removed[local]
+
+        def sink_for(group: list[int]) -> Optional[_ArticleSink]:
+            if not on_article:
+                return None
+
+            def complete(local: int, incidents: list[dict]) -> None:
+                if 0 <= local < len(group):
+                    handle(group, incidents)
+                    on_article(group[local], results.get(group[local]), removed.get(group[local]))
+
+            return _ArticleSink(complete, self.stats)
+
+        for salvage_round in range(SALVAGE_MAX_ROUNDS + 1):
+            responses = await asyncio.gather(
+                *(self._enrich_batch([batch[i] for i in group], sink_for(group)) for group in groups)
+            )
+            missing = []
+            for group, llm_results in zip(groups, responses):
+                handle(group, llm_results)
+                missing.extend(
+                    group[i] for i in missing_article_indices(llm_results, len(group))
+                    if group[i] not in delivered
+                )
+
+            if salvage_round:
+                self.stats.salvaged += sum(len(g) for g in groups) - len(missing)
+            if not missing or self._shutdown:
+                break
+            if salvage_round == SALVAGE_MAX_ROUNDS:
+                self.stats.lost += len(missing)
+                break
+            if not salvage_round:
+                self.stats.requeued += len(missing)
+            groups = salvage_batches(missing)
+
+        return results, removed
+
+    def _article_result(
+        self, art: dict, records: Optional[list[dict]], removed: Optional[dict]
+    ) -> tuple[ArticleResult, Optional[tuple[str, list[dict]]]]:
+        """(result, cache write) for one article of an LLM batch; no write if the LLM skipped it."""
+        key = self._cache_key(art.get("url", ""), art.get("body", ""))
+        if removed:
+            classification = removed["_removal_reason"].split(":")[1]
+            reason = removed.get("_triage_reason", "")
+            self.stats.removed += 1
+            return (art, [], removed), (key, [{"_classification": classification, "reason": reason}])
+        if records:
+            # Store enrichment data (without original article fields) in cache
+            cache_entries = []
+            for record in records:
+                cache_entry = {
+                    k: v for k, v in record.items()
+                    if k not in ("title", "body", "date", "city", "url", "source",
+                                 "bundesland", "source_url", "scraped_at")
+                }
+                cache_entries.append(cache_entry)
+            self.stats.enriched += len(records)
+            return (art, records, None), (key, cache_entries)
+        return (art, [], None), None
+
     async def _process_single_batch(
-        self, batch: list[dict], batch_num: int, total_batches: int
-    ) -> tuple[list[dict], list[dict], list[dict]]:
+        self, batch: list[dict], batch_num: int, total_batches: int,
+        emit: Optional[Callable[[ArticleResult], None]] = None,
+    ) -> list[ArticleResult]:
         """Process one batch: call LLM, parse results, update cache.
 
-        Returns: (enriched_records, removed_records, cache_entries_to_write)
+        Returns one (article, enriched_records, removed_record) per article.
+        With stream_responses and `emit`, articles whose incidents are
+        complete are cached and passed to emit() while the response is
+        still streaming, and left out of the returned list.
         """
         if self._shutdown:
-            return [], [], []
-
-        llm_results = await self._enrich_batch(batch)
-        results_by_idx, removed_by_idx = self._process_llm_results(batch, llm_results)
+            return []
+
+        emitted: set[int] = set()
+
+        def on_article(idx: int, records: Optional[list[dict]], removed: Optional[dict]) -> None:
+            if idx in emitted:
+                return
+            result, cache_write = self._article_result(batch[idx], records, removed)
+            if cache_write:
+                self.cache.put_many([cache_write])
+            self.stats.processed += 1
+            emitted.add(idx)
+            emit(result)
+
+        streaming = self.stream_responses and emit is not None
+        results_by_idx, removed_by_idx = await self._enrich_with_salvage(
+            batch, on_article if streaming else None, emitted,
+        )
 
-        enriched = []
-        removed = []
+        results: list[ArticleResult] = []
 
         # Update cache and collect results
         async with self._cache_lock:
+            cache_writes = []
             for idx in range(len(batch)):
-                art = batch[idx]
-                key = self._cache_key(art.get("url", ""), art.get("body", ""))
-
-                if idx in removed_by_idx:
-                    classification = removed_by_idx[idx]["_removal_reason"].split(":")[1]
-                    reason = removed_by_idx[idx].get("_triage_reason", "")
-                    self.cache[key] = [{"_classification": classification, "reason": reason}]
-                    removed.append(removed_by_idx[idx])
-                    self.stats.removed += 1
-                elif idx in results_by_idx:
-                    # Store enrichment data (without original article fields) in cache
-                    cache_entries = []
-                    for record in results_by_idx[idx]:
-                        cache_entry = {
-                            k: v for k, v in record.items()
-                            if k not in ("title", "body", "date", "city", "url", "source",
-                                         "bundesland", "source_url", "scraped_at")
-                        }
-                        cache_entries.append(cache_entry)
-                    self.cache[key] = cache_entries
-                    enriched.extend(results_by_idx[idx])
-                    self.stats.enriched += len(results_by_idx[idx])
-
-            self.stats.processed += len(batch)
-            self._save_counter += len(batch)
-
-        # Periodic cache save
-        if self._save_counter >= ASYNC_CACHE_SAVE_INTERVAL:
-            self._save_counter = 0
-            await self._save_cache_async()
-
-        return enriched, removed, []
+                if idx in emitted:
+                    continue
+                result, cache_write = self._article_result(
+                    batch[idx], results_by_idx.get(idx), removed_by_idx.get(idx),
+                )
+                if cache_write:
+                    cache_writes.append(cache_write)
+                results.append(result)
+
+            # One transaction per batch
+            self.cache.put_many(cache_writes)
+            self.stats.processed += len(batch) - len(emitted)
+
+        return results
+
+    def _cached_result(self, art: dict, cached) -> ArticleResult:
+        """Result for an article from its cache entry (records or junk sentinel)."""
+        entries = cached if isinstance(cached, list) else [cached]
+        if len(entries) == 1 and entries[0].get("_classification"):
+            self.stats.cached_removed += 1
+            return art, [], {
+                **art,
+                "_removal_reason": f"llm:{entries[0]['_classification']}",
+                "_triage_reason": entries[0].get("reason", ""),
+            }
+        self.stats.cached += 1
+        return art, [{**art, **e} for e in entries], None
+
+    @staticmethod
+    def _assign_solo_groups(records: list[dict]) -> None:
+        """Give ungrouped records their own incident group (no clustering here)."""
+        for rec in records:
+            if not rec.get("incident_group_id"):
+                rec["incident_group_id"] = uuid.uuid4().hex[:12]
+                rec["group_role"] = "primary"
 
     async def enrich_all(self, articles: list[dict]) -> tuple[list[dict], list[dict]]:
         """Enrich all articles with async concurrent LLM calls.
 
         Returns: (enriched_records, removed_records)
         """
-        self.stats = Stats(total=len(articles))
+        self.stats = Stats(total=len(articles), limiter=self._limiter)
 
         print(f"\n{'='*60}")
         print(f"Async parallel enrichment: {len(articles)} articles")
-        print(f"  Concurrency: {self._semaphore._value}, Batch size: {self.batch_size}")
+        batching = f"{self.packing} packing" if self.packing == "tokens" else f"Batch size: {self.batch_size}"
+        print(f"  Concurrency: {int(self._limiter.limit)} (adaptive, max {self._limiter.max_limit}), {batching}")
         print(f"  Model: {self.model}")
         print(f"  Cache: {len(self.cache)} entries")
         print(f"{'='*60}")
@@ -450,23 +739,14 @@ class AsyncFastEnricher:
         all_enriched = []
         all_removed = []
 
-        for art in articles:
-            key = self._cache_key(art.get("url", ""), art.get("body", ""))
-            if key in self.cache:
-                cached = self.cache[key]
-                entries = cached if isinstance(cached, list) else [cached]
-
-                if len(entries) == 1 and entries[0].get("_classification"):
-                    cls = entries[0]["_classification"]
-                    all_removed.append({
-                        **art,
-                        "_removal_reason": f"llm:{cls}",
-                        "_triage_reason": entries[0].get("reason", ""),
-                    })
-                    self.stats.cached_removed += 1
-                else:
-                    all_enriched.extend([{**art, **e} for e in entries])
-                    self.stats.cached += 1
+        keys = [self._cache_key(art.get("url", ""), art.get("body", "")) for art in articles]
+        cached_by_key = self.cache.get_many(keys)
+        for art, key in zip(articles, keys):
+            if key in cached_by_key:
+                _, records, removed = self._cached_result(art, cached_by_key[key])
+                all_enriched.extend(records)
+                if removed:
+                    all_removed.append(removed)
             else:
                 uncached.append(art)
 
@@ -477,16 +757,16 @@ class AsyncFastEnricher:
             print("  All articles cached — nothing to do!")
             return all_enriched, all_removed
 
-        # Batch uncached articles
+        # Batch uncached articles (token packing puts the largest calls first)
         batches = [
-            uncached[i : i + self.batch_size]
-            for i in range(0, len(uncached), self.batch_size)
+            [uncached[i] for i in indices]
+            for indices in plan_batches(uncached, self.packing, self.batch_size, self.max_output_tokens)
         ]
         total_batches = len(batches)
-        print(f"  Batches: {total_batches} ({self.batch_size} articles each)")
+        print(f"  Batches: {total_batches} ({len(uncached) / total_batches:.1f} articles each on average)")
         print()
 
-        # Fire all batches as async tasks
+        # Fire all batches as async tasks; the semaphore admits them in this order
         tasks = [
             asyncio.create_task(
                 self._process_single_batch(batch, i + 1, total_batches)
@@ -500,9 +780,10 @@ class AsyncFastEnricher:
 
         for coro in asyncio.as_completed(tasks):
             try:
-                enriched, removed, _ = await coro
-                all_enriched.extend(enriched)
-                all_removed.extend(removed)
+                for _, records, removed in await coro:
+                    all_enriched.extend(records)
+                    if removed:
+                        all_removed.append(removed)
             except Exception as e:
                 self.stats.errors += 1
                 print(f"    Batch error: {e}")
@@ -517,10 +798,7 @@ class AsyncFastEnricher:
         print(self.stats.progress_line(), flush=True)
 
         # Assign group IDs (solo, no clustering)
-        for art in all_enriched:
-            if not art.get("incident_group_id"):
-                art["incident_group_id"] = uuid.uuid4().hex[:12]
-                art["group_role"] = "primary"
+        self._assign_solo_groups(all_enriched)
 
         # Final stats
         print(f"\n{'='*60}")
@@ -528,18 +806,213 @@ class AsyncFastEnricher:
         print(f"  Enriched: {len(all_enriched)} records")
         print(f"  Removed: {len(all_removed)} articles")
         print(f"  LLM calls: {self.stats.llm_calls}")
+        prompt_per_call, completion_per_call = self.stats.tokens_per_call
+        print(f"  Tokens/call: {prompt_per_call:.0f} prompt ({self.stats.cached_share:.0%} cached) + "
+              f"{completion_per_call:.0f} completion, {self.stats.truncated} truncated")
+        if self.stats.streamed_calls:
+            print(f"  Streamed responses: first record after {self.stats.mean_first_record_s:.1f}s on average, "
+                  f"{self.stats.stream_late} late objects dropped")
         print(f"  Cost: ${self.stats.estimated_cost:.3f}")
         print(f"  Throughput: {self.stats.articles_per_min:.0f} articles/min")
         print(f"  Retries: {self.stats.retries}, Errors: {self.stats.errors}")
+        print(f"  Salvage: {self.stats.salvaged}/{self.stats.requeued} re-queued articles recovered "
+              f"({self.stats.salvage_rate:.0%}), {self.stats.lost} lost, "
+              f"{self.stats.partial_responses} partial responses")
+        print(f"  Limiter: {self._limiter.status()}")
         print(f"{'='*60}\n")
 
         return all_enriched, all_removed
 
+    async def enrich_stream(
+        self,
+        articles: AsyncIterable[dict],
+        window: Optional[int] = None,
+        read_ahead: int = ASYNC_STREAM_READ_AHEAD,
+    ) -> AsyncIterator[ArticleResult]:
+        """Enrich articles from an async iterator, yielding results as batches complete.
+
+        enrich_all() needs the whole input up front and creates a task per
+        batch. Here `read_ahead` articles at a time are read, answered from
+        the cache or packed into batches, and no more than about `window`
+        batches are in flight (default: ASYNC_STREAM_WINDOW_FACTOR x the
+        limiter's max concurrency, so the adaptive limit can grow to its
+        ceiling). Memory stays flat however long the input is,
+        and the first results arrive after the first batch. Yields one
+        (article, enriched_records, removed_record) per article, in
+        completion order; the articles of a batch that fails are yielded
+        with no records, so consumers counting pending articles still finish.
+        """
+        self.stats = Stats(limiter=self._limiter)
+        window = window or ASYNC_STREAM_WINDOW_FACTOR * self._limiter.max_limit
+        source = articles.__aiter__()
+        in_flight: set[asyncio.Task] = set()
+        batch_of: dict[asyncio.Task, list[dict]] = {}
+        # Articles handed on mid-response (stream_responses), and the ids of
+        # those already handed on for batches still in flight
+        ready: deque[ArticleResult] = deque()
+        ready_event = asyncio.Event()
+        emitted: set[int] = set()
+
+        def emit(result: ArticleResult) -> None:
+            ready.append(result)
+            emitted.add(id(result[0]))
+            ready_event.set()
+
+        exhausted = False
+        batch_num = 0
+        last_report = time.time()
+
+        print(f"\n{'='*60}")
+        print(f"Async streaming enrichment (window {window} batches, read-ahead {read_ahead})")
+        print(f"  Concurrency: {int(self._limiter.limit)} (adaptive, max {self._limiter.max_limit}), "
+              f"{self.packing} packing")
+        print(f"  Model: {self.model}")
+        print(f"{'='*60}")
+
+        while True:
+            # Top up the window
+            while not exhausted and not self._shutdown and len(in_flight) < window:
+                chunk = []
+                while len(chunk) < read_ahead:
+                    try:
+                        chunk.append(await source.__anext__())
+                    except StopAsyncIteration:
+                        exhausted = True
+                        break
+                if not chunk:
+                    break
+                self.stats.total += len(chunk)
+
+                keys = [self._cache_key(art.get("url", ""), art.get("body", "")) for art in chunk]
+                cached_by_key = self.cache.get_many(keys)
+                uncached = []
+                for art, key in zip(chunk, keys):
+                    if key in cached_by_key:
+                        result = self._cached_result(art, cached_by_key[key])
+                        self._assign_solo_groups(result[1])
+                        yield result
+                    else:
+                        uncached.append(art)
+
+                for indices in plan_batches(uncached, self.packing, self.batch_size, self.max_output_tokens):
+                    batch_num += 1
+                    batch = [uncached[i] for i in indices]
+                    task = asyncio.create_task(self._process_single_batch(batch, batch_num, 0, emit))
+                    in_flight.add(task)
+                    batch_of[task] = batch
+
+            if not in_flight:
+                break
+
+            waiter = asyncio.create_task(ready_event.wait())
+            done, _ = await asyncio.wait(in_flight | {waiter}, return_when=asyncio.FIRST_COMPLETED)
+            waiter.cancel()
+            ready_event.clear()
+            in_flight -= done
+            while ready:
+                result = ready.popleft()
+                self._assign_solo_groups(result[1])
+                yield result
+            for task in done - {waiter}:
+                batch = batch_of.pop(task)
+                try:
+                    results = task.result()
+                except Exception as e:
+                    self.stats.errors += 1
+                    print(f"    Batch error: {e}")
+                    # Resolve the batch's articles without records, as enrich_all drops them
+                    results = [(art, [], None) for art in batch if id(art) not in emitted]
+                emitted.difference_update(id(art) for art in batch)
+                for result in results:
+                    self._assign_solo_groups(result[1])
+                    yield result
+
+            now = time.time()
+            if now - last_report >= 5.0:
+                print(self.stats.progress_line(), flush=True)
+                last_report = now
+
+        print(self.stats.progress_line(), flush=True)
+        prompt_per_call, completion_per_call = self.stats.tokens_per_call
+        print(f"  Streamed {self.stats.total} articles in {self.stats.elapsed:.1f}s: "
+              f"{self.stats.cached + self.stats.cached_removed} cached, {self.stats.processed} via "
+              f"{self.stats.llm_calls} LLM calls ({prompt_per_call:.0f} + {completion_per_call:.0f} tokens/call, "
+              f"{self.stats.cached_share:.0%} of prompt cached), "
+              f"{self.stats.truncated} truncated")
+        if self.stats.streamed_calls:
+            print(f"  Streamed responses: first record after {self.stats.mean_first_record_s:.1f}s on average, "
+                  f"{self.stats.stream_late} late objects dropped")
+        print(f"  Salvage: {self.stats.salvaged}/{self.stats.requeued} re-queued articles recovered "
+              f"({self.stats.salvage_rate:.0%}), {self.stats.lost} lost, "
+              f"{self.stats.partial_responses} partial responses")
+
     async def save_cache(self) -> None:
-        await self._save_cache_async()
+        """Export the namespace to enrichment_cache.json for the admin API routes.
+
+        Batches are committed as they complete; only the legacy JSON the
+        dashboard reads needs writing at the end of a run. Runs on the loop
+        thread, which owns the store's SQLite connection.
+        """
+        self.save_cache_sync()
 
     def save_cache_sync(self) -> None:
-        self._save_cache_sync()
+        """save_cache() for callers outside a coroutine."""
+        count = self.cache.export_json()
+        print(f"Exported {count} enrichment cache entries to {self.cache.legacy_file}")
+
+
+class StreamedOutput:
+    """One output file fed by enrich_stream results.
+
+    Records are appended to <output>.partial.ndjson as they complete, so
+    results reach disk within seconds and none are held in memory. Once the
+    input is read (`reading` False) and every article handed to the
+    enricher is resolved (`pending` 0), finish() rewrites them as the JSON
+    array the rest of the pipeline reads.
+    """
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self.partial = self.path.with_name(self.path.name + ".partial.ndjson")
+        self.partial.parent.mkdir(parents=True, exist_ok=True)
+        self._file = open(self.partial, "w", encoding="utf-8")
+        self.pending = 0
+        self.reading = True
+        self.records = 0
+        self.finished = False
+
+    @property
+    def done(self) -> bool:
+        return not self.reading and self.pending == 0
+
+    def add(self, records: list[dict]) -> None:
+        """Resolve one article with its enriched records (possibly none)."""
+        for rec in records:
+            self._file.write(json.dumps(rec, ensure_ascii=False) + "\n")
+        self._file.flush()
+        self.records += len(records)
+        self.pending -= 1
+
+    def finish(self) -> int:
+        """Write the JSON array (only if there are records); returns the record count."""
+        self._file.close()
+        if self.records:
+            tmp = self.path.with_suffix(".tmp")
+            with open(self.partial, "r", encoding="utf-8") as src, open(tmp, "w", encoding="utf-8") as dst:
+                dst.write("[")
+                for i, line in enumerate(src):
+                    dst.write(",\n" if i else "\n")
+                    dst.write(line.rstrip("\n"))
+                dst.write("\n]\n")
+            tmp.replace(self.path)
+        self.partial.unlink(missing_ok=True)
+        self.finished = True
+        return self.records
+
+    def discard(self) -> None:
+        """Drop an unfinished output (shutdown); its results are in the cache."""
+        self._file.close()
+        self.partial.unlink(missing_ok=True)
 
 
 async def _run_single_file(
@@ -552,16 +1025,15 @@ async def _run_single_file(
     model: str = None,
     no_prefilter: bool = False,
     provider: str = None,
+    packing: str = BATCH_PACKING,
+    max_concurrency: int = ASYNC_MAX_CONCURRENCY,
+    stream_responses: bool = STREAM_RESPONSES,
+    prompt_layout: str = PROMPT_LAYOUT,
 ) -> tuple[int, int]:
     """Enrich a single input file. Returns (enriched_count, removed_count)."""
-    # Load articles
-    with open(input_path, "r", encoding="utf-8") as f:
-        data = json.load(f)
-
-    if isinstance(data, list):
-        articles = data
-    else:
-        articles = data.get("articles", [])
+    # Load articles (JSON or NDJSON)
+    source = ArticleFile(input_path)
+    articles = list(source)  # batches are planned over the whole input
 
     if not articles:
         print(f"No articles in {input_path}")
@@ -593,6 +1065,10 @@ async def _run_single_file(
         model=model,
         prompt_version=prompt_version,
         provider=provider,
+        packing=packing,
+        max_concurrency=max_concurrency,
+        stream_responses=stream_responses,
+        prompt_layout=prompt_layout,
     )
 
     # Handle graceful shutdown
@@ -617,7 +1093,7 @@ async def _run_single_file(
 
     # Save output
     output_path.parent.mkdir(parents=True, exist_ok=True)
-    output_data = {"articles": enriched} if isinstance(data, dict) else enriched
+    output_data = {"articles": enriched} if source.wrapper is not None else enriched
     with open(output_path, "w", encoding="utf-8") as f:
         json.dump(output_data, f, ensure_ascii=False, indent=2)
 
@@ -641,8 +1117,17 @@ async def _run_directory(
     model: str = None,
     no_prefilter: bool = False,
     provider: str = None,
+    packing: str = BATCH_PACKING,
+    max_concurrency: int = ASYNC_MAX_CONCURRENCY,
+    stream_responses: bool = STREAM_RESPONSES,
+    prompt_layout: str = PROMPT_LAYOUT,
 ) -> None:
-    """Enrich all JSON files in a directory tree."""
+    """Enrich all JSON files in a directory tree.
+
+    Files are read one at a time and streamed through enrich_stream, so
+    memory does not grow with the tree; each output file is written as
+    soon as all of its articles are resolved.
+    """
     # Find all JSON files recursively
     input_files = sorted(input_dir.rglob("*.json"))
     if not input_files:
@@ -651,46 +1136,10 @@ async def _run_directory(
 
     print(f"Found {len(input_files)} JSON files in {input_dir}")
 
-    # Load all articles from all files, tracking which file each came from
-    all_articles = []
-    file_ranges: list[tuple[Path, int, int]] = []  # (output_path, start_idx, end_idx)
-
-    for input_file in input_files:
-        rel = input_file.relative_to(input_dir)
-        output_file = output_dir / rel
-
-        with open(input_file, "r", encoding="utf-8") as f:
-            data = json.load(f)
-        articles = data if isinstance(data, list) else data.get("articles", [])
-
-        if not articles:
-            continue
-
-        start_idx = len(all_articles)
-        all_articles.extend(articles)
-        file_ranges.append((output_file, start_idx, start_idx + len(articles)))
-
-    print(f"Total: {len(all_articles)} articles across {len(file_ranges)} files")
-
-    # Optional pre-filter
-    prefilter_removed = []
     if not no_prefilter:
         from .filter_articles import is_junk_article
 
-        kept = []
-        kept_indices = []
-        for i, art in enumerate(all_articles):
-            reason = is_junk_article(art)
-            if reason:
-                prefilter_removed.append({**art, "_removal_reason": f"prefilter:{reason}"})
-            else:
-                kept.append(art)
-                kept_indices.append(i)
-        if prefilter_removed:
-            print(f"Pre-filter: removed {len(prefilter_removed)}, kept {len(kept)}")
-        all_articles = kept
-
-    # Enrich all at once (single enricher, single cache)
+    # Single enricher, single cache
     enricher = AsyncFastEnricher(
         cache_dir=cache_dir,
         concurrency=concurrency,
@@ -698,6 +1147,10 @@ async def _run_directory(
         model=model,
         prompt_version=prompt_version,
         provider=provider,
+        packing=packing,
+        max_concurrency=max_concurrency,
+        stream_responses=stream_responses,
+        prompt_layout=prompt_layout,
     )
 
     loop = asyncio.get_running_loop()
@@ -709,41 +1162,51 @@ async def _run_directory(
     for sig in (signal.SIGINT, signal.SIGTERM):
         loop.add_signal_handler(sig, _signal_shutdown)
 
-    try:
-        enriched, removed = await enricher.enrich_all(all_articles)
-    except Exception:
-        enricher.save_cache_sync()
-        raise
-
+    outputs: list[StreamedOutput] = []
+    owner: dict[int, StreamedOutput] = {}  # id(article) -> its output, while in flight
+    counts = {"prefilter_removed": 0, "removed": 0, "enriched": 0}
+
+    def _finish(output: StreamedOutput) -> None:
+        n = output.finish()
+        counts["enriched"] += n
+        if n:
+            print(f"  Saved {n} to {output.path}")
+
+    async def _articles():
+        for input_file in input_files:
+            if enricher._shutdown:
+                return
+            output = StreamedOutput(output_dir / input_file.relative_to(input_dir))
+            outputs.append(output)
+            for art in await asyncio.to_thread(load_articles, input_file):
+                if not no_prefilter and is_junk_article(art):
+                    counts["prefilter_removed"] += 1
+                    continue
+                owner[id(art)] = output
+                output.pending += 1
+                yield art
+            output.reading = False
+            if output.done:
+                _finish(output)
+
+    async for art, records, removed in enricher.enrich_stream(_articles()):
+        output = owner.pop(id(art))
+        output.add(records)
+        if removed:
+            counts["removed"] += 1
+        if output.done:
+            _finish(output)
+
+    unfinished = [o for o in outputs if not o.finished]
+    for output in unfinished:
+        output.discard()
+    if unfinished:
+        reason = "shutdown" if enricher._shutdown else "incomplete"
+        print(f"  {len(unfinished)} files left unwritten ({reason}) — rerun to resume from the cache")
     await enricher.save_cache()
 
-    # Split results back into per-file outputs based on source URL matching
-    # Build a lookup from (url, body_hash) to enriched records
-    enriched_by_url: dict[str, list[dict]] = {}
-    for rec in enriched:
-        url = rec.get("url", "")
-        enriched_by_url.setdefault(url, []).append(rec)
-
-    for output_file, start_idx, end_idx in file_ranges:
-        # Reconstruct which articles were in this file
-        file_enriched = []
-        orig_range = range(start_idx, end_idx)
-        for idx in orig_range:
-            if idx < len(all_articles):  # Could be out of bounds after prefilter
-                art = all_articles[idx] if not no_prefilter else all_articles[idx]
-                url = art.get("url", "")
-                if url in enriched_by_url:
-                    file_enriched.extend(enriched_by_url.pop(url, []))
-
-        if file_enriched:
-            output_file.parent.mkdir(parents=True, exist_ok=True)
-            with open(output_file, "w", encoding="utf-8") as f:
-                json.dump(file_enriched, f, ensure_ascii=False, indent=2)
-            print(f"  Saved {len(file_enriched)} to {output_file}")
-
-    total_enriched = len(enriched)
-    total_removed = len(prefilter_removed) + len(removed)
-    print(f"\nBatch complete: {total_enriched} enriched, {total_removed} removed")
+    total_removed = counts["prefilter_removed"] + counts["removed"]
+    print(f"\nBatch complete: {counts['enriched']} enriched, {total_removed} removed")
 
 
 def main():
@@ -766,11 +1229,20 @@ def main():
     # Tuning
     parser.add_argument(
         "--concurrency", "-c", type=int, default=ASYNC_CONCURRENCY,
-        help=f"Max concurrent LLM requests (default: {ASYNC_CONCURRENCY})",
+        help=f"Starting concurrent LLM requests (default: {ASYNC_CONCURRENCY})",
+    )
+    parser.add_argument(
+        "--max-concurrency", type=int, default=ASYNC_MAX_CONCURRENCY,
+        help=f"Ceiling for the adaptive concurrency; set to --concurrency to pin it "
+             f"(default: {ASYNC_MAX_CONCURRENCY})",
     )
     parser.add_argument(
         "--batch-size", "-b", type=int, default=ASYNC_BATCH_SIZE,
-        help=f"Articles per LLM call (default: {ASYNC_BATCH_SIZE})",
+        help=f"Articles per LLM call with --packing fixed (default: {ASYNC_BATCH_SIZE})",
+    )
+    parser.add_argument(
+        "--packing", default=BATCH_PACKING, choices=["tokens", "fixed"],
+        help=f"Batch articles by token budget or in fixed-size batches (default: {BATCH_PACKING})",
     )
 
     # Options
@@ -780,6 +1252,11 @@ def main():
     parser.add_argument("--provider", default=None, choices=list(PROVIDERS.keys()),
                         help="LLM provider (default: openrouter)")
     parser.add_argument("--no-prefilter", action="store_true", help="Skip regex pre-filter")
+    parser.add_argument("--stream-responses", action="store_true", default=STREAM_RESPONSES,
+                        help="Stream completions and hand on each article as its incidents arrive")
+    parser.add_argument("--prompt-layout", default=PROMPT_LAYOUT, choices=["system", "inline"],
+                        help=f"Instructions as a cacheable system message or inline in one user message "
+                             f"(default: {PROMPT_LAYOUT})")
 
     args = parser.parse_args()
 
@@ -807,6 +1284,10 @@ def main():
                 model=args.model,
                 no_prefilter=args.no_prefilter,
                 provider=args.provider,
+                packing=args.packing,
+                max_concurrency=max(args.max_concurrency, args.concurrency),
+                stream_responses=args.stream_responses,
+                prompt_layout=args.prompt_layout,
             )
         )
     else:
@@ -824,6 +1305,10 @@ def main():
                 model=args.model,
                 no_prefilter=args.no_prefilter,
                 provider=args.provider,
+                packing=args.packing,
+                max_concurrency=max(args.max_concurrency, args.concurrency),
+                stream_responses=args.stream_responses,
+                prompt_layout=args.prompt_layout,
             )
         )
 
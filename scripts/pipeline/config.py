@@ -89,12 +89,16 @@ MAX_RETRIES = 3
 RETRY_DELAYS_SECONDS = [60, 300, 900]  # 1min, 5min, 15min
 
 # Async enrichment settings (async_enricher.py)
-ASYNC_CONCURRENCY = 30           # Max concurrent LLM requests
+ASYNC_CONCURRENCY = 30           # Starting concurrent LLM requests (adaptive, see llm_limiter.py)
+ASYNC_MAX_CONCURRENCY = 100      # Ceiling the adaptive limit may grow to
+ASYNC_MIN_CONCURRENCY = 2        # Floor for throttle cuts
+ASYNC_THROTTLE_COOLDOWN = 5.0    # First global cooldown after a 429 without Retry-After (doubles per episode)
 ASYNC_BATCH_SIZE = 8             # Articles per LLM call
-ASYNC_CACHE_SAVE_INTERVAL = 500  # Save cache every N articles
 ASYNC_MAX_RETRIES = 5            # Per-request retries on 429
 ASYNC_RETRY_BASE_DELAY = 1.0    # Exponential backoff base (seconds)
 ASYNC_RETRY_MAX_DELAY = 60.0    # Cap on retry delay
+ASYNC_STREAM_WINDOW_FACTOR = 2   # In-flight batches in enrich_stream per slot of ASYNC_MAX_CONCURRENCY (keeps the limiter fed as it grows)
+ASYNC_STREAM_READ_AHEAD = 400    # Articles enrich_stream reads, cache-checks and packs at a time
 
 # API Keys (loaded from environment)
 # HERE_API_KEY - Required for geocoding (set in .env)
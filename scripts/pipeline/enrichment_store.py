@@ -0,0 +1,489 @@
+"""
+SQLite-backed enrichment cache, shared by every enricher.
+
+Replaces enrichment_cache.json, which FastEnricher, AsyncFastEnricher,
+post_geocode, quality_fix and enrich_blaulicht each loaded whole at startup
+and rewrote whole on save. Saving a 10^6-entry cache took seconds and the
+dict copy doubled memory. Parallel enricher subprocesses on one cache dir
+also overwrote each other's file.
+
+Here every put is a single upsert committed immediately (WAL mode), so
+writers in several processes interleave safely. A crash loses nothing, and
+opening the store costs the same at any size. EnrichmentStore behaves like
+the old dict (key in store, store[key], store[key] = value, pop, items), and
+get_many() looks up a whole batch of keys in one query.
+
+Entries are namespaced by a fingerprint of the prompt template, model,
+provider and prompt layout (enrichment_fingerprint()). Switching
+prompts/active.txt, --model or --prompt-layout starts a fresh namespace
+instead of serving stale results, and the old one stays for switching
+back. A/B runs with identical fingerprints share their entries. `report`
+lists the namespaces and `prune` drops them.
+
+The legacy JSON is imported on first open into the "legacy" namespace and
+left in place: the admin API routes still read it. Its prompt is unknown,
+so enrichers do not read it; an enricher opening an empty namespace warns
+about it instead. `adopt` copies legacy entries into a fingerprint, for
+when you know which prompt produced them. The enrichers rewrite the JSON
+from their namespace plus the legacy entries it lacks at the end of each
+run (export_json), and `export` does the same by hand.
+
+Usage:
+    from scripts.pipeline.enrichment_store import EnrichmentStore, enrichment_fingerprint
+    cache = EnrichmentStore(".cache", enrichment_fingerprint(template, model, provider))
+    cached = cache.get_many(keys)
+
+    python3 -m scripts.pipeline.enrichment_store report --cache-dir .cache
+    python3 -m scripts.pipeline.enrichment_store prune --fingerprint 3fa2c1d9e0ab --cache-dir .cache
+    python3 -m scripts.pipeline.enrichment_store prune --unused-days 30 --cache-dir .cache
+    python3 -m scripts.pipeline.enrichment_store adopt --to 3fa2c1d9e0ab --cache-dir .cache
+    python3 -m scripts.pipeline.enrichment_store import --cache-dir .cache
+    python3 -m scripts.pipeline.enrichment_store export --cache-dir .cache
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import sqlite3
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Iterable, Iterator, Optional
+
+# SQLite's default limit on host parameters is 999 on older builds
+_IN_CHUNK = 900
+
+_MISSING = object()
+
+# Namespace of entries whose prompt/model is unknown (imported JSON, pre-fingerprint stores)
+LEGACY_FINGERPRINT = "legacy"
+
+_CREATE_ENRICHMENTS = (
+    "CREATE TABLE IF NOT EXISTS enrichments ("
+    " fingerprint TEXT NOT NULL,"
+    " key TEXT NOT NULL,"
+    " value TEXT NOT NULL,"
+    " updated_at TEXT NOT NULL,"
+    " PRIMARY KEY (fingerprint, key)"
+    ")"
+)
+
+
+def enrichment_fingerprint(template: str, model: str, provider: str, layout: str = "inline") -> str:
+    """Short hash naming the cache namespace of one prompt template/model/provider/layout.
+
+    The "system" layout sends a different prompt than "inline" (see
+    fast_enricher.build_messages), so it gets its own namespace. "inline"
+    hashes as before layouts existed and keeps the existing namespaces.
+    """
+    parts = [template, model, provider] if layout == "inline" else [template, model, provider, layout]
+    payload = json.dumps(parts, ensure_ascii=False)
+    return hashlib.sha256(payload.encode()).hexdigest()[:12]
+
+
+class EnrichmentStore:
+    """Persistent cache key -> enrichment value (any JSON: entry list or sentinel).
+
+    Lookups and writes stay within `fingerprint`. Enrichers also pass
+    prompt_version, model and provider, which label the namespace in reports
+    and mark it used now; tools that open a namespace without them leave the
+    label and last use alone. cache_filename keeps the
+    legacy JSON name; the data lives next to it in <stem>.sqlite.
+    """
+
+    def __init__(
+        self,
+        cache_dir: str = ".cache",
+        fingerprint: str = LEGACY_FINGERPRINT,
+        prompt_version: Optional[str] = None,
+        model: Optional[str] = None,
+        provider: Optional[str] = None,
+        cache_filename: str = "enrichment_cache.json",
+    ):
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.legacy_file = self.cache_dir / cache_filename
+        self.cache_file = self.cache_dir / (Path(cache_filename).stem + ".sqlite")
+        self.fingerprint = fingerprint
+
+        self._conn = sqlite3.connect(self.cache_file, timeout=30, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(_CREATE_ENRICHMENTS)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS fingerprints ("
+            " fingerprint TEXT PRIMARY KEY,"
+            " prompt_version TEXT,"
+            " model TEXT,"
+            " provider TEXT,"
+            " created_at TEXT NOT NULL,"
+            " last_used_at TEXT NOT NULL"
+            ") WITHOUT ROWID"
+        )
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS store_meta ("
+            " name TEXT PRIMARY KEY,"
+            " value TEXT"
+            ") WITHOUT ROWID"
+        )
+        self._migrate_unversioned()
+        self._import_legacy_json()
+        if fingerprint != LEGACY_FINGERPRINT and model:
+            self._register(prompt_version, model, provider)
+            self._warn_unadopted_legacy()
+
+    def _migrate_unversioned(self) -> None:
+        """Move a store from before fingerprints (key-only table) into the legacy namespace."""
+        columns = {row[1] for row in self._conn.execute("PRAGMA table_info(enrichments)")}
+        if "fingerprint" in columns:
+            return
+        with self._conn:
+            self._conn.execute("BEGIN IMMEDIATE")
+            columns = {row[1] for row in self._conn.execute("PRAGMA table_info(enrichments)")}
+            if "fingerprint" in columns:
+                return  # another process migrated it meanwhile
+            self._conn.execute("ALTER TABLE enrichments RENAME TO enrichments_unversioned")
+            self._conn.execute(_CREATE_ENRICHMENTS)
+            self._conn.execute(
+                "INSERT INTO enrichments (fingerprint, key, value, updated_at)"
+                " SELECT ?, key, value, updated_at FROM enrichments_unversioned",
+                (LEGACY_FINGERPRINT,),
+            )
+            self._conn.execute("DROP TABLE enrichments_unversioned")
+
+    def _register(self, prompt_version: Optional[str], model: Optional[str], provider: Optional[str]) -> None:
+        now = datetime.now().isoformat()
+        self._conn.execute(
+            "INSERT INTO fingerprints (fingerprint, prompt_version, model, provider, created_at, last_used_at)"
+            " VALUES (?, ?, ?, ?, ?, ?)"
+            " ON CONFLICT(fingerprint) DO UPDATE SET last_used_at = excluded.last_used_at",
+            (self.fingerprint, prompt_version, model, provider, now, now),
+        )
+
+    def _warn_unadopted_legacy(self) -> None:
+        """Point out legacy entries an empty enricher namespace could adopt.
+
+        They are never copied automatically: their prompt is unknown, and
+        serving them under another prompt is what the fingerprints prevent.
+        """
+        has_own = self._conn.execute(
+            "SELECT 1 FROM enrichments WHERE fingerprint = ? LIMIT 1", (self.fingerprint,),
+        ).fetchone()
+        if has_own:
+            return
+        legacy = self._conn.execute(
+            "SELECT COUNT(*) FROM enrichments WHERE fingerprint = ?", (LEGACY_FINGERPRINT,),
+        ).fetchone()[0]
+        if legacy:
+            print(f"Warning: fingerprint {self.fingerprint} starts empty; {legacy} legacy entries are not used. "
+                  f"If they came from this prompt/model, copy them over with "
+                  f"`python3 -m scripts.pipeline.enrichment_store adopt --to {self.fingerprint}`.")
+
+    # ---- Legacy JSON ----
+    def _meta(self, name: str) -> Optional[str]:
+        row = self._conn.execute("SELECT value FROM store_meta WHERE name = ?", (name,)).fetchone()
+        return row[0] if row else None
+
+    def _set_meta(self, name: str, value: str) -> None:
+        self._conn.execute(
+            "INSERT INTO store_meta (name, value) VALUES (?, ?)"
+            " ON CONFLICT(name) DO UPDATE SET value = excluded.value",
+            (name, value),
+        )
+
+    def _import_legacy_json(self, force: bool = False) -> int:
+        """Import enrichment_cache.json if it changed since the last import.
+
+        Keys already in the store win, so a stale JSON never overwrites newer
+        results. Returns the number of entries read from the file.
+        """
+        if not self.legacy_file.exists():
+            return 0
+        stamp = str(self.legacy_file.stat().st_mtime_ns)
+        if not force and self._meta("legacy_mtime") == stamp:
+            return 0
+        try:
+            with open(self.legacy_file, "r", encoding="utf-8") as f:
+                cache = json.load(f)
+        except (json.JSONDecodeError, IOError) as e:
+            print(f"Warning: Could not import enrichment cache {self.legacy_file}: {e}")
+            return 0
+        if not isinstance(cache, dict):
+            print(f"Warning: Unexpected format in {self.legacy_file}, skipping import")
+            return 0
+
+        now = datetime.now().isoformat()
+        with self._conn:
+            self._conn.execute("BEGIN")
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO enrichments (fingerprint, key, value, updated_at) VALUES (?, ?, ?, ?)",
+                ((LEGACY_FINGERPRINT, key, json.dumps(value, ensure_ascii=False), now)
+                 for key, value in cache.items()),
+            )
+            self._set_meta("legacy_mtime", stamp)
+        print(f"Imported {len(cache)} entries from {self.legacy_file.name} into {self.cache_file.name} "
+              f"(fingerprint {LEGACY_FINGERPRINT})")
+        return len(cache)
+
+    def export_json(self, path: Optional[Path] = None) -> int:
+        """Write this namespace as the legacy JSON dict (for readers of the old file).
+
+        Legacy entries this namespace lacks are written too: the exported file
+        replaces the JSON they were imported from, and the admin routes have
+        no other copy of them.
+        """
+        path = Path(path) if path else self.legacy_file
+        # Per-process temp file: parallel enrichers may export at the same time
+        tmp = path.with_suffix(f".{os.getpid()}.tmp")
+        count = 0
+        with open(tmp, "w", encoding="utf-8") as f:
+            f.write("{")
+            for key, raw in self._conn.execute(
+                "SELECT key, value FROM enrichments WHERE fingerprint = ?"
+                " UNION ALL"
+                " SELECT key, value FROM enrichments AS legacy WHERE fingerprint = ? AND ? != ?"
+                " AND NOT EXISTS (SELECT 1 FROM enrichments WHERE fingerprint = ? AND key = legacy.key)"
+                " ORDER BY key",
+                (self.fingerprint, LEGACY_FINGERPRINT, self.fingerprint, LEGACY_FINGERPRINT, self.fingerprint),
+            ):
+                f.write(f"{',' if count else ''}{json.dumps(key)}: {raw}")
+                count += 1
+            f.write("}")
+        tmp.replace(path)
+        if path == self.legacy_file:
+            # Our own export is not new data
+            self._set_meta("legacy_mtime", str(path.stat().st_mtime_ns))
+        return count
+
+    # ---- Mapping interface ----
+    def save(self) -> None:
+        """No-op kept for API compatibility — every put() is already committed."""
+
+    def get(self, key: str, default: Any = None) -> Any:
+        row = self._conn.execute(
+            "SELECT value FROM enrichments WHERE fingerprint = ? AND key = ?", (self.fingerprint, key),
+        ).fetchone()
+        return json.loads(row[0]) if row else default
+
+    def get_many(self, keys: Iterable[str]) -> dict[str, Any]:
+        """Return {key: value} for the keys present in the store."""
+        unique = list(dict.fromkeys(keys))
+        found: dict[str, Any] = {}
+        for i in range(0, len(unique), _IN_CHUNK):
+            chunk = unique[i:i + _IN_CHUNK]
+            placeholders = ",".join("?" * len(chunk))
+            rows = self._conn.execute(
+                f"SELECT key, value FROM enrichments WHERE fingerprint = ? AND key IN ({placeholders})",
+                [self.fingerprint, *chunk],
+            )
+            found.update((key, json.loads(raw)) for key, raw in rows)
+        return found
+
+    def put(self, key: str, value: Any) -> None:
+        """Insert or replace one entry (persisted immediately)."""
+        self._conn.execute(
+            "INSERT INTO enrichments (fingerprint, key, value, updated_at) VALUES (?, ?, ?, ?)"
+            " ON CONFLICT(fingerprint, key) DO UPDATE SET value = excluded.value, updated_at = excluded.updated_at",
+            (self.fingerprint, key, json.dumps(value, ensure_ascii=False), datetime.now().isoformat()),
+        )
+
+    def put_many(self, items: Iterable[tuple[str, Any]]) -> None:
+        """Insert or replace several entries in one transaction."""
+        now = datetime.now().isoformat()
+        with self._conn:
+            self._conn.execute("BEGIN")
+            self._conn.executemany(
+                "INSERT INTO enrichments (fingerprint, key, value, updated_at) VALUES (?, ?, ?, ?)"
+                " ON CONFLICT(fingerprint, key) DO UPDATE SET value = excluded.value, updated_at = excluded.updated_at",
+                ((self.fingerprint, key, json.dumps(value, ensure_ascii=False), now) for key, value in items),
+            )
+
+    def pop(self, key: str, default: Any = None) -> Any:
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            return default
+        self._conn.execute(
+            "DELETE FROM enrichments WHERE fingerprint = ? AND key = ?", (self.fingerprint, key),
+        )
+        return value
+
+    def clear(self) -> None:
+        """Drop every entry of this namespace."""
+        self._conn.execute("DELETE FROM enrichments WHERE fingerprint = ?", (self.fingerprint,))
+
+    def items(self) -> Iterator[tuple[str, Any]]:
+        """Iterate over the namespace's entries without loading them at once."""
+        for key, raw in self._conn.execute(
+            "SELECT key, value FROM enrichments WHERE fingerprint = ?", (self.fingerprint,),
+        ):
+            yield key, json.loads(raw)
+
+    def keys(self) -> Iterator[str]:
+        for (key,) in self._conn.execute(
+            "SELECT key FROM enrichments WHERE fingerprint = ?", (self.fingerprint,),
+        ):
+            yield key
+
+    def __getitem__(self, key: str) -> Any:
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            raise KeyError(key)
+        return value
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        self.put(key, value)
+
+    def __delitem__(self, key: str) -> None:
+        if self.pop(key, _MISSING) is _MISSING:
+            raise KeyError(key)
+
+    def __contains__(self, key: object) -> bool:
+        row = self._conn.execute(
+            "SELECT 1 FROM enrichments WHERE fingerprint = ? AND key = ?", (self.fingerprint, key),
+        ).fetchone()
+        return row is not None
+
+    def __iter__(self) -> Iterator[str]:
+        return self.keys()
+
+    def __len__(self) -> int:
+        """Return number of cached entries in this namespace."""
+        return self._conn.execute(
+            "SELECT COUNT(*) FROM enrichments WHERE fingerprint = ?", (self.fingerprint,),
+        ).fetchone()[0]
+
+    # ---- Namespaces ----
+    def report(self) -> list[dict]:
+        """One row per fingerprint: labels, entry and removed-sentinel counts, last write/use."""
+        labels = {
+            row[0]: row[1:]
+            for row in self._conn.execute(
+                "SELECT fingerprint, prompt_version, model, provider, last_used_at FROM fingerprints"
+            )
+        }
+        rows = []
+        counted = self._conn.execute(
+            "SELECT fingerprint, COUNT(*),"
+            " SUM(value LIKE '[{\"_classification\"%'), MAX(updated_at)"
+            " FROM enrichments GROUP BY fingerprint"
+        ).fetchall()
+        seen = set()
+        for fingerprint, entries, removed, updated in counted:
+            seen.add(fingerprint)
+            version, model, provider, used = labels.get(fingerprint, (None, None, None, None))
+            rows.append({
+                "fingerprint": fingerprint, "prompt_version": version, "model": model,
+                "provider": provider, "entries": entries, "removed": removed or 0,
+                "last_updated": updated, "last_used": used,
+            })
+        for fingerprint, (version, model, provider, used) in labels.items():
+            if fingerprint not in seen:
+                rows.append({
+                    "fingerprint": fingerprint, "prompt_version": version, "model": model,
+                    "provider": provider, "entries": 0, "removed": 0,
+                    "last_updated": None, "last_used": used,
+                })
+        return sorted(rows, key=lambda r: r["last_used"] or r["last_updated"] or "", reverse=True)
+
+    def unused_fingerprints(self, days: int) -> list[str]:
+        """Labelled fingerprints not opened by an enricher for `days` days (never legacy)."""
+        cutoff = (datetime.now() - timedelta(days=days)).isoformat()
+        rows = self._conn.execute("SELECT fingerprint FROM fingerprints WHERE last_used_at < ?", (cutoff,))
+        return [row[0] for row in rows]
+
+    def prune(self, fingerprints: Iterable[str]) -> int:
+        """Delete every entry of the given namespaces; returns entries deleted."""
+        deleted = 0
+        with self._conn:
+            self._conn.execute("BEGIN")
+            for fingerprint in fingerprints:
+                deleted += self._conn.execute(
+                    "DELETE FROM enrichments WHERE fingerprint = ?", (fingerprint,),
+                ).rowcount
+                self._conn.execute("DELETE FROM fingerprints WHERE fingerprint = ?", (fingerprint,))
+        return deleted
+
+    def adopt(self, source: str = LEGACY_FINGERPRINT) -> int:
+        """Copy another namespace's entries into this one (existing keys win); returns entries added."""
+        now = datetime.now().isoformat()
+        with self._conn:
+            self._conn.execute("BEGIN")
+            return self._conn.execute(
+                "INSERT OR IGNORE INTO enrichments (fingerprint, key, value, updated_at)"
+                " SELECT ?, key, value, ? FROM enrichments WHERE fingerprint = ?",
+                (self.fingerprint, now, source),
+            ).rowcount
+
+    def close(self) -> None:
+        self._conn.close()
+
+
+def _print_report(store: EnrichmentStore) -> None:
+    rows = store.report()
+    if not rows:
+        print(f"No entries in {store.cache_file}")
+        return
+    print(f"{'fingerprint':<13} {'prompt':<10} {'model':<28} {'provider':<11} "
+          f"{'entries':>9} {'removed':>8}  last used")
+    for row in rows:
+        used = (row["last_used"] or row["last_updated"] or "")[:16]
+        print(f"{row['fingerprint']:<13} {row['prompt_version'] or '-':<10} {row['model'] or '-':<28} "
+              f"{row['provider'] or '-':<11} {row['entries']:>9} {row['removed']:>8}  {used}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Manage the SQLite enrichment cache")
+    parser.add_argument("command", choices=["report", "prune", "adopt", "import", "export"],
+                        help="report: entries per fingerprint; prune: delete namespaces; "
+                             "adopt: copy legacy entries into --to; "
+                             "import: load enrichment_cache.json into the store; "
+                             "export: rewrite enrichment_cache.json from one namespace "
+                             "(plus legacy entries it lacks)")
+    parser.add_argument("--cache-dir", type=str, default=".cache",
+                        help="Directory for caches (default: .cache)")
+    parser.add_argument("--fingerprint", action="append", default=[],
+                        help="Namespace to prune or export (repeatable for prune; "
+                             "export defaults to the most recently used one)")
+    parser.add_argument("--unused-days", type=int, default=None,
+                        help="prune: also drop fingerprints no enricher opened for this many days")
+    parser.add_argument("--to", type=str, default=None,
+                        help="adopt: target fingerprint (see report)")
+    parser.add_argument("--from", dest="source", type=str, default=LEGACY_FINGERPRINT,
+                        help=f"adopt: source fingerprint (default: {LEGACY_FINGERPRINT})")
+    args = parser.parse_args()
+
+    store = EnrichmentStore(args.cache_dir)
+    if args.command == "import":
+        count = store._import_legacy_json(force=True)
+        if not count:
+            print(f"Nothing imported from {store.legacy_file}")
+    elif args.command == "export":
+        rows = store.report()
+        fingerprint = args.fingerprint[0] if args.fingerprint else (
+            rows[0]["fingerprint"] if rows else LEGACY_FINGERPRINT
+        )
+        namespace = EnrichmentStore(args.cache_dir, fingerprint)
+        count = namespace.export_json()
+        namespace.close()
+        print(f"Exported {count} entries of {fingerprint} to {store.legacy_file}")
+    elif args.command == "prune":
+        targets = list(args.fingerprint)
+        if args.unused_days is not None:
+            targets += store.unused_fingerprints(args.unused_days)
+        if not targets:
+            parser.error("prune needs --fingerprint or --unused-days")
+        deleted = store.prune(dict.fromkeys(targets))
+        print(f"Pruned {deleted} entries from {len(set(targets))} fingerprint(s)")
+    elif args.command == "adopt":
+        if not args.to:
+            parser.error("adopt needs --to")
+        target = EnrichmentStore(args.cache_dir, args.to)
+        added = target.adopt(args.source)
+        target.close()
+        print(f"Copied {added} entries from {args.source} to {args.to}")
+    _print_report(store)
+    store.close()
+
+
+if __name__ == "__main__":
+    main()
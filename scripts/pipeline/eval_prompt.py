@@ -574,7 +574,7 @@ def run_eval(model: str = None, batch_size: int = None, runs: int = 1,
             print(f"  RUN {run_num}/{runs}")
             print(f"{'='*60}")
             # Clear eval cache between runs for consistency testing
-            enricher.cache = {}
+            enricher.cache.clear()
 
         # Override batch size if specified
         orig_batch_size = None
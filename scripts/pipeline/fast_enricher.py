@@ -25,6 +25,8 @@ import re
 import sys
 import time
 import uuid
+from collections import deque
+from functools import lru_cache
 from datetime import datetime
 from pathlib import Path
 
@@ -33,6 +35,11 @@ import requests
 from dotenv import load_dotenv
 from openai import OpenAI
 
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent))
+from scripts.pipeline.article_io import ArticleFile
+from scripts.pipeline.enrichment_store import EnrichmentStore, enrichment_fingerprint
+
 # Load .env
 load_dotenv()
 
@@ -44,7 +51,8 @@ MODEL = "x-ai/grok-4-fast"
 OPENROUTER_BASE_URL = "https://openrouter.ai/api/v1"
 API_DELAY = 0.2  # Seconds between API calls
 
-# Provider configurations: {base_url, api_key_env, default_model}
+# Provider configurations: {base_url, api_key_env, default_model}; optional
+# tokens_per_minute caps the async enricher's token rate (llm_limiter.py)
 PROVIDERS = {
     "openrouter": {
         "base_url": "https://openrouter.ai/api/v1",
@@ -66,6 +74,28 @@ DEFAULT_PROVIDER = "openrouter"
 UNIFIED_BATCH_SIZE = 8      # Articles per LLM call (unified enrichment + classification)
 UNIFIED_MAX_TOKENS = 16000  # Max tokens for unified prompt response
 
+# Token-budget batch packing (pack_batches)
+BATCH_PACKING = "tokens"        # "tokens" (bin-pack to a budget) or "fixed" (batch_size articles)
+CHARS_PER_TOKEN = 3.2           # German press text
+ARTICLE_OVERHEAD_TOKENS = 40    # JSON keys, index, date, city, source per article
+INCIDENT_OUTPUT_TOKENS = 320    # One crime record in the response (see the prompt's example)
+PACK_INPUT_TOKENS = 12000       # Article tokens per call (prompt template not counted)
+PACK_OUTPUT_FILL = 0.6          # Share of max_output_tokens the estimated output may fill
+PACK_MAX_ARTICLES = 24          # Article cap per call; article_index mix-ups grow beyond this
+_PACK_OPEN_BINS = 64            # Batches still accepting articles while packing
+
+# Partial-batch salvage: articles a response leaves out are re-queued in smaller batches
+SALVAGE_MAX_ROUNDS = 2          # Follow-up rounds per article before it is left for the next run
+
+# Stream completions and parse each incident as its JSON object closes (--stream-responses)
+STREAM_RESPONSES = False
+
+# "system": instructions in a byte-identical system message, only the batch varies, so
+# providers can serve the instructions from their prompt prefix cache.
+# "inline": the whole template formatted into one user message (before prefix caching)
+PROMPT_LAYOUT = "system"
+CACHED_INPUT_PRICE = 0.25       # Share of the input price billed for cached prompt tokens (xAI; OpenAI 0.5)
+
 
 # ── Unified Prompt (classification + enrichment in 1 round) ──────
 
@@ -257,6 +287,7 @@ def load_prompt(prompts_dir: Path = None, version: str = None) -> dict:
         provider: str    — provider key (e.g. "openrouter")
         max_tokens: int  — max output tokens
         temperature: float
+        version: str     — resolved prompt version (None for the inline prompt)
     """
     if prompts_dir is None:
         prompts_dir = Path(__file__).parent / "prompts"
@@ -289,7 +320,57 @@ def load_prompt(prompts_dir: Path = None, version: str = None) -> dict:
             except Exception:
                 pass  # Fall back to defaults on parse error
 
-    return {"template": template, **config}
+    return {"template": template, **config, "version": version or None}
+
+
+# Fixed text for the template's placeholders in the shared system message: the
+# count phrase of the first line is dropped ("Analysiere die deutschen ..."),
+# any other {count} reads "alle"
+_SYSTEM_COUNT_PHRASE = ("diese {count} ", "die ")
+_SYSTEM_COUNT = "alle"
+_SYSTEM_ARTICLES = "(folgen in der nächsten Nachricht)"
+
+
+@lru_cache(maxsize=8)
+def system_prompt(template: str) -> str:
+    """The template with its per-batch placeholders replaced by fixed text."""
+    template = template.replace(*_SYSTEM_COUNT_PHRASE)
+    return template.format(count=_SYSTEM_COUNT, articles_json=_SYSTEM_ARTICLES)
+
+
+def build_messages(template: str, articles_json: str, count: int, layout: str = PROMPT_LAYOUT) -> list[dict]:
+    """Chat messages for one enrichment batch.
+
+    "inline" formats the batch into the middle of the template. Its first
+    line already carries the article count, so no two calls share a prefix
+    and the instruction block is processed and billed in full every time.
+    "system" sends the instructions, rules and examples as a system message
+    that is identical on every call, and only the articles as the user
+    message, which lets the provider's prefix cache serve the rest.
+    """
+    if layout == "inline":
+        return [{"role": "user", "content": template.format(count=count, articles_json=articles_json)}]
+    return [
+        {"role": "system", "content": system_prompt(template)},
+        {"role": "user", "content": f"ARTIKEL ({count}):\n{articles_json}"},
+    ]
+
+
+def chat_messages(prompt) -> list[dict]:
+    """Messages from build_messages(), or a plain prompt string as one user message."""
+    return prompt if isinstance(prompt, list) else [{"role": "user", "content": prompt}]
+
+
+def cached_prompt_tokens(usage) -> int | None:
+    """Prompt tokens the provider served from its cache, if it reports them."""
+    details = getattr(usage, "prompt_tokens_details", None)
+    if isinstance(details, dict):
+        cached = details.get("cached_tokens")
+    else:
+        cached = getattr(details, "cached_tokens", None)
+    if cached is None:
+        cached = getattr(usage, "prompt_cache_hit_tokens", None)  # DeepSeek
+    return cached
 
 
 # Germany bounding box for coordinate validation
@@ -510,11 +591,234 @@ def _try_split_date_paragraphs(body: str, incident_count: int) -> list[str] | No
     return sections
 
 
+# ── Token-budget batch packing ─────────────────────────────────────
+
+def estimate_incident_count(body: str) -> int:
+    """Rough number of incidents in an article, from the digest section markers.
+
+    Counts the same markers _split_body_sections splits on; ordinary
+    articles give 1.
+    """
+    if not body:
+        return 1
+    numbered = 0
+    for m in _NUMBERED_RE.finditer(body):
+        num = int(m.group(1))
+        if num == numbered + 1:
+            numbered = num
+        elif num == 1:
+            numbered = 1
+    return max(
+        1,
+        numbered,
+        len(_POL_HEADER_RE.findall(body)),
+        len(_CITY_TITLE_RE.findall(body)),
+        len(_ZEIT_SECTION_RE.findall(body)),
+        len(_DATE_PARAGRAPH_RE.findall(body)),
+    )
+
+
+def estimate_article_tokens(art: dict) -> tuple[int, int]:
+    """Estimated (input, output) tokens one article adds to an LLM call.
+
+    Digests cost one record per incident plus the incident_body texts,
+    which together repeat the article body.
+    """
+    body = art.get("body", "") or ""
+    chars = len(body) + len((art.get("title", "") or "")[:200]) + len(art.get("city", "") or "")
+    input_tokens = ARTICLE_OVERHEAD_TOKENS + int(chars / CHARS_PER_TOKEN)
+    incidents = estimate_incident_count(body)
+    output_tokens = incidents * INCIDENT_OUTPUT_TOKENS
+    if incidents > 1:
+        output_tokens += int(len(body) / CHARS_PER_TOKEN)
+    return input_tokens, output_tokens
+
+
+def pack_batches(
+    articles: list[dict],
+    max_output_tokens: int,
+    input_budget: int = PACK_INPUT_TOKENS,
+    output_fill: float = PACK_OUTPUT_FILL,
+    max_articles: int = PACK_MAX_ARTICLES,
+) -> list[list[int]]:
+    """Bin-pack articles into LLM calls by estimated tokens; returns index lists.
+
+    First-fit decreasing over a window of open batches: short teasers fill
+    up a call, and a mega-digest goes out alone instead of pushing seven
+    neighbours past max_output_tokens. Batches come back largest estimated
+    output first so the slowest calls start first rather than trailing.
+    """
+    output_budget = max(1, int(max_output_tokens * output_fill))
+    sizes = [estimate_article_tokens(art) for art in articles]
+    order = sorted(
+        range(len(articles)),
+        key=lambda i: max(sizes[i][0] / input_budget, sizes[i][1] / output_budget),
+        reverse=True,
+    )
+
+    bins: list[list] = []  # [input_tokens, output_tokens, indices]
+    open_bins: list[list] = []
+    for i in order:
+        tokens_in, tokens_out = sizes[i]
+        for b in open_bins:
+            if b[0] + tokens_in <= input_budget and b[1] + tokens_out <= output_budget:
+                b[0] += tokens_in
+                b[1] += tokens_out
+                b[2].append(i)
+                if len(b[2]) >= max_articles:
+                    open_bins.remove(b)
+                break
+        else:
+            b = [tokens_in, tokens_out, [i]]
+            bins.append(b)
+            if max_articles > 1:
+                open_bins.append(b)
+                if len(open_bins) > _PACK_OPEN_BINS:
+                    open_bins.pop(0)
+
+    bins.sort(key=lambda b: (b[1], b[0]), reverse=True)
+    return [sorted(b[2]) for b in bins]
+
+
+def plan_batches(articles: list[dict], packing: str, batch_size: int, max_output_tokens: int) -> list[list[int]]:
+    """Index lists of the LLM calls for `articles`, packed or in fixed-size slices."""
+    if packing == "tokens":
+        return pack_batches(articles, max_output_tokens)
+    return [list(range(i, min(i + batch_size, len(articles)))) for i in range(0, len(articles), batch_size)]
+
+
+def parse_llm_array(text: str) -> tuple[list[dict], bool]:
+    """Parse the JSON array of an LLM response; returns (objects, complete).
+
+    A response cut off at max_tokens has no closing bracket. Instead of
+    losing the whole batch, the complete objects before the cut are kept;
+    the last article among them is dropped too, since its incident list may
+    have been cut, so it is re-queued with the articles that never appeared.
+    """
+    text = text.strip()
+    if "```json" in text:
+        text = text.split("```json", 1)[1]
+    if "```" in text:
+        text = text.split("```")[0]
+
+    # Find the array
+    match = re.search(r'\[[\s\S]*\]', text)
+    if match:
+        try:
+            return json.loads(match.group()), True
+        except json.JSONDecodeError:
+            pass
+
+    start = text.find("[")
+    if start < 0:
+        return [], False
+    decoder = json.JSONDecoder()
+    objects = []
+    pos = start + 1
+    while True:
+        while pos < len(text) and text[pos] in " \t\r\n,":
+            pos += 1
+        try:
+            obj, pos = decoder.raw_decode(text, pos)
+        except json.JSONDecodeError:
+            break
+        if isinstance(obj, dict):
+            objects.append(obj)
+    return drop_last_article(objects), False
+
+
+def drop_last_article(objects: list[dict]) -> list[dict]:
+    """Objects of a cut-off array without its last article, whose incidents may be incomplete."""
+    if not objects:
+        return objects
+    last = objects[-1].get("article_index")
+    return [obj for obj in objects if obj.get("article_index") != last]
+
+
+class JsonArrayStream:
+    """Incremental parser for a streamed JSON array of objects.
+
+    feed() takes completion deltas as they arrive and returns the top-level
+    objects that closed, so each incident can be handled while the model
+    is still writing the next one. Code fences and text before the array
+    are skipped; `closed` is True once the array's closing bracket arrived.
+    """
+
+    def __init__(self):
+        self.closed = False
+        self._buf = ""
+        self._pos = 0        # next character to scan in _buf
+        self._start = -1     # start of the open top-level object, -1 between objects
+        self._depth = 0      # 0 before the array, 1 inside it, 2+ inside an element
+        self._in_string = False
+        self._escape = False
+
+    def feed(self, text: str) -> list[dict]:
+        self._buf += text
+        buf = self._buf
+        objects = []
+        i = self._pos
+        while i < len(buf) and not self.closed:
+            c = buf[i]
+            if self._in_string:
+                if self._escape:
+                    self._escape = False
+                elif c == "\\":
+                    self._escape = True
+                elif c == '"':
+                    self._in_string = False
+            elif self._depth == 0:
+                if c == "[":
+                    self._depth = 1
+            elif c == '"':
+                self._in_string = True
+            elif c in "[{":
+                if self._depth == 1:
+                    self._start = i
+                self._depth += 1
+            elif c in "]}":
+                self._depth -= 1
+                if self._depth == 0:
+                    self.closed = True
+                elif self._depth == 1 and self._start >= 0:
+                    try:
+                        obj = json.loads(buf[self._start:i + 1])
+                    except json.JSONDecodeError:
+                        obj = None
+                    if isinstance(obj, dict):
+                        objects.append(obj)
+                    self._start = -1
+            i += 1
+
+        # Keep only the open object in the buffer
+        keep = self._start if self._start >= 0 else i
+        self._buf = buf[keep:]
+        self._pos = i - keep
+        if self._start >= 0:
+            self._start = 0
+        return objects
+
+
+def missing_article_indices(llm_results: list[dict], batch_len: int) -> list[int]:
+    """Batch positions no LLM result refers to (truncated, miscounted or dropped)."""
+    returned = {r.get("article_index") for r in llm_results}
+    return [i for i in range(batch_len) if i not in returned]
+
+
+def salvage_batches(indices: list[int]) -> list[list[int]]:
+    """Split articles a batch failed to return into two smaller follow-up batches."""
+    if len(indices) <= 1:
+        return [indices] if indices else []
+    half = (len(indices) + 1) // 2
+    return [indices[:half], indices[half:]]
+
+
 class FastEnricher:
     """Single-round article enricher with HERE geocoding."""
 
     def __init__(self, cache_dir: str = ".cache", no_geocode: bool = False, model: str = None,
-                 prompt_version: str = None, provider: str = None):
+                 prompt_version: str = None, provider: str = None, packing: str = BATCH_PACKING,
+                 stream_responses: bool = STREAM_RESPONSES, prompt_layout: str = PROMPT_LAYOUT):
         # Load prompt config first — it may supply model/provider defaults
         self.prompt_config = load_prompt(version=prompt_version)
 
@@ -533,10 +837,19 @@ class FastEnricher:
         self.model = model or self.prompt_config.get("model") or prov["default_model"]
         self.max_output_tokens = self.prompt_config.get("max_tokens") or prov.get("max_output_tokens", UNIFIED_MAX_TOKENS)
         self.batch_size = prov.get("batch_size", UNIFIED_BATCH_SIZE)
+        self.packing = packing
+        self.stream_responses = stream_responses
+        self.prompt_layout = prompt_layout
         self.cache_dir = Path(cache_dir)
-        self.cache_file = self.cache_dir / "enrichment_cache.json"
         self.geocode_file = self.cache_dir / "geocode_cache.json"
-        self.cache = self._load_cache(self.cache_file)
+        # SQLite store: entries are committed as they are written; save_caches() saves
+        # geocodes and exports the namespace to enrichment_cache.json for the admin API.
+        # Namespaced by prompt/model/provider so switching either never serves stale results.
+        self.cache = EnrichmentStore(
+            cache_dir,
+            enrichment_fingerprint(self.prompt_config["template"], self.model, effective_provider, prompt_layout),
+            prompt_version=self.prompt_config["version"], model=self.model, provider=effective_provider,
+        )
         self.geocode_cache = self._load_cache(self.geocode_file) if not no_geocode else {}
         self.no_geocode = no_geocode
         self.prompt_version = prompt_version
@@ -558,52 +871,100 @@ class FastEnricher:
     def _cache_key(self, url: str, body: str) -> str:
         return hashlib.sha256(f"{url}:{body}".encode()).hexdigest()[:16]
 
-    def _call_llm(self, prompt: str, max_tokens: int = 4000, batch_size: int = 1) -> list[dict]:
-        """Call LLM and parse JSON array response."""
+    def _call_llm(self, prompt: str | list[dict], max_tokens: int = 4000, batch_size: int = 1,
+                  on_object=None) -> list[dict]:
+        """Call LLM and parse JSON array response.
+
+        `prompt` is a prompt string or the messages from build_messages().
+
+        With stream_responses the completion is streamed and each object is
+        passed to on_object(obj) as soon as it closes.
+        """
         try:
             start_time = time.time()
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=[{"role": "user", "content": prompt}],
-                temperature=0.1,
-                max_tokens=max_tokens,
-            )
+            first_record_s = None
+            if self.stream_responses:
+                results, complete, finish_reason, usage, first_record_s = self._stream_completion(
+                    prompt, max_tokens, on_object,
+                )
+            else:
+                response = self.client.chat.completions.create(
+                    model=self.model,
+                    messages=chat_messages(prompt),
+                    temperature=0.1,
+                    max_tokens=max_tokens,
+                )
+                finish_reason = response.choices[0].finish_reason
+                usage = response.usage
             latency_ms = int((time.time() - start_time) * 1000)
-            text = response.choices[0].message.content
+            if finish_reason == "length":
+                print(f"    WARNING: response truncated at max_tokens={max_tokens} ({batch_size} articles)")
 
             # Record token usage
-            if response.usage:
+            if usage:
                 entry = {
                     "timestamp": time.time(),
                     "model": self.model,
-                    "prompt_tokens": response.usage.prompt_tokens,
-                    "completion_tokens": response.usage.completion_tokens,
-                    "total_tokens": response.usage.total_tokens,
+                    "prompt_tokens": usage.prompt_tokens,
+                    "completion_tokens": usage.completion_tokens,
+                    "total_tokens": usage.total_tokens,
                     "batch_size": batch_size,
                     "latency_ms": latency_ms,
+                    "finish_reason": finish_reason,
+                    "packing": self.packing,
+                    "streamed": self.stream_responses,
+                    "cached_tokens": cached_prompt_tokens(usage),
+                    "prompt_layout": self.prompt_layout if isinstance(prompt, list) else "inline",
                 }
+                if first_record_s is not None:
+                    entry["first_record_ms"] = int(first_record_s * 1000)
                 usage_path = os.path.join(self.cache_dir, "token_usage.jsonl")
                 os.makedirs(self.cache_dir, exist_ok=True)
                 with open(usage_path, "a") as f:
                     f.write(json.dumps(entry) + "\n")
 
-            # Parse JSON response
-            text = text.strip()
-            if "```json" in text:
-                text = text.split("```json", 1)[1]
-            if "```" in text:
-                text = text.split("```")[0]
-
-            # Find the array
-            match = re.search(r'\[[\s\S]*\]', text)
-            if match:
-                return json.loads(match.group())
-            return []
+            if not self.stream_responses:
+                results, complete = parse_llm_array(response.choices[0].message.content)
+            if not complete and results:
+                print(f"    Salvaged {len(results)} objects from an incomplete response ({batch_size} articles)")
+            return results
 
         except Exception as e:
             print(f"    LLM error: {e}")
             return []
 
+    def _stream_completion(self, prompt: str | list[dict], max_tokens: int, on_object=None):
+        """Streamed completion parsed as it arrives.
+
+        Returns (objects, complete, finish_reason, usage, first_record_s).
+        """
+        start_time = time.time()
+        stream = self.client.chat.completions.create(
+            model=self.model,
+            messages=chat_messages(prompt),
+            temperature=0.1,
+            max_tokens=max_tokens,
+            stream=True,
+            stream_options={"include_usage": True},
+        )
+        parser = JsonArrayStream()
+        objects, finish_reason, usage, first_record_s = [], None, None, None
+        for chunk in stream:
+            usage = getattr(chunk, "usage", None) or usage
+            if not chunk.choices:
+                continue
+            choice = chunk.choices[0]
+            finish_reason = choice.finish_reason or finish_reason
+            for obj in parser.feed(choice.delta.content or ""):
+                if first_record_s is None:
+                    first_record_s = time.time() - start_time
+                objects.append(obj)
+                if on_object:
+                    on_object(obj)
+        if not parser.closed:
+            objects = drop_last_article(objects)
+        return objects, parser.closed, finish_reason, usage, first_record_s
+
     # ── Enrichment ─────────────────────────────────────────────────
 
     def _enrich_batch(self, articles: list[dict], max_tokens: int = UNIFIED_MAX_TOKENS) -> list[dict]:
@@ -619,12 +980,60 @@ class FastEnricher:
                 "source": art.get("source", ""),  # Needed for feuerwehr detection
             })
 
-        prompt = self.prompt_config["template"].format(
-            count=len(articles),
-            articles_json=json.dumps(articles_data, ensure_ascii=False, indent=2)
+        messages = build_messages(
+            self.prompt_config["template"],
+            json.dumps(articles_data, ensure_ascii=False, indent=2),
+            len(articles),
+            self.prompt_layout,
         )
 
-        return self._call_llm(prompt, max_tokens=max_tokens, batch_size=len(articles))
+        on_object = self._geocode_streamed(articles) if self.stream_responses else None
+        return self._call_llm(messages, max_tokens=max_tokens, batch_size=len(articles), on_object=on_object)
+
+    def _geocode_streamed(self, articles: list[dict]):
+        """on_object callback: geocode each article's incidents while the rest of the response streams.
+
+        Fills geocode_cache with the same lookups _enrich_articles makes
+        afterwards, which then are cache hits. An article is geocoded once
+        the next one starts, and only if _enrich_articles would keep it: the
+        last article may be cut off (drop_last_article), and junk, feuerwehr
+        and update-without-data articles are removed without geocoding.
+        """
+        current: list[dict] = []
+
+        def flush() -> None:
+            if not current:
+                return
+            first = current[0]
+            classification = first.get("classification", "crime")
+            if classification in ("junk", "feuerwehr"):
+                return
+            if classification == "update" and not first.get("location") and not first.get("crime"):
+                return
+            art = articles[first["article_index"]]
+            for llm_result in current:
+                loc = llm_result.get("location")
+                if isinstance(loc, dict) and (loc.get("street") or loc.get("city") or loc.get("district")):
+                    self._geocode(
+                        street=loc.get("street"),
+                        city=loc.get("city") or art.get("city"),
+                        district=loc.get("district"),
+                        bundesland=art.get("bundesland"),
+                        location_hint=loc.get("location_hint"),
+                        cross_street=loc.get("cross_street"),
+                    )
+
+        def geocode(llm_result: dict) -> None:
+            idx = llm_result.get("article_index", -1)
+            if self.no_geocode or not isinstance(idx, int) or not 0 <= idx < len(articles):
+                return
+            if current and idx != current[0]["article_index"]:
+                # A lower index means a retried call is streaming from the start
+                if idx > current[0]["article_index"]:
+                    flush()
+                current.clear()
+            current.append(llm_result)
+        return geocode
 
     def _enrich_articles(self, articles: list[dict]) -> tuple[list[dict], list[dict]]:
         """Enrich articles with unified classification + enrichment.
@@ -637,10 +1046,12 @@ class FastEnricher:
         removed_by_idx: dict[int, dict] = {}
 
         regeocode_count = 0
+        keys = [self._cache_key(art.get("url", ""), art.get("body", "")) for art in articles]
+        cached_by_key = self.cache.get_many(keys)
         for i, art in enumerate(articles):
-            key = self._cache_key(art.get("url", ""), art.get("body", ""))
-            if key in self.cache:
-                cached = self.cache[key]
+            key = keys[i]
+            if key in cached_by_key:
+                cached = cached_by_key[key]
                 entries = cached if isinstance(cached, list) else [cached]
 
                 # Check for classification sentinel (junk/feuerwehr from previous run)
@@ -691,13 +1102,19 @@ class FastEnricher:
             print(f"  Enrichment: {cached_count} cached{geo_msg}{removed_msg}, {len(uncached)} to enrich")
 
         if uncached:
-            batch_size = self.batch_size
             max_tokens = self.max_output_tokens
-            batches = [uncached[i:i + batch_size] for i in range(0, len(uncached), batch_size)]
-            print(f"  Enrichment: processing {len(uncached)} articles in {len(batches)} batches...")
-
-            batch_offset = 0
-            for batch_num, batch in enumerate(batches, 1):
+            batch_indices = plan_batches(uncached, self.packing, self.batch_size, max_tokens)
+            print(f"  Enrichment: processing {len(uncached)} articles in {len(batch_indices)} batches "
+                  f"({self.packing} packing)...")
+
+            # (indices into uncached, salvage round); articles a response left out come back smaller
+            queue = deque((indices, 0) for indices in batch_indices)
+            requeued = salvaged = lost = 0
+            batch_num = 0
+            while queue:
+                indices, salvage_round = queue.popleft()
+                batch = [uncached[i] for i in indices]
+                batch_num += 1
                 llm_results = self._enrich_batch(batch, max_tokens=max_tokens)
 
                 # Group LLM results by article_index
@@ -707,10 +1124,21 @@ class FastEnricher:
                     if 0 <= idx < len(batch):
                         incidents_by_idx.setdefault(idx, []).append(llm_result)
 
+                missing_indices = [indices[i] for i in missing_article_indices(llm_results, len(batch))]
+                if salvage_round:
+                    salvaged += len(indices) - len(missing_indices)
+                if missing_indices and salvage_round < SALVAGE_MAX_ROUNDS:
+                    requeued += 0 if salvage_round else len(missing_indices)
+                    queue.extend((part, salvage_round + 1) for part in salvage_batches(missing_indices))
+                elif missing_indices:
+                    lost += len(missing_indices)
+                    print(f"    WARNING: {len(missing_indices)} articles still missing after "
+                          f"{SALVAGE_MAX_ROUNDS} salvage rounds, left uncached for the next run")
+
                 # Process each article's results
                 for idx, incidents in incidents_by_idx.items():
                     art = batch[idx]
-                    orig_idx = uncached_indices[batch_offset + idx]
+                    orig_idx = uncached_indices[indices[idx]]
                     key = self._cache_key(art.get("url", ""), art.get("body", ""))
 
                     # Check if LLM classified as junk/feuerwehr
@@ -794,23 +1222,25 @@ class FastEnricher:
                     self.cache[key] = enrichments
                     results_by_idx[orig_idx] = [{**art, **e} for e in enrichments]
 
-                batch_offset += len(batch)
-
                 geocoded = sum(
                     1 for records in results_by_idx.values()
                     for r in records if r.get("location", {}).get("lat")
                 )
                 total_records = sum(len(records) for records in results_by_idx.values())
                 batch_removed = len(removed_by_idx)
+                requeue_msg = f", {len(missing_indices)} re-queued" if missing_indices and salvage_round < SALVAGE_MAX_ROUNDS else ""
                 print(
-                    f"    Batch {batch_num}/{len(batches)}: "
-                    f"{total_records} enriched, {geocoded} geocoded, {batch_removed} removed",
+                    f"    Batch {batch_num}/{batch_num + len(queue)}: "
+                    f"{total_records} enriched, {geocoded} geocoded, {batch_removed} removed{requeue_msg}",
                     flush=True,
                 )
 
-                if batch_num < len(batches):
+                if queue:
                     time.sleep(API_DELAY)
 
+            if requeued:
+                print(f"  Salvage: {salvaged}/{requeued} re-queued articles recovered, {lost} left for the next run")
+
         # Build flat output lists
         enriched = []
         for i in range(len(articles)):
@@ -981,9 +1411,11 @@ class FastEnricher:
         return enriched, removed
 
     def save_caches(self):
-        self._save_cache(self.cache, self.cache_file)
         if not self.no_geocode:
             self._save_cache(self.geocode_cache, self.geocode_file)
+        # The admin API routes still read the legacy JSON
+        count = self.cache.export_json()
+        print(f"Exported {count} enrichment cache entries to {self.cache.legacy_file}")
 
 
 def main():
@@ -1017,17 +1449,19 @@ def main():
                         help="Override LLM model (default: depends on provider)")
     parser.add_argument("--provider", default=None, choices=list(PROVIDERS.keys()),
                         help="LLM provider (default: openrouter)")
+    parser.add_argument("--packing", default=BATCH_PACKING, choices=["tokens", "fixed"],
+                        help=f"Batch articles by token budget or in fixed-size batches (default: {BATCH_PACKING})")
+    parser.add_argument("--stream-responses", action="store_true", default=STREAM_RESPONSES,
+                        help="Stream completions and geocode each incident as it arrives")
+    parser.add_argument("--prompt-layout", default=PROMPT_LAYOUT, choices=["system", "inline"],
+                        help=f"Instructions as a cacheable system message or inline in one user message "
+                             f"(default: {PROMPT_LAYOUT})")
 
     args = parser.parse_args()
 
-    # Load articles
-    with open(args.input, "r", encoding="utf-8") as f:
-        data = json.load(f)
-
-    if isinstance(data, list):
-        articles = data
-    else:
-        articles = data.get("articles", [])
+    # Load articles (JSON or NDJSON)
+    source = ArticleFile(args.input)
+    articles = list(source)  # batches are planned over the whole input
 
     if not articles:
         print("No articles found")
@@ -1061,7 +1495,8 @@ def main():
     no_geocode = not args.with_geocode
     enricher = FastEnricher(cache_dir=args.cache_dir, no_geocode=no_geocode,
                             prompt_version=args.prompt_version, model=args.model,
-                            provider=args.provider)
+                            provider=args.provider, packing=args.packing,
+                            stream_responses=args.stream_responses, prompt_layout=args.prompt_layout)
 
     try:
         enriched, removed = enricher.enrich_all(
@@ -1078,7 +1513,7 @@ def main():
     all_removed = prefilter_removed + removed
 
     # Save enriched output
-    output_data = {"articles": enriched} if isinstance(data, dict) else enriched
+    output_data = {"articles": enriched} if source.wrapper is not None else enriched
     with open(args.output, "w", encoding="utf-8") as f:
         json.dump(output_data, f, ensure_ascii=False, indent=2)
 
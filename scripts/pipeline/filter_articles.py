@@ -24,6 +24,10 @@ from typing import Optional
 import certifi
 from dotenv import load_dotenv
 
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent))
+from scripts.pipeline.article_io import ArticleFile
+
 load_dotenv()
 os.environ['SSL_CERT_FILE'] = certifi.where()
 
@@ -117,13 +121,13 @@ def _is_missing_person_bulletin(title: str) -> bool:
     )
 
 
-def is_junk_article(article: dict) -> Optional[str]:
-    """Check if article is junk.
-    Returns removal reason string, or None if article is valid.
+def junk_title_reason(title: Optional[str], source: Optional[str] = None) -> Optional[str]:
+    """The title/source part of is_junk_article().
+
+    Needs no article body, so scrapers can apply it to listing entries
+    before fetching the article page.
     """
-    title = article.get("title", "")
-    body = article.get("body", "")
-    source = article.get("source", "")
+    title = title or ""
 
     # Feuerwehr backup check
     if source and FEUERWEHR_PATTERN.search(source):
@@ -140,6 +144,21 @@ def is_junk_article(article: dict) -> Optional[str]:
         if pattern.search(title):
             return f"junk_title:{pattern.pattern[:30]}"
 
+    return None
+
+
+def is_junk_article(article: dict) -> Optional[str]:
+    """Check if article is junk.
+    Returns removal reason string, or None if article is valid.
+    """
+    title = article.get("title", "")
+    body = article.get("body", "")
+    source = article.get("source", "")
+
+    reason = junk_title_reason(title, source)
+    if reason:
+        return reason
+
     # Body-based junk
     for pattern in JUNK_BODY_PATTERNS:
         if pattern.search(body[:500]):
@@ -386,28 +405,20 @@ def run_filter(
 
     Returns stats dict with counts.
     """
-    # Load articles
-    with open(input_path, "r", encoding="utf-8") as f:
-        data = json.load(f)
-
-    if isinstance(data, list):
-        articles = data
-    else:
-        articles = data.get("articles", [])
-
-    total = len(articles)
-    print(f"Loaded {total} articles from {input_path}")
-
-    # Step 1: Junk removal
+    # Read articles lazily (JSON or NDJSON); step 1: junk removal as they come
+    source = ArticleFile(input_path)
+    total = 0
     kept = []
     removed = []
-    for art in articles:
+    for art in source:
+        total += 1
         reason = is_junk_article(art)
         if reason:
             removed.append({**art, "_removal_reason": reason})
         else:
             kept.append(art)
 
+    print(f"Loaded {total} articles from {input_path}")
     junk_count = len(removed)
     print(f"Junk removal: {junk_count} removed, {len(kept)} kept")
 
@@ -449,10 +460,7 @@ def run_filter(
 
     # Write output
     Path(output_path).parent.mkdir(parents=True, exist_ok=True)
-    if isinstance(data, list):
-        output_data = kept
-    else:
-        output_data = {**data, "articles": kept}
+    output_data = source.wrap(kept)
 
     with open(output_path, "w", encoding="utf-8") as f:
         json.dump(output_data, f, ensure_ascii=False, indent=2)
@@ -13,6 +13,7 @@ Usage:
 
 import asyncio
 import fcntl
+import importlib
 import json
 import os
 import sys
@@ -35,7 +36,7 @@ from .config import (
     CACHE_DIR,
     PROJECT_ROOT,
 )
-from .poll_state import PollState
+from .poll_state import PollState, newest_watermark
 from .filter_articles import is_junk_article
 from .push_to_supabase import transform_article
 
@@ -44,6 +45,12 @@ LIVE_POLL_INTERVAL_MINUTES = 15
 LIVE_MAX_ARTICLES_PER_SOURCE = 200
 LIVE_CONCURRENT_REQUESTS = 5
 LIVE_PIPELINE_RUN_NAME = "cron_2026"
+# Presseportal states come from one crawl of the unfiltered /blaulicht/ feed
+# (articles attributed to states locally) instead of one listing crawl per state
+LIVE_PRESSEPORTAL_FIREHOSE = True
+# Dedicated state scrapers run as concurrent tasks over one shared session
+# (they hit different hosts) instead of one after another
+LIVE_DEDICATED_CONCURRENT = True
 PUSH_QUEUE_FILE = CACHE_DIR / "push_queue.json"
 LOCK_FILE = CACHE_DIR / "live_pipeline.lock"
 
@@ -88,6 +95,14 @@ class LivePipeline:
         self.supabase = None  # Lazy-init on first use
 
         self._start_date = None  # Cached start date for this cycle
+        # Presseportal articles from this cycle's firehose crawl, by state
+        self._firehose_articles: dict[str, list[dict]] | None = None
+        # Newest article of the whole firehose crawl: the crawl covered the
+        # feed down to the old watermark for every state, so each gets this one
+        self._firehose_watermark: dict | None = None
+        # Dedicated scraper results from this cycle's concurrent run, by source
+        # name (the exception instead, if that scraper failed)
+        self._dedicated_articles: dict[str, list[dict] | BaseException] = {}
 
         # Cycle metrics
         self.cycle_start = None
@@ -224,26 +239,33 @@ class LivePipeline:
 
     async def _scrape_source(self, source: dict) -> list[dict]:
         """Scrape a single source and return new articles as dicts."""
-        start_date = self._get_start_date_for_source(source)
         end_date = _today_iso()
 
-        if source["type"] == "presseportal":
+        if source["type"] == "presseportal" and self._firehose_articles is not None \
+                and source["bundesland"] in self._firehose_articles:
+            articles = self._firehose_articles.pop(source["bundesland"])
+        elif source["type"] == "dedicated" and source["name"] in self._dedicated_articles:
+            articles = self._dedicated_articles.pop(source["name"])
+            if isinstance(articles, BaseException):
+                raise articles
+        elif source["type"] == "presseportal":
             from scripts.scrape_blaulicht_async import scrape_new as pp_scrape
             articles = await pp_scrape(
                 bundesland=source["bundesland"],
-                start_date=start_date,
+                start_date=self._get_start_date_for_source(source),
                 end_date=end_date,
                 cache_dir=self.cache_dir,
                 concurrent=LIVE_CONCURRENT_REQUESTS,
+                watermark=self.poll_state.get_watermark(source["name"]),
             )
         else:
-            import importlib
             mod = importlib.import_module(source["module"])
             articles = await mod.scrape_new(
-                start_date=start_date,
+                start_date=self._get_start_date_for_source(source),
                 end_date=end_date,
                 cache_dir=self.cache_dir,
                 concurrent=LIVE_CONCURRENT_REQUESTS,
+                watermark=self.poll_state.get_watermark(source["name"]),
             )
 
         # Cap articles per source
@@ -253,6 +275,75 @@ class LivePipeline:
 
         return articles
 
+    async def _prefetch_presseportal(self, sources: list[dict]) -> None:
+        """Crawl /blaulicht/ once for every presseportal source due this cycle.
+
+        _scrape_source then hands each state its share. On failure the
+        sources fall back to per-state crawls. The crawl stops at the oldest
+        of the states' watermarks (none if any state has no watermark yet).
+        """
+        due = [s for s in sources
+               if s["type"] == "presseportal" and not self.poll_state.should_backoff(s["name"])]
+        states = [s["bundesland"] for s in due]
+        if len(states) < 2:
+            return
+        marks = [self.poll_state.get_watermark(s["name"]) for s in due]
+        watermark = None
+        if all(marks):
+            watermark = min(marks, key=lambda m: m["published_at"][:19])
+        print(f"\n  [presseportal] Firehose crawl for {len(states)} states...")
+        try:
+            from scripts.scrape_blaulicht_async import scrape_new_firehose
+            self._firehose_articles = await scrape_new_firehose(
+                states=states,
+                start_date=self._get_start_date(),
+                end_date=_today_iso(),
+                cache_dir=self.cache_dir,
+                concurrent=LIVE_CONCURRENT_REQUESTS,
+                watermark=watermark,
+            )
+            self._firehose_watermark = newest_watermark(
+                [a for articles in self._firehose_articles.values() for a in articles]
+            )
+        except Exception as e:
+            print(f"  [presseportal] Firehose crawl failed, falling back to per-state crawls: {e}")
+            self._firehose_articles = None
+
+    async def _prefetch_dedicated(self, sources: list[dict]) -> None:
+        """Run every dedicated scraper due this cycle as one concurrent batch.
+
+        All scrapers share one aiohttp session in this event loop; each keeps
+        its own semaphore and rate controller. _scrape_source then hands each
+        source its result, re-raising a scraper's exception there so the
+        failure is recorded against that source only.
+        """
+        due = [s for s in sources
+               if s["type"] == "dedicated" and not self.poll_state.should_backoff(s["name"])]
+        if len(due) < 2:
+            return
+        import aiohttp
+        from scripts.scrapers.base import create_connector
+
+        # Per-source start dates are synchronous Supabase queries; resolve them up front
+        start_dates = {s["name"]: self._get_start_date_for_source(s) for s in due}
+        print(f"\n  [dedicated] Scraping {len(due)} sources concurrently: "
+              f"{', '.join(s['name'] for s in due)}")
+
+        # No pool-wide cap: every scraper's semaphore bounds its own host
+        async with aiohttp.ClientSession(connector=create_connector(limit=0)) as session:
+            results = await asyncio.gather(
+                *(importlib.import_module(s["module"]).scrape_new(
+                    start_date=start_dates[s["name"]],
+                    end_date=_today_iso(),
+                    cache_dir=self.cache_dir,
+                    concurrent=LIVE_CONCURRENT_REQUESTS,
+                    session=session,
+                    watermark=self.poll_state.get_watermark(s["name"]),
+                ) for s in due),
+                return_exceptions=True,
+            )
+        self._dedicated_articles = {s["name"]: r for s, r in zip(due, results)}
+
     def _filter_junk(self, articles: list[dict]) -> list[dict]:
         """Remove junk articles."""
         kept = []
@@ -351,12 +442,17 @@ class LivePipeline:
         try:
             # 1. Scrape
             print(f"\n  [{name}] Scraping...")
+            from_firehose = source["type"] == "presseportal" and self._firehose_articles is not None \
+                and source["bundesland"] in self._firehose_articles
             articles = await self._scrape_source(source)
             result["scraped"] = len(articles)
             print(f"  [{name}] Scraped {len(articles)} new articles")
+            # Scraped articles are URL-cached, so the watermark advances even
+            # if all of them turn out to be junk
+            watermark = self._firehose_watermark if from_firehose else newest_watermark(articles)
 
             if not articles:
-                self.poll_state.record_success(name, 0)
+                self.poll_state.record_success(name, 0, watermark)
                 return result
 
             # 2. Filter junk
@@ -366,7 +462,7 @@ class LivePipeline:
                 print(f"  [{name}] Filtered {filtered_out} junk articles, {len(kept)} remaining")
 
             if not kept:
-                self.poll_state.record_success(name, 0)
+                self.poll_state.record_success(name, 0, watermark)
                 return result
 
             # 3. Enrich
@@ -391,7 +487,7 @@ class LivePipeline:
                     result["pushed"] = pushed
                     print(f"  [{name}] Pushed {pushed} records to Supabase")
 
-            self.poll_state.record_success(name, result["pushed"])
+            self.poll_state.record_success(name, result["pushed"], watermark)
 
         except Exception as e:
             result["error"] = str(e)
@@ -405,6 +501,11 @@ class LivePipeline:
     async def run_cycle(self) -> dict:
         """Run one complete poll cycle across all sources."""
         self.cycle_start = _now_utc()
+        # Prefetched results belong to one cycle; a source whose prefetch is
+        # skipped this time must not pick up the previous cycle's articles
+        self._firehose_articles = None
+        self._firehose_watermark = None
+        self._dedicated_articles = {}
         sources = self._get_sources()
         print(f"\n{'='*60}")
         print(f"Live Pipeline Cycle — {self.cycle_start.isoformat()}")
@@ -416,6 +517,15 @@ class LivePipeline:
         if drained:
             self.total_pushed += drained
 
+        # Up-front crawls run side by side (different hosts); each source then
+        # picks up its share in the sequential loop below
+        prefetches = []
+        if LIVE_PRESSEPORTAL_FIREHOSE:
+            prefetches.append(self._prefetch_presseportal(sources))
+        if LIVE_DEDICATED_CONCURRENT:
+            prefetches.append(self._prefetch_dedicated(sources))
+        await asyncio.gather(*prefetches)
+
         # Process each source sequentially (to be polite to APIs)
         for source in sources:
             result = await self._process_source(source)
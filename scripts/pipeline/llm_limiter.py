@@ -0,0 +1,210 @@
+"""
+Adaptive concurrency limit shared by all in-flight LLM calls.
+
+A fixed asyncio.Semaphore(30) never finds out how much the provider will
+take. Each call also backed off on its own after a 429, so one throttle
+turned into a burst of retries landing together. AdaptiveLimiter replaces
+the semaphore with AIMD:
+
+- after every `limit` successful calls it adds one slot, as long as the
+  recent p95 latency stays near its running baseline and calls are not
+  failing
+- the first 429 of an episode halves the limit and starts a global
+  cooldown (Retry-After if the provider sends one, else doubling from
+  ASYNC_THROTTLE_COOLDOWN); no call starts until it is over
+- an optional tokens-per-minute bucket (PROVIDERS[...]["tokens_per_minute"])
+  holds calls back before they would exceed the provider's budget
+
+Usage:
+    limiter = AdaptiveLimiter(30, max_limit=100, tokens_per_minute=None)
+    await limiter.acquire(est_tokens)
+    ... call ...
+    limiter.release("ok", latency_s=1.2, est_tokens=est_tokens, used_tokens=usage.total_tokens)
+"""
+
+import asyncio
+import time
+from collections import deque
+from typing import Optional
+
+# Calls the latency percentile and error rate are computed over
+_WINDOW = 50
+# p95 may drift this far above its baseline and still count as flat
+_LATENCY_TOLERANCE = 1.5
+# Weight of each round's p95 in the running baseline
+_BASELINE_WEIGHT = 0.1
+# Share of calls that may fail (timeouts, connection errors) while growing
+_MAX_ERROR_RATE = 0.02
+# Multiplicative decrease on a throttle
+_DECREASE = 0.5
+
+
+class AdaptiveLimiter:
+    """AIMD concurrency limit with a global throttle cooldown and optional TPM budget."""
+
+    def __init__(
+        self,
+        initial: int,
+        max_limit: Optional[int] = None,
+        min_limit: int = 1,
+        tokens_per_minute: Optional[int] = None,
+        cooldown: float = 5.0,
+        max_cooldown: float = 60.0,
+    ):
+        self.min_limit = max(1, min_limit)
+        self.max_limit = max(initial, max_limit or initial)
+        self.limit = float(max(self.min_limit, initial))
+        self.in_flight = 0
+
+        self.throttles = 0        # 429 responses
+        self.cuts = 0             # throttle episodes (limit cuts + cooldowns)
+        self.cooldown_until = 0.0
+        self._cooldown = cooldown
+        self._next_cooldown = cooldown
+        self._max_cooldown = max_cooldown
+
+        self.tokens_per_minute = tokens_per_minute
+        self._tokens = float(tokens_per_minute or 0)
+        self._refilled_at = time.monotonic()
+
+        self._latencies: deque[float] = deque(maxlen=_WINDOW)
+        self._failures: deque[bool] = deque(maxlen=_WINDOW)
+        self._baseline_p95: Optional[float] = None
+        self._since_change = 0
+
+        # FIFO of (future, est_tokens); each wakeup hands over one slot, so
+        # thousands of queued batches cost O(1) per release
+        self._waiters: deque[tuple[asyncio.Future, int]] = deque()
+        self._timer: Optional[asyncio.TimerHandle] = None
+
+    # ---- Slots ----
+    async def acquire(self, est_tokens: int = 0) -> None:
+        """Wait for a free slot, the end of any cooldown and enough TPM budget."""
+        if not self._waiters and self._try_take(est_tokens):
+            return
+        future = asyncio.get_running_loop().create_future()
+        self._waiters.append((future, est_tokens))
+        self._wake()
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                # The slot was handed over just before the cancel: give it back
+                self.in_flight -= 1
+                self._wake()
+            raise
+
+    def release(
+        self,
+        outcome: str,
+        latency_s: Optional[float] = None,
+        est_tokens: int = 0,
+        used_tokens: Optional[int] = None,
+        retry_after: Optional[float] = None,
+    ) -> None:
+        """Return a slot. outcome is "ok", "throttled" (429) or "error"."""
+        self.in_flight -= 1
+        if self.tokens_per_minute and used_tokens is not None:
+            # Settle the estimate taken in acquire() against actual usage
+            self._tokens -= used_tokens - min(est_tokens, self.tokens_per_minute)
+
+        if outcome == "throttled":
+            self._throttled(retry_after)
+        elif outcome == "ok":
+            if latency_s is not None:
+                self._latencies.append(latency_s)
+            self._failures.append(False)
+            self._next_cooldown = self._cooldown
+            self._maybe_increase()
+        else:
+            self._failures.append(True)
+        self._wake()
+
+    def _try_take(self, est_tokens: int) -> bool:
+        if self.in_flight >= int(self.limit) or time.monotonic() < self.cooldown_until:
+            return False
+        need = 0.0
+        if self.tokens_per_minute:
+            self._refill(time.monotonic())
+            need = float(min(est_tokens, self.tokens_per_minute))
+            if self._tokens < need:
+                return False
+        self.in_flight += 1
+        self._tokens -= need
+        return True
+
+    def _wake(self) -> None:
+        """Hand free slots to waiters in order; if time (cooldown/TPM) blocks them, retry later."""
+        while self._waiters:
+            future, est_tokens = self._waiters[0]
+            if future.done():
+                self._waiters.popleft()  # cancelled while queued
+                continue
+            if not self._try_take(est_tokens):
+                break
+            self._waiters.popleft()
+            future.set_result(None)
+
+        if not self._waiters or self.in_flight >= int(self.limit) or self._timer is not None:
+            return
+        # A slot is free but the head waiter must wait out a cooldown or refill
+        now = time.monotonic()
+        delay = self.cooldown_until - now
+        if delay <= 0 and self.tokens_per_minute:
+            need = min(self._waiters[0][1], self.tokens_per_minute)
+            delay = (need - self._tokens) * 60 / self.tokens_per_minute
+        self._timer = asyncio.get_running_loop().call_later(max(delay, 0.001), self._on_timer)
+
+    def _on_timer(self) -> None:
+        self._timer = None
+        self._wake()
+
+    # ---- Control ----
+    def _throttled(self, retry_after: Optional[float]) -> None:
+        self.throttles += 1
+        now = time.monotonic()
+        if now < self.cooldown_until:
+            return  # same episode: calls that were already in flight
+        self.cuts += 1
+        self.limit = max(float(self.min_limit), self.limit * _DECREASE)
+        delay = retry_after if retry_after and retry_after > 0 else self._next_cooldown
+        self._next_cooldown = min(self._next_cooldown * 2, self._max_cooldown)
+        self.cooldown_until = now + min(delay, self._max_cooldown)
+        self._since_change = 0
+
+    def _maybe_increase(self) -> None:
+        self._since_change += 1
+        if self._since_change < int(self.limit) or len(self._latencies) < _WINDOW // 2:
+            return
+        self._since_change = 0
+        p95 = self.p95()
+        if self._baseline_p95 is None:
+            self._baseline_p95 = p95
+        flat = p95 <= self._baseline_p95 * _LATENCY_TOLERANCE and self.error_rate() <= _MAX_ERROR_RATE
+        self._baseline_p95 += _BASELINE_WEIGHT * (p95 - self._baseline_p95)
+        if flat and self.limit < self.max_limit:
+            self.limit = min(float(self.max_limit), self.limit + 1)
+
+    def _refill(self, now: float) -> None:
+        elapsed = now - self._refilled_at
+        self._refilled_at = now
+        self._tokens = min(float(self.tokens_per_minute), self._tokens + elapsed * self.tokens_per_minute / 60)
+
+    # ---- Reporting ----
+    def p95(self) -> float:
+        if not self._latencies:
+            return 0.0
+        ordered = sorted(self._latencies)
+        return ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))]
+
+    def error_rate(self) -> float:
+        return sum(self._failures) / len(self._failures) if self._failures else 0.0
+
+    def status(self) -> str:
+        """Live state for progress lines."""
+        line = (f"conc {int(self.limit)}/{self.max_limit} ({self.in_flight} active), "
+                f"p95 {self.p95():.1f}s, {self.throttles} throttled/{self.cuts} cuts")
+        remaining = self.cooldown_until - time.monotonic()
+        if remaining > 0:
+            line += f", cooldown {remaining:.0f}s"
+        return line
@@ -26,6 +26,7 @@ from .config import (
     FILTER_SCRIPT,
     BUNDESLAENDER,
     DEDICATED_SCRAPER_STATES,
+    PRESSEPORTAL_STATES,
     STATE_SCRAPER_SCRIPTS,
     LOG_DIR,
     DATA_DIR,
@@ -51,6 +52,7 @@ from .chunk_manager import (
 MAX_PARALLEL_SCRAPERS = 8  # Run 8 scrapers at once
 MAX_PARALLEL_ENRICHERS = 4  # Run 4 enrichers at once (LLM rate limits)
 DELAY_BETWEEN_BATCHES = 2  # Seconds between batch starts
+USE_PRESSEPORTAL_ENGINE = True  # Scrape presseportal states in-process (one session) instead of subprocesses
 
 # Global shutdown flag
 _shutdown_requested = False
@@ -126,6 +128,37 @@ def _run_single_state_scraper(
         return False, 0, str(e)[:200]
 
 
+def run_presseportal_engine_phase(chunks: list[dict]) -> None:
+    """Scrape the presseportal states of all chunks in-process, in one event loop.
+
+    Results are stored on each chunk as chunk["presseportal_results"]
+    ({bundesland: (success, count, error)}) for run_scraper_sync to pick up;
+    state files that already have data are left to its resume logic.
+    """
+    from .presseportal_engine import scrape_jobs
+
+    jobs = []
+    owners = []
+    for chunk in chunks:
+        ensure_chunk_dirs(chunk)
+        chunk["presseportal_results"] = {}
+        for bundesland in PRESSEPORTAL_STATES:
+            state_file = chunk_raw_path(bundesland, chunk["year_month"])
+            if state_file.exists() and state_file.stat().st_size > 10:
+                continue
+            jobs.append((bundesland, chunk["start_date"], chunk["end_date"], str(state_file)))
+            owners.append((chunk, bundesland))
+
+    if not jobs:
+        return
+
+    print(f"\n[{datetime.now().isoformat()}] Presseportal engine: {len(jobs)} state-months "
+          f"across {len(chunks)} chunks")
+    results = scrape_jobs(jobs, should_stop=lambda: _shutdown_requested)
+    for (chunk, bundesland), result in zip(owners, results):
+        chunk["presseportal_results"][bundesland] = result
+
+
 def run_scraper_sync(chunk: dict, use_async: bool = True) -> tuple[str, bool, Optional[int], Optional[str]]:
     """
     Run scraper for a single monthly chunk across all Bundesländer.
@@ -151,6 +184,16 @@ def run_scraper_sync(chunk: dict, use_async: bool = True) -> tuple[str, bool, Op
         if _shutdown_requested:
             break
 
+        # Already scraped in-process by run_presseportal_engine_phase
+        engine_result = chunk.get("presseportal_results", {}).get(bundesland)
+        if engine_result:
+            success, count, error = engine_result
+            if success:
+                total_articles += count
+            else:
+                failed_states.append(f"{bundesland}: {error}")
+            continue
+
         # Per-state output file: chunks/raw/{bundesland}/{year}/{MM}.json
         state_file = str(chunk_raw_path(bundesland, chunk['year_month']))
 
@@ -420,6 +463,9 @@ def run_parallel_pipeline(
             update_chunk_status(manifest, chunk["id"], "in_progress")
         save_manifest(manifest)
 
+        if USE_PRESSEPORTAL_ENGINE:
+            run_presseportal_engine_phase(pending_chunks)
+
         scrape_success, scrape_fail = run_parallel_phase(
             pending_chunks,
             "scrape",
@@ -500,6 +546,9 @@ def run_scrape_only(
 
     start_time = time.time()
 
+    if USE_PRESSEPORTAL_ENGINE:
+        run_presseportal_engine_phase(to_scrape)
+
     run_parallel_phase(
         to_scrape,
         "scrape",
@@ -539,6 +588,21 @@ def run_enrich_only() -> None:
     print(get_progress_summary(manifest))
 
 
+def _chunk_input_files(chunk: dict) -> list[Path]:
+    """Input files of a manifest chunk: its filtered/raw file, else per-state raw files."""
+    # Use filtered file if available, otherwise raw
+    input_file = chunk.get("filtered_file") or chunk.get("raw_file")
+    if input_file and Path(input_file).exists():
+        return [Path(input_file)]
+    # Try per-state raw files: {bundesland}_{german_month}_{year}.json
+    ym = chunk.get('year_month', '')
+    if '-' not in ym:
+        return []
+    ym_year, ym_month = ym.split('-')
+    german_month = GERMAN_MONTHS.get(ym_month, '')
+    return sorted(CHUNKS_RAW_DIR.glob(f"*_{german_month}_{ym_year}.json")) if german_month else []
+
+
 async def _run_turbo_phase(
     manifest: dict,
     concurrency: int = ASYNC_CONCURRENCY,
@@ -549,13 +613,15 @@ async def _run_turbo_phase(
 ) -> None:
     """Run turbo (async) enrichment on all in-progress manifest chunks.
 
-    Loads all articles from raw/filtered chunk files, enriches them via
-    AsyncFastEnricher with high concurrency, then splits results back
-    into per-chunk enriched files and updates the manifest.
+    Streams the chunks' articles through AsyncFastEnricher.enrich_stream one
+    file at a time, so memory stays flat over a full backfill. Each chunk's
+    enriched file is written and marked completed in the manifest as soon
+    as all of its articles are resolved.
 
     Used by both `run_parallel_pipeline()` Phase 3 and `run_turbo_enrich()` Mode 3.
     """
-    from .async_enricher import AsyncFastEnricher
+    from .article_io import load_articles
+    from .async_enricher import AsyncFastEnricher, StreamedOutput
 
     to_enrich = [
         (chunk_id, chunk)
@@ -573,50 +639,6 @@ async def _run_turbo_phase(
     print(f"  Chunks to enrich: {len(to_enrich)}")
     print(f"{'='*60}")
 
-    # Load all articles from raw chunk files
-    all_articles = []
-    chunk_article_ranges: list[tuple[str, dict, int, int]] = []
-
-    for chunk_id, chunk in to_enrich:
-        # Use filtered file if available, otherwise raw
-        input_file = chunk.get("filtered_file") or chunk.get("raw_file")
-        if not input_file or not Path(input_file).exists():
-            # Try per-state raw files: {bundesland}_{german_month}_{year}.json
-            ym = chunk.get('year_month', '')
-            if '-' in ym:
-                ym_year, ym_month = ym.split('-')
-                german_month = GERMAN_MONTHS.get(ym_month, '')
-                raw_files = sorted(CHUNKS_RAW_DIR.glob(f"*_{german_month}_{ym_year}.json")) if german_month else []
-            else:
-                raw_files = []
-            if not raw_files:
-                print(f"  Skipping {chunk_id}: no input files found")
-                continue
-            articles = []
-            for rf in raw_files:
-                with open(rf, "r", encoding="utf-8") as f:
-                    data = json.load(f)
-                    arts = data if isinstance(data, list) else data.get("articles", [])
-                    articles.extend(arts)
-        else:
-            with open(input_file, "r", encoding="utf-8") as f:
-                data = json.load(f)
-                articles = data if isinstance(data, list) else data.get("articles", [])
-
-        if not articles:
-            continue
-
-        start_idx = len(all_articles)
-        all_articles.extend(articles)
-        chunk_article_ranges.append((chunk_id, chunk, start_idx, start_idx + len(articles)))
-
-    print(f"  Total articles loaded: {len(all_articles)}")
-
-    if not all_articles:
-        print("No articles to enrich.")
-        return
-
-    # Enrich all articles in one shot
     enricher = AsyncFastEnricher(
         cache_dir=".cache",
         concurrency=concurrency,
@@ -637,44 +659,60 @@ async def _run_turbo_phase(
     for s in (sig.SIGINT, sig.SIGTERM):
         loop.add_signal_handler(s, _signal_shutdown)
 
-    try:
-        enriched, removed = await enricher.enrich_all(all_articles)
-    except Exception:
-        enricher.save_cache_sync()
-        raise
+    outputs: list[StreamedOutput] = []
+    chunk_of: dict[int, str] = {}           # id(output) -> chunk_id
+    owner: dict[int, StreamedOutput] = {}   # id(article) -> its output, while in flight
+    totals = {"records": 0, "chunks": 0}
 
-    await enricher.save_cache()
+    def _finish(output: StreamedOutput) -> None:
+        n = output.finish()
+        update_chunk_status(manifest, chunk_of[id(output)], "completed", enriched_count=n)
+        save_manifest(manifest)
+        totals["records"] += n
+        totals["chunks"] += 1
+
+    async def _articles():
+        for chunk_id, chunk in to_enrich:
+            if enricher._shutdown:
+                return
+            input_files = _chunk_input_files(chunk)
+            if not input_files:
+                print(f"  Skipping {chunk_id}: no input files found")
+                continue
 
-    # Build URL-based lookup for splitting results back into chunks
-    enriched_by_url: dict[str, list[dict]] = {}
-    for rec in enriched:
-        url = rec.get("url", "")
-        enriched_by_url.setdefault(url, []).append(rec)
-
-    # Split results back into per-chunk output files
-    for chunk_id, chunk, start_idx, end_idx in chunk_article_ranges:
-        chunk_enriched = []
-        for idx in range(start_idx, end_idx):
-            art = all_articles[idx]
-            url = art.get("url", "")
-            if url in enriched_by_url:
-                chunk_enriched.extend(enriched_by_url.pop(url, []))
-
-        enriched_file = chunk.get("enriched_file")
-        if not enriched_file:
-            bl = chunk.get("bundesland", "unknown")
-            ym = chunk.get("year_month", chunk_id)
-            enriched_file = str(chunk_enriched_path(bl, ym))
-
-        if chunk_enriched:
-            Path(enriched_file).parent.mkdir(parents=True, exist_ok=True)
-            with open(enriched_file, "w", encoding="utf-8") as f:
-                json.dump(chunk_enriched, f, ensure_ascii=False, indent=2)
-
-        update_chunk_status(manifest, chunk_id, "completed", enriched_count=len(chunk_enriched))
+            enriched_file = chunk.get("enriched_file")
+            if not enriched_file:
+                bl = chunk.get("bundesland", "unknown")
+                ym = chunk.get("year_month", chunk_id)
+                enriched_file = str(chunk_enriched_path(bl, ym))
+            output = StreamedOutput(Path(enriched_file))
+            outputs.append(output)
+            chunk_of[id(output)] = chunk_id
+
+            for input_file in input_files:
+                for art in await asyncio.to_thread(load_articles, input_file):
+                    owner[id(art)] = output
+                    output.pending += 1
+                    yield art
+            output.reading = False
+            if output.done:
+                _finish(output)
+
+    async for art, records, _ in enricher.enrich_stream(_articles()):
+        output = owner.pop(id(art))
+        output.add(records)
+        if output.done:
+            _finish(output)
+
+    unfinished = [o for o in outputs if not o.finished]
+    for output in unfinished:
+        output.discard()
+    if unfinished:
+        reason = "shutdown" if enricher._shutdown else "incomplete"
+        print(f"  {len(unfinished)} chunks left in progress ({reason}) — rerun to resume from the cache")
+    await enricher.save_cache()
 
-    save_manifest(manifest)
-    print(f"\nTurbo enrichment complete. {len(enriched)} records across {len(chunk_article_ranges)} chunks.")
+    print(f"\nTurbo enrichment complete. {totals['records']} records across {totals['chunks']} chunks.")
 
 
 async def run_turbo_enrich(
@@ -4,18 +4,37 @@ Per-source poll state tracking for the live pipeline.
 Dual storage:
   - Primary: Supabase `pipeline_poll_state` table (survives machine changes)
   - Fallback: `.cache/poll_state.json` (works offline / when Supabase unreachable)
+
+Each source also keeps a listing watermark: the URL and publication time of
+the newest article its last successful cycle scraped. Scrapers given the
+watermark stop listing discovery at the first page with nothing newer, so a
+steady-state cycle fetches one or two listing pages per source. The Supabase
+columns come from migrations/add_poll_watermarks.sql.
 """
 
 import json
 import os
 from datetime import datetime, timezone
 from pathlib import Path
+from typing import Optional
 
 from dotenv import load_dotenv
 
 load_dotenv()
 load_dotenv(Path(".env.local"), override=True)
 
+WATERMARK_KEYS = ("watermark_url", "watermark_published_at")
+
+
+def newest_watermark(articles: list[dict]) -> Optional[dict]:
+    """Watermark ({"url", "published_at"}) of the newest dated article, or None."""
+    dated = [a for a in articles if a.get("date") and a.get("url")]
+    if not dated:
+        return None
+    # ISO dates sort as strings; compare up to seconds so timezone suffixes don't matter
+    newest = max(dated, key=lambda a: a["date"][:19])
+    return {"url": newest["url"], "published_at": newest["date"]}
+
 
 class PollState:
     """Track per-source poll metadata."""
@@ -61,13 +80,31 @@ class PollState:
             "last_error": None,
         })
 
-    def record_success(self, source: str, articles_count: int) -> None:
+    def get_watermark(self, source: str) -> Optional[dict]:
+        """Return {"url", "published_at"} of the source's watermark, if any."""
+        info = self.get(source)
+        if not info.get("watermark_published_at"):
+            return None
+        return {"url": info.get("watermark_url"), "published_at": info["watermark_published_at"]}
+
+    def record_success(self, source: str, articles_count: int,
+                       watermark: Optional[dict] = None) -> None:
+        """Record a successful cycle, advancing the watermark if `watermark` is newer."""
         now = datetime.now(timezone.utc).isoformat()
+        existing = self.get(source)
+        marks = {key: existing.get(key) for key in WATERMARK_KEYS}
+        current = marks["watermark_published_at"]
+        if watermark and (not current or watermark["published_at"][:19] >= current[:19]):
+            marks = {
+                "watermark_url": watermark["url"],
+                "watermark_published_at": watermark["published_at"],
+            }
         self.state[source] = {
             "last_success_at": now,
             "last_articles_count": articles_count,
             "consecutive_failures": 0,
             "last_error": None,
+            **marks,
         }
         self._save_local()
         self._sync_to_supabase(source)
@@ -97,11 +134,16 @@ class PollState:
         sb = self._get_supabase()
         if not sb:
             return
+        row = {"source": source, **self.state[source]}
         try:
-            row = {"source": source, **self.state[source]}
             sb.table("pipeline_poll_state").upsert(row, on_conflict="source").execute()
         except Exception:
-            pass  # Supabase sync is best-effort
+            # Table may predate the watermark columns; sync the rest
+            try:
+                row = {k: v for k, v in row.items() if k not in WATERMARK_KEYS}
+                sb.table("pipeline_poll_state").upsert(row, on_conflict="source").execute()
+            except Exception:
+                pass  # Supabase sync is best-effort
 
     def load_from_supabase(self) -> bool:
         """Pull state from Supabase (used on fresh machines). Returns True on success."""
@@ -134,6 +176,8 @@ class PollState:
             err = info.get("last_error", "")
             status = f"OK ({count} articles)" if fails == 0 else f"FAILING x{fails}"
             lines.append(f"  {source:<25} {status:<20} last: {last}")
+            if info.get("watermark_published_at"):
+                lines.append(f"  {'':25} watermark: {info['watermark_published_at']} {info.get('watermark_url') or ''}")
             if err:
                 lines.append(f"  {'':25} error: {err[:80]}")
         return "Poll State:\n" + "\n".join(lines)
@@ -18,6 +18,10 @@ import certifi
 import requests
 from dotenv import load_dotenv
 
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent))
+from scripts.pipeline.enrichment_store import EnrichmentStore
+
 load_dotenv()
 load_dotenv(Path(".env.local"), override=True)
 os.environ['SSL_CERT_FILE'] = certifi.where()
@@ -107,10 +111,11 @@ def main():
     parser.add_argument("--cache-dir", required=True, help="Cache directory (e.g. .cache/week_2026_w01)")
     parser.add_argument("--dry-run", action="store_true", help="Count addresses without geocoding")
     parser.add_argument("--batch-save", type=int, default=200, help="Save cache every N geocodes")
+    parser.add_argument("--fingerprint", action="append", default=[],
+                        help="Enrichment cache namespace to update (repeatable; default: all)")
     args = parser.parse_args()
 
     cache_dir = Path(args.cache_dir)
-    enrichment_file = cache_dir / "enrichment_cache.json"
     geocode_file = cache_dir / "geocode_cache.json"
 
     api_key = os.environ.get("HERE_API_KEY")
@@ -118,10 +123,11 @@ def main():
         print("ERROR: HERE_API_KEY not set")
         sys.exit(1)
 
-    # Load caches
-    print(f"Loading enrichment cache from {enrichment_file}")
-    enrichment_cache = json.load(open(enrichment_file, encoding="utf-8"))
-    print(f"  {len(enrichment_cache)} entries")
+    # Load caches: every prompt/model namespace holds its own copy of the locations
+    fingerprints = args.fingerprint or [row["fingerprint"] for row in EnrichmentStore(args.cache_dir).report()]
+    stores = {fp: EnrichmentStore(args.cache_dir, fp) for fp in fingerprints}
+    for fp, store in stores.items():
+        print(f"Enrichment cache {store.cache_file} [{fp}]: {len(store)} entries")
 
     geocode_cache = {}
     if geocode_file.exists():
@@ -129,26 +135,27 @@ def main():
     print(f"  Geocode cache: {len(geocode_cache)} entries")
 
     # Find entries needing geocoding
-    needs_geocoding = []  # (cache_key, entry_index, address, bundesland)
+    needs_geocoding = []  # (fingerprint, cache_key, entry_index, address, bundesland)
     already_has_coords = 0
     no_location_data = 0
 
-    for cache_key, val in enrichment_cache.items():
-        entries = val if isinstance(val, list) else [val]
-        for idx, entry in enumerate(entries):
-            loc = entry.get("location", {})
-            if loc.get("lat") is not None and loc.get("lon") is not None:
-                already_has_coords += 1
-                continue
-            if not (loc.get("street") or loc.get("city") or loc.get("district")):
-                no_location_data += 1
-                continue
-            bundesland = loc.get("bundesland", "")
-            address = make_address(loc, bundesland)
-            needs_geocoding.append((cache_key, idx, address, bundesland))
+    for fp, store in stores.items():
+        for cache_key, val in store.items():
+            entries = val if isinstance(val, list) else [val]
+            for idx, entry in enumerate(entries):
+                loc = entry.get("location", {})
+                if loc.get("lat") is not None and loc.get("lon") is not None:
+                    already_has_coords += 1
+                    continue
+                if not (loc.get("street") or loc.get("city") or loc.get("district")):
+                    no_location_data += 1
+                    continue
+                bundesland = loc.get("bundesland", "")
+                address = make_address(loc, bundesland)
+                needs_geocoding.append((fp, cache_key, idx, address, bundesland))
 
     # Deduplicate addresses
-    unique_addresses = set(addr for _, _, addr, _ in needs_geocoding)
+    unique_addresses = set(addr for _, _, _, addr, _ in needs_geocoding)
     cached_addrs = sum(1 for a in unique_addresses if a in geocode_cache and geocode_cache[a].get("lat") is not None)
     failed_addrs = sum(1 for a in unique_addresses if a in geocode_cache and not geocode_cache[a])
     new_addrs = sum(1 for a in unique_addresses if a not in geocode_cache)
@@ -204,14 +211,19 @@ def main():
     print(f"\nUpdating enrichment cache with coordinates...")
     updated = 0
     still_missing = 0
+    values = {
+        fp: store.get_many(key for key_fp, key, _, _, _ in needs_geocoding if key_fp == fp)
+        for fp, store in stores.items()
+    }
+    changed: set[tuple[str, str]] = set()
 
-    for cache_key, entry_idx, address, bundesland in needs_geocoding:
+    for fp, cache_key, entry_idx, address, bundesland in needs_geocoding:
         geo = geocode_cache.get(address, {})
         if not geo or geo.get("lat") is None:
             still_missing += 1
             continue
 
-        val = enrichment_cache[cache_key]
+        val = values[fp][cache_key]
         entries = val if isinstance(val, list) else [val]
         entry = entries[entry_idx]
         entry["location"]["lat"] = geo["lat"]
@@ -221,15 +233,23 @@ def main():
             entry["location"]["plz"] = geo["plz"]
         if bundesland:
             entry["location"]["bundesland"] = bundesland
+        changed.add((fp, cache_key))
         updated += 1
 
     print(f"  Updated: {updated} records")
     print(f"  Still missing coords: {still_missing}")
 
-    # Save enrichment cache
-    with open(enrichment_file, "w", encoding="utf-8") as f:
-        json.dump(enrichment_cache, f, ensure_ascii=False)
-    print(f"  Saved enrichment cache")
+    # Upsert only the entries that changed
+    for fp, store in stores.items():
+        store.put_many((key, values[fp][key]) for key_fp, key in changed if key_fp == fp)
+    print(f"  Saved {len(changed)} enrichment cache entries")
+
+    # Refresh the legacy JSON the admin API routes read from the most recently used namespace
+    rows = EnrichmentStore(args.cache_dir).report()
+    recent = stores.get(rows[0]["fingerprint"]) if rows else None
+    if recent:
+        count = recent.export_json()
+        print(f"  Exported {count} entries of {recent.fingerprint} to {recent.legacy_file}")
 
     print(f"\nDone! Re-run the pipeline to push to Supabase:")
     print(f"  python3 -m scripts.pipeline.runner week --year 2026 --week 1 --skip-clustering")
@@ -0,0 +1,131 @@
+"""
+In-process multi-state presseportal scraping.
+
+The parallel orchestrator used to launch one Python subprocess per
+state-month: each paid interpreter startup and imports, built its own SSL
+context, connector and URL cache, and the parent then re-read the output JSON
+just to count articles. This engine runs state-month jobs as tasks in one
+event loop over:
+
+  - one aiohttp ClientSession (shared TCP/TLS connection pool),
+  - one global request budget (semaphore + a shared per-host RateController,
+    since every job hits the same host),
+  - one shared SQLite URL cache,
+
+and returns article counts directly.
+
+Usage:
+    jobs = [("hessen", "2026-01-01", "2026-01-31", "data/.../hessen_januar_2026.json"), ...]
+    results = scrape_jobs(jobs)   # [(True, 812, ""), ...] in job order
+"""
+
+import asyncio
+import contextlib
+import io
+import ssl
+import time
+from typing import Callable, Optional
+
+import aiohttp
+import certifi
+
+from scripts.scrape_blaulicht_async import HEADERS, AsyncPresseportalScraper
+from scripts.scrapers.rate_control import RateController
+from scripts.scrapers.url_store import ScrapedUrlsCache
+
+from .config import CACHE_DIR
+
+# Total in-flight requests across all jobs (the rate controller may settle
+# lower if presseportal pushes back)
+ENGINE_CONCURRENCY = 20
+ENGINE_MAX_CONCURRENCY = 40
+# State-month jobs running at once; bounds memory (each holds its articles
+# until it writes its output) while keeping the request budget saturated
+ENGINE_MAX_JOBS = 16
+
+# (bundesland, start_date, end_date, output_file)
+EngineJob = tuple[str, str, str, str]
+
+
+async def scrape_jobs_async(
+    jobs: list[EngineJob],
+    concurrency: int = ENGINE_CONCURRENCY,
+    max_concurrency: int = ENGINE_MAX_CONCURRENCY,
+    max_jobs: int = ENGINE_MAX_JOBS,
+    cache_dir: str = str(CACHE_DIR),
+    quiet: bool = True,
+    should_stop: Optional[Callable[[], bool]] = None,
+) -> list[tuple[bool, int, str]]:
+    """Run presseportal state-month jobs concurrently in this process.
+
+    Returns (success, article_count, error) per job, in job order. Jobs not
+    yet started when should_stop() turns true fail with "Shutdown requested".
+    """
+    rate = RateController(concurrency, max_concurrency=max_concurrency)
+    url_cache = ScrapedUrlsCache(cache_dir, "scraped_urls.json")
+    semaphore = asyncio.Semaphore(rate.max_concurrency)
+    job_slots = asyncio.Semaphore(max_jobs)
+    ssl_context = ssl.create_default_context(cafile=certifi.where())
+    connector = aiohttp.TCPConnector(ssl=ssl_context, limit=rate.max_concurrency)
+
+    async def run_job(session: aiohttp.ClientSession, job: EngineJob) -> tuple[bool, int, str]:
+        bundesland, start_date, end_date, output = job
+        async with job_slots:
+            if should_stop and should_stop():
+                return False, 0, "Shutdown requested"
+            scraper = AsyncPresseportalScraper(
+                bundesland=bundesland,
+                start_date=start_date,
+                end_date=end_date,
+                output=output,
+                concurrent_requests=concurrency,
+                cache_dir=cache_dir,
+                url_cache=url_cache,
+                rate=rate,
+            )
+            try:
+                await scraper.run_async(session=session, semaphore=semaphore)
+            except Exception as e:
+                return False, 0, str(e)[:200]
+            return True, scraper.saved_count, ""
+
+    # Per-job scraper output would interleave into noise (the subprocess
+    # fan-out discarded it too); callers report the returned counts
+    out = contextlib.redirect_stdout(io.StringIO()) if quiet else contextlib.nullcontext()
+    try:
+        with out:
+            async with aiohttp.ClientSession(headers=HEADERS, connector=connector) as session:
+                results = await asyncio.gather(*(run_job(session, job) for job in jobs))
+    finally:
+        url_cache.close()
+    if not quiet:
+        rate.log_summary()
+    return list(results)
+
+
+def scrape_jobs(
+    jobs: list[EngineJob],
+    concurrency: int = ENGINE_CONCURRENCY,
+    max_concurrency: int = ENGINE_MAX_CONCURRENCY,
+    max_jobs: int = ENGINE_MAX_JOBS,
+    cache_dir: str = str(CACHE_DIR),
+    quiet: bool = True,
+    should_stop: Optional[Callable[[], bool]] = None,
+) -> list[tuple[bool, int, str]]:
+    """Synchronous wrapper. Call from the main thread when quiet=True
+    (stdout redirection is process-wide)."""
+    start = time.time()
+    results = asyncio.run(scrape_jobs_async(
+        jobs,
+        concurrency=concurrency,
+        max_concurrency=max_concurrency,
+        max_jobs=max_jobs,
+        cache_dir=cache_dir,
+        quiet=quiet,
+        should_stop=should_stop,
+    ))
+    total = sum(count for _, count, _ in results)
+    failed = sum(not ok for ok, _, _ in results)
+    print(f"  Presseportal engine: {len(jobs)} state-months, {total} articles, "
+          f"{failed} failed in {time.time() - start:.1f}s")
+    return results
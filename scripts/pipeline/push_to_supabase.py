@@ -16,10 +16,15 @@ import json
 import os
 import sys
 from pathlib import Path
+from typing import Iterator
 
 from dotenv import load_dotenv
 from supabase import create_client
 
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent))
+from scripts.pipeline.article_io import iter_articles, load_articles
+
 load_dotenv()
 # Also load .env.local (higher priority, override=True)
 load_dotenv(Path(".env.local"), override=True)
@@ -652,27 +657,31 @@ def transform_article(article: dict, pipeline_run: str = "default") -> dict | No
 
 
 def collect_articles_from_dir(dir_path: Path, year: str | None = None) -> list[dict]:
-    """Scan a directory tree for enriched JSON files and collect all articles.
+    """Scan a directory tree for enriched JSON files and collect all articles."""
+    return list(iter_articles_from_dir(dir_path, year=year))
+
+
+def iter_articles_from_dir(dir_path: Path, year: str | None = None) -> Iterator[dict]:
+    """Yield the articles of all enriched JSON/NDJSON files under a directory tree, one file at a time.
 
     Args:
         dir_path: Root directory to scan (e.g. chunks/enriched/)
         year: If set, only load files from */{year}/*.json subdirectories
     """
-    articles = []
     files_loaded = 0
-    for json_file in sorted(dir_path.rglob("*.json")):
+    for json_file in sorted([*dir_path.rglob("*.json"), *dir_path.rglob("*.ndjson")]):
         # Year filter: check if the file is inside a /{year}/ directory
         if year and f"/{year}/" not in str(json_file):
             continue
         try:
-            data = json.load(open(json_file, encoding="utf-8"))
-            if isinstance(data, list) and len(data) > 0:
-                articles.extend(data)
-                files_loaded += 1
+            data = load_articles(json_file)
         except (json.JSONDecodeError, OSError) as e:
             print(f"  WARN: skipping {json_file}: {e}")
+            continue
+        if data:
+            files_loaded += 1
+            yield from data
     print(f"Scanned {files_loaded} files from {dir_path}" + (f" (year={year})" if year else ""))
-    return articles
 
 
 def main():
@@ -700,20 +709,18 @@ def main():
         if not dir_path.is_dir():
             print(f"ERROR: Directory not found: {dir_path}")
             sys.exit(1)
-        articles = collect_articles_from_dir(dir_path, year=args.year)
+        articles = iter_articles_from_dir(dir_path, year=args.year)
     elif args.input:
         input_path = Path(args.input)
         if not input_path.exists():
             print(f"ERROR: Input file not found: {input_path}")
             sys.exit(1)
-        articles = json.load(open(input_path, encoding="utf-8"))
-        print(f"Loaded {len(articles)} articles from {input_path}")
+        articles = iter_articles(input_path)
     else:
         # Default: scan CHUNKS_ENRICHED_DIR
         from scripts.pipeline.config import CHUNKS_ENRICHED_DIR
-        articles = collect_articles_from_dir(CHUNKS_ENRICHED_DIR, year=args.year)
+        articles = iter_articles_from_dir(CHUNKS_ENRICHED_DIR, year=args.year)
 
-    print(f"Total articles: {len(articles)}")
     print(f"Pipeline run: {args.run_name}")
 
     # Transform and deduplicate by ID (multi-incident articles can produce dupes)
@@ -721,7 +728,9 @@ def main():
     seen_ids: set[str] = set()
     skipped = 0
     dupes = 0
+    total = 0
     for art in articles:
+        total += 1
         row = transform_article(art, pipeline_run=args.run_name)
         if row:
             if row["id"] in seen_ids:
@@ -732,6 +741,7 @@ def main():
         else:
             skipped += 1
 
+    print(f"Total articles: {total}")
     no_coords = sum(1 for r in rows if r["latitude"] is None or r["longitude"] is None)
     print(f"Transformed {len(rows)} records ({skipped} skipped, {dupes} deduped, {no_coords} without coords)")
 
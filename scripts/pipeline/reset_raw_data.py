@@ -13,8 +13,10 @@ Usage:
 """
 
 import argparse
+import contextlib
 import json
 import os
+import sqlite3
 import sys
 from pathlib import Path
 
@@ -22,7 +24,7 @@ ROOT = Path(__file__).resolve().parent.parent.parent
 
 RAW_DIR = ROOT / "data" / "pipeline" / "chunks" / "raw"
 MERGED_DIR = ROOT / "data" / "pipeline" / "merged"
-SCRAPED_URLS_CACHE = ROOT / ".cache" / "scraped_urls.json"
+CACHE_DIR = ROOT / ".cache"
 
 
 def scan_raw_dir():
@@ -65,17 +67,36 @@ def scan_merged_dir():
     return sorted(files, key=lambda x: x["name"])
 
 
+def _scraped_urls_files():
+    """Presseportal scraped-URL stores: SQLite dbs (+ WAL files) and any legacy JSON.
+
+    Includes the firehose's skip store, so a reset firehose crawl refetches everything.
+    """
+    names = ["scraped_urls.sqlite", "scraped_urls.sqlite-wal", "scraped_urls.sqlite-shm",
+             "scraped_urls.json", "scraped_urls.json.migrated",
+             "firehose_skipped_urls.sqlite", "firehose_skipped_urls.sqlite-wal", "firehose_skipped_urls.sqlite-shm"]
+    return [CACHE_DIR / name for name in names if (CACHE_DIR / name).exists()]
+
+
 def scan_scraped_urls_cache():
     """Check scraped URLs cache."""
-    if not SCRAPED_URLS_CACHE.exists():
+    files = _scraped_urls_files()
+    if not files:
         return None
-    size = SCRAPED_URLS_CACHE.stat().st_size
+    size = sum(f.stat().st_size for f in files)
+    count = 0
+    db = CACHE_DIR / "scraped_urls.sqlite"
+    legacy = CACHE_DIR / "scraped_urls.json"
     try:
-        with open(SCRAPED_URLS_CACHE) as f:
-            data = json.load(f)
-            count = len(data) if isinstance(data, (list, dict)) else 0
-    except (json.JSONDecodeError, IOError):
-        count = 0
+        if db.exists():
+            with contextlib.closing(sqlite3.connect(db)) as conn:
+                count += conn.execute("SELECT COUNT(*) FROM scraped_urls").fetchone()[0]
+        if legacy.exists():
+            with open(legacy) as f:
+                data = json.load(f)
+                count += len(data) if isinstance(data, (list, dict)) else 0
+    except (json.JSONDecodeError, IOError, sqlite3.Error):
+        pass
     return {"entries": count, "bytes": size}
 
 
@@ -117,7 +138,7 @@ def print_summary(raw_stats, merged_files, url_cache):
         print("  (empty or does not exist)")
 
     # Scraped URLs cache
-    print("\n--- .cache/scraped_urls.json ---")
+    print("\n--- .cache/scraped_urls.sqlite ---")
     if url_cache:
         print(f"  {url_cache['entries']} entries, {fmt_bytes(url_cache['bytes'])}")
     else:
@@ -140,8 +161,8 @@ def execute_reset():
                 deleted_files += 1
 
     # Delete scraped URLs cache
-    if SCRAPED_URLS_CACHE.exists():
-        SCRAPED_URLS_CACHE.unlink()
+    for f in _scraped_urls_files():
+        f.unlink()
         deleted_files += 1
 
     # Delete merged files
@@ -172,7 +193,8 @@ def main():
     print("EXECUTING RESET...")
     deleted = execute_reset()
     print(f"Done. Deleted {deleted} files.")
-    print("Preserved: data/pipeline/chunks/enriched/, .cache/enrichment_cache.json")
+    print("Preserved: data/pipeline/chunks/enriched/, .cache/enrichment_cache.sqlite "
+          "(and its enrichment_cache.json export)")
 
 
 if __name__ == "__main__":
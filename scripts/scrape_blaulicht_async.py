@@ -7,6 +7,8 @@ simultaneously, dramatically reducing scrape time from ~30 min to ~2-3 min per m
 
 Usage:
     python scripts/scrape_blaulicht_async.py --bundesland hessen --start-date 2024-01-01 --end-date 2024-01-31
+    python scripts/scrape_blaulicht_async.py --bundesland hessen --start-date 2024-01-01 --parse-workers -1
+    python scripts/scrape_blaulicht_async.py --firehose hessen bremen --start-date 2024-01-01 -o live.ndjson
 """
 
 import argparse
@@ -30,10 +32,24 @@ from bs4 import BeautifulSoup
 # Fix SSL on macOS - certifi provides Mozilla's CA bundle
 os.environ['SSL_CERT_FILE'] = certifi.where()
 
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from scripts.pipeline.article_io import NdjsonArticleWriter, is_ndjson, meta_path_for
+from scripts.pipeline.filter_articles import junk_title_reason
+from scripts.scrapers.html_archive import HtmlArchive
+from scripts.scrapers.parse_pool import ParsePool
+from scripts.scrapers.rate_control import RateController
+from scripts.scrapers.url_store import ScrapedUrlsCache
+
 # Constants
 BASE_URL = "https://www.presseportal.de"
 BLAULICHT_URL = f"{BASE_URL}/blaulicht/"
 USER_AGENT = "adlerlicht/1.0 (+contact: scraper@adlerlicht.de)"
+HEADERS = {
+    "User-Agent": USER_AGENT,
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+    "Accept-Language": "de-DE,de;q=0.9,en;q=0.5",
+}
 
 # Async configuration - the key to 10-20x speedup
 CONCURRENT_REQUESTS = 20  # Fetch 20 pages/articles at once
@@ -41,6 +57,10 @@ DELAY_BETWEEN_BATCHES = 0.3  # Small delay between batches to avoid rate limits
 REQUEST_TIMEOUT_SECONDS = 30
 MAX_RETRIES = 3
 
+# Streaming mode (--stream): discovered articles wait in a bounded queue
+STREAM_QUEUE_FACTOR = 4  # queue holds concurrent_requests * 4 article infos
+STREAM_PROGRESS_EVERY = 50
+
 # Bundesland slug to display name mapping
 BUNDESLAND_SLUGS = {
     "baden-wuerttemberg": "Baden-Württemberg",
@@ -92,52 +112,11 @@ class Article:
     themes: list[str]  # from "Themen in dieser Meldung" tags
 
 
-class ScrapedUrlsCache:
-    """Persistent cache for tracking already-scraped article URLs.
-
-    Prevents re-scraping articles across scraper runs by storing URLs
-    with their scrape timestamp.
-    """
-
-    def __init__(self, cache_dir: str = ".cache"):
-        self.cache_dir = Path(cache_dir)
-        self.cache_file = self.cache_dir / "scraped_urls.json"
-        self.urls: dict[str, str] = {}  # url -> timestamp
-        self._load()
-
-    def _load(self) -> None:
-        """Load cache from disk if exists."""
-        if self.cache_file.exists():
-            try:
-                with open(self.cache_file, "r", encoding="utf-8") as f:
-                    self.urls = json.load(f)
-            except (json.JSONDecodeError, IOError) as e:
-                print(f"Warning: Could not load scraped URLs cache: {e}")
-                self.urls = {}
-
-    def save(self) -> None:
-        """Persist cache to disk."""
-        self.cache_dir.mkdir(parents=True, exist_ok=True)
-        with open(self.cache_file, "w", encoding="utf-8") as f:
-            json.dump(self.urls, f, ensure_ascii=False, indent=2)
-
-    def is_scraped(self, url: str) -> bool:
-        """Check if URL has already been scraped."""
-        return url in self.urls
-
-    def mark_scraped(self, url: str) -> None:
-        """Mark a URL as scraped with current timestamp."""
-        self.urls[url] = datetime.now().isoformat()
-
-    def __len__(self) -> int:
-        """Return number of cached URLs."""
-        return len(self.urls)
-
-
 def parse_listing_page(html: str) -> list[dict]:
     """
     Parse a listing page to extract article links and metadata.
-    Returns list of dicts with 'url', 'title', 'date' keys.
+    Returns list of dicts with 'url', 'title', 'date', 'source' keys
+    (source is the card's newsroom name, None if not shown).
     """
     soup = BeautifulSoup(html, "html.parser")
     articles = []
@@ -157,6 +136,7 @@ def parse_listing_page(html: str) -> list[dict]:
                     "url": full_url,
                     "title": title,
                     "date": None,
+                    "source": None,
                 })
         return articles
 
@@ -191,10 +171,16 @@ def parse_listing_page(html: str) -> list[dict]:
             if date_match:
                 date_str = date_match.group()
 
+        # Newsroom (e.g. "Polizeipräsidium Südhessen", "Feuerwehr Bochum"),
+        # linked as /blaulicht/nr/<id> on the card
+        source_elem = container.select_one('p.customer, a[href*="/blaulicht/nr/"], [itemprop="author"]')
+        source = source_elem.get_text(strip=True) if source_elem else None
+
         articles.append({
             "url": full_url,
             "title": title,
             "date": date_str,
+            "source": source or None,
         })
 
     return articles
@@ -218,19 +204,37 @@ def parse_german_date(date_str: str) -> Optional[str]:
     return None
 
 
+_TIME_RE = re.compile(r"(\d{1,2}):(\d{2})")
+
+
 def parse_to_datetime(date_str: str) -> Optional[datetime]:
-    """Parse an ISO or German date string into a naive datetime."""
+    """Parse an ISO or German date string into a naive datetime.
+
+    A time after a German date ("16.10.2026 – 15:30", as on listing cards)
+    is kept; a bare date parses to midnight.
+    """
     if not date_str:
         return None
     try:
         if "T" in date_str:
             return datetime.fromisoformat(date_str.replace("Z", "+00:00")).replace(tzinfo=None)
         parsed = parse_german_date(date_str)
-        return datetime.fromisoformat(parsed) if parsed else None
+        if not parsed:
+            return None
+        day = datetime.fromisoformat(parsed)
+        time_match = _TIME_RE.search(date_str[10:])
+        if time_match:
+            return day.replace(hour=int(time_match.group(1)), minute=int(time_match.group(2)))
+        return day
     except (ValueError, AttributeError):
         return None
 
 
+def has_time_of_day(date_str: str) -> bool:
+    """True if a date string carries a time, not just a day."""
+    return bool(date_str) and ("T" in date_str or bool(_TIME_RE.search(date_str[10:])))
+
+
 def parse_article_page(html: str, url: str) -> Optional[dict]:
     """
     Parse an article page to extract full details.
@@ -409,6 +413,265 @@ def parse_article_page(html: str, url: str) -> Optional[dict]:
     }
 
 
+# --- lexbor (selectolax) backend ---------------------------------------------
+#
+# Same extraction rules as parse_article_page, on selectolax's C parser instead
+# of a pure-Python html.parser soup. The helpers below reproduce the
+# BeautifulSoup semantics the original relies on (get_text(strip=True) skips
+# script/style text, select_one never matches the node itself, find_next walks
+# document order). Known gap: lexbor normalizes CRLF to LF inside text nodes.
+# Parity is checked with scripts/benchmarks/parser_parity.py.
+
+_LEXBOR_NON_TEXT_TAGS = "script, style, template"
+
+
+def _lexbor_text(node, separator: str = "") -> str:
+    """Equivalent of BeautifulSoup's node.get_text(separator, strip=True)."""
+    if not separator and node.css_first(_LEXBOR_NON_TEXT_TAGS) is None:
+        return node.text(deep=True, strip=True)
+    parts = []
+    for child in node.traverse(include_text=True):
+        if child.tag == "-text" and child.parent.tag not in ("script", "style", "template"):
+            text = child.text_content.strip()
+            if text:
+                parts.append(text)
+    return separator.join(parts)
+
+
+def _lexbor_select_one(node, selector: str):
+    """First matching descendant (lexbor's css_first also matches the node itself)."""
+    for child in node.iter():
+        if child.tag.startswith("-"):
+            continue
+        match = child.css_first(selector)
+        if match is not None:
+            return match
+    return None
+
+
+def _lexbor_find_next(node, tag: str):
+    """Equivalent of BeautifulSoup's node.find_next(tag): first match after node's start tag."""
+    match = _lexbor_select_one(node, tag)
+    if match is not None:
+        return match
+    while node is not None:
+        sibling = node.next
+        while sibling is not None:
+            if not sibling.tag.startswith("-"):
+                match = sibling.css_first(tag)
+                if match is not None:
+                    return match
+            sibling = sibling.next
+        node = node.parent
+    return None
+
+
+def _lexbor_find_next_sibling(node, tag: str):
+    sibling = node.next
+    while sibling is not None:
+        if sibling.tag == tag:
+            return sibling
+        sibling = sibling.next
+    return None
+
+
+def _lexbor_attr(node, name: str) -> str:
+    return node.attributes.get(name) or ""
+
+
+def parse_article_page_lexbor(html: str, url: str) -> Optional[dict]:
+    """
+    Drop-in replacement for parse_article_page built on selectolax (lexbor).
+    Returns the same dict, field for field. Requires: pip install selectolax
+    """
+    from selectolax.lexbor import LexborHTMLParser
+
+    tree = LexborHTMLParser(html)
+    root = tree.root
+    if root is None:
+        return parse_article_page(html, url)
+
+    story = tree.css_first("article.story")
+    card = _lexbor_select_one(story, ".card") if story is not None else None
+
+    # Title - try card h1, then og:title, then any h1
+    title = None
+    if card is not None:
+        h1 = card.css_first("h1")
+        if h1 is not None:
+            title = _lexbor_text(h1)
+    if not title:
+        og_title = tree.css_first('meta[property="og:title"]')
+        if og_title is not None:
+            title = _lexbor_attr(og_title, "content").strip()
+    if not title:
+        h1 = tree.css_first("h1")
+        title = _lexbor_text(h1) if h1 is not None else None
+    if not title:
+        title = "Ohne Titel"
+
+    # Date - JSON-LD first (same loop semantics as the bs4 parser)
+    date_str = None
+    for script in tree.css('script[type="application/ld+json"]'):
+        try:
+            data = json.loads(script.text(deep=True) or "")
+            if isinstance(data, dict) and "datePublished" in data:
+                date_str = data["datePublished"]
+                break
+            if isinstance(data, list):
+                for item in data:
+                    if isinstance(item, dict) and "datePublished" in item:
+                        date_str = item["datePublished"]
+                        break
+        except json.JSONDecodeError:
+            continue
+
+    if not date_str and card is not None:
+        date_elem = card.css_first("p.date")
+        if date_elem is not None:
+            date_text = _lexbor_text(date_elem)
+            date_match = re.match(r"(\d{2})\.(\d{2})\.(\d{4})\s*[–-]\s*(\d{2}):(\d{2})", date_text)
+            if date_match:
+                day, month, year, hour, minute = date_match.groups()
+                date_str = f"{year}-{month}-{day}T{hour}:{minute}:00"
+
+    if not date_str:
+        for selector in ['meta[property="article:published_time"]', 'meta[name="date"]']:
+            elem = tree.css_first(selector)
+            if elem is not None:
+                date_str = _lexbor_attr(elem, "content").strip()
+                if date_str:
+                    break
+
+    # Source/Agency
+    source = None
+    if card is not None:
+        customer = card.css_first("p.customer")
+        if customer is not None:
+            source = _lexbor_text(customer)
+
+    if not source:
+        for selector in [".article__office", "[itemprop='author']", ".newsroom", ".author"]:
+            elem = tree.css_first(selector)
+            if elem is not None:
+                source = _lexbor_text(elem)
+                if source:
+                    break
+
+    if not source:
+        author_meta = tree.css_first('meta[property="article:author"]')
+        if author_meta is not None:
+            source = _lexbor_attr(author_meta, "content").strip()
+
+    # Body text
+    body = ""
+    city = None
+
+    if card is not None:
+        paragraphs = []
+        for p in card.css("p"):
+            classes = _lexbor_attr(p, "class").split()
+            if any(c in classes for c in ["date", "customer", "contact-headline", "contact-text", "originator"]):
+                continue
+            text = _lexbor_text(p)
+            if text:
+                paragraphs.append(text)
+
+        if paragraphs:
+            city_match = re.match(r"([A-ZÄÖÜa-zäöüß][A-ZÄÖÜa-zäöüß\s-]+?)\s*\(ots\)", paragraphs[0])
+            if city_match:
+                city = city_match.group(1).strip()
+
+        body = "\n\n".join(paragraphs)
+
+    if not body:
+        for selector in ['[itemprop="articleBody"]', ".article__content", ".story-text", ".text"]:
+            elem = tree.css_first(selector)
+            if elem is not None:
+                body = _lexbor_text(elem, separator="\n")
+                if body:
+                    break
+
+    if not city:
+        for selector in [".location", ".article__location", ".article-location"]:
+            elem = tree.css_first(selector)
+            if elem is not None:
+                city = _lexbor_text(elem)
+                if city:
+                    break
+
+    if not city and title:
+        title_match = re.search(r"[-–]\s*([A-ZÄÖÜa-zäöüß][a-zäöüß]+(?:\s+[A-ZÄÖÜa-zäöüß][a-zäöüß]+)?)\s*$", title)
+        if title_match:
+            city = title_match.group(1).strip()
+
+    if not city and body:
+        loc_match = re.search(r"(?:Ort|Tatort|Einsatzort)\s*:\s*([A-ZÄÖÜa-zäöüß][a-zäöüß-]+(?:\s+[A-ZÄÖÜa-zäöüß][a-zäöüß-]+)?)", body)
+        if loc_match:
+            city = loc_match.group(1).strip()
+
+    agency_code = None
+    if title:
+        agency_match = re.match(r'^([A-Z][A-Z0-9 -]+?):\s', title)
+        if agency_match:
+            agency_code = agency_match.group(1).strip()
+
+    # Orte / Themen tags — cheap substring check before walking the tree
+    def _extract_tags(label: str) -> list[str]:
+        if label not in html:
+            return []
+        for node in root.traverse(include_text=True):
+            if node.tag == "-text":
+                text = node.text_content
+            elif node.tag == "-comment":
+                text = node.comment_content
+            else:
+                continue
+            if not text or label not in text:
+                continue
+            parent = node.parent
+            if parent is None:
+                continue
+            ul = _lexbor_find_next_sibling(parent, "ul") or _lexbor_find_next(parent, "ul")
+            if ul is not None:
+                return [_lexbor_text(a) for a in ul.css("li a")]
+        return []
+
+    places = _extract_tags('Orte in dieser Meldung')
+    themes = _extract_tags('Themen in dieser Meldung')
+
+    return {
+        "title": title,
+        "date": date_str,
+        "city": city,
+        "source": source,
+        "agency_code": agency_code,
+        "url": url,
+        "body": body,
+        "places": places,
+        "themes": themes,
+    }
+
+
+# Article parser backends selectable via --parser
+ARTICLE_PARSERS = {
+    "bs4": parse_article_page,
+    "lexbor": parse_article_page_lexbor,
+}
+
+
+def get_article_parser(name: str):
+    """Return the article parser for a backend name, checking its dependency."""
+    if name not in ARTICLE_PARSERS:
+        raise ValueError(f"Unknown parser backend: {name} (choose from {', '.join(ARTICLE_PARSERS)})")
+    if name == "lexbor":
+        try:
+            import selectolax.lexbor  # noqa: F401
+        except ImportError:
+            raise ImportError("--parser lexbor requires selectolax: pip install selectolax")
+    return ARTICLE_PARSERS[name]
+
+
 # Feuerwehr source filter — drop fire dept articles before enrichment
 FEUERWEHR_PATTERN = re.compile(
     r'Feuerwehr|^FW[ -]|Berufsfeuerwehr|Freiwillige Feuerwehr',
@@ -426,6 +689,107 @@ def is_feuerwehr_source(source: Optional[str], title: Optional[str] = None) -> b
     return False
 
 
+# Firehose mode: state slug <-> display name, as used in "Orte in dieser Meldung"
+# (Berlin and Brandenburg are tagged separately even though they share a slug)
+FIREHOSE_STATE_NAMES = {
+    **{slug: name for slug, name in BUNDESLAND_SLUGS.items() if slug != "berlin-brandenburg"},
+    "berlin": "Berlin",
+    "brandenburg": "Brandenburg",
+}
+FIREHOSE_STATE_BY_PLACE = {name: slug for slug, name in FIREHOSE_STATE_NAMES.items()}
+
+# A newsroom/agency code is trusted for attribution once it has been seen this
+# often with (nearly) one state — BPOL/Zoll newsrooms span several and never qualify
+NEWSROOM_MIN_OBSERVATIONS = 3
+NEWSROOM_MIN_SHARE = 0.9
+
+# Firehose articles fetched but not kept (unattributed or another state's):
+# a URL store of their own, so later firehose crawls skip them while a
+# per-state crawl (scraped_urls.json) can still pick them up
+FIREHOSE_SKIPPED_URLS_FILE = "firehose_skipped_urls.json"
+
+
+def agency_code_from_title(title: Optional[str]) -> Optional[str]:
+    """Agency code prefix of a title, e.g. "POL-DA: ..." -> "POL-DA"."""
+    if not title:
+        return None
+    match = re.match(r'^([A-Z][A-Z0-9 -]+?):\s', title)
+    return match.group(1).strip() if match else None
+
+
+class NewsroomStateIndex:
+    """Learned newsroom (source) / agency code -> state mapping for firehose mode.
+
+    The unfiltered /blaulicht/ feed carries no state, so each article is
+    attributed from its "Orte in dieser Meldung" tags. Every tag-attributed
+    article also teaches this index, which then attributes untagged articles
+    and lets discovery skip listing entries of unwanted states by their title
+    prefix alone, before the article page is fetched.
+    """
+
+    def __init__(self, cache_dir: str = ".cache", filename: str = "newsroom_states.json"):
+        self.path = Path(cache_dir) / filename
+        self.counts: dict[str, dict[str, int]] = {}
+        if self.path.exists():
+            try:
+                with open(self.path, "r", encoding="utf-8") as f:
+                    self.counts = json.load(f)
+            except (json.JSONDecodeError, OSError):
+                self.counts = {}
+
+    @staticmethod
+    def _keys(agency_code: Optional[str], source: Optional[str]) -> list[str]:
+        # Newsroom names are more specific than agency codes, so they go first
+        keys = []
+        if source:
+            keys.append(f"source:{source}")
+        if agency_code:
+            keys.append(f"agency:{agency_code}")
+        return keys
+
+    def learn(self, agency_code: Optional[str], source: Optional[str], state: str) -> None:
+        for key in self._keys(agency_code, source):
+            states = self.counts.setdefault(key, {})
+            states[state] = states.get(state, 0) + 1
+
+    def lookup(self, agency_code: Optional[str] = None, source: Optional[str] = None) -> Optional[str]:
+        """Return the state a newsroom/agency code reliably belongs to, if known."""
+        for key in self._keys(agency_code, source):
+            states = self.counts.get(key)
+            if not states:
+                continue
+            total = sum(states.values())
+            state, count = max(states.items(), key=lambda item: item[1])
+            if total >= NEWSROOM_MIN_OBSERVATIONS and count / total >= NEWSROOM_MIN_SHARE:
+                return state
+        return None
+
+    def attribute(self, parsed: dict) -> Optional[str]:
+        """Attribute a parsed article to a state slug (None if undecidable).
+
+        Place tags win; when they name several states (e.g. a motorway
+        incident on a border) the newsroom's usual state breaks the tie.
+        """
+        agency_code, source = parsed.get("agency_code"), parsed.get("source")
+        tagged = [FIREHOSE_STATE_BY_PLACE[p] for p in parsed.get("places") or [] if p in FIREHOSE_STATE_BY_PLACE]
+        known = self.lookup(agency_code, source)
+        if not tagged:
+            return known
+        state = known if known in tagged else tagged[0]
+        self.learn(agency_code, source, state)
+        return state
+
+    def save(self) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_suffix(".tmp")
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(self.counts, f, ensure_ascii=False, indent=2, sort_keys=True)
+        tmp.replace(self.path)
+
+    def __len__(self) -> int:
+        return len(self.counts)
+
+
 class AsyncPresseportalScraper:
     """
     Async scraper for Presseportal Blaulicht - 10-20x faster than sync version.
@@ -434,6 +798,10 @@ class AsyncPresseportalScraper:
     1. Concurrent page fetching with semaphore control
     2. Batch processing to avoid rate limits
     3. No per-request delays (controlled by semaphore instead)
+    4. Optional process-pool parsing so fetching and parsing overlap
+    5. Optional streaming mode: article fetches start while discovery runs
+    6. Optional firehose mode: one crawl of the unfiltered /blaulicht/ feed
+       covers several states, each article attributed locally
     """
 
     def __init__(
@@ -447,7 +815,20 @@ class AsyncPresseportalScraper:
         verbose: bool = False,
         concurrent_requests: int = CONCURRENT_REQUESTS,
         cache_dir: str = ".cache",
+        parse_workers: int = 0,
+        parser: str = "bs4",
+        streaming: bool = False,
+        adaptive: bool = True,
+        max_concurrent: Optional[int] = None,
+        archive_dir: Optional[str] = None,
+        url_cache: Optional[ScrapedUrlsCache] = None,
+        rate: Optional[RateController] = None,
+        firehose_states: Optional[list[str]] = None,
+        prefilter: bool = True,
+        watermark: Optional[dict] = None,
     ):
+        if firehose_states is not None and bundesland:
+            raise ValueError("firehose mode crawls the unfiltered feed; do not combine it with bundesland")
         self.bundesland = bundesland
         self.bundesland_display = BUNDESLAND_SLUGS.get(bundesland) if bundesland else None
         self.dienststelle = dienststelle
@@ -459,9 +840,47 @@ class AsyncPresseportalScraper:
         self.verbose = verbose
         self.concurrent_requests = concurrent_requests
 
+        # Per-host AIMD concurrency + Retry-After handling; starts at
+        # concurrent_requests and may grow up to max_concurrency
+        self.rate = rate or RateController(
+            concurrent_requests, max_concurrency=max_concurrent, adaptive=adaptive, verbose=verbose,
+        )
+        self.archive = HtmlArchive(archive_dir, source="presseportal") if archive_dir else None
+
+        # HTML parsing: inline on the event loop (0) or in a process pool
+        self.parse_pool = ParsePool(parse_workers)
+        self.parser = parser
+        self.parse_article = get_article_parser(parser)
+        self.streaming = streaming
+
+        # Firehose mode: crawl /blaulicht/ once, keep articles of these states
+        self.firehose_states = set(firehose_states) if firehose_states is not None else None
+        self.newsroom_index = NewsroomStateIndex(cache_dir) if firehose_states is not None else None
+        self.firehose_skipped = (
+            ScrapedUrlsCache(cache_dir, FIREHOSE_SKIPPED_URLS_FILE) if firehose_states is not None else None
+        )
+        self.firehose_counts: dict[str, int] = {}
+        self.firehose_foreign_skipped = 0  # listing entries of unwanted states (known agency code)
+        self.firehose_foreign_dropped = 0  # fetched, then attributed to an unwanted state
+        self.firehose_unattributed = 0
+
+        # Listing-stage filter: skip fetching articles the title already marks as dropped
+        self.prefilter = prefilter
+        self.listing_feuerwehr_skipped = 0
+        self.listing_junk_skipped = 0
+
+        # Poll watermark ({"url", "published_at"} of the newest article seen
+        # by the last live cycle); discovery stops at a page with nothing newer
+        self.watermark = watermark
+
         self.articles: list[Article] = []
         self.seen_urls: set[str] = set()
-        self.url_cache = ScrapedUrlsCache(cache_dir)
+        self.url_cache = url_cache if url_cache is not None else ScrapedUrlsCache(cache_dir, "scraped_urls.json")
+        # .ndjson output: articles are appended as they are parsed (opened in run_async)
+        self.writer: Optional[NdjsonArticleWriter] = None
+        # JSON output: URLs are marked scraped only once the file is written
+        self._unsaved_urls: list[str] = []
+        self.saved_count = 0  # articles in the output file after the run
         self.skipped_cached_count = 0
         self.feuerwehr_dropped_count = 0
 
@@ -538,22 +957,28 @@ class AsyncPresseportalScraper:
         url: str,
         semaphore: asyncio.Semaphore,
     ) -> Optional[str]:
-        """Fetch a single URL with semaphore-controlled concurrency and retries."""
+        """Fetch a single URL with semaphore-controlled concurrency and retries.
+
+        Per-host pacing comes from self.rate: a 429 pauses the whole host
+        (Retry-After or exponential backoff) before the next attempt.
+        """
         async with semaphore:
             for attempt in range(MAX_RETRIES):
                 try:
-                    async with session.get(
+                    async with self.rate.slot(url) as slot, session.get(
                         url,
                         timeout=aiohttp.ClientTimeout(total=REQUEST_TIMEOUT_SECONDS)
                     ) as response:
+                        slot.record(response.status, response.headers)
                         if response.status == 200:
                             self.fetch_count += 1
-                            return await response.text()
-                        elif response.status == 429:  # Rate limited
-                            wait_time = 2 ** attempt
+                            html = await response.text()
+                            if self.archive:
+                                self.archive.put(url, html)
+                            return html
+                        elif response.status == 429:  # Rate limited — host cooldown set by self.rate
                             if self.verbose:
-                                print(f"  Rate limited, waiting {wait_time}s...")
-                            await asyncio.sleep(wait_time)
+                                print(f"  Rate limited on {url} (attempt {attempt + 1}/{MAX_RETRIES})")
                         else:
                             if self.verbose:
                                 print(f"  HTTP {response.status} for {url}")
@@ -581,17 +1006,62 @@ class AsyncPresseportalScraper:
         results = await asyncio.gather(*tasks)
         return list(zip(urls, results))
 
+    async def _fetch_and_parse(
+        self,
+        session: aiohttp.ClientSession,
+        url: str,
+        semaphore: asyncio.Semaphore,
+        parse_fn,
+        *parse_args,
+    ):
+        """Fetch a URL and parse it as soon as it arrives.
+
+        Parsing happens after the semaphore slot is released, so with a
+        process pool the next fetch starts while this page is being parsed.
+        Returns None if the fetch failed.
+        """
+        html = await self._fetch_url(session, url, semaphore)
+        if not html:
+            return None
+        return await self.parse_pool.run(parse_fn, html, *parse_args)
+
+    async def _fetch_parse_batch(
+        self,
+        session: aiohttp.ClientSession,
+        urls: list[str],
+        semaphore: asyncio.Semaphore,
+        parse_fn,
+        pass_url: bool = False,
+    ) -> list[tuple[str, object]]:
+        """Fetch and parse a batch of URLs concurrently.
+
+        parse_fn is called as parse_fn(html) or, with pass_url, parse_fn(html, url).
+        """
+        tasks = [
+            self._fetch_and_parse(session, url, semaphore, parse_fn, *((url,) if pass_url else ()))
+            for url in urls
+        ]
+        results = await asyncio.gather(*tasks)
+        return list(zip(urls, results))
+
     async def _discover_listing_pages(
         self,
         session: aiohttp.ClientSession,
         semaphore: asyncio.Semaphore,
+        queue: Optional[asyncio.Queue] = None,
     ) -> list[dict]:
         """
         Discover all listing pages and extract article URLs.
 
         Strategy: Fetch listing pages in batches of CONCURRENT_REQUESTS for
         massive speedup. Stop when we hit consecutive empty pages or find
-        no new articles in range.
+        no new articles in range. With a poll watermark, batches start at one
+        page and double, and a page with nothing newer than the watermark
+        ends discovery, so a steady-state poll fetches a page or two.
+
+        If queue is given (streaming mode), each new article info is also put
+        on it as soon as its listing page is parsed, so article workers can
+        start fetching while discovery continues.
         """
         all_articles = []
         page = 1
@@ -599,6 +1069,9 @@ class AsyncPresseportalScraper:
         batch_size = self.concurrent_requests  # Fetch this many pages at once
 
         print(f"Discovering listing pages (batch size: {batch_size})...")
+        if self.watermark:
+            print(f"  Watermark: {self.watermark.get('published_at')} ({self.watermark.get('url')})")
+            batch_size = 1
         if self.bundesland:
             print(f"  Bundesland: {self.bundesland_display}")
         if self.dienststelle:
@@ -623,26 +1096,28 @@ class AsyncPresseportalScraper:
             if not batch_urls:
                 break
 
-            # Fetch all pages in batch concurrently
-            results = await self._fetch_batch(session, batch_urls, semaphore)
+            # Fetch and parse all pages in batch concurrently
+            results = await self._fetch_parse_batch(session, batch_urls, semaphore, parse_listing_page)
             self.pages_visited += len(batch_urls)
 
             batch_added = 0
             empty_pages = 0
             all_too_old_batch = True
+            reached_watermark = False
 
-            for url, html in results:
-                if not html:
-                    empty_pages += 1
-                    continue
-
-                articles = parse_listing_page(html)
+            for url, articles in results:
                 if not articles:
                     empty_pages += 1
                     continue
 
                 self.pages_with_content += 1
 
+                # One bulk lookup per page against the persistent URL store
+                unscraped = set(self.url_cache.filter_unscraped(a["url"] for a in articles))
+                if self.firehose_skipped is not None:
+                    unscraped = set(self.firehose_skipped.filter_unscraped(unscraped))
+                reached_watermark = reached_watermark or self._listing_page_seen(articles, unscraped)
+
                 for article in articles:
                     article_date_str = article.get("date")
                     in_range = self._is_in_date_range(article_date_str)
@@ -657,13 +1132,24 @@ class AsyncPresseportalScraper:
 
                     if article["url"] not in self.seen_urls:
                         # Skip if already in persistent cache
-                        if self.url_cache.is_scraped(article["url"]):
+                        if article["url"] not in unscraped:
                             self.skipped_cached_count += 1
                             self.seen_urls.add(article["url"])
                             continue
 
+                        if in_range and self._is_foreign_listing(article):
+                            self.firehose_foreign_skipped += 1
+                            self.seen_urls.add(article["url"])
+                            continue
+
+                        if in_range and self._skip_at_listing(article):
+                            self.seen_urls.add(article["url"])
+                            continue
+
                         if in_range:
                             all_articles.append(article)
+                            if queue is not None:
+                                await queue.put(article)
                             self.seen_urls.add(article["url"])
                             batch_added += 1
 
@@ -680,6 +1166,11 @@ class AsyncPresseportalScraper:
                 self.stop_reason = "date_boundary"
                 break
 
+            if reached_watermark:
+                print(f"  Reached the poll watermark, stopping")
+                self.stop_reason = "watermark"
+                break
+
             # Track consecutive batches with 0 new articles
             if batch_added == 0:
                 consecutive_no_new += 1
@@ -691,15 +1182,160 @@ class AsyncPresseportalScraper:
                 consecutive_no_new = 0
 
             page += len(batch_urls)
+            batch_size = min(batch_size * 2, self.concurrent_requests)
 
             # Small delay between batches
             await asyncio.sleep(DELAY_BETWEEN_BATCHES)
 
         if self.skipped_cached_count > 0:
             print(f"  Skipped {self.skipped_cached_count} already-scraped articles")
+        if self.firehose_foreign_skipped > 0:
+            print(f"  Skipped {self.firehose_foreign_skipped} articles of other states (known agency code)")
+        if self.listing_feuerwehr_skipped or self.listing_junk_skipped:
+            print(f"  Skipped {self.listing_feuerwehr_skipped} Feuerwehr and {self.listing_junk_skipped} "
+                  f"junk articles by listing title")
         print(f"  Found {len(all_articles)} new articles to scrape")
         return all_articles
 
+    def _listing_page_seen(self, articles: list[dict], unscraped: set[str]) -> bool:
+        """True if a listing page holds nothing newer than the poll watermark.
+
+        Every entry must be already scraped, the watermark URL itself, or
+        timestamped before the watermark. Entries of other states and junk
+        skipped at the listing are never scraped, so the timestamp is what
+        lets a page of them count as seen. An entry with only a date counts
+        as older only if its day is before the watermark's day. Always False
+        without a watermark.
+        """
+        if not self.watermark or not articles:
+            return False
+        mark_url = self.watermark.get("url")
+        mark_time = parse_to_datetime(self.watermark.get("published_at") or "")
+        for article in articles:
+            if article["url"] not in unscraped or article["url"] == mark_url:
+                continue
+            date_str = article.get("date") or ""
+            article_time = parse_to_datetime(date_str)
+            if article_time and mark_time:
+                if has_time_of_day(date_str):
+                    if article_time < mark_time:
+                        continue
+                elif article_time.date() < mark_time.date():
+                    continue
+            return False
+        return True
+
+    def _skip_at_listing(self, info: dict) -> bool:
+        """True (counted) if the listing title/newsroom already shows the article would be dropped.
+
+        Feuerwehr newsrooms (unless --dienststelle feuerwehr) and title-based
+        junk (filter_articles.junk_title_reason) are skipped without fetching.
+        They are not marked scraped, so a changed filter can still pick them up.
+        """
+        if not self.prefilter or self.dienststelle == "feuerwehr":
+            return False
+        reason = junk_title_reason(info.get("title"), info.get("source"))
+        if reason is None:
+            return False
+        if reason.startswith("feuerwehr"):
+            self.listing_feuerwehr_skipped += 1
+        else:
+            self.listing_junk_skipped += 1
+        if self.verbose:
+            print(f"  Skipping {info['url']} at listing ({reason})")
+        return True
+
+    def _is_foreign_listing(self, info: dict) -> bool:
+        """Firehose mode: True if the title's agency code belongs to an unwanted state."""
+        if self.newsroom_index is None:
+            return False
+        state = self.newsroom_index.lookup(agency_code=agency_code_from_title(info.get("title")))
+        return state is not None and state not in self.firehose_states
+
+    def _firehose_state(self, url: str, parsed: dict) -> Optional[str]:
+        """Attribute a parsed article; None (counted) if unattributable or unwanted.
+
+        Neither case is marked scraped, so the article stays available to a
+        per-state scrape. Both are recorded in the firehose's own skip store,
+        so later firehose crawls do not fetch them again.
+        """
+        state = self.newsroom_index.attribute(parsed)
+        if state is None:
+            self.firehose_unattributed += 1
+            self.firehose_skipped.mark_scraped(url)
+            if self.verbose:
+                print(f"  No state for {url} (places: {parsed.get('places')})")
+            return None
+        if state not in self.firehose_states:
+            self.firehose_foreign_dropped += 1
+            self.firehose_skipped.mark_scraped(url)
+            return None
+        self.firehose_counts[state] = self.firehose_counts.get(state, 0) + 1
+        return state
+
+    def _mark_scraped(self, url: str) -> None:
+        """Mark a URL scraped once its article is safe on disk.
+
+        NDJSON output has already appended it, so the URL is marked right
+        away. JSON output is only merged at the end of the run; until then
+        the URL waits in _unsaved_urls.
+        """
+        if self.writer:
+            self.url_cache.mark_scraped(url)
+        else:
+            self._unsaved_urls.append(url)
+
+    def _build_article(self, url: str, parsed: Optional[dict], info: dict) -> Optional[Article]:
+        """Turn a parsed article page into an Article (None if dropped or unparsable)."""
+        if not parsed:
+            return None
+
+        # Drop Feuerwehr (fire dept) articles — unless
+        # user explicitly requested them via --dienststelle feuerwehr
+        if self.dienststelle != "feuerwehr" and is_feuerwehr_source(parsed.get("source"), parsed.get("title")):
+            self.feuerwehr_dropped_count += 1
+            self._mark_scraped(url)
+            return None
+
+        bundesland = self.bundesland_display
+        if self.firehose_states is not None:
+            state = self._firehose_state(url, parsed)
+            if state is None:
+                return None
+            bundesland = FIREHOSE_STATE_NAMES[state]
+
+        # Use listing date as fallback
+        if not parsed["date"] and info.get("date"):
+            parsed["date"] = info["date"]
+
+        # Format date to ISO
+        if parsed["date"]:
+            date_str = parsed["date"]
+            if "T" in date_str:
+                parsed["date"] = date_str[:19]
+            else:
+                iso_date = parse_german_date(date_str)
+                if iso_date:
+                    parsed["date"] = iso_date
+
+        article = Article(
+            title=parsed["title"],
+            date=parsed["date"] or "",
+            city=parsed["city"],
+            bundesland=bundesland,
+            agency_code=parsed["agency_code"],
+            source=parsed["source"],
+            url=parsed["url"],
+            body=parsed["body"],
+            places=parsed.get("places", []),
+            themes=parsed.get("themes", []),
+        )
+        if self.writer:
+            self.writer.append(asdict(article))
+        # Mark URL as scraped in persistent cache
+        self._mark_scraped(url)
+        return article
+
     async def _scrape_articles_batch(
         self,
         session: aiohttp.ClientSession,
@@ -710,57 +1346,24 @@ class AsyncPresseportalScraper:
         articles = []
         total = len(article_infos)
 
-        # Process in batches for progress reporting
-        batch_size = self.concurrent_requests
+        # Process in batches for progress reporting; batches are sized to the
+        # rate controller's ceiling so AIMD has room to grow
+        batch_size = self.rate.max_concurrency
 
         for i in range(0, total, batch_size):
             batch = article_infos[i:i + batch_size]
             urls = [a["url"] for a in batch]
 
-            # Fetch all URLs in batch concurrently
-            results = await self._fetch_batch(session, urls, semaphore)
-
-            # Parse results
-            for (url, html), info in zip(results, batch):
-                if html:
-                    parsed = parse_article_page(html, url)
-                    if parsed:
-                        # Drop Feuerwehr (fire dept) articles — unless
-                        # user explicitly requested them via --dienststelle feuerwehr
-                        if self.dienststelle != "feuerwehr" and is_feuerwehr_source(parsed.get("source"), parsed.get("title")):
-                            self.feuerwehr_dropped_count += 1
-                            self.url_cache.mark_scraped(url)
-                            continue
+            # Fetch and parse all URLs in batch concurrently
+            results = await self._fetch_parse_batch(
+                session, urls, semaphore, self.parse_article, pass_url=True,
+            )
 
-                        # Use listing date as fallback
-                        if not parsed["date"] and info.get("date"):
-                            parsed["date"] = info["date"]
-
-                        # Format date to ISO
-                        if parsed["date"]:
-                            date_str = parsed["date"]
-                            if "T" in date_str:
-                                parsed["date"] = date_str[:19]
-                            else:
-                                iso_date = parse_german_date(date_str)
-                                if iso_date:
-                                    parsed["date"] = iso_date
-
-                        article = Article(
-                            title=parsed["title"],
-                            date=parsed["date"] or "",
-                            city=parsed["city"],
-                            bundesland=self.bundesland_display,
-                            agency_code=parsed["agency_code"],
-                            source=parsed["source"],
-                            url=parsed["url"],
-                            body=parsed["body"],
-                            places=parsed.get("places", []),
-                            themes=parsed.get("themes", []),
-                        )
-                        articles.append(article)
-                        # Mark URL as scraped in persistent cache
-                        self.url_cache.mark_scraped(url)
+            # Process parsed results
+            for (url, parsed), info in zip(results, batch):
+                article = self._build_article(url, parsed, info)
+                if article:
+                    articles.append(article)
 
             # Progress update
             progress = min(i + batch_size, total)
@@ -772,12 +1375,132 @@ class AsyncPresseportalScraper:
 
         return articles
 
-    async def run_async(self) -> None:
-        """Execute the async scraping pipeline."""
+    async def _scrape_streaming(
+        self,
+        session: aiohttp.ClientSession,
+        semaphore: asyncio.Semaphore,
+    ) -> list[Article]:
+        """Pipelined mode: article workers drain a bounded queue fed by discovery.
+
+        Discovery and article fetches share the same semaphore, so the total
+        number of in-flight requests stays at concurrent_requests while article
+        fetching starts as soon as the first listing page is parsed. The queue
+        bound applies backpressure: discovery pauses when workers fall behind.
+        Stop conditions are those of _discover_listing_pages, unchanged.
+        """
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self.concurrent_requests * STREAM_QUEUE_FACTOR)
+        articles: list[Article] = []
+        done = 0
+
+        async def worker() -> None:
+            nonlocal done
+            while True:
+                info = await queue.get()
+                if info is None:
+                    return
+                parsed = await self._fetch_and_parse(
+                    session, info["url"], semaphore, self.parse_article, info["url"],
+                )
+                article = self._build_article(info["url"], parsed, info)
+                if article:
+                    articles.append(article)
+                done += 1
+                if done % STREAM_PROGRESS_EVERY == 0:
+                    print(f"  Scraped {done} articles ({len(articles)} success, {queue.qsize()} queued)")
+
+        workers = [asyncio.create_task(worker()) for _ in range(self.rate.max_concurrency)]
+
+        async def feed() -> None:
+            await self._discover_listing_pages(session, semaphore, queue=queue)
+            for _ in workers:
+                await queue.put(None)
+
+        # Supervise discovery and workers together: a failing worker would
+        # otherwise leave discovery blocked on a full queue forever
+        tasks = [asyncio.create_task(feed()), *workers]
+        try:
+            finished, _ = await asyncio.wait(tasks, return_when=asyncio.FIRST_EXCEPTION)
+            for task in finished:
+                task.result()
+        finally:
+            for task in tasks:
+                task.cancel()
+
+        print(f"  Scraped {done} articles ({len(articles)} success)")
+        return articles
+
+    def _merge_json_output(self) -> tuple[int, int]:
+        """Merge self.articles into the JSON output file (dedupe by URL).
+
+        Returns (total articles in file, newly added).
+        """
+        output_data = [asdict(article) for article in self.articles]
+
+        # Ensure output directory exists
+        Path(self.output).parent.mkdir(parents=True, exist_ok=True)
+
+        # Load existing articles and merge (dedupe by URL)
+        existing = []
+        if Path(self.output).exists():
+            try:
+                with open(self.output, "r", encoding="utf-8") as f:
+                    loaded = json.load(f)
+                    existing = loaded if isinstance(loaded, list) else loaded.get("articles", [])
+            except (json.JSONDecodeError, IOError):
+                existing = []
+
+        existing_urls = {a.get("url") for a in existing if a.get("url")}
+        new_count = 0
+        for article in output_data:
+            if article.get("url") not in existing_urls:
+                existing.append(article)
+                existing_urls.add(article.get("url"))
+                new_count += 1
+
+        with open(self.output, "w", encoding="utf-8") as f:
+            json.dump(existing, f, ensure_ascii=False, indent=2)
+
+        return len(existing), new_count
+
+    async def _scrape(self, session: aiohttp.ClientSession, semaphore: asyncio.Semaphore) -> bool:
+        """Discover and scrape articles into self.articles. False if nothing was found."""
+        if self.streaming:
+            # Discovery and article fetching overlap, sharing one budget
+            print(f"Streaming mode: {self.rate.max_concurrency} article workers")
+            self.articles = await self._scrape_streaming(session, semaphore)
+            return True
+
+        # Phase 1: Discover all article URLs from listing pages
+        article_infos = await self._discover_listing_pages(session, semaphore)
+
+        if not article_infos:
+            print("No articles found to scrape")
+            return False
+
+        # Phase 2: Scrape all articles concurrently
+        print(f"\nScraping {len(article_infos)} articles with {self.concurrent_requests} concurrent requests...")
+        self.articles = await self._scrape_articles_batch(session, article_infos, semaphore)
+        return True
+
+    async def run_async(
+        self,
+        session: Optional[aiohttp.ClientSession] = None,
+        semaphore: Optional[asyncio.Semaphore] = None,
+    ) -> None:
+        """Execute the async scraping pipeline.
+
+        session/semaphore let several scrapers share one connection pool and
+        request budget (see scripts/pipeline/presseportal_engine.py).
+        """
         print("=" * 60)
         print("Async Presseportal Blaulicht Scraper")
         print("=" * 60)
-        print(f"Concurrent requests: {self.concurrent_requests}")
+        print(f"Concurrent requests: {self.concurrent_requests}"
+              + (f" (adaptive, up to {self.rate.max_concurrency})" if self.rate.adaptive else ""))
+        print(f"HTML parsing: {self.parser}, {self.parse_pool.describe()}")
+        if self.firehose_states is not None:
+            print(f"Firehose: /blaulicht/ feed -> {len(self.firehose_states)} states "
+                  f"(newsroom index: {len(self.newsroom_index)} entries)")
 
         if self.start_date:
             print(f"Start date: {self.start_date.date()}")
@@ -787,39 +1510,36 @@ class AsyncPresseportalScraper:
 
         start_time = time.time()
 
-        # Create HTTP headers
-        headers = {
-            "User-Agent": USER_AGENT,
-            "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
-            "Accept-Language": "de-DE,de;q=0.9,en;q=0.5",
-        }
-
-        # Create SSL context with certifi certificates (fixes macOS SSL issues)
-        ssl_context = ssl.create_default_context(cafile=certifi.where())
-
-        # Create semaphore for concurrency control
-        semaphore = asyncio.Semaphore(self.concurrent_requests)
-
-        # Create connector with custom SSL context
-        connector = aiohttp.TCPConnector(ssl=ssl_context)
+        # Create semaphore for concurrency control (hard ceiling; the rate
+        # controller decides the actual per-host concurrency below it)
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(self.rate.max_concurrency)
 
-        async with aiohttp.ClientSession(headers=headers, connector=connector) as session:
-            # Phase 1: Discover all article URLs from listing pages
-            article_infos = await self._discover_listing_pages(session, semaphore)
+        if is_ndjson(self.output):
+            self.writer = NdjsonArticleWriter(self.output)
 
-            if not article_infos:
-                print("No articles found to scrape")
+        try:
+            if session is not None:
+                found = await self._scrape(session, semaphore)
+            else:
+                # Create SSL context with certifi certificates (fixes macOS SSL issues)
+                ssl_context = ssl.create_default_context(cafile=certifi.where())
+                connector = aiohttp.TCPConnector(ssl=ssl_context)
+                async with aiohttp.ClientSession(headers=HEADERS, connector=connector) as session:
+                    found = await self._scrape(session, semaphore)
+            if not found:
                 return
-
-            # Phase 2: Scrape all articles concurrently
-            print(f"\nScraping {len(article_infos)} articles with {self.concurrent_requests} concurrent requests...")
-            self.articles = await self._scrape_articles_batch(session, article_infos, semaphore)
+        finally:
+            self.parse_pool.shutdown()
+            if self.writer:
+                self.writer.close()
+            if self.archive:
+                self.archive.close()
+            if self.newsroom_index is not None:
+                self.newsroom_index.save()
 
         elapsed = time.time() - start_time
 
-        # Save URL cache
-        self.url_cache.save()
-
         # Write scrape metadata
         meta = {
             "source": "presseportal",
@@ -831,51 +1551,63 @@ class AsyncPresseportalScraper:
             "articles_scraped": len(self.articles),
             "articles_cached_skip": self.skipped_cached_count,
             "articles_feuerwehr_skip": self.feuerwehr_dropped_count,
+            "articles_listing_feuerwehr_skip": self.listing_feuerwehr_skipped,
+            "articles_listing_junk_skip": self.listing_junk_skipped,
             "stop_reason": self.stop_reason,
+            "watermark": self.watermark,
             "fetch_count": self.fetch_count,
             "fetch_errors": self.fetch_errors,
+            "rate_control": self.rate.summary(),
+            "html_archived": self.archive.stored if self.archive else None,
+            "firehose": {
+                "states": sorted(self.firehose_states),
+                "articles_per_state": dict(sorted(self.firehose_counts.items())),
+                "foreign_skipped_listing": self.firehose_foreign_skipped,
+                "foreign_dropped": self.firehose_foreign_dropped,
+                "unattributed": self.firehose_unattributed,
+            } if self.firehose_states is not None else None,
+            "mode": "streaming" if self.streaming else "two_phase",
+            "parser": self.parser,
+            "parse_workers": self.parse_pool.workers,
             "scrape_duration_s": round(elapsed, 1),
         }
-        meta_path = self.output.rsplit('.json', 1)[0] + '.meta.json'
+        meta_path = meta_path_for(self.output)
         Path(meta_path).parent.mkdir(parents=True, exist_ok=True)
         with open(meta_path, 'w', encoding='utf-8') as f:
             json.dump(meta, f, ensure_ascii=False, indent=2)
 
-        # Write output — merge with existing file to preserve prior data
-        output_data = [asdict(article) for article in self.articles]
-
-        # Ensure output directory exists
-        Path(self.output).parent.mkdir(parents=True, exist_ok=True)
-
-        # Load existing articles and merge (dedupe by URL)
-        existing = []
-        if Path(self.output).exists():
-            try:
-                with open(self.output, "r", encoding="utf-8") as f:
-                    loaded = json.load(f)
-                    existing = loaded if isinstance(loaded, list) else loaded.get("articles", [])
-            except (json.JSONDecodeError, IOError):
-                existing = []
+        if self.writer:
+            # NDJSON: every article was already appended as it was parsed
+            total_count = self.writer.existing_count + self.writer.new_count
+            new_count = self.writer.new_count
+        else:
+            total_count, new_count = self._merge_json_output()
 
-        existing_urls = {a.get("url") for a in existing if a.get("url")}
-        new_count = 0
-        for article in output_data:
-            if article.get("url") not in existing_urls:
-                existing.append(article)
-                existing_urls.add(article.get("url"))
-                new_count += 1
+        # Save URL cache (JSON output: the articles are on disk only now)
+        self.url_cache.mark_many(self._unsaved_urls)
+        self._unsaved_urls.clear()
+        self.url_cache.save()
 
-        with open(self.output, "w", encoding="utf-8") as f:
-            json.dump(existing, f, ensure_ascii=False, indent=2)
+        self.saved_count = total_count
 
         print()
         print("=" * 60)
-        print(f"Saved {len(existing)} articles to {self.output} ({new_count} new, {len(existing) - new_count} existing)")
+        print(f"Saved {total_count} articles to {self.output} ({new_count} new, {total_count - new_count} existing)")
         if self.feuerwehr_dropped_count:
             print(f"Dropped {self.feuerwehr_dropped_count} Feuerwehr (fire dept) articles")
+        if self.firehose_states is not None:
+            per_state = ", ".join(f"{state} {n}" for state, n in sorted(self.firehose_counts.items()))
+            print(f"Firehose: {per_state or 'no articles'}")
+            print(f"  other states: {self.firehose_foreign_skipped} skipped at listing, "
+                  f"{self.firehose_foreign_dropped} dropped after fetch; "
+                  f"{self.firehose_unattributed} unattributed")
         print(f"URL cache: {len(self.url_cache)} total URLs in {self.url_cache.cache_file}")
         print(f"Elapsed time: {elapsed:.1f}s ({elapsed/60:.1f} min)")
         print(f"Fetch stats: {self.fetch_count} requests, {self.fetch_errors} errors")
+        self.rate.log_summary()
+        if self.archive:
+            print(f"HTML archive: {self.archive.stored} stored, {self.archive.deduplicated} unchanged "
+                  f"in {self.archive.archive_dir}")
         if self.articles:
             print(f"Speed: {len(self.articles)/elapsed:.1f} articles/sec")
         print("=" * 60)
@@ -903,6 +1635,16 @@ Examples:
         help="Filter by Bundesland (use slug, e.g., 'hessen', 'bayern')"
     )
 
+    parser.add_argument(
+        "--firehose",
+        type=str,
+        nargs="*",
+        metavar="STATE",
+        default=None,
+        help="Crawl the unfiltered /blaulicht/ feed once and keep articles of these states, "
+             "attributed from place tags and newsroom (no STATE = every state; excludes --bundesland)"
+    )
+
     parser.add_argument(
         "--dienststelle",
         type=str,
@@ -933,7 +1675,7 @@ Examples:
         "--output", "-o",
         type=str,
         default="blaulicht_reports.json",
-        help="Output JSON file path (default: blaulicht_reports.json)"
+        help="Output file path; .ndjson appends articles as they are parsed (default: blaulicht_reports.json)"
     )
 
     parser.add_argument(
@@ -949,6 +1691,26 @@ Examples:
         help=f"Number of concurrent requests (default: {CONCURRENT_REQUESTS})"
     )
 
+    parser.add_argument(
+        "--max-concurrent",
+        type=int,
+        default=None,
+        help="Ceiling for adaptive per-host concurrency (default: 3x --concurrent)"
+    )
+
+    parser.add_argument(
+        "--no-adaptive",
+        action="store_true",
+        help="Keep concurrency fixed at --concurrent (Retry-After is still honored)"
+    )
+
+    parser.add_argument(
+        "--archive-dir",
+        type=str,
+        default=None,
+        help="Store fetched HTML (zstd) here for later reparse (see scrapers/html_archive.py)"
+    )
+
     parser.add_argument(
         "--cache-dir",
         type=str,
@@ -956,6 +1718,37 @@ Examples:
         help="Directory for caches (default: .cache)"
     )
 
+    parser.add_argument(
+        "--parse-workers",
+        type=int,
+        default=0,
+        help="Parse HTML in a process pool with N workers so fetching and parsing "
+             "overlap (0 = parse on the event loop, -1 = one per CPU core; default: 0)"
+    )
+
+    parser.add_argument(
+        "--parser",
+        type=str,
+        choices=list(ARTICLE_PARSERS.keys()),
+        default="bs4",
+        help="Article page parser backend: bs4 (html.parser) or lexbor (selectolax, "
+             "several times faster; default: bs4)"
+    )
+
+    parser.add_argument(
+        "--stream",
+        action="store_true",
+        help="Pipelined mode: fetch articles while listing discovery is still running "
+             "(shares the --concurrent budget across both stages)"
+    )
+
+    parser.add_argument(
+        "--no-prefilter",
+        action="store_true",
+        help="Fetch every listed article, even ones whose listing title/newsroom "
+             "marks them as Feuerwehr or junk"
+    )
+
     args = parser.parse_args()
 
     # Validate dates
@@ -975,6 +1768,22 @@ Examples:
             print("Use ISO format: YYYY-MM-DD")
             sys.exit(1)
 
+    if args.firehose is not None:
+        if args.bundesland:
+            print("Error: --firehose crawls all states; do not combine it with --bundesland")
+            sys.exit(1)
+        unknown = [s for s in args.firehose if s not in FIREHOSE_STATE_NAMES]
+        if unknown:
+            print(f"Error: Unknown state(s) for --firehose: {', '.join(unknown)}")
+            print(f"Choose from: {', '.join(FIREHOSE_STATE_NAMES)}")
+            sys.exit(1)
+
+    try:
+        get_article_parser(args.parser)
+    except ImportError as e:
+        print(f"Error: {e}")
+        sys.exit(1)
+
     scraper = AsyncPresseportalScraper(
         bundesland=args.bundesland,
         dienststelle=args.dienststelle,
@@ -985,6 +1794,14 @@ Examples:
         verbose=args.verbose,
         concurrent_requests=args.concurrent,
         cache_dir=args.cache_dir,
+        parse_workers=args.parse_workers,
+        parser=args.parser,
+        streaming=args.stream,
+        adaptive=not args.no_adaptive,
+        max_concurrent=args.max_concurrent,
+        archive_dir=args.archive_dir,
+        firehose_states=(args.firehose or list(FIREHOSE_STATE_NAMES)) if args.firehose is not None else None,
+        prefilter=not args.no_prefilter,
     )
 
     try:
@@ -996,9 +1813,14 @@ Examples:
 
 
 async def scrape_new(bundesland: str, start_date: str, end_date: str,
-                     cache_dir: str = ".cache", concurrent: int = 5) -> list[dict]:
-    """Return new articles as dicts. Used by live pipeline."""
-    out = os.path.join(cache_dir, f"_live_{bundesland}.json")
+                     cache_dir: str = ".cache", concurrent: int = 5,
+                     parse_workers: int = 0, streaming: bool = False,
+                     watermark: Optional[dict] = None) -> list[dict]:
+    """Return new articles as dicts. Used by live pipeline.
+
+    The state's poll watermark stops listing discovery at already-seen pages.
+    """
+    out = os.path.join(cache_dir, f"_live_{bundesland}.ndjson")
     scraper = AsyncPresseportalScraper(
         bundesland=bundesland,
         start_date=start_date,
@@ -1006,10 +1828,42 @@ async def scrape_new(bundesland: str, start_date: str, end_date: str,
         output=out,
         cache_dir=cache_dir,
         concurrent_requests=concurrent,
+        parse_workers=parse_workers,
+        streaming=streaming,
+        watermark=watermark,
     )
     await scraper.run_async()
     return [asdict(a) for a in scraper.articles]
 
 
+async def scrape_new_firehose(states: list[str], start_date: str, end_date: str,
+                              cache_dir: str = ".cache", concurrent: int = 5,
+                              parse_workers: int = 0, streaming: bool = False,
+                              watermark: Optional[dict] = None) -> dict[str, list[dict]]:
+    """Return new articles of several states from one /blaulicht/ crawl, keyed by
+    state slug (every requested state present, possibly empty). Used by live pipeline.
+
+    Pass the oldest of the states' poll watermarks, so no state's new
+    articles are cut off.
+    """
+    out = os.path.join(cache_dir, "_live_firehose.ndjson")
+    scraper = AsyncPresseportalScraper(
+        start_date=start_date,
+        end_date=end_date,
+        output=out,
+        cache_dir=cache_dir,
+        concurrent_requests=concurrent,
+        parse_workers=parse_workers,
+        streaming=streaming,
+        firehose_states=states,
+        watermark=watermark,
+    )
+    await scraper.run_async()
+    by_state: dict[str, list[dict]] = {state: [] for state in states}
+    for article in scraper.articles:
+        by_state[FIREHOSE_STATE_BY_PLACE[article.bundesland]].append(asdict(article))
+    return by_state
+
+
 if __name__ == "__main__":
     main()
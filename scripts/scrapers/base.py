@@ -0,0 +1,617 @@
+"""
+Shared async runtime for the dedicated state scrapers (scrapers/scrape_*.py).
+
+Every state scraper used to carry its own copy of the Article dataclass, the
+retrying fetch loop, batch fetching, SSL/connector setup, date-range checks,
+progress output and meta/output writing. AsyncScraperBase holds all of that;
+a state scraper supplies what differs between sites:
+
+  _discover(session, semaphore)       listing dicts to fetch (each has "url");
+                                      _fetch_listing_waves() and
+                                      _collect_listing_entries() help with
+                                      planned, newest-first listings, and
+                                      _listing_page_seen() ends it at a
+                                      poll watermark
+  parse_page                          the module's parse_article_page; runs in
+                                      the ParsePool, so it must be module-level
+  _parse_args(url, html, info)        its arguments (default: html, url)
+  _build_articles(url, parsed, info)  Articles from one parsed page; [] when
+                                      every article was dropped (the URL is
+                                      still marked scraped)
+  _banner_lines() / _meta_extra()     optional banner lines and meta keys
+
+A page that fails to fetch or parse is not marked scraped, so the next run
+retries it.
+
+run_async() takes an optional session and semaphore, so several scrapers can
+run as tasks in one event loop over one connection pool:
+
+    scrapers = [AsyncBerlinPolizeiScraper(...), AsyncSachsenPolizeiScraper(...)]
+    errors = await run_scrapers(scrapers)   # [None, None] when both succeed
+"""
+
+import abc
+import asyncio
+import json
+import ssl
+import time
+from dataclasses import asdict, dataclass, field
+from datetime import date, datetime
+from pathlib import Path
+from typing import AsyncIterator, Callable, Optional
+
+import aiohttp
+import certifi
+
+from scripts.pipeline.article_io import NdjsonArticleWriter, is_ndjson, meta_path_for
+from scripts.scrapers.html_archive import HtmlArchive
+from scripts.scrapers.parse_pool import ParsePool
+from scripts.scrapers.rate_control import THROTTLE_STATUSES, RateController
+from scripts.scrapers.url_store import ScrapedUrlsCache
+
+DEFAULT_USER_AGENT = "adlerlicht/1.0 (+contact: scraper@adlerlicht.de)"
+ACCEPT_HTML = "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8"
+MAX_RETRIES = 3
+
+
+@dataclass
+class Article:
+    """A scraped press release (same schema as the presseportal scraper)."""
+    title: str
+    date: str
+    city: Optional[str]
+    bundesland: Optional[str]
+    agency_code: Optional[str]
+    source: Optional[str]
+    url: str
+    body: str
+    places: list[str] = field(default_factory=list)
+    themes: list[str] = field(default_factory=list)
+
+
+def request_headers(user_agent: str = DEFAULT_USER_AGENT, accept: str = ACCEPT_HTML) -> dict[str, str]:
+    """Headers sent with every scraper request."""
+    return {
+        "User-Agent": user_agent,
+        "Accept": accept,
+        "Accept-Language": "de-DE,de;q=0.9,en;q=0.5",
+    }
+
+
+def create_connector(limit: int) -> aiohttp.TCPConnector:
+    """TCP connector with certifi's CA bundle (fixes macOS SSL issues)."""
+    ssl_context = ssl.create_default_context(cafile=certifi.where())
+    return aiohttp.TCPConnector(ssl=ssl_context, limit=limit)
+
+
+def parse_day(iso_date: Optional[str]) -> Optional[date]:
+    """'YYYY-MM-DD[THH:MM:SS]' -> date; None if missing or unparsable."""
+    if not iso_date:
+        return None
+    try:
+        return date.fromisoformat(iso_date[:10])
+    except ValueError:
+        return None
+
+
+class AsyncScraperBase(abc.ABC):
+    """Discover -> fetch -> parse -> write runtime shared by the state scrapers."""
+
+    # Banner title, meta "source", HtmlArchive source name, URL cache file
+    NAME = "Async Scraper"
+    SOURCE = ""
+    ARCHIVE_SOURCE = ""
+    URL_CACHE_FILE = "scraped_urls.json"
+
+    USER_AGENT = DEFAULT_USER_AGENT
+    ACCEPT = ACCEPT_HTML
+    # Responses retried after the rate controller's host pause
+    THROTTLE_STATUSES = THROTTLE_STATUSES
+    # Print throttling and fetch failures even without --verbose
+    LOG_FETCH_ISSUES = False
+    # Fixed listing page size for the meta estimate (None = not paginated that way)
+    ARTICLES_PER_PAGE: Optional[int] = None
+    # What --max-pages limits, for the banner
+    MAX_PAGES_LABEL = "Max pages"
+    # Module-level article page parser, wrapped in staticmethod()
+    parse_page = None
+
+    def __init__(
+        self,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+        max_pages: int = 0,
+        output: str = "reports.json",
+        verbose: bool = False,
+        concurrent_requests: int = 10,
+        cache_dir: str = ".cache",
+        adaptive: bool = True,
+        max_concurrent: Optional[int] = None,
+        archive_dir: Optional[str] = None,
+        parse_workers: int = 0,
+        request_timeout: float = 30,
+        batch_delay: float = 0.5,
+        watermark: Optional[dict] = None,
+    ):
+        self.start_date = datetime.fromisoformat(start_date) if start_date else None
+        self.end_date = datetime.fromisoformat(end_date) if end_date else None
+        self.max_pages = max_pages
+        self.output = output
+        self.verbose = verbose
+        self.concurrent_requests = concurrent_requests
+        self.request_timeout = request_timeout
+        self.batch_delay = batch_delay
+        self.rate = RateController(
+            concurrent_requests, max_concurrency=max_concurrent, adaptive=adaptive, verbose=verbose,
+        )
+        self.archive = HtmlArchive(archive_dir, source=self.ARCHIVE_SOURCE) if archive_dir else None
+        self.parse_pool = ParsePool(parse_workers)
+        # Poll watermark ({"url", "published_at"} of the newest article seen
+        # by the last live cycle); discovery stops at a page with nothing newer
+        self.watermark = watermark
+
+        self.articles: list[Article] = []
+        self.seen_urls: set[str] = set()
+        self.url_cache = ScrapedUrlsCache(cache_dir, self.URL_CACHE_FILE)
+        self.writer: Optional[NdjsonArticleWriter] = None
+        # JSON output: URLs are marked scraped only once the file is written
+        self._unsaved_urls: list[str] = []
+        self.saved_count = 0
+        self.skipped_cached_count = 0
+        self.feuerwehr_dropped_count = 0
+
+        # Stats
+        self.fetch_count = 0
+        self.fetch_errors = 0
+
+        # Metadata tracking
+        self.pages_visited = 0
+        self.pages_with_content = 0
+        self.source_total: Optional[int] = None
+        self.stop_reason = "unknown"
+
+    # ---- Site hooks ----
+    @abc.abstractmethod
+    async def _discover(
+        self,
+        session: aiohttp.ClientSession,
+        semaphore: asyncio.Semaphore,
+    ) -> list[dict]:
+        """Listing dicts (each with "url") of the articles to fetch."""
+
+    def _parse_args(self, url: str, html: str, info: dict) -> tuple:
+        return (html, url)
+
+    @abc.abstractmethod
+    def _build_articles(self, url: str, parsed, info: dict) -> list[Article]:
+        """Articles from one parsed page; [] when every article was dropped."""
+
+    def _banner_lines(self) -> list[str]:
+        return []
+
+    def _meta_extra(self) -> dict:
+        return {}
+
+    def _close(self) -> None:
+        """Release site-specific resources once fetching is done."""
+
+    # ---- Date range ----
+    def _is_in_date_range(self, iso_date: Optional[str]) -> bool:
+        """Unknown or unparsable dates count as in range."""
+        day = parse_day(iso_date)
+        if day is None:
+            return True
+        if self.start_date and day < self.start_date.date():
+            return False
+        if self.end_date and day > self.end_date.date():
+            return False
+        return True
+
+    def _is_before_start(self, iso_date: Optional[str]) -> bool:
+        """Strictly before start_date (newest-first listings stop here)."""
+        day = parse_day(iso_date)
+        return bool(day and self.start_date and day < self.start_date.date())
+
+    def _entry_iso_date(self, entry: dict) -> Optional[str]:
+        """ISO date of a listing entry, for comparison with the watermark."""
+        return entry.get("date")
+
+    def _listing_page_seen(self, entries: list[dict]) -> bool:
+        """True if a listing page holds nothing newer than the poll watermark.
+
+        An entry counts as seen if it is already scraped, is the watermark URL
+        itself, or is dated before the watermark's day (same-day entries need
+        the URL cache, since most listings only give a date). Always False
+        without a watermark, so backfills are unaffected.
+        """
+        if not self.watermark or not entries:
+            return False
+        mark_url = self.watermark.get("url")
+        mark_day = (self.watermark.get("published_at") or "")[:10]
+        for entry in entries:
+            url = entry.get("url")
+            if url == mark_url or (url and self.url_cache.is_scraped(url)):
+                continue
+            iso = self._entry_iso_date(entry)
+            if iso and mark_day and iso[:10] < mark_day:
+                continue
+            return False
+        return True
+
+    # ---- HTTP ----
+    @property
+    def headers(self) -> dict[str, str]:
+        return request_headers(self.USER_AGENT, self.ACCEPT)
+
+    async def _fetch_url(
+        self,
+        session: aiohttp.ClientSession,
+        url: str,
+        semaphore: asyncio.Semaphore,
+        method: str = "GET",
+        json_body: Optional[dict] = None,
+        expect_json: bool = False,
+    ) -> Optional[str | dict | list]:
+        """Fetch a single URL with semaphore-controlled concurrency and retries.
+
+        Returns the body (decoded JSON with expect_json), or None on any other
+        HTTP error. A throttled response pauses the host in self.rate before
+        the next attempt. Headers go on every request, so the session may be
+        shared with scrapers for other sites.
+        """
+        log = self.verbose or self.LOG_FETCH_ISSUES
+        async with semaphore:
+            for attempt in range(MAX_RETRIES):
+                try:
+                    async with self.rate.slot(url) as slot, session.request(
+                        method,
+                        url,
+                        json=json_body,
+                        headers=self.headers,
+                        timeout=aiohttp.ClientTimeout(total=self.request_timeout),
+                    ) as response:
+                        throttled = response.status in self.THROTTLE_STATUSES
+                        slot.record(response.status, response.headers, throttled=throttled)
+                        if response.status == 200:
+                            self.fetch_count += 1
+                            if expect_json:
+                                try:
+                                    return await response.json(content_type=None)
+                                except ValueError:
+                                    if log:
+                                        print(f"  Invalid JSON from {url}")
+                                    return None
+                            html = await response.text()
+                            if self.archive and method == "GET":
+                                self.archive.put(url, html)
+                            return html
+                        elif throttled:  # Host cooldown set by self.rate
+                            if log:
+                                print(f"  Rate limited ({response.status}) on {url} "
+                                      f"(attempt {attempt + 1}/{MAX_RETRIES})")
+                        else:
+                            if log:
+                                print(f"  HTTP {response.status} for {url}")
+                            return None
+                except asyncio.TimeoutError:
+                    if log:
+                        print(f"  Timeout ({attempt + 1}/{MAX_RETRIES}): {url}")
+                    if attempt < MAX_RETRIES - 1:
+                        await asyncio.sleep(1)
+                except aiohttp.ClientError as e:
+                    if log:
+                        print(f"  Error fetching {url}: {e}")
+                    if attempt < MAX_RETRIES - 1:
+                        await asyncio.sleep(1)
+
+            self.fetch_errors += 1
+            if log:
+                print(f"  FAILED after {MAX_RETRIES} attempts: {url}")
+            return None
+
+    async def _fetch_batch(
+        self,
+        session: aiohttp.ClientSession,
+        urls: list[str],
+        semaphore: asyncio.Semaphore,
+    ) -> list[tuple[str, Optional[str]]]:
+        """Fetch a batch of URLs concurrently."""
+        tasks = [self._fetch_url(session, url, semaphore) for url in urls]
+        results = await asyncio.gather(*tasks)
+        return list(zip(urls, results))
+
+    # ---- Listing discovery ----
+    def _collect_listing_entries(self, articles: list[dict], all_articles: list[dict]) -> tuple[int, int, int]:
+        """Add a listing page's new in-range entries; returns (added, too_old, too_new).
+
+        Entries carry their date under "date" in whatever form the
+        subclass's _is_in_date_range() accepts.
+        """
+        page_added = 0
+        page_too_old = 0
+        page_too_new = 0
+
+        for article in articles:
+            article_url = article["url"]
+            article_date = article.get("date")
+
+            # Skip duplicates
+            if article_url in self.seen_urls:
+                continue
+
+            # Skip cached
+            if self.url_cache.is_scraped(article_url):
+                self.skipped_cached_count += 1
+                self.seen_urls.add(article_url)
+                continue
+
+            # Date filtering (unknown dates are kept)
+            if not self._is_in_date_range(article_date):
+                if self._is_before_start(article_date):
+                    page_too_old += 1
+                else:
+                    page_too_new += 1
+                self.seen_urls.add(article_url)
+                continue
+
+            # Article is in range (or date unknown)
+            all_articles.append(article)
+            self.seen_urls.add(article_url)
+            page_added += 1
+
+        return page_added, page_too_old, page_too_new
+
+    async def _fetch_listing_waves(
+        self,
+        session: aiohttp.ClientSession,
+        urls: list[str],
+        semaphore: asyncio.Semaphore,
+        parse: Callable[[str], list[dict]],
+        delay: float,
+        wave_size: Optional[int] = None,
+    ) -> AsyncIterator[list[tuple[str, Optional[list[dict]]]]]:
+        """Fetch a planned list of listing pages concurrently, a wave at a time.
+
+        Yields each wave's (url, parsed entries) in page order; entries are
+        None if the fetch failed. Waves default to the rate controller's
+        ceiling and are separated by `delay`. Stop iterating to skip the
+        rest, e.g. once a newest-first listing passes the start date; smaller
+        waves stop sooner. With a watermark the waves start at one page and
+        double, since a steady-state poll usually stops on the first.
+        """
+        max_wave = wave_size or self.rate.max_concurrency
+        size = 1 if self.watermark else max_wave
+        i = 0
+        while i < len(urls):
+            results = await self._fetch_batch(session, urls[i:i + size], semaphore)
+            yield [(url, parse(html) if html else None) for url, html in results]
+            i += size
+            size = min(size * 2, max_wave)
+            if i < len(urls):
+                await asyncio.sleep(delay)
+
+    async def _fetch_and_parse(
+        self,
+        session: aiohttp.ClientSession,
+        info: dict,
+        semaphore: asyncio.Semaphore,
+    ):
+        """Fetch an article page and parse it as soon as it arrives.
+
+        Parsing happens after the semaphore slot is released, so with a
+        process pool the next fetch starts while this page is being parsed.
+        Returns None if the fetch failed.
+        """
+        url = info["url"]
+        html = await self._fetch_url(session, url, semaphore)
+        if not html:
+            return None
+        return await self.parse_pool.run(self.parse_page, *self._parse_args(url, html, info))
+
+    # ---- Pipeline ----
+    async def _scrape_articles(
+        self,
+        session: aiohttp.ClientSession,
+        article_infos: list[dict],
+        semaphore: asyncio.Semaphore,
+    ) -> list[Article]:
+        """Fetch and parse article pages in batches, building Articles via _build_articles."""
+        articles: list[Article] = []
+        total = len(article_infos)
+        # Batches are sized to the rate controller's ceiling so AIMD has room to grow
+        batch_size = self.rate.max_concurrency
+
+        for i in range(0, total, batch_size):
+            batch = article_infos[i:i + batch_size]
+            results = await asyncio.gather(
+                *(self._fetch_and_parse(session, info, semaphore) for info in batch)
+            )
+
+            for parsed, info in zip(results, batch):
+                if not parsed:
+                    continue
+                url = info["url"]
+                built = self._build_articles(url, parsed, info)
+                articles.extend(built)
+                if self.writer:
+                    for article in built:
+                        self.writer.append(asdict(article))
+                self._mark_scraped(url)
+
+            progress = min(i + batch_size, total)
+            print(f"  Scraped {progress}/{total} articles ({len(articles)} success)")
+
+            if i + batch_size < total:
+                await asyncio.sleep(self.batch_delay)
+
+        return articles
+
+    def _mark_scraped(self, url: str) -> None:
+        """Mark a URL scraped once its articles are safe on disk.
+
+        NDJSON output has already appended them, so the URL is marked right
+        away. JSON output is only written at the end of the run; until then
+        the URL waits in _unsaved_urls, so a crash cannot leave it marked
+        without its articles in the file.
+        """
+        if self.writer:
+            self.url_cache.mark_scraped(url)
+        else:
+            self._unsaved_urls.append(url)
+
+    async def _scrape(self, session: aiohttp.ClientSession, semaphore: asyncio.Semaphore) -> bool:
+        """Discover and scrape articles into self.articles. False if nothing was found."""
+        article_infos = await self._discover(session, semaphore)
+        if not article_infos:
+            print("\nNo articles found to scrape")
+            return False
+
+        print(f"\nScraping {len(article_infos)} articles with {self.concurrent_requests} concurrent requests...")
+        self.articles = await self._scrape_articles(session, article_infos, semaphore)
+        return True
+
+    def _print_banner(self) -> None:
+        print("=" * 60)
+        print(self.NAME)
+        print("=" * 60)
+        for line in self._banner_lines():
+            print(line)
+        print(f"Concurrent requests: {self.concurrent_requests}"
+              + (f" (adaptive, up to {self.rate.max_concurrency})" if self.rate.adaptive else ""))
+        print(f"HTML parsing: {self.parse_pool.describe()}")
+        if self.start_date:
+            print(f"Start date: {self.start_date.date()}")
+        if self.end_date:
+            print(f"End date: {self.end_date.date()}")
+        if self.max_pages:
+            print(f"{self.MAX_PAGES_LABEL}: {self.max_pages}")
+        print()
+
+    def _write_meta(self, elapsed: float) -> None:
+        if self.source_total is not None:
+            estimated_total = self.source_total
+        elif self.ARTICLES_PER_PAGE:
+            estimated_total = self.pages_with_content * self.ARTICLES_PER_PAGE
+        else:
+            estimated_total = None
+        meta = {
+            "source": self.SOURCE,
+            "pages_visited": self.pages_visited,
+            "pages_with_content": self.pages_with_content,
+            "articles_per_page": self.ARTICLES_PER_PAGE,
+            "source_total": self.source_total,
+            "estimated_total": estimated_total,
+            "articles_scraped": len(self.articles),
+            "articles_cached_skip": self.skipped_cached_count,
+            "articles_feuerwehr_skip": self.feuerwehr_dropped_count,
+            "stop_reason": self.stop_reason,
+            "fetch_count": self.fetch_count,
+            "fetch_errors": self.fetch_errors,
+            "rate_control": self.rate.summary(),
+            "html_archived": self.archive.stored if self.archive else None,
+            "parse_workers": self.parse_pool.workers,
+            "watermark": self.watermark,
+            **self._meta_extra(),
+            "scrape_duration_s": round(elapsed, 1),
+        }
+        meta_path = meta_path_for(self.output)
+        Path(meta_path).parent.mkdir(parents=True, exist_ok=True)
+        with open(meta_path, 'w', encoding='utf-8') as f:
+            json.dump(meta, f, ensure_ascii=False, indent=2)
+
+    def _write_output(self) -> str:
+        """Write self.articles; returns the "Saved ..." summary line."""
+        if self.writer:
+            # NDJSON: every article was already appended as it was parsed
+            self.saved_count = self.writer.existing_count + self.writer.new_count
+            return (f"Saved {self.saved_count} articles to {self.output} "
+                    f"({self.writer.new_count} new, {self.writer.existing_count} existing)")
+
+        Path(self.output).parent.mkdir(parents=True, exist_ok=True)
+        with open(self.output, "w", encoding="utf-8") as f:
+            json.dump([asdict(article) for article in self.articles], f, ensure_ascii=False, indent=2)
+        self.saved_count = len(self.articles)
+        return f"Saved {self.saved_count} articles to {self.output}"
+
+    async def run_async(
+        self,
+        session: Optional[aiohttp.ClientSession] = None,
+        semaphore: Optional[asyncio.Semaphore] = None,
+    ) -> None:
+        """Execute the async scraping pipeline.
+
+        session/semaphore let several scrapers share one event loop and
+        connection pool (see run_scrapers()).
+        """
+        self._print_banner()
+        start_time = time.time()
+
+        # Hard ceiling; the rate controller decides the per-host concurrency below it
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(self.rate.max_concurrency)
+
+        if is_ndjson(self.output):
+            self.writer = NdjsonArticleWriter(self.output)
+
+        try:
+            if session is not None:
+                found = await self._scrape(session, semaphore)
+            else:
+                connector = create_connector(self.rate.max_concurrency)
+                async with aiohttp.ClientSession(connector=connector) as session:
+                    found = await self._scrape(session, semaphore)
+            if not found:
+                return
+        finally:
+            self.parse_pool.shutdown()
+            if self.writer:
+                self.writer.close()
+            if self.archive:
+                self.archive.close()
+            self._close()
+
+        elapsed = time.time() - start_time
+
+        self._write_meta(elapsed)
+        saved = self._write_output()
+
+        # Save URL cache (JSON output: the articles are on disk only now)
+        self.url_cache.mark_many(self._unsaved_urls)
+        self._unsaved_urls.clear()
+        self.url_cache.save()
+
+        print()
+        print("=" * 60)
+        print(saved)
+        if self.feuerwehr_dropped_count:
+            print(f"Dropped {self.feuerwehr_dropped_count} Feuerwehr (fire dept) articles")
+        print(f"URL cache: {len(self.url_cache)} total URLs in {self.url_cache.cache_file}")
+        print(f"Elapsed time: {elapsed:.1f}s ({elapsed / 60:.1f} min)")
+        print(f"Fetch stats: {self.fetch_count} requests, {self.fetch_errors} errors")
+        self.rate.log_summary()
+        if self.archive:
+            print(f"HTML archive: {self.archive.stored} stored, {self.archive.deduplicated} unchanged "
+                  f"in {self.archive.archive_dir}")
+        if self.articles:
+            print(f"Speed: {len(self.articles) / max(elapsed, 0.1):.1f} articles/sec")
+        print("=" * 60)
+
+    def run(self) -> None:
+        """Synchronous entry point - runs the async pipeline."""
+        asyncio.run(self.run_async())
+
+
+async def run_scrapers(scrapers: list[AsyncScraperBase]) -> list[Optional[BaseException]]:
+    """Run several scrapers as concurrent tasks over one connection pool.
+
+    Each scraper keeps its own semaphore, rate controller and URL cache (they
+    hit different hosts). Returns the exception each one raised, or None, in
+    order; one failing scraper does not cancel the others.
+    """
+    connector = create_connector(sum(s.rate.max_concurrency for s in scrapers))
+    async with aiohttp.ClientSession(connector=connector) as session:
+        results = await asyncio.gather(
+            *(scraper.run_async(session=session) for scraper in scrapers),
+            return_exceptions=True,
+        )
+    return [r if isinstance(r, BaseException) else None for r in results]
@@ -0,0 +1,364 @@
+"""
+Content-addressed archive of fetched HTML, so parser fixes can be applied
+without re-downloading.
+
+Every response body a scraper fetches (with --archive-dir) is stored
+zstd-compressed, one frame per body, appended to large segment files. A
+SQLite index (WAL, shared by concurrent scraper processes) maps
+url + fetch time -> sha256 digest -> (segment, offset, length). Identical
+bodies are stored once. Each writer process appends to its own segment
+files, so parallel scrapers never interleave writes.
+
+`reparse` regenerates raw chunk JSON from the archive: for every article in
+the given chunks it looks up the latest archived page for its URL, runs the
+*current* parse_article_page of the scraper that fetched it (in a process
+pool), and refreshes the page-derived fields (title, body, city, ...). Fields
+that come from listing pages (date, bundesland) are kept unless the page
+provides them. Articles whose URL is not archived are left unchanged.
+
+Usage:
+    python3 scripts/scrape_blaulicht_async.py --bundesland hessen --archive-dir .cache/html_archive
+    python3 scripts/scrapers/html_archive.py stats
+    python3 scripts/scrapers/html_archive.py reparse data/pipeline/chunks/raw/hessen_*.json --workers -1
+    python3 scripts/scrapers/html_archive.py reparse data/pipeline/chunks/raw/*.json --output-dir /tmp/reparsed
+"""
+
+import argparse
+import hashlib
+import importlib
+import json
+import os
+import sqlite3
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from pathlib import Path
+from typing import Optional
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent))
+from scripts.scrapers.parse_pool import resolve_workers
+
+DEFAULT_ARCHIVE_DIR = ".cache/html_archive"
+SEGMENT_MAX_BYTES = 256 * 1024 * 1024  # roll over to a new segment file
+ZSTD_LEVEL = 6
+
+# source name -> (module, parse function) used by reparse
+ARCHIVE_PARSERS = {
+    "presseportal": ("scripts.scrape_blaulicht_async", "parse_article_page"),
+    "bayern": ("scripts.scrapers.scrape_bayern_polizei", "parse_article_page"),
+    "berlin": ("scripts.scrapers.scrape_berlin_polizei", "parse_article_page"),
+    "brandenburg": ("scripts.scrapers.scrape_brandenburg_polizei", "parse_article_page"),
+    "hamburg": ("scripts.scrapers.scrape_hamburg_polizei", "parse_article_page"),
+    "sachsen-anhalt": ("scripts.scrapers.scrape_sachsen_anhalt", "parse_article_page"),
+    "sachsen": ("scripts.scrapers.scrape_sachsen_polizei", "parse_article_page"),
+}
+
+# Raw chunk fields a page parse may refresh (date/bundesland/url stay listing-derived)
+PAGE_FIELDS = ("title", "city", "agency_code", "source", "body", "places", "themes")
+
+
+class HtmlArchive:
+    """Append-only zstd segment store with a SQLite url/digest index."""
+
+    def __init__(self, archive_dir: str = DEFAULT_ARCHIVE_DIR, source: str = "unknown"):
+        import zstandard
+
+        self.archive_dir = Path(archive_dir)
+        self.archive_dir.mkdir(parents=True, exist_ok=True)
+        self.source = source
+        self.index_file = self.archive_dir / "index.sqlite"
+
+        self._conn = sqlite3.connect(self.index_file, timeout=30, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS blobs ("
+            " digest TEXT PRIMARY KEY,"
+            " segment TEXT NOT NULL,"
+            " offset INTEGER NOT NULL,"
+            " length INTEGER NOT NULL,"
+            " size INTEGER NOT NULL"
+            ") WITHOUT ROWID"
+        )
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS fetches ("
+            " url TEXT NOT NULL,"
+            " fetched_at TEXT NOT NULL,"
+            " source TEXT NOT NULL,"
+            " digest TEXT NOT NULL,"
+            " PRIMARY KEY (url, fetched_at)"
+            ") WITHOUT ROWID"
+        )
+
+        self._compressor = zstandard.ZstdCompressor(level=ZSTD_LEVEL)
+        self._decompressor = zstandard.ZstdDecompressor()
+        self._segment = None  # opened lazily on first write
+        self._segment_name: Optional[str] = None
+        self._segment_seq = 0
+        self._readers: dict[str, object] = {}
+
+        self.stored = 0
+        self.deduplicated = 0
+
+    # ---- writing ----
+
+    def _open_segment(self) -> None:
+        if self._segment:
+            self._segment.close()
+        self._segment_seq += 1
+        stamp = datetime.now().strftime("%Y%m%d%H%M%S")
+        self._segment_name = f"{self.source}-{stamp}-{os.getpid()}-{self._segment_seq:03d}.zst"
+        self._segment = open(self.archive_dir / self._segment_name, "ab")
+
+    def put(self, url: str, body: str) -> str:
+        """Archive one response body; returns its digest."""
+        data = body.encode("utf-8")
+        digest = hashlib.sha256(data).hexdigest()
+
+        exists = self._conn.execute("SELECT 1 FROM blobs WHERE digest = ?", (digest,)).fetchone()
+        if exists:
+            self.deduplicated += 1
+        else:
+            if self._segment is None or self._segment.tell() >= SEGMENT_MAX_BYTES:
+                self._open_segment()
+            frame = self._compressor.compress(data)
+            offset = self._segment.tell()
+            self._segment.write(frame)
+            self._segment.flush()  # bytes on disk before the index points at them
+            self._conn.execute(
+                "INSERT OR IGNORE INTO blobs (digest, segment, offset, length, size) VALUES (?, ?, ?, ?, ?)",
+                (digest, self._segment_name, offset, len(frame), len(data)),
+            )
+            self.stored += 1
+
+        self._conn.execute(
+            "INSERT OR REPLACE INTO fetches (url, fetched_at, source, digest) VALUES (?, ?, ?, ?)",
+            (url, datetime.now().isoformat(), self.source, digest),
+        )
+        return digest
+
+    # ---- reading ----
+
+    def _read_blob(self, segment: str, offset: int, length: int) -> str:
+        f = self._readers.get(segment)
+        if f is None:
+            f = self._readers[segment] = open(self.archive_dir / segment, "rb")
+        f.seek(offset)
+        return self._decompressor.decompress(f.read(length)).decode("utf-8")
+
+    def latest(self, url: str) -> Optional[tuple[str, str, str]]:
+        """Return (source, fetched_at, html) of the newest fetch of url, or None."""
+        row = self._conn.execute(
+            "SELECT f.source, f.fetched_at, b.segment, b.offset, b.length"
+            " FROM fetches f JOIN blobs b ON b.digest = f.digest"
+            " WHERE f.url = ? ORDER BY f.fetched_at DESC LIMIT 1",
+            (url,),
+        ).fetchone()
+        if row is None:
+            return None
+        source, fetched_at, segment, offset, length = row
+        return source, fetched_at, self._read_blob(segment, offset, length)
+
+    def get(self, url: str) -> Optional[str]:
+        """Return the newest archived body for url, or None."""
+        found = self.latest(url)
+        return found[2] if found else None
+
+    def stats(self) -> dict:
+        urls, fetches = self._conn.execute("SELECT COUNT(DISTINCT url), COUNT(*) FROM fetches").fetchone()
+        blobs, raw = self._conn.execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM blobs").fetchone()
+        per_source = dict(self._conn.execute("SELECT source, COUNT(DISTINCT url) FROM fetches GROUP BY source"))
+        segments = sorted(self.archive_dir.glob("*.zst"))
+        compressed = sum(p.stat().st_size for p in segments)
+        return {
+            "urls": urls,
+            "fetches": fetches,
+            "blobs": blobs,
+            "segments": len(segments),
+            "raw_bytes": raw,
+            "compressed_bytes": compressed,
+            "per_source": per_source,
+        }
+
+    def close(self) -> None:
+        if self._segment:
+            self._segment.close()
+            self._segment = None
+        for f in self._readers.values():
+            f.close()
+        self._readers.clear()
+        self._conn.close()
+
+
+# ---------------------------------------------------------------------------
+# Reparse
+# ---------------------------------------------------------------------------
+
+_worker_archive: Optional[HtmlArchive] = None
+
+
+def _init_worker(archive_dir: str) -> None:
+    global _worker_archive
+    _worker_archive = HtmlArchive(archive_dir, source="reparse")
+
+
+def _parse_archived(job: tuple[str, dict]) -> tuple[str, Optional[str], object]:
+    """Worker: parse the newest archived page for one URL with its source's parser."""
+    url, listing = job
+    found = _worker_archive.latest(url)
+    if found is None:
+        return url, None, None
+    source, _, html = found
+    if source not in ARCHIVE_PARSERS:
+        return url, source, None
+    module, func = ARCHIVE_PARSERS[source]
+    parse_fn = getattr(importlib.import_module(module), func)
+    if source == "sachsen-anhalt":
+        return url, source, parse_fn(html, url, _listing_info(listing))
+    return url, source, parse_fn(html, url)
+
+
+def _listing_info(article: dict) -> dict:
+    """Rebuild the listing entry a raw chunk article came from (date back to DD.MM.YYYY)."""
+    date_str = article.get("date") or ""
+    try:
+        date_str = datetime.strptime(date_str[:10], "%Y-%m-%d").strftime("%d.%m.%Y")
+    except ValueError:
+        pass
+    return {
+        "url": article.get("url", ""),
+        "title": article.get("title", ""),
+        "date": date_str,
+        "preview": article.get("body", ""),
+    }
+
+
+def _normalize_date(date_str: str) -> str:
+    """Same ISO normalization the presseportal scraper applies."""
+    from scripts.scrape_blaulicht_async import parse_german_date
+
+    if "T" in date_str:
+        return date_str[:19]
+    return parse_german_date(date_str) or date_str
+
+
+def merge_reparsed(source: str, old: list[dict], parsed) -> list[dict]:
+    """Apply a fresh page parse to the raw chunk article(s) that share its URL."""
+    if source == "bayern":
+        from scripts.scrapers.scrape_bayern_polizei import is_feuerwehr_source
+
+        # Accordion pages become one article per Landkreis section, minus the
+        # Feuerwehr sections the scraper dropped; the scraper prefers the
+        # listing title for flat pages.
+        base = old[0]
+        if len(parsed) > 1:
+            return [
+                {**base, "title": p["title"] or base["title"], "body": p["body"] or base["body"],
+                 "city": p["city"], "agency_code": p["agency_code"]}
+                for p in parsed
+                if not is_feuerwehr_source(base.get("source"), p["title"] or base["title"])
+            ]
+        p = parsed[0]
+        return [{**base, "body": p["body"] or base["body"], "city": p["city"], "agency_code": p["agency_code"]}]
+
+    merged = []
+    for article in old:
+        updated = dict(article)
+        for field in PAGE_FIELDS:
+            if parsed.get(field):
+                updated[field] = parsed[field]
+        if not article.get("date") and parsed.get("date"):
+            updated["date"] = _normalize_date(parsed["date"]) if source == "presseportal" else parsed["date"]
+        merged.append(updated)
+    return merged
+
+
+def reparse_chunks(paths: list[Path], archive_dir: str, workers: int, output_dir: Optional[Path]) -> None:
+    workers = resolve_workers(workers) or 1
+    print(f"Reparsing {len(paths)} chunk file(s) from {archive_dir} with {workers} worker(s)...")
+    start = time.time()
+    totals = {"articles": 0, "archived": 0, "changed": 0}
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(archive_dir,)) as pool:
+        for path in paths:
+            with open(path, "r", encoding="utf-8") as f:
+                articles = json.load(f)
+
+            by_url: dict[str, list[dict]] = {}
+            for article in articles:
+                by_url.setdefault(article.get("url", ""), []).append(article)
+            jobs = [(url, group[0]) for url, group in by_url.items() if url]
+
+            reparsed = {}
+            for url, source, parsed in pool.map(_parse_archived, jobs, chunksize=32):
+                if parsed:
+                    reparsed[url] = merge_reparsed(source, by_url[url], parsed)
+
+            out_articles = []
+            changed = 0
+            for url, group in by_url.items():
+                new_group = reparsed.get(url, group)
+                changed += new_group != group
+                out_articles.extend(new_group)
+
+            out_path = (output_dir / path.name) if output_dir else path
+            out_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(out_path, "w", encoding="utf-8") as f:
+                json.dump(out_articles, f, ensure_ascii=False, indent=2)
+
+            totals["articles"] += len(articles)
+            totals["archived"] += len(reparsed)
+            totals["changed"] += changed
+            print(f"  {path.name}: {len(articles)} articles, {len(reparsed)} URLs archived, "
+                  f"{changed} changed -> {out_path}")
+
+    elapsed = time.time() - start
+    print(f"\nReparsed {totals['archived']} URLs ({totals['changed']} changed) "
+          f"across {totals['articles']} articles in {elapsed:.1f}s")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Manage the raw HTML archive")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    stats_p = sub.add_parser("stats", help="Show archive size and per-source URL counts")
+    stats_p.add_argument("--archive-dir", type=str, default=DEFAULT_ARCHIVE_DIR,
+                         help=f"Archive directory (default: {DEFAULT_ARCHIVE_DIR})")
+
+    reparse_p = sub.add_parser("reparse", help="Regenerate raw chunk JSON from archived pages")
+    reparse_p.add_argument("chunks", nargs="+", help="Raw chunk JSON files to refresh")
+    reparse_p.add_argument("--archive-dir", type=str, default=DEFAULT_ARCHIVE_DIR,
+                           help=f"Archive directory (default: {DEFAULT_ARCHIVE_DIR})")
+    reparse_p.add_argument("--workers", type=int, default=-1,
+                           help="Parse processes (-1 = one per CPU core, default)")
+    reparse_p.add_argument("--output-dir", type=str, default=None,
+                           help="Write refreshed chunks here instead of overwriting the inputs")
+    args = parser.parse_args()
+
+    if not Path(args.archive_dir, "index.sqlite").exists():
+        print(f"Error: No archive in {args.archive_dir}")
+        sys.exit(1)
+
+    if args.command == "stats":
+        archive = HtmlArchive(args.archive_dir)
+        s = archive.stats()
+        archive.close()
+        ratio = s["raw_bytes"] / s["compressed_bytes"] if s["compressed_bytes"] else 0
+        print(f"Archive: {args.archive_dir}")
+        print(f"  URLs: {s['urls']}  fetches: {s['fetches']}  unique bodies: {s['blobs']}  segments: {s['segments']}")
+        print(f"  Size: {s['raw_bytes'] / 1e6:.1f} MB raw -> {s['compressed_bytes'] / 1e6:.1f} MB zstd ({ratio:.1f}x)")
+        for source, count in sorted(s["per_source"].items()):
+            print(f"  {source:<16} {count:>8} URLs")
+    else:
+        reparse_chunks(
+            [Path(p) for p in args.chunks],
+            args.archive_dir,
+            args.workers,
+            Path(args.output_dir) if args.output_dir else None,
+        )
+
+
+if __name__ == "__main__":
+    main()
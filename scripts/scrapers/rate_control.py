@@ -0,0 +1,317 @@
+"""
+Adaptive per-host rate control for the async scrapers.
+
+Replaces hand-tuned CONCURRENT_REQUESTS + naive `2 ** attempt` sleeps on 429.
+Each host gets:
+
+  - AIMD concurrency: the in-flight limit grows by 1 after every window of
+    healthy responses (latency EWMA close to its baseline) and is halved on
+    429/503, 5xx or timeouts (at most once per latency window, so one burst of
+    429s does not collapse the limit to the floor).
+  - A token bucket (optional requests/sec cap) that is halved on throttling
+    and creeps back up while healthy.
+  - A shared cooldown: Retry-After (seconds or HTTP date) or an exponential
+    backoff pauses *all* requests to the host, not just the one that got 429.
+
+Usage:
+    rate = RateController(concurrency=10, max_concurrency=30)
+    async with rate.slot(url) as slot:
+        async with session.get(url) as resp:
+            slot.record(resp.status, resp.headers)
+    rate.log_summary()   # "www.presseportal.de: settled at 14 concurrent ..."
+"""
+
+import asyncio
+import time
+from contextlib import asynccontextmanager
+from email.utils import parsedate_to_datetime
+from typing import Mapping, Optional
+from urllib.parse import urlparse
+
+RETRY_AFTER_CAP_SECONDS = 120.0
+BACKOFF_BASE_SECONDS = 1.0
+BACKOFF_CAP_SECONDS = 60.0
+LATENCY_EWMA_ALPHA = 0.2
+LATENCY_CONGESTION_FACTOR = 2.5  # EWMA above baseline * this counts as congestion
+LATENCY_CONGESTION_MIN_SECONDS = 0.25  # ...and at least this much above it (ignores event-loop jitter on fast hosts)
+DECREASE_FACTOR = 0.5
+RATE_INCREASE_PER_WINDOW = 0.5  # req/s added to the token bucket per healthy window
+THROTTLE_STATUSES = (429, 503)
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Parse a Retry-After header (delta-seconds or HTTP date) into seconds."""
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return min(float(value), RETRY_AFTER_CAP_SECONDS)
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    delay = when.timestamp() - time.time()
+    return max(0.0, min(delay, RETRY_AFTER_CAP_SECONDS))
+
+
+class FetchSlot:
+    """One admitted request. Report its outcome via record()/record_error()."""
+
+    def __init__(self, limiter: "HostLimiter"):
+        self.limiter = limiter
+        self.started = time.monotonic()
+        self.outcome: Optional[str] = None  # ok | throttled | error
+        self.retry_after: Optional[float] = None
+
+    def record(self, status: int, headers: Optional[Mapping[str, str]] = None,
+               throttled: Optional[bool] = None) -> None:
+        """Classify an HTTP response. throttled overrides the 429/503 default
+        (e.g. sites that signal rate limiting with 403)."""
+        if throttled is None:
+            throttled = status in THROTTLE_STATUSES
+        if throttled:
+            self.outcome = "throttled"
+            self.retry_after = parse_retry_after(headers.get("Retry-After")) if headers else None
+        elif status >= 500:
+            self.outcome = "error"
+        else:
+            self.outcome = "ok"
+
+    def record_error(self) -> None:
+        """Timeouts and connection errors count as congestion."""
+        self.outcome = "error"
+
+
+class HostLimiter:
+    """Token bucket + AIMD concurrency limit for a single host."""
+
+    def __init__(
+        self,
+        host: str,
+        concurrency: int,
+        min_concurrency: int,
+        max_concurrency: int,
+        rate: Optional[float],
+        adaptive: bool,
+        verbose: bool = False,
+    ):
+        self.host = host
+        self.limit = float(concurrency)
+        self.min_concurrency = min_concurrency
+        self.max_concurrency = max_concurrency if adaptive else concurrency
+        self.adaptive = adaptive
+        self.verbose = verbose
+
+        # Token bucket (rate=None: concurrency-limited only)
+        self.rate = rate
+        self.tokens = float(concurrency)
+        self._last_refill = time.monotonic()
+
+        self.in_flight = 0
+        self.cooldown_until = 0.0
+        self._cond = asyncio.Condition()
+
+        # Health tracking
+        self.latency_ewma: Optional[float] = None
+        self.latency_baseline: Optional[float] = None
+        self._window_ok = 0
+        self._last_decrease = 0.0
+        self._consecutive_throttles = 0
+
+        # Stats
+        self.requests = 0
+        self.throttled = 0
+        self.errors = 0
+        self.peak_in_flight = 0
+        self.peak_limit = self.limit
+
+    # ---- admission ----
+
+    def _refill(self, now: float) -> None:
+        if self.rate is None:
+            return
+        burst = max(1.0, self.limit)
+        self.tokens = min(burst, self.tokens + (now - self._last_refill) * self.rate)
+        self._last_refill = now
+
+    def _admission_delay(self) -> Optional[float]:
+        """0 = admit now, >0 = retry after that many seconds, None = wait for a release."""
+        now = time.monotonic()
+        if now < self.cooldown_until:
+            return self.cooldown_until - now
+        if self.in_flight >= int(self.limit):
+            return None
+        if self.rate is not None:
+            self._refill(now)
+            if self.tokens < 1.0:
+                return (1.0 - self.tokens) / self.rate
+        return 0.0
+
+    async def acquire(self) -> None:
+        async with self._cond:
+            while True:
+                delay = self._admission_delay()
+                if delay == 0.0:
+                    break
+                try:
+                    await asyncio.wait_for(self._cond.wait(), timeout=delay)
+                except asyncio.TimeoutError:
+                    pass
+            if self.rate is not None:
+                self.tokens -= 1.0
+            self.in_flight += 1
+            self.requests += 1
+            self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+
+    async def release(self, slot: FetchSlot) -> None:
+        async with self._cond:
+            self.in_flight -= 1
+            self._observe(slot)
+            self._cond.notify_all()
+
+    # ---- AIMD ----
+
+    def _set_limit(self, new_limit: float, reason: str) -> None:
+        new_limit = max(float(self.min_concurrency), min(float(self.max_concurrency), new_limit))
+        if int(new_limit) != int(self.limit) and self.verbose:
+            print(f"  [rate] {self.host}: concurrency {int(self.limit)} -> {int(new_limit)} ({reason})")
+        self.limit = new_limit
+        self.peak_limit = max(self.peak_limit, new_limit)
+
+    def _decrease(self, now: float, reason: str) -> None:
+        # At most one decrease per latency window
+        window = self.latency_ewma or 1.0
+        if now - self._last_decrease < window:
+            return
+        self._last_decrease = now
+        self._window_ok = 0
+        if self.adaptive:
+            self._set_limit(self.limit * DECREASE_FACTOR, reason)
+            if self.rate is not None:
+                self.rate = max(0.5, self.rate * DECREASE_FACTOR)
+
+    def _observe(self, slot: FetchSlot) -> None:
+        now = time.monotonic()
+        latency = now - slot.started
+
+        if slot.outcome == "throttled":
+            self.throttled += 1
+            self._consecutive_throttles += 1
+            backoff = min(BACKOFF_BASE_SECONDS * 2 ** (self._consecutive_throttles - 1), BACKOFF_CAP_SECONDS)
+            pause = slot.retry_after if slot.retry_after is not None else backoff
+            self.cooldown_until = max(self.cooldown_until, now + pause)
+            if self.verbose:
+                source = "Retry-After" if slot.retry_after is not None else "backoff"
+                print(f"  [rate] {self.host}: throttled, pausing host for {pause:.1f}s ({source})")
+            self._decrease(now, "throttled")
+            return
+
+        if slot.outcome == "error":
+            self.errors += 1
+            self._decrease(now, "errors")
+            return
+
+        if slot.outcome != "ok":
+            return
+
+        self._consecutive_throttles = 0
+        if self.latency_ewma is None:
+            self.latency_ewma = latency
+        else:
+            self.latency_ewma += LATENCY_EWMA_ALPHA * (latency - self.latency_ewma)
+        if self.latency_baseline is None or self.latency_ewma < self.latency_baseline:
+            self.latency_baseline = self.latency_ewma
+
+        if not self.adaptive:
+            return
+        if (
+            self.latency_ewma > self.latency_baseline * LATENCY_CONGESTION_FACTOR
+            and self.latency_ewma - self.latency_baseline > LATENCY_CONGESTION_MIN_SECONDS
+        ):
+            self._decrease(now, f"latency {self.latency_ewma * 1000:.0f}ms")
+            return
+
+        # Additive increase after a full window of healthy responses
+        self._window_ok += 1
+        if self._window_ok >= int(self.limit):
+            self._window_ok = 0
+            self._set_limit(self.limit + 1, "healthy")
+            if self.rate is not None:
+                self.rate += RATE_INCREASE_PER_WINDOW
+
+    def summary(self) -> dict:
+        return {
+            "concurrency": int(self.limit),
+            "peak_concurrency": int(self.peak_limit),
+            "peak_in_flight": self.peak_in_flight,
+            "rate_per_s": round(self.rate, 2) if self.rate is not None else None,
+            "requests": self.requests,
+            "throttled": self.throttled,
+            "errors": self.errors,
+            "latency_ms": round(self.latency_ewma * 1000) if self.latency_ewma is not None else None,
+        }
+
+
+class RateController:
+    """Per-host limiters created on demand, sharing one configuration.
+
+    adaptive=False keeps the concurrency fixed at `concurrency` but still
+    honors Retry-After and pauses the host on throttling.
+    """
+
+    def __init__(
+        self,
+        concurrency: int,
+        max_concurrency: Optional[int] = None,
+        min_concurrency: int = 1,
+        rate: Optional[float] = None,
+        adaptive: bool = True,
+        verbose: bool = False,
+    ):
+        self.concurrency = concurrency
+        self.max_concurrency = max(concurrency, max_concurrency or concurrency * 3) if adaptive else concurrency
+        self.min_concurrency = min(min_concurrency, concurrency)
+        self.rate = rate
+        self.adaptive = adaptive
+        self.verbose = verbose
+        self.hosts: dict[str, HostLimiter] = {}
+
+    def limiter(self, url: str) -> HostLimiter:
+        host = urlparse(url).netloc
+        if host not in self.hosts:
+            self.hosts[host] = HostLimiter(
+                host,
+                concurrency=self.concurrency,
+                min_concurrency=self.min_concurrency,
+                max_concurrency=self.max_concurrency,
+                rate=self.rate,
+                adaptive=self.adaptive,
+                verbose=self.verbose,
+            )
+        return self.hosts[host]
+
+    @asynccontextmanager
+    async def slot(self, url: str):
+        limiter = self.limiter(url)
+        await limiter.acquire()
+        slot = FetchSlot(limiter)
+        try:
+            yield slot
+        except Exception:
+            if slot.outcome is None:
+                slot.record_error()
+            raise
+        finally:
+            await limiter.release(slot)
+
+    def summary(self) -> dict:
+        return {host: limiter.summary() for host, limiter in self.hosts.items()}
+
+    def log_summary(self) -> None:
+        for host, s in self.summary().items():
+            latency = f"{s['latency_ms']}ms" if s["latency_ms"] is not None else "n/a"
+            print(
+                f"Rate control: {host} settled at {s['concurrency']} concurrent "
+                f"(peak {s['peak_concurrency']}, {s['requests']} requests, "
+                f"{s['throttled']} throttled, {s['errors']} errors, latency {latency})"
+            )
@@ -7,7 +7,10 @@ articles by date range, then fetches individual article pages for full body text
 Falls back to window.montagedata from the listing page when no date range is given.
 
 The API returns max 1,000 results per request, so date-range queries are chunked
-into monthly intervals (~480 articles/month on average).
+into monthly intervals (~480 articles/month on average). A month that still
+exceeds the cap is split into weeks, then days, with the sub-queries run
+concurrently. Completed windows are stored in .cache/es_windows_bayern.sqlite
+so reruns over the same range skip their searches.
 
 Many Bayern press releases contain multiple incidents in a single article
 (numbered like "0207 - Description"). The pipeline's fast_enricher handles
@@ -25,32 +28,34 @@ import calendar
 import json
 import os
 import re
-import ssl
+import sqlite3
 import sys
-import time
-from dataclasses import dataclass, asdict
-from datetime import datetime, date, timezone
+from dataclasses import asdict
+from datetime import datetime, date, timedelta, timezone
 from pathlib import Path
 from typing import Optional
 
 import aiohttp
-import certifi
 from bs4 import BeautifulSoup
 
-# Fix SSL on macOS - certifi provides Mozilla's CA bundle
-os.environ['SSL_CERT_FILE'] = certifi.where()
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent))
+from scripts.scrapers.base import ACCEPT_HTML, Article, AsyncScraperBase
 
 # Constants
 BASE_URL = "https://www.polizei.bayern.de"
 LISTING_URL = f"{BASE_URL}/aktuelles/pressemitteilungen/"
 ES_SEARCH_URL = f"{BASE_URL}/es/search"
-USER_AGENT = "adlerlicht/1.0 (+contact: scraper@adlerlicht.de)"
 
 # Async configuration
 CONCURRENT_REQUESTS = 20
 DELAY_BETWEEN_BATCHES = 0.3
 REQUEST_TIMEOUT_SECONDS = 30
-MAX_RETRIES = 3
+
+# Elasticsearch search windows
+ES_RESULT_CAP = 1000  # Max hits the Pressearchiv API returns per query
+ES_WINDOW_CACHE_FILE = "es_windows_bayern.sqlite"
+ES_WINDOW_SETTLE_DAYS = 2  # Windows ending this recently are re-queried on every run
 
 # Feuerwehr source filter - drop fire dept articles before enrichment
 FEUERWEHR_PATTERN = re.compile(
@@ -85,63 +90,6 @@ CITY_PATTERNS = [
 AGENCY_CODE_PATTERN = re.compile(r'^(\d{4})\s*[–\-]\s*')
 
 
-@dataclass
-class Article:
-    """Represents a scraped press release article."""
-    title: str
-    date: str
-    city: Optional[str]
-    bundesland: str
-    agency_code: Optional[str]
-    source: Optional[str]
-    url: str
-    body: str
-    places: list[str]
-    themes: list[str]
-
-
-class ScrapedUrlsCache:
-    """Persistent cache for tracking already-scraped article URLs.
-
-    Prevents re-scraping articles across scraper runs by storing URLs
-    with their scrape timestamp.
-    """
-
-    def __init__(self, cache_dir: str = ".cache", cache_filename: str = "scraped_urls_bayern.json"):
-        self.cache_dir = Path(cache_dir)
-        self.cache_file = self.cache_dir / cache_filename
-        self.urls: dict[str, str] = {}  # url -> timestamp
-        self._load()
-
-    def _load(self) -> None:
-        """Load cache from disk if exists."""
-        if self.cache_file.exists():
-            try:
-                with open(self.cache_file, "r", encoding="utf-8") as f:
-                    self.urls = json.load(f)
-            except (json.JSONDecodeError, IOError) as e:
-                print(f"Warning: Could not load scraped URLs cache: {e}")
-                self.urls = {}
-
-    def save(self) -> None:
-        """Persist cache to disk."""
-        self.cache_dir.mkdir(parents=True, exist_ok=True)
-        with open(self.cache_file, "w", encoding="utf-8") as f:
-            json.dump(self.urls, f, ensure_ascii=False, indent=2)
-
-    def is_scraped(self, url: str) -> bool:
-        """Check if URL has already been scraped."""
-        return url in self.urls
-
-    def mark_scraped(self, url: str) -> None:
-        """Mark a URL as scraped with current timestamp."""
-        self.urls[url] = datetime.now().isoformat()
-
-    def __len__(self) -> int:
-        """Return number of cached URLs."""
-        return len(self.urls)
-
-
 def is_feuerwehr_source(source: Optional[str], title: Optional[str] = None) -> bool:
     """Check if article is from a fire department (not police)."""
     if source and FEUERWEHR_PATTERN.search(source):
@@ -221,6 +169,103 @@ def monthly_chunks(start: date, end: date) -> list[tuple[date, date]]:
     return chunks
 
 
+def split_window(start: date, end: date, total: int) -> list[tuple[date, date]]:
+    """Split a search window whose `total` hits exceed ES_RESULT_CAP.
+
+    Months split into weeks and weeks into days. When the window's hit
+    density says weeks would overflow too, it goes straight to days rather
+    than spending a query per week first.
+    """
+    days = (end - start).days + 1
+    step = 7 if days > 7 and total * 7 / days <= ES_RESULT_CAP * 0.8 else 1
+    windows = []
+    current = start
+    while current <= end:
+        window_end = min(current + timedelta(days=step - 1), end)
+        windows.append((current, window_end))
+        current = window_end + timedelta(days=1)
+    return windows
+
+
+class EsWindowCache:
+    """ES search windows completed by earlier runs, so reruns skip the queries.
+
+    A SQLite table next to the URL stores, keyed "YYYY-MM-DD..YYYY-MM-DD":
+    a window holds either its hits as article entries or the keys of the
+    windows it was split into. Each put() is a single committed upsert (WAL
+    mode), so a crash keeps every finished window and nothing is rewritten
+    whole. Article URLs still go through the scraped-URL cache, so a cached
+    window only saves the search, not the retry of articles that failed to
+    scrape.
+    """
+
+    def __init__(self, cache_dir: str = ".cache", filename: str = ES_WINDOW_CACHE_FILE):
+        cache_dir = Path(cache_dir)
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        self.path = cache_dir / filename
+
+        self._conn = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS es_windows ("
+            " key TEXT PRIMARY KEY,"
+            " entries TEXT,"
+            " children TEXT,"
+            " stored_at TEXT NOT NULL"
+            ") WITHOUT ROWID"
+        )
+
+    @staticmethod
+    def key(start: date, end: date) -> str:
+        return f"{start.isoformat()}..{end.isoformat()}"
+
+    def get(self, start: date, end: date) -> Optional[list[dict]]:
+        """Entries of a completed window, or None if it (or a sub-window) is missing."""
+        row = self._conn.execute(
+            "SELECT entries, children FROM es_windows WHERE key = ?", (self.key(start, end),),
+        ).fetchone()
+        if row is None:
+            return None
+        entries_json, children_json = row
+        if children_json is None:
+            return json.loads(entries_json)
+        entries = []
+        for child in json.loads(children_json):
+            child_start, child_end = (date.fromisoformat(d) for d in child.split(".."))
+            child_entries = self.get(child_start, child_end)
+            if child_entries is None:
+                return None
+            entries.extend(child_entries)
+        return entries
+
+    def put(
+        self,
+        start: date,
+        end: date,
+        entries: Optional[list[dict]] = None,
+        children: Optional[list[tuple[date, date]]] = None,
+    ) -> None:
+        """Store a completed window (persisted immediately)."""
+        if children is not None:
+            values = (None, json.dumps([self.key(s, e) for s, e in children]))
+        else:
+            values = (json.dumps(entries or [], ensure_ascii=False), None)
+        self._conn.execute(
+            "INSERT INTO es_windows (key, entries, children, stored_at) VALUES (?, ?, ?, ?)"
+            " ON CONFLICT(key) DO UPDATE SET entries = excluded.entries, children = excluded.children,"
+            " stored_at = excluded.stored_at",
+            (self.key(start, end), *values, datetime.now().isoformat()),
+        )
+
+    def close(self) -> None:
+        self._conn.close()
+
+    def __len__(self) -> int:
+        """Return number of stored windows."""
+        return self._conn.execute("SELECT COUNT(*) FROM es_windows").fetchone()[0]
+
+
 def extract_city_from_body(body: str) -> Optional[str]:
     """Try to extract a city name from the article body text."""
     for pattern in CITY_PATTERNS:
@@ -388,16 +433,25 @@ def parse_article_page(html: str, url: str) -> list[dict]:
     }]
 
 
-class AsyncBayernPolizeiScraper:
+class AsyncBayernPolizeiScraper(AsyncScraperBase):
     """
     Async scraper for polizei.bayern.de press releases.
 
     When --start-date and --end-date are given, queries the Elasticsearch
-    Pressearchiv API month-by-month to discover articles, then fetches
+    Pressearchiv API month-by-month (splitting busy months until every
+    window fits the result cap) to discover articles, then fetches
     individual pages for full body text. Without date range, falls back
     to window.montagedata (recent ~165 articles only).
     """
 
+    NAME = "Async Bayern Polizei Scraper (polizei.bayern.de)"
+    SOURCE = "polizei_bayern"
+    ARCHIVE_SOURCE = "bayern"
+    URL_CACHE_FILE = "scraped_urls_bayern.json"
+    parse_page = staticmethod(parse_article_page)
+    ACCEPT = ACCEPT_HTML.replace("*/*", "application/json,*/*")
+    MAX_PAGES_LABEL = "Max articles"  # montagedata is a single page
+
     def __init__(
         self,
         start_date: Optional[str] = None,
@@ -407,103 +461,51 @@ class AsyncBayernPolizeiScraper:
         verbose: bool = False,
         concurrent_requests: int = CONCURRENT_REQUESTS,
         cache_dir: str = ".cache",
+        adaptive: bool = True,
+        max_concurrent: Optional[int] = None,
+        archive_dir: Optional[str] = None,
+        parse_workers: int = 0,
+        window_cache: bool = True,
+        watermark: Optional[dict] = None,
     ):
-        self.start_date = datetime.fromisoformat(start_date) if start_date else None
-        self.end_date = datetime.fromisoformat(end_date) if end_date else None
-        self.max_pages = max_pages  # Limits number of articles (montagedata is single page)
-        self.output = output
-        self.verbose = verbose
-        self.concurrent_requests = concurrent_requests
-
-        self.articles: list[Article] = []
-        self.seen_urls: set[str] = set()
-        self.url_cache = ScrapedUrlsCache(cache_dir)
-        self.skipped_cached_count = 0
-        self.feuerwehr_dropped_count = 0
-
-        # Stats
-        self.fetch_count = 0
-        self.fetch_errors = 0
-
-        # Metadata tracking
-        self.pages_visited = 0
-        self.pages_with_content = 0
+        super().__init__(
+            start_date=start_date,
+            end_date=end_date,
+            max_pages=max_pages,
+            output=output,
+            verbose=verbose,
+            concurrent_requests=concurrent_requests,
+            cache_dir=cache_dir,
+            adaptive=adaptive,
+            max_concurrent=max_concurrent,
+            archive_dir=archive_dir,
+            parse_workers=parse_workers,
+            request_timeout=REQUEST_TIMEOUT_SECONDS,
+            batch_delay=DELAY_BETWEEN_BATCHES,
+            watermark=watermark,
+        )
         self.source_total = 0
-        self.stop_reason = "unknown"
+        self.window_cache = EsWindowCache(cache_dir) if window_cache else None
 
-    def _is_in_date_range(self, ms_timestamp: int) -> bool:
-        """Check if article timestamp falls within configured date range."""
-        if not self.start_date and not self.end_date:
-            return True
-
-        article_date = ms_timestamp_to_date(ms_timestamp)
-
-        if self.start_date and article_date.date() < self.start_date.date():
-            return False
-        if self.end_date and article_date.date() > self.end_date.date():
-            return False
-
-        return True
-
-    async def _fetch_url(
-        self,
-        session: aiohttp.ClientSession,
-        url: str,
-        semaphore: asyncio.Semaphore,
-    ) -> Optional[str]:
-        """Fetch a single URL with semaphore-controlled concurrency and retries."""
-        async with semaphore:
-            for attempt in range(MAX_RETRIES):
-                try:
-                    async with session.get(
-                        url,
-                        timeout=aiohttp.ClientTimeout(total=REQUEST_TIMEOUT_SECONDS),
-                    ) as response:
-                        if response.status == 200:
-                            self.fetch_count += 1
-                            return await response.text()
-                        elif response.status == 429:
-                            wait_time = 2 ** attempt
-                            if self.verbose:
-                                print(f"  Rate limited, waiting {wait_time}s...")
-                            await asyncio.sleep(wait_time)
-                        else:
-                            if self.verbose:
-                                print(f"  HTTP {response.status} for {url}")
-                            return None
-                except asyncio.TimeoutError:
-                    if attempt < MAX_RETRIES - 1:
-                        await asyncio.sleep(1)
-                except aiohttp.ClientError as e:
-                    if self.verbose:
-                        print(f"  Error fetching {url}: {e}")
-                    if attempt < MAX_RETRIES - 1:
-                        await asyncio.sleep(1)
-
-            self.fetch_errors += 1
-            return None
-
-    async def _fetch_batch(
-        self,
-        session: aiohttp.ClientSession,
-        urls: list[str],
-        semaphore: asyncio.Semaphore,
-    ) -> list[tuple[str, Optional[str]]]:
-        """Fetch a batch of URLs concurrently."""
-        tasks = [self._fetch_url(session, url, semaphore) for url in urls]
-        results = await asyncio.gather(*tasks)
-        return list(zip(urls, results))
+        # ES discovery stats
+        self.es_queries = 0
+        self.es_windows_split = 0
+        self.es_windows_cached = 0
+        self.es_hits_missed = 0
 
     async def _search_es(
         self,
         session: aiohttp.ClientSession,
         from_date: date,
         to_date: date,
-    ) -> list[dict]:
+        semaphore: asyncio.Semaphore,
+    ) -> Optional[tuple[list[dict], int]]:
         """Query the Pressearchiv Elasticsearch API for a date range.
 
-        Returns raw ES hit list (each with _source containing title, teaser_text,
-        created_date, sort_date_js, creating_organization, directory).
+        Returns (hits, total): the raw ES hit list (each with _source containing
+        title, teaser_text, created_date, sort_date_js, creating_organization,
+        directory) and the number of matches, which exceeds len(hits) when the
+        API's result cap truncated the response. None if the request failed.
         """
         q_inner = json.dumps({
             "queryStr": "",
@@ -513,37 +515,75 @@ class AsyncBayernPolizeiScraper:
         })
         payload = {"type": "presse", "q": q_inner}
 
-        for attempt in range(MAX_RETRIES):
-            try:
-                async with session.post(
-                    ES_SEARCH_URL,
-                    json=payload,
-                    timeout=aiohttp.ClientTimeout(total=REQUEST_TIMEOUT_SECONDS),
-                ) as response:
-                    if response.status == 200:
-                        self.fetch_count += 1
-                        data = await response.json()
-                        hits = data.get("hits", {}).get("hits", [])
-                        total = data.get("hits", {}).get("total", {})
-                        total_val = total.get("value", len(hits)) if isinstance(total, dict) else total
-                        if total_val > 1000:
-                            print(f"    WARNING: {total_val} results for {from_date}–{to_date}, "
-                                  f"API capped at 1000. Narrow the date range.")
-                        return hits
-                    elif response.status == 429:
-                        await asyncio.sleep(2 ** attempt)
-                    else:
-                        if self.verbose:
-                            print(f"    ES search HTTP {response.status}")
-                        return []
-            except (asyncio.TimeoutError, aiohttp.ClientError) as e:
-                if self.verbose:
-                    print(f"    ES search error: {e}")
-                if attempt < MAX_RETRIES - 1:
-                    await asyncio.sleep(1)
-
-        self.fetch_errors += 1
-        return []
+        data = await self._fetch_url(
+            session, ES_SEARCH_URL, semaphore, method="POST", json_body=payload, expect_json=True,
+        )
+        if not isinstance(data, dict):
+            return None
+
+        hits = data.get("hits", {}).get("hits", [])
+        total = data.get("hits", {}).get("total", {})
+        total_val = total.get("value", len(hits)) if isinstance(total, dict) else total
+        return hits, total_val
+
+    async def _search_window(
+        self,
+        session: aiohttp.ClientSession,
+        from_date: date,
+        to_date: date,
+        semaphore: asyncio.Semaphore,
+    ) -> tuple[list[dict], bool]:
+        """Entries for [from_date, to_date], splitting the window while the API truncates it.
+
+        Sub-windows are queried concurrently (the semaphore bounds requests).
+        Returns (entries, complete): complete is False if a query failed or a
+        single day still exceeded the result cap. Complete, settled windows
+        are stored in the window cache.
+        """
+        cached = self.window_cache.get(from_date, to_date) if self.window_cache is not None else None
+        if cached is not None:
+            self.es_windows_cached += 1
+            return cached, True
+
+        result = await self._search_es(session, from_date, to_date, semaphore)
+        self.es_queries += 1
+        self.pages_visited += 1
+        if result is None:
+            print(f"    ES query failed for {from_date} → {to_date}")
+            return [], False
+        hits, total = result
+
+        if total > len(hits) and from_date < to_date:
+            windows = split_window(from_date, to_date, total)
+            self.es_windows_split += 1
+            if self.verbose:
+                print(f"    {from_date} → {to_date}: {total} results over the cap, "
+                      f"splitting into {len(windows)} windows")
+            results = await asyncio.gather(
+                *(self._search_window(session, start, end, semaphore) for start, end in windows)
+            )
+            entries = [entry for sub_entries, _ in results for entry in sub_entries]
+            complete = all(sub_complete for _, sub_complete in results)
+            if complete and self._is_settled(to_date):
+                self.window_cache.put(from_date, to_date, children=windows)
+            return entries, complete
+
+        if total > len(hits):
+            print(f"    WARNING: {total} results on {from_date}, API capped at {len(hits)}. "
+                  f"{total - len(hits)} articles cannot be reached.")
+            self.es_hits_missed += total - len(hits)
+
+        entries = [entry for entry in map(self._es_hit_to_entry, hits) if entry]
+        if entries:
+            self.pages_with_content += 1
+        complete = total <= len(hits)
+        if complete and self._is_settled(to_date):
+            self.window_cache.put(from_date, to_date, entries=entries)
+        return entries, complete
+
+    def _is_settled(self, to_date: date) -> bool:
+        """Old enough that no more press releases will be filed in the window."""
+        return self.window_cache is not None and (date.today() - to_date).days > ES_WINDOW_SETTLE_DAYS
 
     def _es_hit_to_entry(self, hit: dict) -> Optional[dict]:
         """Convert an ES hit into the same entry format used by montagedata discovery."""
@@ -576,7 +616,7 @@ class AsyncBayernPolizeiScraper:
             "date": ms_ts,
         }
 
-    async def _discover_articles(
+    async def _discover(
         self,
         session: aiohttp.ClientSession,
         semaphore: asyncio.Semaphore,
@@ -593,20 +633,16 @@ class AsyncBayernPolizeiScraper:
             chunks = monthly_chunks(self.start_date.date(), self.end_date.date())
             print(f"Querying ES Pressearchiv API ({len(chunks)} monthly chunks)...")
 
-            for i, (m_start, m_end) in enumerate(chunks, 1):
-                print(f"  [{i}/{len(chunks)}] {m_start} → {m_end} ...", end=" ", flush=True)
-                hits = await self._search_es(session, m_start, m_end)
-                converted = 0
-                for hit in hits:
-                    entry = self._es_hit_to_entry(hit)
-                    if entry:
-                        entries.append(entry)
-                        converted += 1
-                print(f"{converted} articles")
-                self.pages_visited += 1
-                if converted > 0:
-                    self.pages_with_content += 1
+            results = await asyncio.gather(
+                *(self._search_window(session, m_start, m_end, semaphore) for m_start, m_end in chunks)
+            )
+            for i, ((m_start, m_end), (chunk_entries, complete)) in enumerate(zip(chunks, results), 1):
+                print(f"  [{i}/{len(chunks)}] {m_start} → {m_end} ... {len(chunk_entries)} articles"
+                      + ("" if complete else " (incomplete)"))
+                entries.extend(chunk_entries)
 
+            print(f"  {self.es_queries} ES queries, {self.es_windows_split} windows split, "
+                  f"{self.es_windows_cached} windows from cache")
             self.source_total = len(entries)
             self.stop_reason = "es_search_complete"
             print(f"  Total from ES API: {len(entries)} articles")
@@ -652,8 +688,7 @@ class AsyncBayernPolizeiScraper:
                 continue
 
             # Check date range (relevant for montagedata path)
-            ms_ts = entry.get("date")
-            if ms_ts and not self._is_in_date_range(ms_ts):
+            if not self._is_in_date_range(entry.get("iso_date")):
                 continue
 
             # Skip if already in persistent cache
@@ -678,186 +713,67 @@ class AsyncBayernPolizeiScraper:
 
         return filtered
 
-    async def _scrape_articles_batch(
-        self,
-        session: aiohttp.ClientSession,
-        article_infos: list[dict],
-        semaphore: asyncio.Semaphore,
-    ) -> list[Article]:
-        """Scrape article pages concurrently in batches."""
-        articles = []
-        total = len(article_infos)
-        batch_size = self.concurrent_requests
-
-        for i in range(0, total, batch_size):
-            batch = article_infos[i : i + batch_size]
-            urls = [a["url"] for a in batch]
-
-            results = await self._fetch_batch(session, urls, semaphore)
-
-            for (url, html), info in zip(results, batch):
-                if not html:
-                    continue
-
-                parsed_list = parse_article_page(html, url)
-                if not parsed_list:
-                    continue
-
-                # Source from organization name
-                source = info.get("org_name")
-
-                # Date from montagedata/ES timestamp
-                date_str = info.get("iso_date", "")
-
-                # Listing-level title (from ES/montagedata, more specific than page h1)
-                listing_title = info.get("title", "").strip()
-
-                for parsed in parsed_list:
-                    page_title = parsed.get("title", "").strip()
-
-                    # For accordion pages, parsed title already includes section
-                    # name (e.g. "PP SWS | ... — Landkreis Oberallgäu & Kempten").
-                    # For flat pages, prefer listing title over generic page h1.
-                    is_accordion = len(parsed_list) > 1
-                    if is_accordion:
-                        title = page_title or listing_title or "Ohne Titel"
-                    elif listing_title:
-                        title = listing_title
-                    elif page_title and page_title != "Ohne Titel":
-                        title = page_title
-                    else:
-                        title = "Ohne Titel"
-
-                    # Drop Feuerwehr articles
-                    if is_feuerwehr_source(source, title):
-                        self.feuerwehr_dropped_count += 1
-                        continue
-
-                    # Body: prefer parsed page body, fall back to teaser
-                    body = parsed.get("body", "")
-                    if not body:
-                        body = info.get("teaser", "")
-
-                    city = parsed.get("city")
-                    agency_code = parsed.get("agency_code")
-
-                    article = Article(
-                        title=title,
-                        date=date_str,
-                        city=city,
-                        bundesland="Bayern",
-                        agency_code=agency_code,
-                        source=source,
-                        url=url,
-                        body=body,
-                        places=[],
-                        themes=[],
-                    )
-                    articles.append(article)
-
-                self.url_cache.mark_scraped(url)
-
-            progress = min(i + batch_size, total)
-            print(f"  Scraped {progress}/{total} articles ({len(articles)} success)")
-
-            if i + batch_size < total:
-                await asyncio.sleep(DELAY_BETWEEN_BATCHES)
-
-        return articles
-
-    async def run_async(self) -> None:
-        """Execute the async scraping pipeline."""
-        print("=" * 60)
-        print("Async Bayern Polizei Scraper (polizei.bayern.de)")
-        print("=" * 60)
-        print(f"Concurrent requests: {self.concurrent_requests}")
-
-        if self.start_date:
-            print(f"Start date: {self.start_date.date()}")
-        if self.end_date:
-            print(f"End date: {self.end_date.date()}")
-        if self.max_pages:
-            print(f"Max articles: {self.max_pages}")
-        print()
-
-        start_time = time.time()
-
-        headers = {
-            "User-Agent": USER_AGENT,
-            "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,application/json,*/*;q=0.8",
-            "Accept-Language": "de-DE,de;q=0.9,en;q=0.5",
+    def _meta_extra(self) -> dict:
+        return {
+            "es_queries": self.es_queries,
+            "es_windows_split": self.es_windows_split,
+            "es_windows_cached": self.es_windows_cached,
+            "es_hits_missed": self.es_hits_missed,
         }
 
-        ssl_context = ssl.create_default_context(cafile=certifi.where())
-        connector = aiohttp.TCPConnector(ssl=ssl_context)
-        semaphore = asyncio.Semaphore(self.concurrent_requests)
-
-        async with aiohttp.ClientSession(headers=headers, connector=connector) as session:
-            # Phase 1: Discover articles from montagedata
-            article_infos = await self._discover_articles(session, semaphore)
-
-            if not article_infos:
-                print("No articles found to scrape")
-                return
-
-            # Phase 2: Scrape article pages concurrently
-            print(
-                f"\nScraping {len(article_infos)} articles with "
-                f"{self.concurrent_requests} concurrent requests..."
-            )
-            self.articles = await self._scrape_articles_batch(
-                session, article_infos, semaphore
-            )
-
-        elapsed = time.time() - start_time
-
-        # Save URL cache
-        self.url_cache.save()
-
-        # Write scrape metadata
-        meta = {
-            "source": "polizei_bayern",
-            "pages_visited": self.pages_visited,
-            "pages_with_content": self.pages_with_content,
-            "articles_per_page": None,
-            "source_total": self.source_total,
-            "estimated_total": self.source_total,
-            "articles_scraped": len(self.articles),
-            "articles_cached_skip": self.skipped_cached_count,
-            "articles_feuerwehr_skip": self.feuerwehr_dropped_count,
-            "stop_reason": self.stop_reason,
-            "fetch_count": self.fetch_count,
-            "fetch_errors": self.fetch_errors,
-            "scrape_duration_s": round(elapsed, 1),
-        }
-        meta_path = self.output.rsplit('.json', 1)[0] + '.meta.json'
-        Path(meta_path).parent.mkdir(parents=True, exist_ok=True)
-        with open(meta_path, 'w', encoding='utf-8') as f:
-            json.dump(meta, f, ensure_ascii=False, indent=2)
+    def _close(self) -> None:
+        if self.window_cache is not None:
+            self.window_cache.close()
+            self.window_cache = None
 
-        # Write output
-        output_data = [asdict(article) for article in self.articles]
+    def _build_articles(self, url: str, parsed_list: list[dict], info: dict) -> list[Article]:
+        # Source from organization name
+        source = info.get("org_name")
 
-        Path(self.output).parent.mkdir(parents=True, exist_ok=True)
+        # Date from montagedata/ES timestamp
+        date_str = info.get("iso_date", "")
 
-        with open(self.output, "w", encoding="utf-8") as f:
-            json.dump(output_data, f, ensure_ascii=False, indent=2)
+        # Listing-level title (from ES/montagedata, more specific than page h1)
+        listing_title = info.get("title", "").strip()
 
-        print()
-        print("=" * 60)
-        print(f"Saved {len(self.articles)} articles to {self.output}")
-        if self.feuerwehr_dropped_count:
-            print(f"Dropped {self.feuerwehr_dropped_count} Feuerwehr (fire dept) articles")
-        print(f"URL cache: {len(self.url_cache)} total URLs in {self.url_cache.cache_file}")
-        print(f"Elapsed time: {elapsed:.1f}s ({elapsed / 60:.1f} min)")
-        print(f"Fetch stats: {self.fetch_count} requests, {self.fetch_errors} errors")
-        if self.articles:
-            print(f"Speed: {len(self.articles) / elapsed:.1f} articles/sec")
-        print("=" * 60)
+        articles = []
+        for parsed in parsed_list:
+            page_title = parsed.get("title", "").strip()
+
+            # For accordion pages, parsed title already includes section
+            # name (e.g. "PP SWS | ... — Landkreis Oberallgäu & Kempten").
+            # For flat pages, prefer listing title over generic page h1.
+            is_accordion = len(parsed_list) > 1
+            if is_accordion:
+                title = page_title or listing_title or "Ohne Titel"
+            elif listing_title:
+                title = listing_title
+            elif page_title and page_title != "Ohne Titel":
+                title = page_title
+            else:
+                title = "Ohne Titel"
+
+            # Drop Feuerwehr articles
+            if is_feuerwehr_source(source, title):
+                self.feuerwehr_dropped_count += 1
+                continue
 
-    def run(self) -> None:
-        """Synchronous entry point - runs the async pipeline."""
-        asyncio.run(self.run_async())
+            # Body: prefer parsed page body, fall back to teaser
+            body = parsed.get("body", "")
+            if not body:
+                body = info.get("teaser", "")
+
+            articles.append(Article(
+                title=title,
+                date=date_str,
+                city=parsed.get("city"),
+                bundesland="Bayern",
+                agency_code=parsed.get("agency_code"),
+                source=source,
+                url=url,
+                body=body,
+            ))
+        return articles
 
 
 def main():
@@ -918,6 +834,40 @@ Examples:
         help=f"Number of concurrent requests (default: {CONCURRENT_REQUESTS})",
     )
 
+    parser.add_argument(
+        "--max-concurrent",
+        type=int,
+        default=None,
+        help="Upper bound for adaptive concurrency (default: 3x --concurrent)",
+    )
+
+    parser.add_argument(
+        "--no-adaptive",
+        action="store_true",
+        help="Keep concurrency fixed at --concurrent (Retry-After is still honored)",
+    )
+
+    parser.add_argument(
+        "--archive-dir",
+        type=str,
+        default=None,
+        help="Store fetched HTML (zstd) here for later reparse (see scrapers/html_archive.py)",
+    )
+
+    parser.add_argument(
+        "--parse-workers",
+        type=int,
+        default=0,
+        help="Parse HTML in a process pool with N workers so fetching and parsing "
+             "overlap (0 = parse on the event loop, -1 = one per CPU core; default: 0)",
+    )
+
+    parser.add_argument(
+        "--no-window-cache",
+        action="store_true",
+        help=f"Re-run every ES search instead of reusing windows stored in {ES_WINDOW_CACHE_FILE}",
+    )
+
     parser.add_argument(
         "--cache-dir",
         type=str,
@@ -952,6 +902,11 @@ Examples:
         verbose=args.verbose,
         concurrent_requests=args.concurrent,
         cache_dir=args.cache_dir,
+        adaptive=not args.no_adaptive,
+        max_concurrent=args.max_concurrent,
+        archive_dir=args.archive_dir,
+        parse_workers=args.parse_workers,
+        window_cache=not args.no_window_cache,
     )
 
     try:
@@ -963,8 +918,15 @@ Examples:
 
 
 async def scrape_new(start_date: str, end_date: str,
-                     cache_dir: str = ".cache", concurrent: int = 5) -> list[dict]:
-    """Return new articles as dicts. Used by live pipeline."""
+                     cache_dir: str = ".cache", concurrent: int = 5,
+                     session: Optional[aiohttp.ClientSession] = None,
+                     watermark: Optional[dict] = None) -> list[dict]:
+    """Return new articles as dicts. Used by live pipeline.
+
+    Pass session to share one connection pool with other scrapers. The poll
+    watermark is only recorded in the meta: a live window is a single ES
+    query, so there are no listing pages to stop early on.
+    """
     out = os.path.join(cache_dir, "_live_bayern.json")
     scraper = AsyncBayernPolizeiScraper(
         start_date=start_date,
@@ -972,8 +934,9 @@ async def scrape_new(start_date: str, end_date: str,
         output=out,
         cache_dir=cache_dir,
         concurrent_requests=concurrent,
+        watermark=watermark,
     )
-    await scraper.run_async()
+    await scraper.run_async(session=session)
     return [asdict(a) for a in scraper.articles]
 
 
@@ -15,34 +15,30 @@ Usage:
 
 import argparse
 import asyncio
-import json
 import os
 import re
-import ssl
 import sys
-import time
-from dataclasses import dataclass, asdict
+from dataclasses import asdict
 from datetime import datetime, date
 from pathlib import Path
 from typing import Optional
 
 import aiohttp
-import certifi
 from bs4 import BeautifulSoup
 
-# Fix SSL on macOS - certifi provides Mozilla's CA bundle
-os.environ['SSL_CERT_FILE'] = certifi.where()
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent))
+from scripts.scrapers.base import Article, AsyncScraperBase
 
 # Constants
 BASE_URL = "https://www.berlin.de"
 ARCHIVE_URL_TEMPLATE = BASE_URL + "/polizei/polizeimeldungen/archiv/{year}/"
-USER_AGENT = "adlerlicht/1.0 (+contact: scraper@adlerlicht.de)"
 
 # Async configuration
 CONCURRENT_REQUESTS = 15
 DELAY_BETWEEN_BATCHES = 0.5  # Berlin.de is slower; be a bit more polite
 REQUEST_TIMEOUT_SECONDS = 30
-MAX_RETRIES = 3
+LISTING_WAVE_SIZE = 10  # Listing pages per wave; the date cutoff is checked between waves
 
 # Feuerwehr filter pattern (shared with presseportal scraper)
 FEUERWEHR_PATTERN = re.compile(
@@ -51,63 +47,6 @@ FEUERWEHR_PATTERN = re.compile(
 )
 
 
-@dataclass
-class Article:
-    """Represents a scraped press release article (same schema as presseportal scraper)."""
-    title: str
-    date: str
-    city: Optional[str]
-    bundesland: Optional[str]
-    agency_code: Optional[str]
-    source: Optional[str]
-    url: str
-    body: str
-    places: list[str]
-    themes: list[str]
-
-
-class ScrapedUrlsCache:
-    """Persistent cache for tracking already-scraped article URLs.
-
-    Prevents re-scraping articles across scraper runs by storing URLs
-    with their scrape timestamp. Uses a separate cache file from the
-    presseportal scraper.
-    """
-
-    def __init__(self, cache_dir: str = ".cache"):
-        self.cache_dir = Path(cache_dir)
-        self.cache_file = self.cache_dir / "scraped_urls_berlin.json"
-        self.urls: dict[str, str] = {}  # url -> timestamp
-        self._load()
-
-    def _load(self) -> None:
-        """Load cache from disk if exists."""
-        if self.cache_file.exists():
-            try:
-                with open(self.cache_file, "r", encoding="utf-8") as f:
-                    self.urls = json.load(f)
-            except (json.JSONDecodeError, IOError) as e:
-                print(f"Warning: Could not load scraped URLs cache: {e}")
-                self.urls = {}
-
-    def save(self) -> None:
-        """Persist cache to disk."""
-        self.cache_dir.mkdir(parents=True, exist_ok=True)
-        with open(self.cache_file, "w", encoding="utf-8") as f:
-            json.dump(self.urls, f, ensure_ascii=False, indent=2)
-
-    def is_scraped(self, url: str) -> bool:
-        """Check if URL has already been scraped."""
-        return url in self.urls
-
-    def mark_scraped(self, url: str) -> None:
-        """Mark a URL as scraped with current timestamp."""
-        self.urls[url] = datetime.now().isoformat()
-
-    def __len__(self) -> int:
-        return len(self.urls)
-
-
 def is_feuerwehr_article(title: Optional[str], body: Optional[str] = None) -> bool:
     """Check if article is from a fire department (not police)."""
     if title and FEUERWEHR_PATTERN.search(title):
@@ -219,6 +158,16 @@ def parse_listing_page(html: str, year: int) -> list[dict]:
     return articles
 
 
+def parse_listing_page_count(html: str) -> Optional[int]:
+    """Number of pages in a year's archive listing, from its pager links.
+
+    The pager links pages as ?page_at_1_0=N, including the last one.
+    None if there is no pager.
+    """
+    pages = [int(n) for n in re.findall(r'page_at_1_0=(\d+)', html)]
+    return max(pages) if pages else None
+
+
 def parse_article_page(html: str, url: str) -> Optional[dict]:
     """Parse a Berlin Polizei article page.
 
@@ -354,14 +303,21 @@ def parse_article_page(html: str, url: str) -> Optional[dict]:
     }
 
 
-class AsyncBerlinPolizeiScraper:
+class AsyncBerlinPolizeiScraper(AsyncScraperBase):
     """
     Async scraper for Berlin Polizei Pressemeldungen.
 
-    Fetches article listings from the yearly archive pages, then scrapes
+    Fetches article listings from the yearly archive pages (all years in
+    parallel, each year's pages planned from its pager), then scrapes
     individual article pages concurrently.
     """
 
+    NAME = "Async Berlin Polizei Pressemeldungen Scraper"
+    SOURCE = "berlin_polizei"
+    ARCHIVE_SOURCE = "berlin"
+    URL_CACHE_FILE = "scraped_urls_berlin.json"
+    parse_page = staticmethod(parse_article_page)
+
     def __init__(
         self,
         start_date: Optional[str] = None,
@@ -371,42 +327,39 @@ class AsyncBerlinPolizeiScraper:
         verbose: bool = False,
         concurrent_requests: int = CONCURRENT_REQUESTS,
         cache_dir: str = ".cache",
+        adaptive: bool = True,
+        max_concurrent: Optional[int] = None,
+        archive_dir: Optional[str] = None,
+        parse_workers: int = 0,
+        watermark: Optional[dict] = None,
     ):
-        self.start_date: Optional[date] = (
-            datetime.fromisoformat(start_date).date() if start_date else None
+        super().__init__(
+            start_date=start_date,
+            end_date=end_date,
+            max_pages=max_pages,
+            output=output,
+            verbose=verbose,
+            concurrent_requests=concurrent_requests,
+            cache_dir=cache_dir,
+            adaptive=adaptive,
+            max_concurrent=max_concurrent,
+            archive_dir=archive_dir,
+            parse_workers=parse_workers,
+            request_timeout=REQUEST_TIMEOUT_SECONDS,
+            batch_delay=DELAY_BETWEEN_BATCHES,
+            watermark=watermark,
         )
-        self.end_date: Optional[date] = (
-            datetime.fromisoformat(end_date).date() if end_date else None
-        )
-        self.max_pages = max_pages
-        self.output = output
-        self.verbose = verbose
-        self.concurrent_requests = concurrent_requests
-
-        self.articles: list[Article] = []
-        self.seen_urls: set[str] = set()
-        self.url_cache = ScrapedUrlsCache(cache_dir)
-        self.skipped_cached_count = 0
-        self.feuerwehr_dropped_count = 0
-
-        # Stats
-        self.fetch_count = 0
-        self.fetch_errors = 0
-
-        # Metadata tracking
-        self.pages_visited = 0
-        self.pages_with_content = 0
-        self.stop_reason = "unknown"
+        self.year_stops: dict[int, str] = {}
 
     def _get_years_to_scrape(self) -> list[int]:
         """Determine which archive years to scrape based on date range."""
         if self.start_date and self.end_date:
-            return years_in_range(self.start_date, self.end_date)
+            return years_in_range(self.start_date.date(), self.end_date.date())
         elif self.start_date:
-            return years_in_range(self.start_date, date.today())
+            return years_in_range(self.start_date.date(), date.today())
         elif self.end_date:
             # Default: from 2015 to end_date year
-            return years_in_range(date(2015, 1, 1), self.end_date)
+            return years_in_range(date(2015, 1, 1), self.end_date.date())
         else:
             # Default: current year only
             return [date.today().year]
@@ -418,105 +371,101 @@ class AsyncBerlinPolizeiScraper:
             return base
         return f"{base}?page_at_1_0={page}"
 
-    def _is_in_date_range(self, date_str: Optional[str]) -> bool:
-        """Check if article date falls within configured range."""
-        if not date_str:
-            return True  # Keep articles with unknown dates
-        if not self.start_date and not self.end_date:
-            return True
-
-        article_date = parse_date_to_date_obj(date_str)
-        if not article_date:
-            return True
-
-        if self.start_date and article_date < self.start_date:
-            return False
-        if self.end_date and article_date > self.end_date:
-            return False
-        return True
-
-    async def _fetch_url(
+    async def _discover_articles_for_year(
         self,
         session: aiohttp.ClientSession,
-        url: str,
         semaphore: asyncio.Semaphore,
-    ) -> Optional[str]:
-        """Fetch a single URL with semaphore-controlled concurrency and retries."""
-        async with semaphore:
-            for attempt in range(MAX_RETRIES):
-                try:
-                    async with session.get(
-                        url,
-                        timeout=aiohttp.ClientTimeout(total=REQUEST_TIMEOUT_SECONDS),
-                    ) as response:
-                        if response.status == 200:
-                            self.fetch_count += 1
-                            return await response.text()
-                        elif response.status == 429:
-                            wait_time = 2 ** (attempt + 1)
-                            if self.verbose:
-                                print(f"  Rate limited on {url}, waiting {wait_time}s...")
-                            await asyncio.sleep(wait_time)
-                        elif response.status == 404:
-                            if self.verbose:
-                                print(f"  404 Not Found: {url}")
-                            return None
-                        else:
-                            if self.verbose:
-                                print(f"  HTTP {response.status} for {url}")
-                            if attempt < MAX_RETRIES - 1:
-                                await asyncio.sleep(1)
-                            else:
-                                return None
-                except asyncio.TimeoutError:
-                    if self.verbose:
-                        print(f"  Timeout ({attempt+1}/{MAX_RETRIES}): {url}")
-                    if attempt < MAX_RETRIES - 1:
-                        await asyncio.sleep(2 ** attempt)
-                except aiohttp.ClientError as e:
-                    if self.verbose:
-                        print(f"  Client error ({attempt+1}/{MAX_RETRIES}): {url}: {e}")
-                    if attempt < MAX_RETRIES - 1:
-                        await asyncio.sleep(2 ** attempt)
+        year: int,
+    ) -> list[dict]:
+        """Discover all articles from a given archive year.
 
-            self.fetch_errors += 1
-            return None
+        Page 1's pager gives the year's page count (~41 per year), so the
+        remaining pages are planned up front and fetched concurrently in
+        waves, stopping once a wave is entirely older than start_date or
+        holds a page with nothing newer than the poll watermark. Years
+        without a readable pager fall back to open-ended batches.
+        """
+        all_articles = []
 
-    async def _fetch_batch(
-        self,
-        session: aiohttp.ClientSession,
-        urls: list[str],
-        semaphore: asyncio.Semaphore,
-    ) -> list[tuple[str, Optional[str]]]:
-        """Fetch a batch of URLs concurrently."""
-        tasks = [self._fetch_url(session, url, semaphore) for url in urls]
-        results = await asyncio.gather(*tasks)
-        return list(zip(urls, results))
+        print(f"\n  Year {year}: discovering articles...")
 
-    async def _discover_articles_for_year(
+        html = await self._fetch_url(session, self._build_listing_url(year, 1), semaphore)
+        self.pages_visited += 1
+        page_count = parse_listing_page_count(html) if html else None
+        if page_count is None:
+            self.year_stops[year] = await self._discover_year_unplanned(session, semaphore, year, all_articles)
+            print(f"    Year {year}: found {len(all_articles)} articles")
+            return all_articles
+
+        last_page = min(page_count, self.max_pages) if self.max_pages > 0 else page_count
+        stop = "max_pages" if last_page < page_count else "planned_pages"
+        if self.verbose:
+            print(f"    Year {year}: {page_count} listing pages, fetching {last_page}")
+
+        first = parse_listing_page(html, year)
+        if first:
+            self.pages_with_content += 1
+        added, too_old, too_new = self._collect_listing_entries(first, all_articles)
+        reached_start = bool(self.start_date and too_old and not added and not too_new)
+        reached_watermark = self._listing_page_seen(first)
+
+        urls = [self._build_listing_url(year, p) for p in range(2, last_page + 1)]
+        if not reached_start and not reached_watermark and urls:
+            async for wave in self._fetch_listing_waves(
+                session, urls, semaphore, lambda page_html: parse_listing_page(page_html, year),
+                DELAY_BETWEEN_BATCHES, wave_size=LISTING_WAVE_SIZE,
+            ):
+                self.pages_visited += len(wave)
+                wave_added = wave_too_old = wave_too_new = 0
+                for _, articles in wave:
+                    if not articles:
+                        continue
+                    self.pages_with_content += 1
+                    added, too_old, too_new = self._collect_listing_entries(articles, all_articles)
+                    wave_added += added
+                    wave_too_old += too_old
+                    wave_too_new += too_new
+                    reached_watermark = reached_watermark or self._listing_page_seen(articles)
+
+                if self.verbose:
+                    print(f"    Year {year}: +{wave_added} articles from {len(wave)} pages "
+                          f"(total: {len(all_articles)})")
+
+                # Archive pages are newest-first: a wave entirely before start_date ends the year
+                if self.start_date and wave_too_old and not wave_added and not wave_too_new:
+                    reached_start = True
+                    break
+                if reached_watermark:
+                    break
+        if reached_start:
+            stop = "date_boundary"
+        elif reached_watermark:
+            stop = "watermark"
+
+        self.year_stops[year] = stop
+        print(f"    Year {year}: found {len(all_articles)} articles")
+        return all_articles
+
+    async def _discover_year_unplanned(
         self,
         session: aiohttp.ClientSession,
         semaphore: asyncio.Semaphore,
         year: int,
-    ) -> list[dict]:
-        """Discover all articles from a given archive year.
+        all_articles: list[dict],
+    ) -> str:
+        """Paginate a year in open-ended batches until pages come back empty.
 
-        Paginates through listing pages until no more articles are found.
-        Berlin.de archive typically has ~41 pages per year.
+        Used when page 1 has no pager to plan from. Returns the stop reason.
         """
-        all_articles = []
         page = 1
         consecutive_empty = 0
         max_consecutive_empty = 3  # Stop after 3 empty pages in a row
-        batch_size = min(self.concurrent_requests, 10)  # Listing pages in parallel
-
-        print(f"\n  Year {year}: discovering articles...")
+        batch_size = min(self.concurrent_requests, LISTING_WAVE_SIZE)  # Listing pages in parallel
 
         while True:
             if self.max_pages > 0 and page > self.max_pages:
                 print(f"    Reached max pages limit ({self.max_pages})")
-                self.stop_reason = "max_pages"
-                break
+                return "max_pages"
 
             # Build batch of listing page URLs
             batch_urls = []
@@ -527,13 +476,14 @@ class AsyncBerlinPolizeiScraper:
                 batch_urls.append(self._build_listing_url(year, p))
 
             if not batch_urls:
-                break
+                return "max_pages"
 
             results = await self._fetch_batch(session, batch_urls, semaphore)
             self.pages_visited += len(batch_urls)
 
             batch_new = 0
             empty_in_batch = 0
+            batch_seen = False
 
             for url, html in results:
                 if not html:
@@ -546,26 +496,9 @@ class AsyncBerlinPolizeiScraper:
                     continue
                 self.pages_with_content += 1
 
-                for article in articles:
-                    article_url = article["url"]
-
-                    # Dedup within run
-                    if article_url in self.seen_urls:
-                        continue
-
-                    # Skip if already in persistent cache
-                    if self.url_cache.is_scraped(article_url):
-                        self.skipped_cached_count += 1
-                        self.seen_urls.add(article_url)
-                        continue
-
-                    # Date filter
-                    if not self._is_in_date_range(article.get("date")):
-                        continue
-
-                    all_articles.append(article)
-                    self.seen_urls.add(article_url)
-                    batch_new += 1
+                added, _, _ = self._collect_listing_entries(articles, all_articles)
+                batch_new += added
+                batch_seen = batch_seen or self._listing_page_seen(articles)
 
             if self.verbose:
                 print(f"    Pages {page}-{page + len(batch_urls) - 1}: "
@@ -577,192 +510,65 @@ class AsyncBerlinPolizeiScraper:
                 if consecutive_empty >= max_consecutive_empty:
                     if self.verbose:
                         print(f"    {consecutive_empty} consecutive empty batches, stopping")
-                    self.stop_reason = "3_empty_pages"
-                    break
+                    return "3_empty_pages"
             else:
                 consecutive_empty = 0
 
+            if batch_seen:
+                return "watermark"
+
             page += len(batch_urls)
             await asyncio.sleep(DELAY_BETWEEN_BATCHES)
 
-        print(f"    Year {year}: found {len(all_articles)} articles")
-        return all_articles
-
-    async def _discover_all_articles(
+    async def _discover(
         self,
         session: aiohttp.ClientSession,
         semaphore: asyncio.Semaphore,
     ) -> list[dict]:
-        """Discover articles across all years in the date range."""
+        """Discover articles across all years in the date range, years in parallel."""
         target_years = self._get_years_to_scrape()
         print(f"Discovering articles from archive years: {target_years}")
 
-        all_articles = []
-        for year in target_years:
-            year_articles = await self._discover_articles_for_year(
-                session, semaphore, year
-            )
-            all_articles.extend(year_articles)
+        results = await asyncio.gather(
+            *(self._discover_articles_for_year(session, semaphore, year) for year in target_years)
+        )
+        all_articles = [article for year_articles in results for article in year_articles]
+        self.stop_reason = ",".join(sorted(set(self.year_stops.values()))) or "unknown"
 
         if self.skipped_cached_count > 0:
             print(f"\n  Skipped {self.skipped_cached_count} already-scraped articles (cache)")
         print(f"\n  Total: {len(all_articles)} new articles to scrape")
         return all_articles
 
-    async def _scrape_articles_batch(
-        self,
-        session: aiohttp.ClientSession,
-        article_infos: list[dict],
-        semaphore: asyncio.Semaphore,
-    ) -> list[Article]:
-        """Scrape individual article pages concurrently in batches."""
-        articles = []
-        total = len(article_infos)
-        batch_size = self.concurrent_requests
-
-        for i in range(0, total, batch_size):
-            batch = article_infos[i:i + batch_size]
-            urls = [a["url"] for a in batch]
-
-            results = await self._fetch_batch(session, urls, semaphore)
-
-            for (url, html), info in zip(results, batch):
-                if not html:
-                    continue
-
-                parsed = parse_article_page(html, url)
-                if not parsed:
-                    continue
-
-                # Drop Feuerwehr articles
-                if is_feuerwehr_article(parsed.get("title"), parsed.get("body")):
-                    self.feuerwehr_dropped_count += 1
-                    self.url_cache.mark_scraped(url)
-                    continue
-
-                # Use listing-page date as fallback
-                if not parsed["date"] and info.get("date"):
-                    parsed["date"] = info["date"]
-
-                # Use listing-page city as fallback
-                article_city = parsed.get("city") or info.get("city")
-
-                # Normalize date format
-                final_date = parsed["date"] or ""
-                if final_date and "T" in final_date:
-                    final_date = final_date[:19]
-
-                article = Article(
-                    title=parsed["title"],
-                    date=final_date,
-                    city=article_city,
-                    bundesland="Berlin",
-                    agency_code=parsed.get("agency_code"),
-                    source="Polizei Berlin",
-                    url=parsed["url"],
-                    body=parsed.get("body", ""),
-                    places=[],
-                    themes=[],
-                )
-                articles.append(article)
-                self.url_cache.mark_scraped(url)
-
-            progress = min(i + batch_size, total)
-            print(f"  Scraped {progress}/{total} articles ({len(articles)} success)")
-
-            if i + batch_size < total:
-                await asyncio.sleep(DELAY_BETWEEN_BATCHES)
-
-        return articles
-
-    async def run_async(self) -> None:
-        """Execute the async scraping pipeline."""
-        print("=" * 60)
-        print("Async Berlin Polizei Pressemeldungen Scraper")
-        print("=" * 60)
-        print(f"Concurrent requests: {self.concurrent_requests}")
-
-        if self.start_date:
-            print(f"Start date: {self.start_date}")
-        if self.end_date:
-            print(f"End date: {self.end_date}")
-        print()
-
-        start_time = time.time()
-
-        headers = {
-            "User-Agent": USER_AGENT,
-            "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
-            "Accept-Language": "de-DE,de;q=0.9,en;q=0.5",
-        }
-
-        ssl_context = ssl.create_default_context(cafile=certifi.where())
-        connector = aiohttp.TCPConnector(ssl=ssl_context, limit=self.concurrent_requests)
-        semaphore = asyncio.Semaphore(self.concurrent_requests)
-
-        async with aiohttp.ClientSession(headers=headers, connector=connector) as session:
-            # Phase 1: Discover article URLs from archive listing pages
-            article_infos = await self._discover_all_articles(session, semaphore)
-
-            if not article_infos:
-                print("\nNo articles found to scrape.")
-                return
-
-            # Phase 2: Scrape individual article pages
-            print(f"\nScraping {len(article_infos)} articles with "
-                  f"{self.concurrent_requests} concurrent requests...")
-            self.articles = await self._scrape_articles_batch(
-                session, article_infos, semaphore
-            )
-
-        elapsed = time.time() - start_time
-
-        # Save URL cache
-        self.url_cache.save()
-
-        # Write scrape metadata
-        meta = {
-            "source": "berlin_polizei",
-            "pages_visited": self.pages_visited,
-            "pages_with_content": self.pages_with_content,
-            "articles_per_page": None,
-            "source_total": None,
-            "estimated_total": None,
-            "articles_scraped": len(self.articles),
-            "articles_cached_skip": self.skipped_cached_count,
-            "articles_feuerwehr_skip": self.feuerwehr_dropped_count,
-            "stop_reason": self.stop_reason,
-            "fetch_count": self.fetch_count,
-            "fetch_errors": self.fetch_errors,
-            "scrape_duration_s": round(elapsed, 1),
-        }
-        meta_path = self.output.rsplit('.json', 1)[0] + '.meta.json'
-        Path(meta_path).parent.mkdir(parents=True, exist_ok=True)
-        with open(meta_path, 'w', encoding='utf-8') as f:
-            json.dump(meta, f, ensure_ascii=False, indent=2)
-
-        # Write output
-        output_data = [asdict(article) for article in self.articles]
-
-        Path(self.output).parent.mkdir(parents=True, exist_ok=True)
-        with open(self.output, "w", encoding="utf-8") as f:
-            json.dump(output_data, f, ensure_ascii=False, indent=2)
-
-        print()
-        print("=" * 60)
-        print(f"Saved {len(self.articles)} articles to {self.output}")
-        if self.feuerwehr_dropped_count:
-            print(f"Dropped {self.feuerwehr_dropped_count} Feuerwehr (fire dept) articles")
-        print(f"URL cache: {len(self.url_cache)} total URLs in {self.url_cache.cache_file}")
-        print(f"Elapsed time: {elapsed:.1f}s ({elapsed/60:.1f} min)")
-        print(f"Fetch stats: {self.fetch_count} requests, {self.fetch_errors} errors")
-        if self.articles:
-            print(f"Speed: {len(self.articles)/elapsed:.1f} articles/sec")
-        print("=" * 60)
-
-    def run(self) -> None:
-        """Synchronous entry point - runs the async pipeline."""
-        asyncio.run(self.run_async())
+    def _meta_extra(self) -> dict:
+        return {"year_stops": {str(year): stop for year, stop in sorted(self.year_stops.items())}}
+
+    def _build_articles(self, url: str, parsed: dict, info: dict) -> list[Article]:
+        # Drop Feuerwehr articles
+        if is_feuerwehr_article(parsed.get("title"), parsed.get("body")):
+            self.feuerwehr_dropped_count += 1
+            return []
+
+        # Use listing-page date as fallback
+        if not parsed["date"] and info.get("date"):
+            parsed["date"] = info["date"]
+
+        # Normalize date format
+        final_date = parsed["date"] or ""
+        if final_date and "T" in final_date:
+            final_date = final_date[:19]
+
+        return [Article(
+            title=parsed["title"],
+            date=final_date,
+            # Listing-page city as fallback
+            city=parsed.get("city") or info.get("city"),
+            bundesland="Berlin",
+            agency_code=parsed.get("agency_code"),
+            source="Polizei Berlin",
+            url=parsed["url"],
+            body=parsed.get("body", ""),
+        )]
 
 
 def main():
@@ -816,6 +622,34 @@ Examples:
         help=f"Number of concurrent requests (default: {CONCURRENT_REQUESTS})",
     )
 
+    parser.add_argument(
+        "--max-concurrent",
+        type=int,
+        default=None,
+        help="Upper bound for adaptive concurrency (default: 3x --concurrent)",
+    )
+
+    parser.add_argument(
+        "--no-adaptive",
+        action="store_true",
+        help="Keep concurrency fixed at --concurrent (Retry-After is still honored)",
+    )
+
+    parser.add_argument(
+        "--archive-dir",
+        type=str,
+        default=None,
+        help="Store fetched HTML (zstd) here for later reparse (see scrapers/html_archive.py)",
+    )
+
+    parser.add_argument(
+        "--parse-workers",
+        type=int,
+        default=0,
+        help="Parse HTML in a process pool with N workers so fetching and parsing "
+             "overlap (0 = parse on the event loop, -1 = one per CPU core; default: 0)",
+    )
+
     parser.add_argument(
         "--cache-dir",
         type=str,
@@ -843,6 +677,10 @@ Examples:
         verbose=args.verbose,
         concurrent_requests=args.concurrent,
         cache_dir=args.cache_dir,
+        adaptive=not args.no_adaptive,
+        max_concurrent=args.max_concurrent,
+        archive_dir=args.archive_dir,
+        parse_workers=args.parse_workers,
     )
 
     try:
@@ -854,8 +692,14 @@ Examples:
 
 
 async def scrape_new(start_date: str, end_date: str,
-                     cache_dir: str = ".cache", concurrent: int = 5) -> list[dict]:
-    """Return new articles as dicts. Used by live pipeline."""
+                     cache_dir: str = ".cache", concurrent: int = 5,
+                     session: Optional[aiohttp.ClientSession] = None,
+                     watermark: Optional[dict] = None) -> list[dict]:
+    """Return new articles as dicts. Used by live pipeline.
+
+    Pass session to share one connection pool with other scrapers, and the
+    source's poll watermark to stop listing discovery at already-seen pages.
+    """
     out = os.path.join(cache_dir, "_live_berlin.json")
     scraper = AsyncBerlinPolizeiScraper(
         start_date=start_date,
@@ -863,8 +707,9 @@ async def scrape_new(start_date: str, end_date: str,
         output=out,
         cache_dir=cache_dir,
         concurrent_requests=concurrent,
+        watermark=watermark,
     )
-    await scraper.run_async()
+    await scraper.run_async(session=session)
     return [asdict(a) for a in scraper.articles]
 
 
@@ -22,31 +22,23 @@ Usage:
 
 import argparse
 import asyncio
-import json
 import os
 import re
-import ssl
 import sys
-import time
-from dataclasses import dataclass, asdict, field
+from dataclasses import asdict
 from datetime import datetime, date
 from pathlib import Path
 from typing import Optional
 
 import aiohttp
-import certifi
 from bs4 import BeautifulSoup
 
-# Fix SSL on macOS - certifi provides Mozilla's CA bundle
-os.environ['SSL_CERT_FILE'] = certifi.where()
-
-# Force unbuffered stdout for real-time log streaming when spawned as subprocess
-import functools
-print = functools.partial(print, flush=True)  # type: ignore[assignment]
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent))
+from scripts.scrapers.base import Article, AsyncScraperBase, create_connector, request_headers
 
 # Constants
 BASE_URL = "https://polizei.brandenburg.de"
-USER_AGENT = "adlerlicht/1.0 (+contact: scraper@adlerlicht.de)"
 
 # Search API URL template
 # {category} is percent-encoded (e.g. Kriminalit%C3%A4t)
@@ -67,7 +59,6 @@ DEFAULT_CATEGORY = "Kriminalit%C3%A4t"
 CONCURRENT_REQUESTS = 8
 DELAY_BETWEEN_BATCHES = 1.5  # polizei.brandenburg.de rate-limits aggressively
 REQUEST_TIMEOUT_SECONDS = 30
-MAX_RETRIES = 3
 MAX_SEARCH_PAGES = 300  # safety cap — stops runaway pagination
 
 # Feuerwehr filter pattern - drop fire department articles
@@ -77,54 +68,6 @@ FEUERWEHR_PATTERN = re.compile(
 )
 
 
-@dataclass
-class Article:
-    """Represents a scraped press release article (same schema as other scrapers)."""
-    title: str
-    date: str
-    city: Optional[str]
-    bundesland: str
-    agency_code: Optional[str]
-    source: str
-    url: str
-    body: str
-    places: list[str] = field(default_factory=list)
-    themes: list[str] = field(default_factory=list)
-
-
-class ScrapedUrlsCache:
-    """Persistent cache for tracking already-scraped article URLs."""
-
-    def __init__(self, cache_dir: str = ".cache"):
-        self.cache_dir = Path(cache_dir)
-        self.cache_file = self.cache_dir / "scraped_urls_brandenburg.json"
-        self.urls: dict[str, str] = {}  # url -> timestamp
-        self._load()
-
-    def _load(self) -> None:
-        if self.cache_file.exists():
-            try:
-                with open(self.cache_file, "r", encoding="utf-8") as f:
-                    self.urls = json.load(f)
-            except (json.JSONDecodeError, IOError) as e:
-                print(f"Warning: Could not load scraped URLs cache: {e}")
-                self.urls = {}
-
-    def save(self) -> None:
-        self.cache_dir.mkdir(parents=True, exist_ok=True)
-        with open(self.cache_file, "w", encoding="utf-8") as f:
-            json.dump(self.urls, f, ensure_ascii=False, indent=2)
-
-    def is_scraped(self, url: str) -> bool:
-        return url in self.urls
-
-    def mark_scraped(self, url: str) -> None:
-        self.urls[url] = datetime.now().isoformat()
-
-    def __len__(self) -> int:
-        return len(self.urls)
-
-
 def is_feuerwehr(title: Optional[str], body: Optional[str] = None) -> bool:
     """Check if article is from a fire department (not police)."""
     if title and FEUERWEHR_PATTERN.search(title):
@@ -211,6 +154,21 @@ def parse_search_results(html: str) -> list[dict]:
     return results
 
 
+def parse_search_page_count(html: str) -> Optional[int]:
+    """Number of search result pages, from the hit count or the pager.
+
+    Reads "N Treffer"/"N Ergebnisse" when shown, otherwise the highest
+    page number linked as /{page}/1. None if neither is present.
+    """
+    text = BeautifulSoup(html, "html.parser").get_text(" ")
+    match = re.search(r'(\d[\d.]*)\s+(?:Treffer|Ergebnisse?)\b', text)
+    if match:
+        total = int(match.group(1).replace(".", ""))
+        return max(1, -(-total // SEARCH_RESULTS_PER_PAGE))
+    pages = [int(n) for n in re.findall(r'/suche/typ/Meldungen/[^"\s]*?/(\d+)/1\b', html)]
+    return max(pages) if pages else None
+
+
 def parse_article_page(html: str, url: str) -> Optional[dict]:
     """Parse a Brandenburg Polizei article page.
 
@@ -309,15 +267,25 @@ def parse_article_page(html: str, url: str) -> Optional[dict]:
     }
 
 
-class AsyncBrandenburgPolizeiScraper:
+class AsyncBrandenburgPolizeiScraper(AsyncScraperBase):
     """
     Async scraper for Brandenburg Polizei Pressemeldungen.
 
     Uses the search API at /suche/typ/Meldungen/kategorie/... for
-    pre-filtered URL discovery, then scrapes individual article pages
-    concurrently.
+    pre-filtered URL discovery (pages planned from the result count on
+    page 1 and fetched concurrently), then scrapes individual article
+    pages concurrently.
     """
 
+    NAME = "Async Brandenburg Polizei Pressemeldungen Scraper"
+    SOURCE = "brandenburg_polizei"
+    ARCHIVE_SOURCE = "brandenburg"
+    URL_CACHE_FILE = "scraped_urls_brandenburg.json"
+    parse_page = staticmethod(parse_article_page)
+    # 403 from this site = rate limiting, treat like 429
+    THROTTLE_STATUSES = (403,) + AsyncScraperBase.THROTTLE_STATUSES
+    LOG_FETCH_ISSUES = True
+
     def __init__(
         self,
         start_date: Optional[str] = None,
@@ -327,40 +295,41 @@ class AsyncBrandenburgPolizeiScraper:
         verbose: bool = False,
         concurrent_requests: int = CONCURRENT_REQUESTS,
         cache_dir: str = ".cache",
+        adaptive: bool = True,
+        max_concurrent: Optional[int] = None,
+        archive_dir: Optional[str] = None,
+        parse_workers: int = 0,
         category: str = DEFAULT_CATEGORY,
+        watermark: Optional[dict] = None,
     ):
-        self.start_date: Optional[date] = (
-            datetime.fromisoformat(start_date).date() if start_date else None
-        )
-        self.end_date: Optional[date] = (
-            datetime.fromisoformat(end_date).date() if end_date else None
+        super().__init__(
+            start_date=start_date,
+            end_date=end_date,
+            max_pages=max_pages,  # max search pages to paginate (not articles)
+            output=output,
+            verbose=verbose,
+            concurrent_requests=concurrent_requests,
+            cache_dir=cache_dir,
+            adaptive=adaptive,
+            max_concurrent=max_concurrent,
+            archive_dir=archive_dir,
+            parse_workers=parse_workers,
+            request_timeout=REQUEST_TIMEOUT_SECONDS,
+            batch_delay=DELAY_BETWEEN_BATCHES,
+            watermark=watermark,
         )
-        self.max_pages = max_pages  # max search pages to paginate (not articles)
-        self.output = output
-        self.verbose = verbose
-        self.concurrent_requests = concurrent_requests
         self.category = category
 
-        self.articles: list[Article] = []
-        self.seen_urls: set[str] = set()
-        self.url_cache = ScrapedUrlsCache(cache_dir)
-        self.skipped_cached_count = 0
-        self.feuerwehr_dropped_count = 0
-
-        # Stats
-        self.fetch_count = 0
-        self.fetch_errors = 0
         self.search_pages_fetched = 0
         self.search_results_found = 0
-
-        # Metadata tracking
-        self.pages_visited = 0
+        self.date_skipped_count = 0
+        self.discovery_plan = "sequential"
         self.stop_reason = "completed"
 
     def _build_search_url(self, page: int) -> str:
         """Build search API URL for a given page number."""
-        start = self.start_date.isoformat() if self.start_date else "2020-01-01"
-        end = self.end_date.isoformat() if self.end_date else date.today().isoformat()
+        start = self.start_date.date().isoformat() if self.start_date else "2020-01-01"
+        end = self.end_date.date().isoformat() if self.end_date else date.today().isoformat()
         return SEARCH_URL_TPL.format(
             category=self.category,
             page=page,
@@ -368,108 +337,127 @@ class AsyncBrandenburgPolizeiScraper:
             end=end,
         )
 
-    def _is_article_date_in_range(self, date_str: Optional[str]) -> bool:
-        """Exact date filter using the article's actual publication date."""
-        if not date_str:
-            return True  # Keep articles with unknown dates
-        try:
-            article_date = datetime.fromisoformat(date_str[:10]).date()
-            if self.start_date and article_date < self.start_date:
-                return False
-            if self.end_date and article_date > self.end_date:
-                return False
-            return True
-        except (ValueError, AttributeError):
-            return True
-
-    async def _fetch_url(
-        self,
-        session: aiohttp.ClientSession,
-        url: str,
-        semaphore: asyncio.Semaphore,
-    ) -> Optional[str]:
-        """Fetch a single URL with semaphore-controlled concurrency and retries."""
-        async with semaphore:
-            for attempt in range(MAX_RETRIES):
-                try:
-                    async with session.get(
-                        url,
-                        timeout=aiohttp.ClientTimeout(total=REQUEST_TIMEOUT_SECONDS),
-                    ) as response:
-                        if response.status == 200:
-                            self.fetch_count += 1
-                            return await response.text()
-                        elif response.status in (403, 429):
-                            # 403 from this site = rate limiting, treat like 429
-                            wait_time = min(2 ** (attempt + 1), 10)
-                            print(f"  Rate limited ({response.status}) on attempt {attempt+1}/{MAX_RETRIES}, waiting {wait_time}s...")
-                            await asyncio.sleep(wait_time)
-                        elif response.status == 404:
-                            print(f"  404 Not Found: {url}")
-                            return None
-                        elif response.status >= 500:
-                            wait_time = 2 ** attempt
-                            print(f"  HTTP {response.status} for {url}, retrying in {wait_time}s...")
-                            await asyncio.sleep(wait_time)
-                        else:
-                            print(f"  HTTP {response.status} for {url}")
-                            return None
-                except asyncio.TimeoutError:
-                    print(f"  Timeout ({attempt+1}/{MAX_RETRIES}): {url}")
-                    if attempt < MAX_RETRIES - 1:
-                        await asyncio.sleep(2 ** attempt)
-                except aiohttp.ClientError as e:
-                    print(f"  Client error ({attempt+1}/{MAX_RETRIES}): {url}: {e}")
-                    if attempt < MAX_RETRIES - 1:
-                        await asyncio.sleep(2 ** attempt)
-
-            self.fetch_errors += 1
-            print(f"  FAILED after {MAX_RETRIES} retries: {url}")
-            return None
-
-    async def _fetch_batch(
-        self,
-        session: aiohttp.ClientSession,
-        urls: list[str],
-        semaphore: asyncio.Semaphore,
-    ) -> list[tuple[str, Optional[str]]]:
-        """Fetch a batch of URLs concurrently."""
-        tasks = [self._fetch_url(session, url, semaphore) for url in urls]
-        results = await asyncio.gather(*tasks)
-        return list(zip(urls, results))
+    def _collect_search_results(self, results: list[dict], all_entries: list[dict]) -> int:
+        """Add a search page's new results to all_entries; returns how many were added."""
+        page_added = 0
+        for entry in results:
+            article_url = entry["url"]
 
-    async def _discover_from_search(
+            # Dedup
+            if article_url in self.seen_urls:
+                continue
+            self.seen_urls.add(article_url)
+
+            # Skip if already in persistent cache
+            if self.url_cache.is_scraped(article_url):
+                self.skipped_cached_count += 1
+                continue
+
+            all_entries.append(entry)
+            page_added += 1
+        self.search_results_found += len(results)
+        return page_added
+
+    async def _discover(
         self,
         session: aiohttp.ClientSession,
         semaphore: asyncio.Semaphore,
     ) -> list[dict]:
-        """Paginate through the search API to discover article URLs.
+        """Discover article URLs through the search API.
 
-        Fetches search result pages sequentially, parsing each for article
-        links. Stops when an empty page is returned, 3 consecutive empty
-        pages occur, or --max-pages limit is reached.
+        Page 1 carries the result count, so the remaining pages are planned
+        up front and fetched concurrently in waves, until a page has nothing
+        newer than the poll watermark. Without a readable count, pages are
+        fetched one at a time until a partial page.
         """
         all_entries: list[dict] = []
-        page = 1
-        consecutive_empty = 0
 
         print(f"Discovering articles via search API (category: {self.category})...")
         if self.start_date:
-            print(f"  Date range: {self.start_date} to {self.end_date or 'today'}")
+            end = self.end_date.date() if self.end_date else "today"
+            print(f"  Date range: {self.start_date.date()} to {end}")
+
+        effective_max = self.max_pages if self.max_pages > 0 else MAX_SEARCH_PAGES
+        url = self._build_search_url(1)
+        if self.verbose:
+            print(f"  Fetching search page 1: {url}")
+        html = await self._fetch_url(session, url, semaphore)
+        self.search_pages_fetched += 1
+        page_count = parse_search_page_count(html) if html else None
+
+        if page_count is None:
+            await self._discover_sequential(session, semaphore, all_entries, html, effective_max)
+        else:
+            self.discovery_plan = "planned"
+            results = parse_search_results(html)
+            if not results:
+                self.stop_reason = "no_results"
+            else:
+                page_added = self._collect_search_results(results, all_entries)
+                print(f"  Page 1: {len(results)} results, {page_added} new URLs "
+                      f"({page_count} pages in total)")
+
+                last_page = min(page_count, effective_max)
+                if last_page < page_count:
+                    print(f"  Reached max pages limit ({effective_max})")
+                    self.stop_reason = "max_pages"
+                urls = [self._build_search_url(p) for p in range(2, last_page + 1)]
+                if self._listing_page_seen(results):
+                    urls = []
+                    self.stop_reason = "watermark"
+                async for wave in self._fetch_listing_waves(
+                    session, urls, semaphore, parse_search_results, SEARCH_DELAY_SECONDS,
+                ):
+                    self.search_pages_fetched += len(wave)
+                    reached_watermark = False
+                    for page_url, page_results in wave:
+                        if page_results is None:
+                            print(f"  Failed to fetch {page_url}")
+                            continue
+                        page_added = self._collect_search_results(page_results, all_entries)
+                        if self.verbose:
+                            print(f"  {page_url}: {len(page_results)} results, {page_added} new URLs")
+                        reached_watermark = reached_watermark or self._listing_page_seen(page_results)
+                    if reached_watermark:
+                        print("  Reached the poll watermark, stopping")
+                        self.stop_reason = "watermark"
+                        break
+
+        if self.skipped_cached_count > 0:
+            print(f"  Skipped {self.skipped_cached_count} already-scraped articles (cache)")
+        print(f"  {len(all_entries)} articles to scrape from {self.search_pages_fetched} search pages")
+        return all_entries
+
+    async def _discover_sequential(
+        self,
+        session: aiohttp.ClientSession,
+        semaphore: asyncio.Semaphore,
+        all_entries: list[dict],
+        first_html: Optional[str],
+        effective_max: int,
+    ) -> None:
+        """Paginate the search one page at a time, starting from the fetched page 1.
+
+        Stops when an empty page is returned, 3 consecutive empty pages
+        occur, a partial page is reached, or the max pages limit is hit.
+        """
+        page = 1
+        html = first_html
+        consecutive_empty = 0
 
         while True:
-            effective_max = self.max_pages if self.max_pages > 0 else MAX_SEARCH_PAGES
-            if page > effective_max:
-                print(f"  Reached max pages limit ({effective_max})")
-                self.stop_reason = "max_pages"
-                break
+            if page > 1:
+                if page > effective_max:
+                    print(f"  Reached max pages limit ({effective_max})")
+                    self.stop_reason = "max_pages"
+                    break
 
-            url = self._build_search_url(page)
-            if self.verbose:
-                print(f"  Fetching search page {page}: {url}")
+                url = self._build_search_url(page)
+                if self.verbose:
+                    print(f"  Fetching search page {page}: {url}")
 
-            html = await self._fetch_url(session, url, semaphore)
-            self.search_pages_fetched += 1
+                html = await self._fetch_url(session, url, semaphore)
+                self.search_pages_fetched += 1
 
             if not html:
                 print(f"  Page {page}: failed to fetch")
@@ -499,25 +487,7 @@ class AsyncBrandenburgPolizeiScraper:
                 continue
 
             consecutive_empty = 0
-            page_added = 0
-
-            for entry in results:
-                article_url = entry["url"]
-
-                # Dedup
-                if article_url in self.seen_urls:
-                    continue
-                self.seen_urls.add(article_url)
-
-                # Skip if already in persistent cache
-                if self.url_cache.is_scraped(article_url):
-                    self.skipped_cached_count += 1
-                    continue
-
-                all_entries.append(entry)
-                page_added += 1
-
-            self.search_results_found += len(results)
+            page_added = self._collect_search_results(results, all_entries)
 
             if self.verbose or page <= 3:
                 print(f"  Page {page}: {len(results)} results, {page_added} new URLs")
@@ -528,176 +498,69 @@ class AsyncBrandenburgPolizeiScraper:
                     print(f"  Page {page}: partial page ({len(results)} < {SEARCH_RESULTS_PER_PAGE}), last page")
                 break
 
+            if self._listing_page_seen(results):
+                print(f"  Page {page}: nothing newer than the watermark, stopping")
+                self.stop_reason = "watermark"
+                break
+
             page += 1
             await asyncio.sleep(SEARCH_DELAY_SECONDS)
 
-        if self.skipped_cached_count > 0:
-            print(f"  Skipped {self.skipped_cached_count} already-scraped articles (cache)")
-        print(f"  {len(all_entries)} articles to scrape from {self.search_pages_fetched} search pages")
-        return all_entries
-
     async def _scrape_articles(
         self,
         session: aiohttp.ClientSession,
-        article_entries: list[dict],
+        article_infos: list[dict],
         semaphore: asyncio.Semaphore,
     ) -> list[Article]:
-        """Fetch and parse article pages concurrently in batches."""
-        articles = []
-        total = len(article_entries)
-        batch_size = self.concurrent_requests
-        date_skipped = 0
-
-        for i in range(0, total, batch_size):
-            batch = article_entries[i:i + batch_size]
-            urls = [e["url"] for e in batch]
-
-            results = await self._fetch_batch(session, urls, semaphore)
-            self.pages_visited += len(batch)
-
-            for url, html in results:
-                if not html:
-                    continue
-
-                parsed = parse_article_page(html, url)
-                if not parsed:
-                    continue
-
-                # Verify exact article date is in range
-                if not self._is_article_date_in_range(parsed.get("date")):
-                    date_skipped += 1
-                    self.url_cache.mark_scraped(url)
-                    continue
-
-                # Drop Feuerwehr articles
-                if is_feuerwehr(parsed.get("title"), parsed.get("body")):
-                    self.feuerwehr_dropped_count += 1
-                    self.url_cache.mark_scraped(url)
-                    continue
-
-                # Build places list from city + district
-                places = []
-                if parsed.get("city"):
-                    places.append(parsed["city"])
-                if parsed.get("district") and parsed["district"] != parsed.get("city"):
-                    places.append(parsed["district"])
-
-                article = Article(
-                    title=parsed["title"],
-                    date=parsed["date"],
-                    city=parsed.get("city"),
-                    bundesland="Brandenburg",
-                    agency_code=None,
-                    source=parsed.get("agency") or "Polizei Brandenburg",
-                    url=parsed["url"],
-                    body=parsed.get("body", ""),
-                    places=places,
-                    themes=[parsed["category"]] if parsed.get("category") else [],
-                )
-                articles.append(article)
-                self.url_cache.mark_scraped(url)
-
-            progress = min(i + batch_size, total)
-            print(f"  Scraped {progress}/{total} articles ({len(articles)} success)")
-
-            if i + batch_size < total:
-                await asyncio.sleep(DELAY_BETWEEN_BATCHES)
-
-        if date_skipped > 0:
-            print(f"  Skipped {date_skipped} articles outside date range (exact date check)")
-
+        articles = await super()._scrape_articles(session, article_infos, semaphore)
+        self.pages_visited += len(article_infos)
+        if self.date_skipped_count > 0:
+            print(f"  Skipped {self.date_skipped_count} articles outside date range (exact date check)")
         return articles
 
-    async def run_async(self) -> None:
-        """Execute the async scraping pipeline."""
-        print("=" * 60)
-        print("Async Brandenburg Polizei Pressemeldungen Scraper")
-        print("=" * 60)
-        print(f"Source: {BASE_URL}")
-        print(f"Discovery: search API (category: {self.category})")
-        print(f"Concurrent requests: {self.concurrent_requests}")
-        if self.start_date:
-            print(f"Start date: {self.start_date}")
-        if self.end_date:
-            print(f"End date: {self.end_date}")
-        print()
-
-        start_time = time.time()
-
-        headers = {
-            "User-Agent": USER_AGENT,
-            "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
-            "Accept-Language": "de-DE,de;q=0.9,en;q=0.5",
-        }
-
-        ssl_context = ssl.create_default_context(cafile=certifi.where())
-        connector = aiohttp.TCPConnector(ssl=ssl_context, limit=self.concurrent_requests)
-        semaphore = asyncio.Semaphore(self.concurrent_requests)
-
-        async with aiohttp.ClientSession(headers=headers, connector=connector) as session:
-            # Phase 1: Discover article URLs from search API
-            article_entries = await self._discover_from_search(session, semaphore)
-
-            if not article_entries:
-                print("\nNo articles found to scrape.")
-                self.url_cache.save()
-                return
-
-            # Phase 2: Fetch and parse article pages concurrently
-            print(f"\nScraping {len(article_entries)} articles with "
-                  f"{self.concurrent_requests} concurrent requests...")
-            self.articles = await self._scrape_articles(
-                session, article_entries, semaphore
-            )
-
-        elapsed = time.time() - start_time
-
-        # Save URL cache
-        self.url_cache.save()
-
-        # Write scrape metadata
-        meta = {
-            "source": "brandenburg_polizei",
+    def _build_articles(self, url: str, parsed: dict, info: dict) -> list[Article]:
+        # Verify exact article date is in range
+        if not self._is_in_date_range(parsed.get("date")):
+            self.date_skipped_count += 1
+            return []
+
+        # Drop Feuerwehr articles
+        if is_feuerwehr(parsed.get("title"), parsed.get("body")):
+            self.feuerwehr_dropped_count += 1
+            return []
+
+        # Build places list from city + district
+        places = []
+        if parsed.get("city"):
+            places.append(parsed["city"])
+        if parsed.get("district") and parsed["district"] != parsed.get("city"):
+            places.append(parsed["district"])
+
+        return [Article(
+            title=parsed["title"],
+            date=parsed["date"],
+            city=parsed.get("city"),
+            bundesland="Brandenburg",
+            agency_code=None,
+            source=parsed.get("agency") or "Polizei Brandenburg",
+            url=parsed["url"],
+            body=parsed.get("body", ""),
+            places=places,
+            themes=[parsed["category"]] if parsed.get("category") else [],
+        )]
+
+    def _banner_lines(self) -> list[str]:
+        return [f"Source: {BASE_URL}", f"Discovery: search API (category: {self.category})"]
+
+    def _meta_extra(self) -> dict:
+        return {
             "discovery_method": "search_api",
             "category_filter": self.category,
+            "search_plan": self.discovery_plan,
             "search_pages_fetched": self.search_pages_fetched,
             "search_results_found": self.search_results_found,
-            "pages_visited": self.pages_visited,
-            "articles_scraped": len(self.articles),
-            "articles_cached_skip": self.skipped_cached_count,
-            "articles_feuerwehr_skip": self.feuerwehr_dropped_count,
-            "stop_reason": self.stop_reason,
-            "fetch_count": self.fetch_count,
-            "fetch_errors": self.fetch_errors,
-            "scrape_duration_s": round(elapsed, 1),
+            "articles_date_skip": self.date_skipped_count,
         }
-        meta_path = self.output.rsplit('.json', 1)[0] + '.meta.json'
-        Path(meta_path).parent.mkdir(parents=True, exist_ok=True)
-        with open(meta_path, 'w', encoding='utf-8') as f:
-            json.dump(meta, f, ensure_ascii=False, indent=2)
-
-        # Write output
-        output_data = [asdict(article) for article in self.articles]
-
-        Path(self.output).parent.mkdir(parents=True, exist_ok=True)
-        with open(self.output, "w", encoding="utf-8") as f:
-            json.dump(output_data, f, ensure_ascii=False, indent=2)
-
-        print()
-        print("=" * 60)
-        print(f"Saved {len(self.articles)} articles to {self.output}")
-        if self.feuerwehr_dropped_count:
-            print(f"Dropped {self.feuerwehr_dropped_count} Feuerwehr (fire dept) articles")
-        print(f"URL cache: {len(self.url_cache)} total URLs in {self.url_cache.cache_file}")
-        print(f"Elapsed time: {elapsed:.1f}s ({elapsed/60:.1f} min)")
-        print(f"Fetch stats: {self.fetch_count} requests, {self.fetch_errors} errors")
-        if self.articles:
-            print(f"Speed: {len(self.articles)/elapsed:.1f} articles/sec")
-        print("=" * 60)
-
-    def run(self) -> None:
-        """Synchronous entry point - runs the async pipeline."""
-        asyncio.run(self.run_async())
 
 
 async def run_test(verbose: bool = False, category: str = DEFAULT_CATEGORY) -> None:
@@ -706,15 +569,8 @@ async def run_test(verbose: bool = False, category: str = DEFAULT_CATEGORY) -> N
     print("TEST MODE — Diagnostic dump of polizei.brandenburg.de search API")
     print("=" * 60)
 
-    ssl_context = ssl.create_default_context(cafile=certifi.where())
-    connector = aiohttp.TCPConnector(ssl=ssl_context)
-    headers = {
-        "User-Agent": USER_AGENT,
-        "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
-        "Accept-Language": "de-DE,de;q=0.9,en;q=0.5",
-    }
-
-    async with aiohttp.ClientSession(headers=headers, connector=connector) as session:
+    connector = create_connector(limit=2)
+    async with aiohttp.ClientSession(headers=request_headers(), connector=connector) as session:
         # 1. Fetch search page
         today = date.today().isoformat()
         month_ago = date.today().replace(day=1).isoformat()
@@ -858,6 +714,34 @@ Examples:
         help=f"Number of concurrent requests (default: {CONCURRENT_REQUESTS})",
     )
 
+    parser.add_argument(
+        "--max-concurrent",
+        type=int,
+        default=None,
+        help="Upper bound for adaptive concurrency (default: 3x --concurrent)",
+    )
+
+    parser.add_argument(
+        "--no-adaptive",
+        action="store_true",
+        help="Keep concurrency fixed at --concurrent (Retry-After is still honored)",
+    )
+
+    parser.add_argument(
+        "--archive-dir",
+        type=str,
+        default=None,
+        help="Store fetched HTML (zstd) here for later reparse (see scrapers/html_archive.py)",
+    )
+
+    parser.add_argument(
+        "--parse-workers",
+        type=int,
+        default=0,
+        help="Parse HTML in a process pool with N workers so fetching and parsing "
+             "overlap (0 = parse on the event loop, -1 = one per CPU core; default: 0)",
+    )
+
     parser.add_argument(
         "--cache-dir",
         type=str,
@@ -880,6 +764,9 @@ Examples:
 
     args = parser.parse_args()
 
+    # Line-buffered stdout for real-time log streaming when spawned as subprocess
+    sys.stdout.reconfigure(line_buffering=True)
+
     # Validate dates
     for label, val in [("start", args.start_date), ("end", args.end_date)]:
         if val:
@@ -903,6 +790,10 @@ Examples:
         verbose=args.verbose,
         concurrent_requests=args.concurrent,
         cache_dir=args.cache_dir,
+        adaptive=not args.no_adaptive,
+        max_concurrent=args.max_concurrent,
+        archive_dir=args.archive_dir,
+        parse_workers=args.parse_workers,
         category=args.category,
     )
 
@@ -915,8 +806,14 @@ Examples:
 
 
 async def scrape_new(start_date: str, end_date: str,
-                     cache_dir: str = ".cache", concurrent: int = 5) -> list[dict]:
-    """Return new articles as dicts. Used by live pipeline."""
+                     cache_dir: str = ".cache", concurrent: int = 5,
+                     session: Optional[aiohttp.ClientSession] = None,
+                     watermark: Optional[dict] = None) -> list[dict]:
+    """Return new articles as dicts. Used by live pipeline.
+
+    Pass session to share one connection pool with other scrapers, and the
+    source's poll watermark to stop listing discovery at already-seen pages.
+    """
     out = os.path.join(cache_dir, "_live_brandenburg.json")
     scraper = AsyncBrandenburgPolizeiScraper(
         start_date=start_date,
@@ -924,8 +821,9 @@ async def scrape_new(start_date: str, end_date: str,
         output=out,
         cache_dir=cache_dir,
         concurrent_requests=concurrent,
+        watermark=watermark,
     )
-    await scraper.run_async()
+    await scraper.run_async(session=session)
     return [asdict(a) for a in scraper.articles]
 
 
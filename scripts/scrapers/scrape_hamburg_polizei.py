@@ -20,21 +20,19 @@ import asyncio
 import json
 import os
 import re
-import ssl
 import sys
-import time
-from dataclasses import dataclass, asdict, field
+from dataclasses import asdict
 from datetime import datetime
 from pathlib import Path
 from typing import Optional
 from urllib.parse import urljoin, urlencode, urlparse
 
 import aiohttp
-import certifi
 from bs4 import BeautifulSoup, Tag
 
-# Fix SSL on macOS - certifi provides Mozilla's CA bundle
-os.environ["SSL_CERT_FILE"] = certifi.where()
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent))
+from scripts.scrapers.base import Article, AsyncScraperBase
 
 # ---------------------------------------------------------------------------
 # Constants
@@ -47,8 +45,6 @@ USER_AGENT = "adlerlicht-scraper/1.0 (+contact: scraper@adlerlicht.de)"
 DEFAULT_CONCURRENT = 10  # polizei.hamburg is smaller, be gentler
 DELAY_BETWEEN_BATCHES = 0.5
 REQUEST_TIMEOUT_SECONDS = 30
-MAX_RETRIES = 3
-RETRY_BACKOFF_BASE = 2  # seconds, exponential backoff multiplier
 
 # Feuerwehr filter - drop fire department articles
 FEUERWEHR_PATTERN = re.compile(
@@ -67,64 +63,6 @@ GERMAN_MONTHS = {
 }
 
 
-# ---------------------------------------------------------------------------
-# Data classes
-# ---------------------------------------------------------------------------
-@dataclass
-class Article:
-    """Represents a scraped Hamburg police press release."""
-    title: str
-    date: str
-    city: str = "Hamburg"
-    bundesland: str = "Hamburg"
-    agency_code: Optional[str] = None
-    source: str = "Polizei Hamburg"
-    url: str = ""
-    body: str = ""
-    places: list[str] = field(default_factory=list)
-    themes: list[str] = field(default_factory=list)
-
-
-# ---------------------------------------------------------------------------
-# URL cache
-# ---------------------------------------------------------------------------
-class ScrapedUrlsCache:
-    """Persistent cache for tracking already-scraped article URLs.
-
-    Prevents re-scraping articles across scraper runs by storing URLs
-    with their scrape timestamp.
-    """
-
-    def __init__(self, cache_dir: str = ".cache", cache_filename: str = "scraped_urls_hamburg.json"):
-        self.cache_dir = Path(cache_dir)
-        self.cache_file = self.cache_dir / cache_filename
-        self.urls: dict[str, str] = {}  # url -> timestamp
-        self._load()
-
-    def _load(self) -> None:
-        if self.cache_file.exists():
-            try:
-                with open(self.cache_file, "r", encoding="utf-8") as f:
-                    self.urls = json.load(f)
-            except (json.JSONDecodeError, IOError) as e:
-                print(f"Warning: Could not load scraped URLs cache: {e}")
-                self.urls = {}
-
-    def save(self) -> None:
-        self.cache_dir.mkdir(parents=True, exist_ok=True)
-        with open(self.cache_file, "w", encoding="utf-8") as f:
-            json.dump(self.urls, f, ensure_ascii=False, indent=2)
-
-    def is_scraped(self, url: str) -> bool:
-        return url in self.urls
-
-    def mark_scraped(self, url: str) -> None:
-        self.urls[url] = datetime.now().isoformat()
-
-    def __len__(self) -> int:
-        return len(self.urls)
-
-
 # ---------------------------------------------------------------------------
 # Date parsing helpers
 # ---------------------------------------------------------------------------
@@ -628,9 +566,16 @@ def analyze_html_structure(html: str) -> str:
 # ---------------------------------------------------------------------------
 # Main scraper class
 # ---------------------------------------------------------------------------
-class AsyncHamburgPolizeiScraper:
+class AsyncHamburgPolizeiScraper(AsyncScraperBase):
     """Async scraper for polizei.hamburg press releases."""
 
+    NAME = "Hamburg Police Press Release Scraper"
+    SOURCE = "polizei_hamburg"
+    ARCHIVE_SOURCE = "hamburg"
+    URL_CACHE_FILE = "scraped_urls_hamburg.json"
+    parse_page = staticmethod(parse_article_page)
+    USER_AGENT = USER_AGENT
+
     def __init__(
         self,
         start_date: Optional[str] = None,
@@ -640,129 +585,43 @@ class AsyncHamburgPolizeiScraper:
         verbose: bool = False,
         concurrent: int = DEFAULT_CONCURRENT,
         cache_dir: str = ".cache",
+        adaptive: bool = True,
+        max_concurrent: Optional[int] = None,
+        archive_dir: Optional[str] = None,
+        parse_workers: int = 0,
         test_mode: bool = False,
+        watermark: Optional[dict] = None,
     ):
-        self.start_date = datetime.fromisoformat(start_date) if start_date else None
-        self.end_date = datetime.fromisoformat(end_date) if end_date else None
-        self.max_pages = max_pages
-        self.output = output
-        self.verbose = verbose
-        self.concurrent = concurrent
+        super().__init__(
+            start_date=start_date,
+            end_date=end_date,
+            max_pages=max_pages,
+            output=output,
+            verbose=verbose,
+            concurrent_requests=concurrent,
+            cache_dir=cache_dir,
+            adaptive=adaptive,
+            max_concurrent=max_concurrent,
+            archive_dir=archive_dir,
+            parse_workers=parse_workers,
+            request_timeout=REQUEST_TIMEOUT_SECONDS,
+            batch_delay=DELAY_BETWEEN_BATCHES,
+            watermark=watermark,
+        )
         self.test_mode = test_mode
 
-        self.articles: list[Article] = []
-        self.seen_urls: set[str] = set()
-        self.url_cache = ScrapedUrlsCache(cache_dir, "scraped_urls_hamburg.json")
-
-        # Stats
-        self.fetch_count = 0
-        self.fetch_errors = 0
-        self.skipped_cached = 0
-        self.feuerwehr_dropped = 0
-
-        # Metadata tracking
-        self.pages_visited = 0
-        self.pages_with_content = 0
-        self.stop_reason = "unknown"
-
-    # ---- HTTP helpers ----
-    def _create_ssl_context(self) -> ssl.SSLContext:
-        ctx = ssl.create_default_context(cafile=certifi.where())
-        return ctx
-
-    def _create_headers(self) -> dict[str, str]:
-        return {
-            "User-Agent": USER_AGENT,
-            "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
-            "Accept-Language": "de-DE,de;q=0.9,en;q=0.5",
-        }
-
-    async def _fetch(
-        self,
-        session: aiohttp.ClientSession,
-        url: str,
-        semaphore: asyncio.Semaphore,
-    ) -> Optional[str]:
-        """Fetch a URL with retries, semaphore concurrency control."""
-        async with semaphore:
-            for attempt in range(MAX_RETRIES):
-                try:
-                    async with session.get(
-                        url,
-                        timeout=aiohttp.ClientTimeout(total=REQUEST_TIMEOUT_SECONDS),
-                        allow_redirects=True,
-                    ) as resp:
-                        if resp.status == 200:
-                            self.fetch_count += 1
-                            return await resp.text()
-                        elif resp.status == 429:
-                            wait = RETRY_BACKOFF_BASE ** (attempt + 1)
-                            if self.verbose:
-                                print(f"  Rate limited on {url}, waiting {wait}s...")
-                            await asyncio.sleep(wait)
-                        elif resp.status in (301, 302, 303, 307, 308):
-                            # aiohttp follows redirects by default, but log it
-                            if self.verbose:
-                                print(f"  Redirect {resp.status} for {url}")
-                            return None
-                        else:
-                            if self.verbose:
-                                print(f"  HTTP {resp.status} for {url}")
-                            # 404 = don't retry
-                            if resp.status == 404:
-                                break
-                            return None
-                except asyncio.TimeoutError:
-                    if self.verbose:
-                        print(f"  Timeout (attempt {attempt+1}/{MAX_RETRIES}) for {url}")
-                    if attempt < MAX_RETRIES - 1:
-                        await asyncio.sleep(RETRY_BACKOFF_BASE)
-                except aiohttp.ClientError as e:
-                    if self.verbose:
-                        print(f"  Client error (attempt {attempt+1}/{MAX_RETRIES}) for {url}: {e}")
-                    if attempt < MAX_RETRIES - 1:
-                        await asyncio.sleep(RETRY_BACKOFF_BASE)
-
-            self.fetch_errors += 1
-            return None
-
-    async def _fetch_batch(
-        self,
-        session: aiohttp.ClientSession,
-        urls: list[str],
-        semaphore: asyncio.Semaphore,
-    ) -> list[tuple[str, Optional[str]]]:
-        """Fetch multiple URLs concurrently."""
-        tasks = [self._fetch(session, url, semaphore) for url in urls]
-        results = await asyncio.gather(*tasks)
-        return list(zip(urls, results))
-
     # ---- Date range check ----
     def _is_in_date_range(self, date_str: Optional[str]) -> bool:
-        if not date_str:
-            return True
-        if not self.start_date and not self.end_date:
-            return True
+        # Listing dates may be German ("12. Januar 2026")
+        if date_str and "T" not in date_str:
+            date_str = parse_german_date(date_str)
+        return super()._is_in_date_range(date_str)
 
-        try:
-            if "T" in date_str:
-                article_date = datetime.fromisoformat(date_str.replace("Z", "+00:00"))
-            else:
-                parsed = parse_german_date(date_str)
-                if parsed:
-                    article_date = datetime.fromisoformat(parsed)
-                else:
-                    return True
-
-            article_date = article_date.replace(tzinfo=None)
-
-            if self.start_date and article_date.date() < self.start_date.date():
-                return False
-            if self.end_date and article_date.date() > self.end_date.date():
-                return False
-            return True
-        except (ValueError, AttributeError):
-            return True
+    def _entry_iso_date(self, entry: dict) -> Optional[str]:
+        date_str = entry.get("date")
+        if date_str and "T" not in date_str:
+            date_str = parse_german_date(date_str)
+        return date_str
 
     # ---- Pagination URL guessing ----
     def _guess_pagination_urls(self, page_count: int) -> list[str]:
@@ -788,7 +647,7 @@ class AsyncHamburgPolizeiScraper:
         return patterns
 
     # ---- Listing page discovery ----
-    async def _discover_articles(
+    async def _discover(
         self,
         session: aiohttp.ClientSession,
         semaphore: asyncio.Semaphore,
@@ -798,7 +657,7 @@ class AsyncHamburgPolizeiScraper:
 
         print("Phase 1: Fetching listing page...")
         listing_url = BASE_URL + LISTING_PATH
-        first_html = await self._fetch(session, listing_url, semaphore)
+        first_html = await self._fetch_url(session, listing_url, semaphore)
         self.pages_visited += 1
 
         if not first_html:
@@ -828,7 +687,7 @@ class AsyncHamburgPolizeiScraper:
             if url in self.seen_urls:
                 continue
             if self.url_cache.is_scraped(url):
-                self.skipped_cached += 1
+                self.skipped_cached_count += 1
                 self.seen_urls.add(url)
                 continue
             if self._is_in_date_range(art.get("date")):
@@ -840,6 +699,11 @@ class AsyncHamburgPolizeiScraper:
             print("  The page structure may have changed. Run with --test to inspect.")
             return all_articles
 
+        if self._listing_page_seen(articles_p1):
+            print("  Page 1: nothing newer than the watermark, stopping")
+            self.stop_reason = "watermark"
+            return all_articles
+
         # Discover pagination
         pag_urls = discover_pagination(first_html)
         if self.verbose:
@@ -893,13 +757,14 @@ class AsyncHamburgPolizeiScraper:
             print(f"  Fetching {len(pag_urls)} additional listing pages...")
 
             # Fetch in batches
-            for i in range(0, len(pag_urls), self.concurrent):
-                batch = pag_urls[i:i + self.concurrent]
+            for i in range(0, len(pag_urls), self.rate.max_concurrency):
+                batch = pag_urls[i:i + self.rate.max_concurrency]
                 results = await self._fetch_batch(session, batch, semaphore)
                 self.pages_visited += len(batch)
 
                 batch_added = 0
                 empty_count = 0
+                batch_seen = False
 
                 for page_url, page_html in results:
                     if not page_html:
@@ -918,15 +783,16 @@ class AsyncHamburgPolizeiScraper:
                         if url in self.seen_urls:
                             continue
                         if self.url_cache.is_scraped(url):
-                            self.skipped_cached += 1
+                            self.skipped_cached_count += 1
                             self.seen_urls.add(url)
                             continue
                         if self._is_in_date_range(art.get("date")):
                             all_articles.append(art)
                             self.seen_urls.add(url)
                             batch_added += 1
+                    batch_seen = batch_seen or self._listing_page_seen(page_articles)
 
-                page_range_end = min(i + self.concurrent, len(pag_urls))
+                page_range_end = min(i + self.rate.max_concurrency, len(pag_urls))
                 print(f"  Pages {i+2}-{page_range_end+1}: +{batch_added} articles (total: {len(all_articles)})")
 
                 # Stop if all pages in batch were empty (likely past last page)
@@ -934,165 +800,57 @@ class AsyncHamburgPolizeiScraper:
                     print("  All pages in batch empty, stopping pagination")
                     self.stop_reason = "all_empty"
                     break
+                if batch_seen:
+                    print("  Reached the poll watermark, stopping pagination")
+                    self.stop_reason = "watermark"
+                    break
 
                 await asyncio.sleep(DELAY_BETWEEN_BATCHES)
 
-        if self.skipped_cached:
-            print(f"  Skipped {self.skipped_cached} already-scraped articles (cached)")
+        if self.skipped_cached_count:
+            print(f"  Skipped {self.skipped_cached_count} already-scraped articles (cached)")
         print(f"  Found {len(all_articles)} new articles to scrape")
         return all_articles
 
     # ---- Article scraping ----
-    async def _scrape_articles(
-        self,
-        session: aiohttp.ClientSession,
-        article_infos: list[dict],
-        semaphore: asyncio.Semaphore,
-    ) -> list[Article]:
-        """Fetch and parse individual article pages."""
-        articles: list[Article] = []
-        total = len(article_infos)
-
-        for i in range(0, total, self.concurrent):
-            batch = article_infos[i:i + self.concurrent]
-            urls = [a["url"] for a in batch]
-
-            results = await self._fetch_batch(session, urls, semaphore)
-
-            for (url, html), info in zip(results, batch):
-                if not html:
-                    continue
-
-                parsed = parse_article_page(html, url)
-                if not parsed:
-                    if self.verbose:
-                        print(f"  Failed to parse article: {url}")
-                    continue
-
-                # Feuerwehr filter
-                if is_feuerwehr_source(None, parsed.get("title")):
-                    self.feuerwehr_dropped += 1
-                    self.url_cache.mark_scraped(url)
-                    continue
-
-                # Use listing date as fallback
-                if not parsed.get("date") and info.get("date"):
-                    parsed["date"] = info["date"]
-
-                # Truncate date to seconds precision
-                if parsed.get("date") and "T" in parsed["date"]:
-                    parsed["date"] = parsed["date"][:19]
-
-                article = Article(
-                    title=parsed["title"],
-                    date=parsed.get("date") or "",
-                    city="Hamburg",
-                    bundesland="Hamburg",
-                    agency_code=parsed.get("agency_code"),
-                    source="Polizei Hamburg",
-                    url=url,
-                    body=parsed.get("body", ""),
-                    places=[],
-                    themes=[],
-                )
-                articles.append(article)
-                self.url_cache.mark_scraped(url)
-
-            progress = min(i + self.concurrent, total)
-            print(f"  Scraped {progress}/{total} articles ({len(articles)} success)")
-
-            if i + self.concurrent < total:
-                await asyncio.sleep(DELAY_BETWEEN_BATCHES)
+    def _build_articles(self, url: str, parsed: dict, info: dict) -> list[Article]:
+        # Feuerwehr filter
+        if is_feuerwehr_source(None, parsed.get("title")):
+            self.feuerwehr_dropped_count += 1
+            return []
 
-        return articles
+        # Use listing date as fallback
+        if not parsed.get("date") and info.get("date"):
+            parsed["date"] = info["date"]
+
+        # Truncate date to seconds precision
+        if parsed.get("date") and "T" in parsed["date"]:
+            parsed["date"] = parsed["date"][:19]
+
+        return [Article(
+            title=parsed["title"],
+            date=parsed.get("date") or "",
+            city="Hamburg",
+            bundesland="Hamburg",
+            agency_code=parsed.get("agency_code"),
+            source="Polizei Hamburg",
+            url=url,
+            body=parsed.get("body", ""),
+        )]
 
     # ---- Main entrypoint ----
-    async def run_async(self) -> None:
-        print("=" * 60)
-        print("Hamburg Police Press Release Scraper")
-        print("=" * 60)
-        print(f"Source: {BASE_URL}{LISTING_PATH}")
-        print(f"Concurrent requests: {self.concurrent}")
-        if self.start_date:
-            print(f"Start date: {self.start_date.date()}")
-        if self.end_date:
-            print(f"End date: {self.end_date.date()}")
-        if self.max_pages:
-            print(f"Max pages: {self.max_pages}")
+    async def _scrape(self, session: aiohttp.ClientSession, semaphore: asyncio.Semaphore) -> bool:
         if self.test_mode:
-            print("MODE: Test (fetch listing page and analyze structure)")
-        print()
-
-        start_time = time.time()
-
-        ssl_ctx = self._create_ssl_context()
-        connector = aiohttp.TCPConnector(ssl=ssl_ctx)
-        semaphore = asyncio.Semaphore(self.concurrent)
-
-        async with aiohttp.ClientSession(
-            headers=self._create_headers(),
-            connector=connector,
-        ) as session:
-            # Phase 1: discover article URLs
-            article_infos = await self._discover_articles(session, semaphore)
-
-            if self.test_mode or not article_infos:
-                if not self.test_mode:
-                    print("No articles found to scrape.")
-                return
-
-            # Phase 2: scrape article detail pages
-            print(f"\nPhase 2: Scraping {len(article_infos)} articles...")
-            self.articles = await self._scrape_articles(session, article_infos, semaphore)
-
-        elapsed = time.time() - start_time
-
-        # Save URL cache
-        self.url_cache.save()
-
-        # Write scrape metadata
-        meta = {
-            "source": "polizei_hamburg",
-            "pages_visited": self.pages_visited,
-            "pages_with_content": self.pages_with_content,
-            "articles_per_page": None,
-            "source_total": None,
-            "estimated_total": None,
-            "articles_scraped": len(self.articles),
-            "articles_cached_skip": self.skipped_cached,
-            "articles_feuerwehr_skip": self.feuerwehr_dropped,
-            "stop_reason": self.stop_reason,
-            "fetch_count": self.fetch_count,
-            "fetch_errors": self.fetch_errors,
-            "scrape_duration_s": round(elapsed, 1),
-        }
-        meta_path = self.output.rsplit('.json', 1)[0] + '.meta.json'
-        Path(meta_path).parent.mkdir(parents=True, exist_ok=True)
-        with open(meta_path, 'w', encoding='utf-8') as f:
-            json.dump(meta, f, ensure_ascii=False, indent=2)
-
-        # Write output
-        output_data = [asdict(article) for article in self.articles]
-        Path(self.output).parent.mkdir(parents=True, exist_ok=True)
-
-        with open(self.output, "w", encoding="utf-8") as f:
-            json.dump(output_data, f, ensure_ascii=False, indent=2)
-
-        # Summary
-        print()
-        print("=" * 60)
-        print(f"Saved {len(self.articles)} articles to {self.output}")
-        if self.feuerwehr_dropped:
-            print(f"Dropped {self.feuerwehr_dropped} Feuerwehr (fire dept) articles")
-        print(f"URL cache: {len(self.url_cache)} total URLs in {self.url_cache.cache_file}")
-        print(f"Elapsed time: {elapsed:.1f}s ({elapsed/60:.1f} min)")
-        print(f"Fetch stats: {self.fetch_count} requests, {self.fetch_errors} errors")
-        if self.articles:
-            print(f"Speed: {len(self.articles)/max(elapsed, 0.1):.1f} articles/sec")
-        print("=" * 60)
-
-    def run(self) -> None:
-        asyncio.run(self.run_async())
+            # Discovery dumps the listing page structure and returns nothing
+            await self._discover(session, semaphore)
+            return False
+        return await super()._scrape(session, semaphore)
+
+    def _banner_lines(self) -> list[str]:
+        lines = [f"Source: {BASE_URL}{LISTING_PATH}"]
+        if self.test_mode:
+            lines.append("MODE: Test (fetch listing page and analyze structure)")
+        return lines
 
 
 # ---------------------------------------------------------------------------
@@ -1151,6 +909,30 @@ Examples:
         default=DEFAULT_CONCURRENT,
         help=f"Number of concurrent requests (default: {DEFAULT_CONCURRENT})",
     )
+    parser.add_argument(
+        "--max-concurrent",
+        type=int,
+        default=None,
+        help="Upper bound for adaptive concurrency (default: 3x --concurrent)",
+    )
+    parser.add_argument(
+        "--no-adaptive",
+        action="store_true",
+        help="Keep concurrency fixed at --concurrent (Retry-After is still honored)",
+    )
+    parser.add_argument(
+        "--archive-dir",
+        type=str,
+        default=None,
+        help="Store fetched HTML (zstd) here for later reparse (see scrapers/html_archive.py)",
+    )
+    parser.add_argument(
+        "--parse-workers",
+        type=int,
+        default=0,
+        help="Parse HTML in a process pool with N workers so fetching and parsing "
+             "overlap (0 = parse on the event loop, -1 = one per CPU core; default: 0)",
+    )
     parser.add_argument(
         "--cache-dir",
         type=str,
@@ -1183,6 +965,10 @@ Examples:
         verbose=args.verbose,
         concurrent=args.concurrent,
         cache_dir=args.cache_dir,
+        adaptive=not args.no_adaptive,
+        max_concurrent=args.max_concurrent,
+        archive_dir=args.archive_dir,
+        parse_workers=args.parse_workers,
         test_mode=args.test,
     )
 
@@ -1195,8 +981,14 @@ Examples:
 
 
 async def scrape_new(start_date: str, end_date: str,
-                     cache_dir: str = ".cache", concurrent: int = 5) -> list[dict]:
-    """Return new articles as dicts. Used by live pipeline."""
+                     cache_dir: str = ".cache", concurrent: int = 5,
+                     session: Optional[aiohttp.ClientSession] = None,
+                     watermark: Optional[dict] = None) -> list[dict]:
+    """Return new articles as dicts. Used by live pipeline.
+
+    Pass session to share one connection pool with other scrapers, and the
+    source's poll watermark to stop listing discovery at already-seen pages.
+    """
     out = os.path.join(cache_dir, "_live_hamburg.json")
     scraper = AsyncHamburgPolizeiScraper(
         start_date=start_date,
@@ -1204,8 +996,9 @@ async def scrape_new(start_date: str, end_date: str,
         output=out,
         cache_dir=cache_dir,
         concurrent=concurrent,
+        watermark=watermark,
     )
-    await scraper.run_async()
+    await scraper.run_async(session=session)
     return [asdict(a) for a in scraper.articles]
 
 
@@ -4,45 +4,43 @@ Async scraper for Polizei Sachsen-Anhalt press releases.
 
 Source: sachsen-anhalt.de/bs/pressemitteilungen/polizei
 TYPO3 CMS with paginated listing (~4,651 pages, ~20 articles/page).
-Archive is chronologically ordered newest-first, so pagination stops
-once articles fall before --start-date.
+Archive is chronologically ordered newest-first, so with a date range the
+scraper seeks straight to the pages covering it instead of paginating
+from page 1.
 
 Usage:
     python3 scripts/scrapers/scrape_sachsen_anhalt.py --start-date 2026-01-01 --end-date 2026-01-31
     python3 scripts/scrapers/scrape_sachsen_anhalt.py --max-pages 5 --verbose
+    python3 scripts/scrapers/scrape_sachsen_anhalt.py --start-date 2023-01-01 --end-date 2023-12-31
 """
 
 import argparse
 import asyncio
-import json
 import os
 import re
-import ssl
 import sys
-import time
-from dataclasses import dataclass, asdict, field
+from dataclasses import asdict
 from datetime import datetime
 from pathlib import Path
 from typing import Optional
 from urllib.parse import urljoin, urlencode, parse_qs, urlparse
 
 import aiohttp
-import certifi
 from bs4 import BeautifulSoup
 
-# Fix SSL on macOS - certifi provides Mozilla's CA bundle
-os.environ['SSL_CERT_FILE'] = certifi.where()
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent))
+from scripts.scrapers.base import Article, AsyncScraperBase
 
 # Constants
 BASE_URL = "https://www.sachsen-anhalt.de"
 LISTING_PATH = "/bs/pressemitteilungen/polizei"
-USER_AGENT = "adlerlicht/1.0 (+contact: scraper@adlerlicht.de)"
 
 # Async configuration
 CONCURRENT_REQUESTS = 10  # Conservative for government site
 DELAY_BETWEEN_BATCHES = 0.5  # Polite delay for government infrastructure
 REQUEST_TIMEOUT_SECONDS = 45  # Government sites can be slow
-MAX_RETRIES = 3
+SEEK_MAX_PAGE = 16384  # Date-seek probe ceiling, well past the ~4,651-page archive
 
 # Feuerwehr filter pattern - drop fire department articles
 FEUERWEHR_PATTERN = re.compile(
@@ -65,63 +63,6 @@ CITY_BODY_PATTERNS = [
 ]
 
 
-@dataclass
-class Article:
-    """Represents a scraped press release article."""
-    title: str
-    date: str
-    city: Optional[str]
-    bundesland: str
-    agency_code: Optional[str]
-    source: str
-    url: str
-    body: str
-    places: list[str] = field(default_factory=list)
-    themes: list[str] = field(default_factory=list)
-
-
-class ScrapedUrlsCache:
-    """Persistent cache for tracking already-scraped article URLs.
-
-    Prevents re-scraping articles across scraper runs by storing URLs
-    with their scrape timestamp.
-    """
-
-    def __init__(self, cache_dir: str = ".cache"):
-        self.cache_dir = Path(cache_dir)
-        self.cache_file = self.cache_dir / "scraped_urls_sachsen_anhalt.json"
-        self.urls: dict[str, str] = {}  # url -> timestamp
-        self._load()
-
-    def _load(self) -> None:
-        """Load cache from disk if exists."""
-        if self.cache_file.exists():
-            try:
-                with open(self.cache_file, "r", encoding="utf-8") as f:
-                    self.urls = json.load(f)
-            except (json.JSONDecodeError, IOError) as e:
-                print(f"Warning: Could not load scraped URLs cache: {e}")
-                self.urls = {}
-
-    def save(self) -> None:
-        """Persist cache to disk."""
-        self.cache_dir.mkdir(parents=True, exist_ok=True)
-        with open(self.cache_file, "w", encoding="utf-8") as f:
-            json.dump(self.urls, f, ensure_ascii=False, indent=2)
-
-    def is_scraped(self, url: str) -> bool:
-        """Check if URL has already been scraped."""
-        return url in self.urls
-
-    def mark_scraped(self, url: str) -> None:
-        """Mark a URL as scraped with current timestamp."""
-        self.urls[url] = datetime.now().isoformat()
-
-    def __len__(self) -> int:
-        """Return number of cached URLs."""
-        return len(self.urls)
-
-
 def build_listing_url(page: int = 1) -> str:
     """Build the paginated listing URL for Sachsen-Anhalt police press releases."""
     url = f"{BASE_URL}{LISTING_PATH}"
@@ -148,6 +89,18 @@ def parse_german_date(date_str: str) -> Optional[str]:
     return None
 
 
+def listing_date_span(articles: list[dict]) -> Optional[tuple[str, str]]:
+    """(oldest, newest) ISO date on a parsed listing page; None if no entry is dated."""
+    dates = sorted(filter(None, (parse_german_date(a.get("date")) for a in articles)))
+    if not dates:
+        return None
+    return dates[0], dates[-1]
+
+
+class _SeekFailed(Exception):
+    """A listing page needed by the date seek could not be fetched."""
+
+
 def parse_listing_page(html: str) -> list[dict]:
     """
     Parse a listing page from the Sachsen-Anhalt TYPO3 portal.
@@ -359,16 +312,26 @@ def parse_article_page(html: str, url: str, listing_info: dict) -> Optional[dict
     }
 
 
-class AsyncSachsenAnhaltScraper:
+class AsyncSachsenAnhaltScraper(AsyncScraperBase):
     """
     Async scraper for Polizei Sachsen-Anhalt press releases.
 
     Handles the massive archive (4,651+ pages) efficiently by:
-    1. Paginating newest-first and stopping at --start-date boundary
+    1. Seeking to the listing pages that cover the date range (galloping
+       probes + binary search), then fetching only that span; without
+       dates, or with seek=False, paginating newest-first from page 1
+       and stopping at the --start-date boundary
     2. Concurrent fetching with semaphore-controlled concurrency
     3. Persistent URL cache to avoid re-scraping
     """
 
+    NAME = "Async Polizei Sachsen-Anhalt Scraper"
+    SOURCE = "sachsen_anhalt"
+    ARCHIVE_SOURCE = "sachsen-anhalt"
+    URL_CACHE_FILE = "scraped_urls_sachsen_anhalt.json"
+    parse_page = staticmethod(parse_article_page)
+    ARTICLES_PER_PAGE = 20
+
     def __init__(
         self,
         start_date: Optional[str] = None,
@@ -378,139 +341,80 @@ class AsyncSachsenAnhaltScraper:
         verbose: bool = False,
         concurrent_requests: int = CONCURRENT_REQUESTS,
         cache_dir: str = ".cache",
+        adaptive: bool = True,
+        max_concurrent: Optional[int] = None,
+        archive_dir: Optional[str] = None,
+        parse_workers: int = 0,
+        seek: bool = True,
+        watermark: Optional[dict] = None,
     ):
-        self.start_date = datetime.fromisoformat(start_date) if start_date else None
-        self.end_date = datetime.fromisoformat(end_date) if end_date else None
-        self.max_pages = max_pages
-        self.output = output
-        self.verbose = verbose
-        self.concurrent_requests = concurrent_requests
-
-        self.articles: list[Article] = []
-        self.seen_urls: set[str] = set()
-        self.url_cache = ScrapedUrlsCache(cache_dir)
-        self.skipped_cached_count = 0
-        self.feuerwehr_dropped_count = 0
-
-        # Stats
-        self.fetch_count = 0
-        self.fetch_errors = 0
-
-        # Metadata tracking
-        self.pages_visited = 0
-        self.pages_with_content = 0
-        self.stop_reason = "unknown"
-
-    def _is_in_date_range(self, date_str: Optional[str]) -> Optional[bool]:
-        """
-        Check if article date falls within configured range.
-
-        Returns:
-            True  - article is within range
-            False - article is outside range
-            None  - date could not be parsed (treat as included)
-        """
-        if not date_str:
-            return None
-
-        if not self.start_date and not self.end_date:
-            return True
-
-        iso = parse_german_date(date_str)
-        if not iso:
-            return None
-
-        try:
-            article_date = datetime.fromisoformat(iso).date()
-
-            if self.start_date and article_date < self.start_date.date():
-                return False
-            if self.end_date and article_date > self.end_date.date():
-                return False
-
-            return True
-        except (ValueError, AttributeError):
-            return None
-
-    def _is_before_start_date(self, date_str: Optional[str]) -> bool:
-        """Check if article date is strictly before start_date (for early-stop logic)."""
-        if not date_str or not self.start_date:
-            return False
-
-        iso = parse_german_date(date_str)
-        if not iso:
-            return False
-
-        try:
-            article_date = datetime.fromisoformat(iso).date()
-            return article_date < self.start_date.date()
-        except (ValueError, AttributeError):
-            return False
-
-    async def _fetch_url(
+        super().__init__(
+            start_date=start_date,
+            end_date=end_date,
+            max_pages=max_pages,
+            output=output,
+            verbose=verbose,
+            concurrent_requests=concurrent_requests,
+            cache_dir=cache_dir,
+            adaptive=adaptive,
+            max_concurrent=max_concurrent,
+            archive_dir=archive_dir,
+            parse_workers=parse_workers,
+            request_timeout=REQUEST_TIMEOUT_SECONDS,
+            batch_delay=DELAY_BETWEEN_BATCHES,
+            watermark=watermark,
+        )
+        self.seek = seek
+
+        # Listing discovery stats
+        self.discovery_mode = "walk"
+        self.listing_fetches = 0
+        self.walk_fetches_estimate: Optional[int] = None
+        self.seek_span: Optional[tuple[int, int]] = None
+        self._listing_pages: dict[int, list[dict]] = {}
+
+    # Listing dates are DD.MM.YYYY
+    def _is_in_date_range(self, date_str: Optional[str]) -> bool:
+        return super()._is_in_date_range(parse_german_date(date_str))
+
+    def _is_before_start(self, date_str: Optional[str]) -> bool:
+        return super()._is_before_start(parse_german_date(date_str))
+
+    def _entry_iso_date(self, entry: dict) -> Optional[str]:
+        return parse_german_date(entry.get("date"))
+
+    async def _discover(
         self,
         session: aiohttp.ClientSession,
-        url: str,
         semaphore: asyncio.Semaphore,
-    ) -> Optional[str]:
-        """Fetch a single URL with semaphore-controlled concurrency and retries."""
-        async with semaphore:
-            for attempt in range(MAX_RETRIES):
-                try:
-                    async with session.get(
-                        url,
-                        timeout=aiohttp.ClientTimeout(total=REQUEST_TIMEOUT_SECONDS),
-                    ) as response:
-                        if response.status == 200:
-                            self.fetch_count += 1
-                            return await response.text()
-                        elif response.status == 429:
-                            wait_time = 2 ** (attempt + 1)
-                            if self.verbose:
-                                print(f"  Rate limited, waiting {wait_time}s...")
-                            await asyncio.sleep(wait_time)
-                        elif response.status >= 500:
-                            # Server error, retry with backoff
-                            wait_time = 2 ** attempt
-                            if self.verbose:
-                                print(f"  HTTP {response.status} for {url}, retrying in {wait_time}s...")
-                            await asyncio.sleep(wait_time)
-                        else:
-                            if self.verbose:
-                                print(f"  HTTP {response.status} for {url}")
-                            return None
-                except asyncio.TimeoutError:
-                    if self.verbose:
-                        print(f"  Timeout for {url} (attempt {attempt + 1})")
-                    if attempt < MAX_RETRIES - 1:
-                        await asyncio.sleep(2)
-                except aiohttp.ClientError as e:
-                    if self.verbose:
-                        print(f"  Error fetching {url}: {e}")
-                    if attempt < MAX_RETRIES - 1:
-                        await asyncio.sleep(2)
-
-            self.fetch_errors += 1
-            return None
+    ) -> list[dict]:
+        """Collect article URLs, seeking to the date window when one is set."""
+        print(f"Discovering articles from listing pages...")
+        if self.start_date:
+            print(f"  Date range: {self.start_date.date()} to {self.end_date.date() if self.end_date else 'now'}")
+        if self.max_pages:
+            print(f"  Max pages: {self.max_pages}")
 
-    async def _fetch_batch(
-        self,
-        session: aiohttp.ClientSession,
-        urls: list[str],
-        semaphore: asyncio.Semaphore,
-    ) -> list[tuple[str, Optional[str]]]:
-        """Fetch a batch of URLs concurrently."""
-        tasks = [self._fetch_url(session, url, semaphore) for url in urls]
-        results = await asyncio.gather(*tasks)
-        return list(zip(urls, results))
+        all_articles = None
+        # A watermark poll ends on page 1 or 2, cheaper than probing for the window
+        if self.seek and (self.start_date or self.end_date) and not self.watermark:
+            all_articles = await self._discover_by_seek(session, semaphore)
+        if all_articles is None:
+            self.discovery_mode = "walk"
+            all_articles = await self._discover_by_walk(session, semaphore)
+
+        if self.skipped_cached_count > 0:
+            print(f"  Skipped {self.skipped_cached_count} already-scraped articles")
+        print(f"  Found {len(all_articles)} new articles to scrape")
+        return all_articles
 
-    async def _discover_articles(
+    async def _discover_by_walk(
         self,
         session: aiohttp.ClientSession,
         semaphore: asyncio.Semaphore,
     ) -> list[dict]:
         """
-        Paginate through listing pages and collect article URLs.
+        Paginate through listing pages from page 1 and collect article URLs.
 
         Processes one listing page at a time (sequentially) because we need to
         detect the date boundary for early stopping. The archive is ordered
@@ -521,12 +425,6 @@ class AsyncSachsenAnhaltScraper:
         page = 1
         consecutive_empty = 0
 
-        print(f"Discovering articles from listing pages...")
-        if self.start_date:
-            print(f"  Date range: {self.start_date.date()} to {self.end_date.date() if self.end_date else 'now'}")
-        if self.max_pages:
-            print(f"  Max pages: {self.max_pages}")
-
         while True:
             if self.max_pages > 0 and page > self.max_pages:
                 print(f"  Reached max pages limit ({self.max_pages})")
@@ -537,6 +435,7 @@ class AsyncSachsenAnhaltScraper:
 
             html = await self._fetch_url(session, url, semaphore)
             self.pages_visited += 1
+            self.listing_fetches += 1
             if not html:
                 consecutive_empty += 1
                 if consecutive_empty >= 3:
@@ -555,39 +454,7 @@ class AsyncSachsenAnhaltScraper:
 
             self.pages_with_content += 1
 
-            page_added = 0
-            page_too_old = 0
-            page_too_new = 0
-
-            for article in articles:
-                article_url = article["url"]
-                article_date = article.get("date")
-
-                # Skip duplicates
-                if article_url in self.seen_urls:
-                    continue
-
-                # Skip cached
-                if self.url_cache.is_scraped(article_url):
-                    self.skipped_cached_count += 1
-                    self.seen_urls.add(article_url)
-                    continue
-
-                # Date filtering
-                in_range = self._is_in_date_range(article_date)
-
-                if in_range is False:
-                    if self._is_before_start_date(article_date):
-                        page_too_old += 1
-                    else:
-                        page_too_new += 1
-                    self.seen_urls.add(article_url)
-                    continue
-
-                # Article is in range (or date unknown)
-                all_articles.append(article)
-                self.seen_urls.add(article_url)
-                page_added += 1
+            page_added, page_too_old, page_too_new = self._collect_listing_entries(articles, all_articles)
 
             if self.verbose:
                 print(f"  Page {page}: +{page_added} articles, {page_too_old} too old, {page_too_new} too new (total: {len(all_articles)})")
@@ -601,156 +468,206 @@ class AsyncSachsenAnhaltScraper:
                 self.stop_reason = "date_boundary"
                 break
 
+            if self._listing_page_seen(articles):
+                print(f"  Page {page}: nothing newer than the watermark, stopping")
+                self.stop_reason = "watermark"
+                break
+
             page += 1
 
             # Polite delay between listing page requests
             await asyncio.sleep(DELAY_BETWEEN_BATCHES)
 
-        if self.skipped_cached_count > 0:
-            print(f"  Skipped {self.skipped_cached_count} already-scraped articles")
-        print(f"  Found {len(all_articles)} new articles to scrape")
         return all_articles
 
-    async def _scrape_articles(
+    # ---- Date seek ----
+    async def _probe_listing(
         self,
         session: aiohttp.ClientSession,
-        article_infos: list[dict],
         semaphore: asyncio.Semaphore,
-    ) -> list[Article]:
-        """Fetch and parse article pages concurrently in batches."""
-        articles = []
-        total = len(article_infos)
-        batch_size = self.concurrent_requests
-
-        for i in range(0, total, batch_size):
-            batch = article_infos[i:i + batch_size]
-            urls = [a["url"] for a in batch]
-
-            results = await self._fetch_batch(session, urls, semaphore)
-
-            for (url, html), info in zip(results, batch):
-                if not html:
-                    continue
-
-                parsed = parse_article_page(html, url, info)
-                if not parsed:
-                    continue
-
-                # Drop Feuerwehr articles
-                if is_feuerwehr(parsed.get("title"), parsed.get("body")):
-                    self.feuerwehr_dropped_count += 1
-                    self.url_cache.mark_scraped(url)
-                    continue
-
-                article = Article(
-                    title=parsed["title"],
-                    date=parsed["date"],
-                    city=parsed["city"],
-                    bundesland="Sachsen-Anhalt",
-                    agency_code=None,
-                    source="Polizei Sachsen-Anhalt",
-                    url=parsed["url"],
-                    body=parsed["body"],
-                    places=[],
-                    themes=[],
-                )
-                articles.append(article)
-                self.url_cache.mark_scraped(url)
-
-            progress = min(i + batch_size, total)
-            print(f"  Scraped {progress}/{total} articles ({len(articles)} success)")
-
-            if i + batch_size < total:
-                await asyncio.sleep(DELAY_BETWEEN_BATCHES)
+        page: int,
+    ) -> list[dict]:
+        """Fetch and parse one listing page, at most once per run.
 
-        return articles
+        Raises _SeekFailed if the page cannot be fetched; an empty list means
+        the page is past the end of the archive.
+        """
+        if page not in self._listing_pages:
+            html = await self._fetch_url(session, build_listing_url(page), semaphore)
+            self.pages_visited += 1
+            self.listing_fetches += 1
+            if not html:
+                raise _SeekFailed(page)
+            self._listing_pages[page] = parse_listing_page(html)
+        return self._listing_pages[page]
+
+    def _page_after_window(self, articles: list[dict]) -> bool:
+        """Every dated entry is newer than end_date (the window is on a later page)."""
+        span = listing_date_span(articles)
+        return bool(span and self.end_date and span[0] > self.end_date.date().isoformat())
+
+    def _page_before_window(self, articles: list[dict]) -> bool:
+        """Empty, or every dated entry is older than start_date (the window is on an earlier page)."""
+        if not articles:
+            return True
+        span = listing_date_span(articles)
+        return bool(span and self.start_date and span[1] < self.start_date.date().isoformat())
 
-    async def run_async(self) -> None:
-        """Execute the async scraping pipeline."""
-        print("=" * 60)
-        print("Async Polizei Sachsen-Anhalt Scraper")
-        print("=" * 60)
-        print(f"Source: {BASE_URL}{LISTING_PATH}")
-        print(f"Concurrent requests: {self.concurrent_requests}")
-        if self.start_date:
-            print(f"Start date: {self.start_date.date()}")
-        if self.end_date:
-            print(f"End date: {self.end_date.date()}")
-        print()
+    async def _locate_window(
+        self,
+        session: aiohttp.ClientSession,
+        semaphore: asyncio.Semaphore,
+    ) -> Optional[tuple[int, int]]:
+        """First and last listing page covering [start_date, end_date].
+
+        Pages are newest-first, so "after the window" holds for a prefix of
+        pages and "before the window" for a suffix. Each boundary is found by
+        probing at doubling distances and then binary-searching the last
+        bracket: O(log n) fetches instead of walking every page from 1.
+        None if no page overlaps the window.
+        """
+        async def after(page: int) -> bool:
+            return self._page_after_window(await self._probe_listing(session, semaphore, page))
+
+        async def before(page: int) -> bool:
+            return self._page_before_window(await self._probe_listing(session, semaphore, page))
+
+        # First page: smallest page not entirely newer than end_date
+        first = 1
+        if await after(1):
+            low, high = 1, 2
+            while await after(high):
+                if high >= SEEK_MAX_PAGE:
+                    return None
+                low, high = high, high * 2
+            while high - low > 1:
+                mid = (low + high) // 2
+                if await after(mid):
+                    low = mid
+                else:
+                    high = mid
+            first = high
+
+        if await before(first):
+            return None
 
-        start_time = time.time()
+        # Last page: largest page not entirely older than start_date
+        low, step = first, 1
+        while not await before(first + step):
+            low = first + step
+            if step >= SEEK_MAX_PAGE:
+                return first, low
+            step *= 2
+        high = first + step
+        while high - low > 1:
+            mid = (low + high) // 2
+            if await before(mid):
+                high = mid
+            else:
+                low = mid
+        return first, low
+
+    async def _discover_by_seek(
+        self,
+        session: aiohttp.ClientSession,
+        semaphore: asyncio.Semaphore,
+    ) -> Optional[list[dict]]:
+        """
+        Locate the listing pages covering the date window, then fetch only those.
 
-        headers = {
-            "User-Agent": USER_AGENT,
-            "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
-            "Accept-Language": "de-DE,de;q=0.9,en;q=0.5",
-        }
+        Pages already fetched while locating are reused; the rest of the span
+        is fetched concurrently in batches. Returns None (fall back to the
+        walk) if a probe page cannot be fetched.
+        """
+        try:
+            window = await self._locate_window(session, semaphore)
+        except _SeekFailed as e:
+            print(f"  Could not fetch listing page {e.args[0]} while seeking, walking from page 1")
+            return None
+
+        self.discovery_mode = "seek"
+        all_articles = []
+        if window is None:
+            print(f"  No listing page covers the date range ({self.listing_fetches} pages probed)")
+            self.stop_reason = "date_boundary"
+            return all_articles
+
+        first, last = window
+        # Walking from page 1 fetches every page up to `last`, plus one to see the boundary
+        self.walk_fetches_estimate = last + 1
+        self.stop_reason = "date_span"
+        if self.max_pages > 0 and last - first + 1 > self.max_pages:
+            print(f"  Reached max pages limit ({self.max_pages})")
+            last = first + self.max_pages - 1
+            self.stop_reason = "max_pages"
+        self.seek_span = (first, last)
+        print(f"  Date range is on pages {first}-{last} (located with {self.listing_fetches} probes)")
+
+        pages = list(range(first, last + 1))
+        missing = [page for page in pages if page not in self._listing_pages]
+        batch_size = self.rate.max_concurrency
+        for i in range(0, len(missing), batch_size):
+            batch = missing[i:i + batch_size]
+            results = await self._fetch_batch(
+                session, [build_listing_url(page) for page in batch], semaphore,
+            )
+            self.pages_visited += len(batch)
+            self.listing_fetches += len(batch)
+            for page, (_, html) in zip(batch, results):
+                if html:
+                    self._listing_pages[page] = parse_listing_page(html)
+            if i + batch_size < len(missing):
+                await asyncio.sleep(DELAY_BETWEEN_BATCHES)
 
-        ssl_context = ssl.create_default_context(cafile=certifi.where())
-        connector = aiohttp.TCPConnector(ssl=ssl_context, limit=self.concurrent_requests)
-        semaphore = asyncio.Semaphore(self.concurrent_requests)
-
-        async with aiohttp.ClientSession(headers=headers, connector=connector) as session:
-            # Phase 1: Discover article URLs from listing pages
-            article_infos = await self._discover_articles(session, semaphore)
-
-            if not article_infos:
-                print("No articles found to scrape")
-                self.url_cache.save()
-                return
-
-            # Phase 2: Fetch and parse article pages concurrently
-            print(f"\nScraping {len(article_infos)} articles with {self.concurrent_requests} concurrent requests...")
-            self.articles = await self._scrape_articles(session, article_infos, semaphore)
-
-        elapsed = time.time() - start_time
-
-        # Save URL cache
-        self.url_cache.save()
-
-        # Write scrape metadata
-        meta = {
-            "source": "sachsen_anhalt",
-            "pages_visited": self.pages_visited,
-            "pages_with_content": self.pages_with_content,
-            "articles_per_page": 20,
-            "source_total": None,
-            "estimated_total": self.pages_with_content * 20,
-            "articles_scraped": len(self.articles),
-            "articles_cached_skip": self.skipped_cached_count,
-            "articles_feuerwehr_skip": self.feuerwehr_dropped_count,
-            "stop_reason": self.stop_reason,
-            "fetch_count": self.fetch_count,
-            "fetch_errors": self.fetch_errors,
-            "scrape_duration_s": round(elapsed, 1),
+        for page in pages:
+            articles = self._listing_pages.get(page)
+            if not articles:
+                print(f"  Page {page}: failed or empty, skipped")
+                continue
+            self.pages_with_content += 1
+            page_added, page_too_old, page_too_new = self._collect_listing_entries(articles, all_articles)
+            if self.verbose:
+                print(f"  Page {page}: +{page_added} articles, {page_too_old} too old, {page_too_new} too new (total: {len(all_articles)})")
+
+        print(f"  {self.listing_fetches} listing fetches "
+              f"(walking from page 1: ~{self.walk_fetches_estimate}, saved {self._listing_fetches_saved()})")
+        return all_articles
+
+    def _listing_fetches_saved(self) -> int:
+        if self.walk_fetches_estimate is None:
+            return 0
+        return max(0, self.walk_fetches_estimate - self.listing_fetches)
+
+    def _parse_args(self, url: str, html: str, info: dict) -> tuple:
+        return (html, url, info)
+
+    def _build_articles(self, url: str, parsed: dict, info: dict) -> list[Article]:
+        # Drop Feuerwehr articles
+        if is_feuerwehr(parsed.get("title"), parsed.get("body")):
+            self.feuerwehr_dropped_count += 1
+            return []
+
+        return [Article(
+            title=parsed["title"],
+            date=parsed["date"],
+            city=parsed["city"],
+            bundesland="Sachsen-Anhalt",
+            agency_code=None,
+            source="Polizei Sachsen-Anhalt",
+            url=parsed["url"],
+            body=parsed["body"],
+        )]
+
+    def _banner_lines(self) -> list[str]:
+        return [f"Source: {BASE_URL}{LISTING_PATH}"]
+
+    def _meta_extra(self) -> dict:
+        return {
+            "discovery_mode": self.discovery_mode,
+            "seek_pages": list(self.seek_span) if self.seek_span else None,
+            "listing_fetches": self.listing_fetches,
+            "listing_fetches_saved": self._listing_fetches_saved(),
         }
-        meta_path = self.output.rsplit('.json', 1)[0] + '.meta.json'
-        Path(meta_path).parent.mkdir(parents=True, exist_ok=True)
-        with open(meta_path, 'w', encoding='utf-8') as f:
-            json.dump(meta, f, ensure_ascii=False, indent=2)
-
-        # Write output
-        output_data = [asdict(article) for article in self.articles]
-
-        Path(self.output).parent.mkdir(parents=True, exist_ok=True)
-        with open(self.output, "w", encoding="utf-8") as f:
-            json.dump(output_data, f, ensure_ascii=False, indent=2)
-
-        print()
-        print("=" * 60)
-        print(f"Saved {len(self.articles)} articles to {self.output}")
-        if self.feuerwehr_dropped_count:
-            print(f"Dropped {self.feuerwehr_dropped_count} Feuerwehr (fire dept) articles")
-        print(f"URL cache: {len(self.url_cache)} total URLs in {self.url_cache.cache_file}")
-        print(f"Elapsed time: {elapsed:.1f}s ({elapsed / 60:.1f} min)")
-        print(f"Fetch stats: {self.fetch_count} requests, {self.fetch_errors} errors")
-        if self.articles:
-            print(f"Speed: {len(self.articles) / elapsed:.1f} articles/sec")
-        print("=" * 60)
-
-    def run(self) -> None:
-        """Synchronous entry point - runs the async pipeline."""
-        asyncio.run(self.run_async())
 
 
 def main():
@@ -804,6 +721,40 @@ Examples:
         help=f"Number of concurrent requests (default: {CONCURRENT_REQUESTS})",
     )
 
+    parser.add_argument(
+        "--max-concurrent",
+        type=int,
+        default=None,
+        help="Upper bound for adaptive concurrency (default: 3x --concurrent)",
+    )
+
+    parser.add_argument(
+        "--no-adaptive",
+        action="store_true",
+        help="Keep concurrency fixed at --concurrent (Retry-After is still honored)",
+    )
+
+    parser.add_argument(
+        "--archive-dir",
+        type=str,
+        default=None,
+        help="Store fetched HTML (zstd) here for later reparse (see scrapers/html_archive.py)",
+    )
+
+    parser.add_argument(
+        "--parse-workers",
+        type=int,
+        default=0,
+        help="Parse HTML in a process pool with N workers so fetching and parsing "
+             "overlap (0 = parse on the event loop, -1 = one per CPU core; default: 0)",
+    )
+
+    parser.add_argument(
+        "--no-seek",
+        action="store_true",
+        help="Walk listing pages from page 1 instead of seeking to the date range",
+    )
+
     parser.add_argument(
         "--cache-dir",
         type=str,
@@ -831,6 +782,11 @@ Examples:
         verbose=args.verbose,
         concurrent_requests=args.concurrent,
         cache_dir=args.cache_dir,
+        adaptive=not args.no_adaptive,
+        max_concurrent=args.max_concurrent,
+        archive_dir=args.archive_dir,
+        parse_workers=args.parse_workers,
+        seek=not args.no_seek,
     )
 
     try:
@@ -842,8 +798,14 @@ Examples:
 
 
 async def scrape_new(start_date: str, end_date: str,
-                     cache_dir: str = ".cache", concurrent: int = 5) -> list[dict]:
-    """Return new articles as dicts. Used by live pipeline."""
+                     cache_dir: str = ".cache", concurrent: int = 5,
+                     session: Optional[aiohttp.ClientSession] = None,
+                     watermark: Optional[dict] = None) -> list[dict]:
+    """Return new articles as dicts. Used by live pipeline.
+
+    Pass session to share one connection pool with other scrapers, and the
+    source's poll watermark to stop listing discovery at already-seen pages.
+    """
     out = os.path.join(cache_dir, "_live_sachsen_anhalt.json")
     scraper = AsyncSachsenAnhaltScraper(
         start_date=start_date,
@@ -851,8 +813,9 @@ async def scrape_new(start_date: str, end_date: str,
         output=out,
         cache_dir=cache_dir,
         concurrent_requests=concurrent,
+        watermark=watermark,
     )
-    await scraper.run_async()
+    await scraper.run_async(session=session)
     return [asdict(a) for a in scraper.articles]
 
 
@@ -7,7 +7,9 @@ medienservice.sachsen.de JSON search API (/medien/news/search.json).
 
 The portal uses a Rails backend with a JSON API that returns HTML teasers.
 Pagination uses `page=N` (6 items per page). Date filtering via
-`search[from]` and `search[to]` (DD.MM.YYYY format).
+`search[from]` and `search[to]` (DD.MM.YYYY format). Discovery splits the
+search by Polizeidirektion and 14-day window and pages through all
+partitions concurrently, instead of one serial page at a time.
 
 Polizeidirektionen and their institution IDs:
   Chemnitz  = 10996
@@ -24,24 +26,21 @@ Usage:
 
 import argparse
 import asyncio
-import json
 import os
 import re
-import ssl
 import sys
-import time
-from dataclasses import dataclass, asdict
-from datetime import datetime
+from dataclasses import asdict
+from datetime import date, datetime, timedelta
 from pathlib import Path
 from typing import Optional
 from urllib.parse import urlencode, urljoin
 
 import aiohttp
-import certifi
 from bs4 import BeautifulSoup
 
-# Fix SSL on macOS — certifi provides Mozilla's CA bundle
-os.environ["SSL_CERT_FILE"] = certifi.where()
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent))
+from scripts.scrapers.base import Article, AsyncScraperBase, create_connector
 
 # ---------------------------------------------------------------------------
 # Constants
@@ -67,7 +66,10 @@ ITEMS_PER_PAGE = 6
 DEFAULT_CONCURRENT = 15
 DELAY_BETWEEN_BATCHES = 0.3
 REQUEST_TIMEOUT = 30
-MAX_RETRIES = 3
+
+# Partitioned discovery: one search per Polizeidirektion and date window
+PARTITION_DAYS = 14
+PAGES_PER_WAVE = 4  # Search pages fetched concurrently per partition
 
 # Feuerwehr filter — drop fire dept articles
 FEUERWEHR_PATTERN = re.compile(
@@ -76,61 +78,6 @@ FEUERWEHR_PATTERN = re.compile(
 )
 
 
-# ---------------------------------------------------------------------------
-# Data model
-# ---------------------------------------------------------------------------
-@dataclass
-class Article:
-    """Scraped press release from Sachsen Polizei."""
-
-    title: str
-    date: str
-    city: Optional[str]
-    bundesland: str
-    agency_code: Optional[str]
-    source: Optional[str]
-    url: str
-    body: str
-    places: list[str]
-    themes: list[str]
-
-
-# ---------------------------------------------------------------------------
-# URL cache (same pattern as presseportal scraper)
-# ---------------------------------------------------------------------------
-class ScrapedUrlsCache:
-    """Persistent cache tracking already-scraped article URLs."""
-
-    def __init__(self, cache_dir: str = ".cache", filename: str = "scraped_urls_sachsen.json"):
-        self.cache_dir = Path(cache_dir)
-        self.cache_file = self.cache_dir / filename
-        self.urls: dict[str, str] = {}  # url -> timestamp
-        self._load()
-
-    def _load(self) -> None:
-        if self.cache_file.exists():
-            try:
-                with open(self.cache_file, "r", encoding="utf-8") as f:
-                    self.urls = json.load(f)
-            except (json.JSONDecodeError, IOError) as e:
-                print(f"Warning: Could not load scraped URLs cache: {e}")
-                self.urls = {}
-
-    def save(self) -> None:
-        self.cache_dir.mkdir(parents=True, exist_ok=True)
-        with open(self.cache_file, "w", encoding="utf-8") as f:
-            json.dump(self.urls, f, ensure_ascii=False, indent=2)
-
-    def is_scraped(self, url: str) -> bool:
-        return url in self.urls
-
-    def mark_scraped(self, url: str) -> None:
-        self.urls[url] = datetime.now().isoformat()
-
-    def __len__(self) -> int:
-        return len(self.urls)
-
-
 # ---------------------------------------------------------------------------
 # Helpers
 # ---------------------------------------------------------------------------
@@ -143,6 +90,17 @@ def is_feuerwehr(source: Optional[str], title: Optional[str] = None) -> bool:
     return False
 
 
+def date_windows(start: date, end: date, days: int = PARTITION_DAYS) -> list[tuple[date, date]]:
+    """Split [start, end] into windows of at most `days` days, newest first."""
+    windows = []
+    current = end
+    while current >= start:
+        window_start = max(current - timedelta(days=days - 1), start)
+        windows.append((window_start, current))
+        current = window_start - timedelta(days=1)
+    return windows
+
+
 def parse_german_datetime(date_str: str) -> Optional[str]:
     """Convert 'DD.MM.YYYY HH:MM' or 'DD.MM.YYYY, HH:MM Uhr' to ISO."""
     if not date_str:
@@ -361,7 +319,7 @@ def parse_article_page(html: str, url: str) -> Optional[dict]:
 # ---------------------------------------------------------------------------
 # Scraper
 # ---------------------------------------------------------------------------
-class AsyncSachsenPolizeiScraper:
+class AsyncSachsenPolizeiScraper(AsyncScraperBase):
     """
     Async scraper for Sachsen Polizeidirektionen press releases.
 
@@ -369,6 +327,14 @@ class AsyncSachsenPolizeiScraper:
     then fetches individual article pages for full content.
     """
 
+    NAME = "Sachsen Polizeidirektion Scraper"
+    SOURCE = "medienservice_sachsen"
+    ARCHIVE_SOURCE = "sachsen"
+    URL_CACHE_FILE = "scraped_urls_sachsen.json"
+    parse_page = staticmethod(parse_article_page)
+    USER_AGENT = USER_AGENT
+    ARTICLES_PER_PAGE = ITEMS_PER_PAGE
+
     def __init__(
         self,
         start_date: Optional[str] = None,
@@ -378,134 +344,242 @@ class AsyncSachsenPolizeiScraper:
         verbose: bool = False,
         concurrent: int = DEFAULT_CONCURRENT,
         cache_dir: str = ".cache",
+        adaptive: bool = True,
+        max_concurrent: Optional[int] = None,
+        archive_dir: Optional[str] = None,
+        parse_workers: int = 0,
         institution_ids: Optional[list[int]] = None,
+        partitioned: bool = True,
+        watermark: Optional[dict] = None,
     ):
-        self.start_date = datetime.fromisoformat(start_date) if start_date else None
-        self.end_date = datetime.fromisoformat(end_date) if end_date else None
-        self.max_pages = max_pages
-        self.output = output
-        self.verbose = verbose
-        self.concurrent = concurrent
+        super().__init__(
+            start_date=start_date,
+            end_date=end_date,
+            max_pages=max_pages,
+            output=output,
+            verbose=verbose,
+            concurrent_requests=concurrent,
+            cache_dir=cache_dir,
+            adaptive=adaptive,
+            max_concurrent=max_concurrent,
+            archive_dir=archive_dir,
+            parse_workers=parse_workers,
+            request_timeout=REQUEST_TIMEOUT,
+            batch_delay=DELAY_BETWEEN_BATCHES,
+            watermark=watermark,
+        )
         self.institution_ids = institution_ids or list(POLIZEIDIREKTIONEN.keys())
+        self.partitioned = partitioned
+        self.partition_count = 0
+        self.partition_stops: dict[str, int] = {}
 
-        self.articles: list[Article] = []
-        self.seen_urls: set[str] = set()
-        self.url_cache = ScrapedUrlsCache(cache_dir)
-        self.skipped_cached = 0
-        self.feuerwehr_dropped = 0
-
-        # Stats
-        self.fetch_count = 0
-        self.fetch_errors = 0
-
-        # Metadata tracking
-        self.pages_visited = 0
-        self.pages_with_content = 0
-        self.stop_reason = "unknown"
+    def _build_search_url(
+        self,
+        page: int = 1,
+        institution_ids: Optional[list[int]] = None,
+        from_date: Optional[date] = None,
+        to_date: Optional[date] = None,
+    ) -> str:
+        """Build the search API URL with institution and date filters.
 
-    def _build_search_url(self, page: int = 1) -> str:
-        """Build the search API URL with institution and date filters."""
+        Defaults to the scraper's institutions and date range.
+        """
         params: list[tuple[str, str]] = []
 
         # Institution IDs
-        for iid in self.institution_ids:
+        for iid in institution_ids or self.institution_ids:
             params.append(("search[institution_ids][]", str(iid)))
 
         # Filter for press releases only (no social media)
         params.append(("search[filter][]", "press_releases"))
 
         # Date range
-        if self.start_date:
-            params.append(("search[from]", self.start_date.strftime("%d.%m.%Y")))
-        if self.end_date:
-            params.append(("search[to]", self.end_date.strftime("%d.%m.%Y")))
+        from_date = from_date or (self.start_date.date() if self.start_date else None)
+        to_date = to_date or (self.end_date.date() if self.end_date else None)
+        if from_date:
+            params.append(("search[from]", from_date.strftime("%d.%m.%Y")))
+        if to_date:
+            params.append(("search[to]", to_date.strftime("%d.%m.%Y")))
 
         # Pagination
         params.append(("page", str(page)))
 
         return f"{SEARCH_API}?{urlencode(params)}"
 
-    def _is_in_date_range(self, iso_date: Optional[str]) -> bool:
-        """Check if article date falls within configured range."""
-        if not iso_date:
-            return True
-        if not self.start_date and not self.end_date:
-            return True
-        try:
-            article_date = datetime.fromisoformat(iso_date.replace("Z", "+00:00")).replace(
-                tzinfo=None
+    def _collect_teasers(self, teasers: list[str], articles: list[dict]) -> int:
+        """Add a search page's new in-range teasers to articles; returns how many were added."""
+        added = 0
+        for teaser_html in teasers:
+            info = parse_teaser_html(teaser_html)
+            if not info or not info["url"]:
+                continue
+
+            url_str = info["url"]
+
+            # Deduplicate
+            if url_str in self.seen_urls:
+                continue
+            self.seen_urls.add(url_str)
+
+            # Check persistent cache
+            if self.url_cache.is_scraped(url_str):
+                self.skipped_cached_count += 1
+                continue
+
+            # Check date range from teaser date
+            if info["date_str"]:
+                iso = parse_german_datetime(info["date_str"])
+                if iso and not self._is_in_date_range(iso):
+                    continue
+
+            articles.append(info)
+            added += 1
+        return added
+
+    def _entry_iso_date(self, entry: dict) -> Optional[str]:
+        return parse_german_datetime(entry.get("date_str"))
+
+    def _partitions(self) -> list[tuple[int, Optional[date], Optional[date]]]:
+        """(institution ID, from, to) search partitions, newest window first."""
+        if self.start_date:
+            end = self.end_date.date() if self.end_date else date.today()
+            windows = date_windows(self.start_date.date(), end)
+        else:
+            windows = [(None, self.end_date.date() if self.end_date else None)]
+        return [(iid, from_date, to_date) for from_date, to_date in windows for iid in self.institution_ids]
+
+    async def _discover(
+        self,
+        session: aiohttp.ClientSession,
+        semaphore: asyncio.Semaphore,
+    ) -> list[dict]:
+        """
+        Discover article URLs through the search API.
+
+        The search is split into one partition per Polizeidirektion and
+        PARTITION_DAYS date window. All partitions run concurrently, each
+        fetching page 1, then PAGES_PER_WAVE pages at a time, and stopping
+        on its own `disable: true`; results are merged newest window first.
+        A watermark poll uses the combined search instead: it usually ends on
+        page 1, where partitions would each spend a request.
+        """
+        print(f"Discovering articles from {len(self.institution_ids)} Polizeidirektionen...")
+        if self.start_date:
+            print(
+                f"  Date range: {self.start_date.date()} to "
+                f"{self.end_date.date() if self.end_date else 'now'}"
             )
-            if self.start_date and article_date.date() < self.start_date.date():
-                return False
-            if self.end_date and article_date.date() > self.end_date.date():
-                return False
-            return True
-        except (ValueError, AttributeError):
-            return True
-
-    async def _fetch(
+        if not self.partitioned or self.watermark:
+            return await self._discover_combined(session, semaphore)
+
+        partitions = self._partitions()
+        self.partition_count = len(partitions)
+        print(f"  {len(partitions)} partitions (Polizeidirektion x {PARTITION_DAYS}-day window), "
+              f"{PAGES_PER_WAVE} pages at a time each")
+        results = await asyncio.gather(
+            *(self._discover_partition(session, semaphore, *partition) for partition in partitions)
+        )
+
+        all_articles: list[dict] = []
+        stops: dict[str, int] = {}
+        for articles, stop in results:
+            all_articles.extend(articles)
+            stops[stop] = stops.get(stop, 0) + 1
+        self.partition_stops = stops
+        self.stop_reason = ",".join(sorted(stops))
+
+        if self.skipped_cached_count > 0:
+            print(f"  Skipped {self.skipped_cached_count} already-scraped articles (cached)")
+        print(f"  Found {len(all_articles)} new articles to scrape")
+        return all_articles
+
+    async def _discover_partition(
         self,
         session: aiohttp.ClientSession,
-        url: str,
         semaphore: asyncio.Semaphore,
-        expect_json: bool = False,
-    ) -> Optional[str | dict]:
-        """Fetch a URL with retries and semaphore concurrency control."""
-        async with semaphore:
-            for attempt in range(MAX_RETRIES):
-                try:
-                    async with session.get(
-                        url,
-                        timeout=aiohttp.ClientTimeout(total=REQUEST_TIMEOUT),
-                    ) as resp:
-                        if resp.status == 200:
-                            self.fetch_count += 1
-                            if expect_json:
-                                return await resp.json(content_type=None)
-                            return await resp.text()
-                        elif resp.status == 429:
-                            wait = 2**attempt
-                            if self.verbose:
-                                print(f"  Rate limited on {url}, waiting {wait}s...")
-                            await asyncio.sleep(wait)
-                        else:
-                            if self.verbose:
-                                print(f"  HTTP {resp.status} for {url}")
-                            return None
-                except asyncio.TimeoutError:
-                    if attempt < MAX_RETRIES - 1:
-                        await asyncio.sleep(1)
-                except aiohttp.ClientError as e:
-                    if self.verbose:
-                        print(f"  Error fetching {url}: {e}")
-                    if attempt < MAX_RETRIES - 1:
-                        await asyncio.sleep(1)
-
-            self.fetch_errors += 1
-            return None
-
-    async def _discover_articles(
+        institution_id: int,
+        from_date: Optional[date],
+        to_date: Optional[date],
+    ) -> tuple[list[dict], str]:
+        """Page through one partition's search results; returns (articles, stop reason)."""
+        articles: list[dict] = []
+        page = 1
+        consecutive_empty = 0
+        stop = None
+
+        while stop is None:
+            # Page 1 alone first: most partitions of a short range end there
+            pages = list(range(page, page + (PAGES_PER_WAVE if page > 1 else 1)))
+            if self.max_pages > 0:
+                pages = [p for p in pages if p <= self.max_pages]
+                if not pages:
+                    stop = "max_pages"
+                    break
+
+            results = await asyncio.gather(*(
+                self._fetch_url(
+                    session,
+                    self._build_search_url(p, [institution_id], from_date, to_date),
+                    semaphore,
+                    expect_json=True,
+                )
+                for p in pages
+            ))
+            self.pages_visited += len(pages)
+
+            # Pages past the end of a wave are discarded once one says disable
+            for p, data in zip(pages, results):
+                if not data or not isinstance(data, dict):
+                    consecutive_empty += 1
+                    if consecutive_empty >= 3:
+                        stop = "3_empty_pages"
+                        break
+                    continue
+
+                teasers = data.get("teaser", [])
+                if not teasers:
+                    stop = "api_disable"
+                    break
+
+                self.pages_with_content += 1
+                if self._collect_teasers(teasers, articles) == 0:
+                    consecutive_empty += 1
+                    if consecutive_empty >= 3:
+                        stop = "3_empty_pages"
+                        break
+                else:
+                    consecutive_empty = 0
+
+                # disable=True means no more pages (last page of results)
+                if data.get("disable", False):
+                    stop = "api_disable"
+                    break
+            else:
+                page += len(pages)
+                await asyncio.sleep(DELAY_BETWEEN_BATCHES)
+
+        if self.verbose or articles:
+            name = POLIZEIDIREKTIONEN.get(institution_id, (f"ID {institution_id}", "?"))[0]
+            print(f"  {name} {from_date or 'start'} → {to_date or 'now'}: "
+                  f"+{len(articles)} articles ({stop})")
+        return articles, stop
+
+    async def _discover_combined(
         self,
         session: aiohttp.ClientSession,
         semaphore: asyncio.Semaphore,
     ) -> list[dict]:
         """
-        Paginate through the search API to discover all article URLs.
+        Paginate one search over all institutions, a page at a time.
 
         The search API returns JSON with a `teaser` list (HTML snippets)
-        and `disable: true` when there are no more results.
+        and `disable: true` when there are no more results. Stops early at a
+        page with nothing newer than the poll watermark.
         """
         all_articles: list[dict] = []
         page = 1
         consecutive_empty = 0
 
-        print(f"Discovering articles from {len(self.institution_ids)} Polizeidirektionen...")
-        if self.start_date:
-            print(
-                f"  Date range: {self.start_date.date()} to "
-                f"{self.end_date.date() if self.end_date else 'now'}"
-            )
-
         while True:
             if self.max_pages > 0 and page > self.max_pages:
                 print(f"  Reached max pages limit ({self.max_pages})")
@@ -513,7 +587,7 @@ class AsyncSachsenPolizeiScraper:
                 break
 
             url = self._build_search_url(page)
-            data = await self._fetch(session, url, semaphore, expect_json=True)
+            data = await self._fetch_url(session, url, semaphore, expect_json=True)
             self.pages_visited += 1
 
             if not data or not isinstance(data, dict):
@@ -534,33 +608,8 @@ class AsyncSachsenPolizeiScraper:
                 self.stop_reason = "api_disable"
                 break
 
-            page_added = 0
             self.pages_with_content += 1
-            for teaser_html in teasers:
-                info = parse_teaser_html(teaser_html)
-                if not info or not info["url"]:
-                    continue
-
-                url_str = info["url"]
-
-                # Deduplicate
-                if url_str in self.seen_urls:
-                    continue
-                self.seen_urls.add(url_str)
-
-                # Check persistent cache
-                if self.url_cache.is_scraped(url_str):
-                    self.skipped_cached += 1
-                    continue
-
-                # Check date range from teaser date
-                if info["date_str"]:
-                    iso = parse_german_datetime(info["date_str"])
-                    if iso and not self._is_in_date_range(iso):
-                        continue
-
-                all_articles.append(info)
-                page_added += 1
+            page_added = self._collect_teasers(teasers, all_articles)
 
             if self.verbose or page % 10 == 0 or page <= 3:
                 print(
@@ -581,37 +630,29 @@ class AsyncSachsenPolizeiScraper:
                 self.stop_reason = "api_disable"
                 break
 
+            if self.watermark and self._listing_page_seen(
+                [info for info in map(parse_teaser_html, teasers) if info and info["url"]]
+            ):
+                print(f"  Page {page}: nothing newer than the watermark, stopping")
+                self.stop_reason = "watermark"
+                break
+
             page += 1
             await asyncio.sleep(DELAY_BETWEEN_BATCHES)
 
-        if self.skipped_cached > 0:
-            print(f"  Skipped {self.skipped_cached} already-scraped articles (cached)")
+        if self.skipped_cached_count > 0:
+            print(f"  Skipped {self.skipped_cached_count} already-scraped articles (cached)")
         print(f"  Found {len(all_articles)} new articles to scrape")
         return all_articles
 
-    async def _scrape_article(
-        self,
-        session: aiohttp.ClientSession,
-        info: dict,
-        semaphore: asyncio.Semaphore,
-    ) -> Optional[Article]:
-        """Fetch and parse a single article page."""
-        html = await self._fetch(session, info["url"], semaphore)
-        if not html:
-            return None
-
-        parsed = parse_article_page(html, info["url"])
-        if not parsed:
-            return None
-
+    def _build_articles(self, url: str, parsed: dict, info: dict) -> list[Article]:
         # Determine source — prefer article meta, fall back to teaser overlay
         source = parsed.get("source") or info.get("source_name")
 
         # Drop Feuerwehr articles
         if is_feuerwehr(source, parsed.get("title")):
-            self.feuerwehr_dropped += 1
-            self.url_cache.mark_scraped(info["url"])
-            return None
+            self.feuerwehr_dropped_count += 1
+            return []
 
         # Determine city — prefer article extraction, fall back to PD primary city
         city = parsed.get("city")
@@ -629,141 +670,29 @@ class AsyncSachsenPolizeiScraper:
 
         date_display = extract_date_only(date) or (date if date else "")
 
-        return Article(
+        return [Article(
             title=parsed["title"],
             date=date_display,
             city=city,
             bundesland="Sachsen",
             agency_code=None,
             source=source,
-            url=info["url"],
+            url=url,
             body=parsed.get("body", ""),
-            places=[],
-            themes=[],
-        )
-
-    async def _scrape_articles_batch(
-        self,
-        session: aiohttp.ClientSession,
-        article_infos: list[dict],
-        semaphore: asyncio.Semaphore,
-    ) -> list[Article]:
-        """Scrape article pages concurrently in batches."""
-        articles: list[Article] = []
-        total = len(article_infos)
-        batch_size = self.concurrent
-
-        for i in range(0, total, batch_size):
-            batch = article_infos[i : i + batch_size]
-            tasks = [
-                self._scrape_article(session, info, semaphore) for info in batch
-            ]
-            results = await asyncio.gather(*tasks)
-
-            for result, info in zip(results, batch):
-                if result is not None:
-                    articles.append(result)
-                    self.url_cache.mark_scraped(info["url"])
-                # If fetch failed, don't mark as scraped so we retry next time
-
-            progress = min(i + batch_size, total)
-            print(f"  Scraped {progress}/{total} articles ({len(articles)} success)")
-
-            if i + batch_size < total:
-                await asyncio.sleep(DELAY_BETWEEN_BATCHES)
+        )]
 
-        return articles
+    def _meta_extra(self) -> dict:
+        return {
+            "search_partitions": self.partition_count,
+            "partition_stops": self.partition_stops,
+        }
 
-    async def run_async(self) -> None:
-        """Execute the full async scraping pipeline."""
-        print("=" * 60)
-        print("Sachsen Polizeidirektion Scraper")
-        print("=" * 60)
-        print(f"Source: medienservice.sachsen.de")
-        print(f"Polizeidirektionen: {len(self.institution_ids)}")
+    def _banner_lines(self) -> list[str]:
+        lines = ["Source: medienservice.sachsen.de", f"Polizeidirektionen: {len(self.institution_ids)}"]
         for iid in self.institution_ids:
             name, city = POLIZEIDIREKTIONEN.get(iid, (f"ID {iid}", "?"))
-            print(f"  - {name} ({city})")
-        print(f"Concurrent requests: {self.concurrent}")
-        if self.start_date:
-            print(f"Start date: {self.start_date.date()}")
-        if self.end_date:
-            print(f"End date: {self.end_date.date()}")
-        print()
-
-        start_time = time.time()
-
-        headers = {
-            "User-Agent": USER_AGENT,
-            "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
-            "Accept-Language": "de-DE,de;q=0.9,en;q=0.5",
-        }
-
-        ssl_context = ssl.create_default_context(cafile=certifi.where())
-        connector = aiohttp.TCPConnector(ssl=ssl_context)
-        semaphore = asyncio.Semaphore(self.concurrent)
-
-        async with aiohttp.ClientSession(headers=headers, connector=connector) as session:
-            # Phase 1: discover article URLs via the search API
-            article_infos = await self._discover_articles(session, semaphore)
-
-            if not article_infos:
-                print("\nNo articles found to scrape")
-                return
-
-            # Phase 2: scrape individual article pages concurrently
-            print(
-                f"\nScraping {len(article_infos)} articles with "
-                f"{self.concurrent} concurrent requests..."
-            )
-            self.articles = await self._scrape_articles_batch(
-                session, article_infos, semaphore
-            )
-
-        elapsed = time.time() - start_time
-        self.url_cache.save()
-
-        # Write scrape metadata
-        meta = {
-            "source": "medienservice_sachsen",
-            "pages_visited": self.pages_visited,
-            "pages_with_content": self.pages_with_content,
-            "articles_per_page": 6,
-            "source_total": None,
-            "estimated_total": self.pages_with_content * 6,
-            "articles_scraped": len(self.articles),
-            "articles_cached_skip": self.skipped_cached,
-            "articles_feuerwehr_skip": self.feuerwehr_dropped,
-            "stop_reason": self.stop_reason,
-            "fetch_count": self.fetch_count,
-            "fetch_errors": self.fetch_errors,
-            "scrape_duration_s": round(elapsed, 1),
-        }
-        meta_path = self.output.rsplit('.json', 1)[0] + '.meta.json'
-        Path(meta_path).parent.mkdir(parents=True, exist_ok=True)
-        with open(meta_path, 'w', encoding='utf-8') as f:
-            json.dump(meta, f, ensure_ascii=False, indent=2)
-
-        # Write output
-        output_data = [asdict(a) for a in self.articles]
-        Path(self.output).parent.mkdir(parents=True, exist_ok=True)
-        with open(self.output, "w", encoding="utf-8") as f:
-            json.dump(output_data, f, ensure_ascii=False, indent=2)
-
-        print()
-        print("=" * 60)
-        print(f"Saved {len(self.articles)} articles to {self.output}")
-        if self.feuerwehr_dropped:
-            print(f"Dropped {self.feuerwehr_dropped} Feuerwehr (fire dept) articles")
-        print(f"URL cache: {len(self.url_cache)} total URLs in {self.url_cache.cache_file}")
-        print(f"Elapsed: {elapsed:.1f}s ({elapsed / 60:.1f} min)")
-        print(f"Fetches: {self.fetch_count} requests, {self.fetch_errors} errors")
-        if self.articles:
-            print(f"Speed: {len(self.articles) / elapsed:.1f} articles/sec")
-        print("=" * 60)
-
-    def run(self) -> None:
-        asyncio.run(self.run_async())
+            lines.append(f"  - {name} ({city})")
+        return lines
 
 
 # ---------------------------------------------------------------------------
@@ -775,8 +704,7 @@ async def run_test(verbose: bool = False) -> None:
     print("TEST MODE — Diagnostic dump of medienservice.sachsen.de")
     print("=" * 60)
 
-    ssl_context = ssl.create_default_context(cafile=certifi.where())
-    connector = aiohttp.TCPConnector(ssl=ssl_context)
+    connector = create_connector(limit=2)
     headers = {"User-Agent": USER_AGENT, "Accept-Language": "de-DE,de;q=0.9"}
 
     async with aiohttp.ClientSession(headers=headers, connector=connector) as session:
@@ -938,7 +866,7 @@ Institution IDs (Polizeidirektionen):
         "--max-pages",
         type=int,
         default=0,
-        help="Max listing pages per search request (0 = no limit, default: 0)",
+        help="Max listing pages per search request, i.e. per partition (0 = no limit, default: 0)",
     )
     parser.add_argument(
         "--output",
@@ -959,6 +887,30 @@ Institution IDs (Polizeidirektionen):
         default=DEFAULT_CONCURRENT,
         help=f"Concurrent requests (default: {DEFAULT_CONCURRENT})",
     )
+    parser.add_argument(
+        "--max-concurrent",
+        type=int,
+        default=None,
+        help="Upper bound for adaptive concurrency (default: 3x --concurrent)",
+    )
+    parser.add_argument(
+        "--no-adaptive",
+        action="store_true",
+        help="Keep concurrency fixed at --concurrent (Retry-After is still honored)",
+    )
+    parser.add_argument(
+        "--archive-dir",
+        type=str,
+        default=None,
+        help="Store fetched HTML (zstd) here for later reparse (see scrapers/html_archive.py)",
+    )
+    parser.add_argument(
+        "--parse-workers",
+        type=int,
+        default=0,
+        help="Parse HTML in a process pool with N workers so fetching and parsing "
+             "overlap (0 = parse on the event loop, -1 = one per CPU core; default: 0)",
+    )
     parser.add_argument(
         "--cache-dir",
         type=str,
@@ -977,6 +929,12 @@ Institution IDs (Polizeidirektionen):
         choices=list(POLIZEIDIREKTIONEN.keys()),
         help="Limit to specific Polizeidirektion IDs (default: all 5)",
     )
+    parser.add_argument(
+        "--no-partition",
+        action="store_true",
+        help="Page through one combined search sequentially instead of "
+             "concurrent per-Polizeidirektion/date-window searches",
+    )
 
     args = parser.parse_args()
 
@@ -1002,7 +960,12 @@ Institution IDs (Polizeidirektionen):
         verbose=args.verbose,
         concurrent=args.concurrent,
         cache_dir=args.cache_dir,
+        adaptive=not args.no_adaptive,
+        max_concurrent=args.max_concurrent,
+        archive_dir=args.archive_dir,
+        parse_workers=args.parse_workers,
         institution_ids=args.pd,
+        partitioned=not args.no_partition,
     )
 
     try:
@@ -1014,8 +977,14 @@ Institution IDs (Polizeidirektionen):
 
 
 async def scrape_new(start_date: str, end_date: str,
-                     cache_dir: str = ".cache", concurrent: int = 5) -> list[dict]:
-    """Return new articles as dicts. Used by live pipeline."""
+                     cache_dir: str = ".cache", concurrent: int = 5,
+                     session: Optional[aiohttp.ClientSession] = None,
+                     watermark: Optional[dict] = None) -> list[dict]:
+    """Return new articles as dicts. Used by live pipeline.
+
+    Pass session to share one connection pool with other scrapers, and the
+    source's poll watermark to stop listing discovery at already-seen pages.
+    """
     out = os.path.join(cache_dir, "_live_sachsen.json")
     scraper = AsyncSachsenPolizeiScraper(
         start_date=start_date,
@@ -1023,8 +992,9 @@ async def scrape_new(start_date: str, end_date: str,
         output=out,
         cache_dir=cache_dir,
         concurrent=concurrent,
+        watermark=watermark,
     )
-    await scraper.run_async()
+    await scraper.run_async(session=session)
     return [asdict(a) for a in scraper.articles]
 
 
@@ -0,0 +1,157 @@
+"""
+SQLite-backed store of already-scraped article URLs, shared by all scrapers.
+
+Replaces the per-scraper JSON ScrapedUrlsCache, which loaded the whole
+url -> timestamp dict at startup and rewrote it (indent=2) on save(), so both
+grew with every run and nothing was persisted until the run finished.
+
+Here each mark_scraped() is a single INSERT committed immediately (WAL mode),
+so a crash or Ctrl-C loses nothing, startup cost is constant, and several
+scraper processes can share one store. The legacy JSON file is imported on
+first open and renamed to *.json.migrated.
+
+Usage:
+    from scripts.scrapers.url_store import ScrapedUrlsCache
+    cache = ScrapedUrlsCache(".cache", "scraped_urls_bayern.json")
+    new_urls = cache.filter_unscraped(urls)
+
+    python3 scripts/scrapers/url_store.py migrate --cache-dir .cache
+    python3 scripts/scrapers/url_store.py stats --cache-dir .cache
+"""
+
+import argparse
+import json
+import sqlite3
+from datetime import datetime
+from pathlib import Path
+from typing import Iterable
+
+# SQLite's default limit on host parameters is 999 on older builds
+_IN_CHUNK = 900
+
+
+class ScrapedUrlsCache:
+    """Persistent set of scraped article URLs (url -> scrape timestamp).
+
+    cache_filename keeps the legacy JSON name so each scraper keeps its own
+    store; the data lives next to it in <stem>.sqlite.
+    """
+
+    def __init__(self, cache_dir: str = ".cache", cache_filename: str = "scraped_urls.json"):
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.legacy_file = self.cache_dir / cache_filename
+        self.cache_file = self.cache_dir / (Path(cache_filename).stem + ".sqlite")
+
+        self._conn = sqlite3.connect(self.cache_file, timeout=30, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS scraped_urls ("
+            " url TEXT PRIMARY KEY,"
+            " scraped_at TEXT NOT NULL"
+            ") WITHOUT ROWID"
+        )
+        self._migrate_legacy_json()
+
+    def _migrate_legacy_json(self) -> None:
+        """Import the old scraped_urls*.json dict once, then rename it."""
+        if not self.legacy_file.exists():
+            return
+        try:
+            with open(self.legacy_file, "r", encoding="utf-8") as f:
+                urls = json.load(f)
+        except (json.JSONDecodeError, IOError) as e:
+            print(f"Warning: Could not migrate scraped URLs cache {self.legacy_file}: {e}")
+            return
+        if not isinstance(urls, dict):
+            print(f"Warning: Unexpected format in {self.legacy_file}, skipping migration")
+            return
+
+        with self._conn:
+            self._conn.execute("BEGIN")
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO scraped_urls (url, scraped_at) VALUES (?, ?)",
+                ((url, str(ts)) for url, ts in urls.items()),
+            )
+        migrated = self.legacy_file.with_name(self.legacy_file.name + ".migrated")
+        try:
+            self.legacy_file.replace(migrated)
+        except FileNotFoundError:
+            return  # another scraper process migrated it concurrently
+        print(f"Migrated {len(urls)} URLs from {self.legacy_file.name} to {self.cache_file.name}")
+
+    def save(self) -> None:
+        """No-op kept for API compatibility — every mark_scraped() is already committed."""
+
+    def is_scraped(self, url: str) -> bool:
+        """Check if URL has already been scraped."""
+        row = self._conn.execute("SELECT 1 FROM scraped_urls WHERE url = ?", (url,)).fetchone()
+        return row is not None
+
+    def mark_scraped(self, url: str) -> None:
+        """Mark a URL as scraped with current timestamp (persisted immediately)."""
+        self._conn.execute(
+            "INSERT OR IGNORE INTO scraped_urls (url, scraped_at) VALUES (?, ?)",
+            (url, datetime.now().isoformat()),
+        )
+
+    def mark_many(self, urls: Iterable[str]) -> None:
+        """Mark several URLs in one transaction."""
+        now = datetime.now().isoformat()
+        with self._conn:
+            self._conn.execute("BEGIN")
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO scraped_urls (url, scraped_at) VALUES (?, ?)",
+                ((url, now) for url in urls),
+            )
+
+    def filter_unscraped(self, urls: Iterable[str]) -> list[str]:
+        """Return the URLs not yet scraped, preserving input order."""
+        urls = list(urls)
+        scraped: set[str] = set()
+        unique = list(dict.fromkeys(urls))
+        for i in range(0, len(unique), _IN_CHUNK):
+            chunk = unique[i:i + _IN_CHUNK]
+            placeholders = ",".join("?" * len(chunk))
+            rows = self._conn.execute(
+                f"SELECT url FROM scraped_urls WHERE url IN ({placeholders})", chunk,
+            )
+            scraped.update(row[0] for row in rows)
+        return [url for url in urls if url not in scraped]
+
+    def close(self) -> None:
+        self._conn.close()
+
+    def __len__(self) -> int:
+        """Return number of cached URLs."""
+        return self._conn.execute("SELECT COUNT(*) FROM scraped_urls").fetchone()[0]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Manage the SQLite scraped-URL stores")
+    parser.add_argument("command", choices=["migrate", "stats"],
+                        help="migrate: import all scraped_urls*.json files; stats: show store sizes")
+    parser.add_argument("--cache-dir", type=str, default=".cache",
+                        help="Directory for caches (default: .cache)")
+    args = parser.parse_args()
+
+    cache_dir = Path(args.cache_dir)
+    if args.command == "migrate":
+        legacy = sorted(cache_dir.glob("scraped_urls*.json"))
+        if not legacy:
+            print(f"No scraped_urls*.json files in {cache_dir}")
+        for path in legacy:
+            ScrapedUrlsCache(args.cache_dir, path.name).close()
+
+    stores = sorted(cache_dir.glob("scraped_urls*.sqlite"))
+    for path in stores:
+        cache = ScrapedUrlsCache(args.cache_dir, path.stem + ".json")
+        print(f"  {path.name:<40} {len(cache):>8} URLs  {path.stat().st_size / 1024:>8.0f} KB")
+        cache.close()
+    if not stores:
+        print(f"No URL stores in {cache_dir}")
+
+
+if __name__ == "__main__":
+    main()